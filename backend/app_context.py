@@ -0,0 +1,159 @@
+"""
+Contexto de Aplicación - Sistema Braille
+=========================================
+Agrupa los componentes con estado del servidor (conversor, gestor de
+base de datos, generador de PDFs, renderizador de imágenes, documentos
+de la conversión incremental y sesiones en vivo) en un único objeto
+creado por create_app y accesible desde las rutas.
+
+Bajo un servidor con pre-fork (Gunicorn con preload):
+- Las tablas del conversor se construyen una vez en el proceso maestro
+  y los workers las comparten copy-on-write (ver freeze_shared_state).
+- Tras el fork, post_fork descarta el estado por proceso heredado
+  (conexiones SQLite) para que cada worker abra las suyas.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import gc
+import os
+from typing import Callable, List, Optional
+
+EXTENSION_NAME = 'braille'
+
+
+class AppContext:
+    """Componentes con estado de una aplicación Flask."""
+
+    def __init__(self, converter=None, db_manager=None, pdf_generator=None,
+                 image_renderer=None, documents=None, live_sessions=None):
+        """
+        Crea el contexto. Los componentes omitidos son las instancias
+        globales de cada módulo, salvo la base de datos: cada contexto
+        abre su propio DatabaseManager (sus conexiones son estado por
+        contexto y proceso).
+
+        Args:
+            converter: Conversor Braille (BrailleConverter)
+            db_manager: Gestor de base de datos (DatabaseManager)
+            pdf_generator: Generador de PDFs (BrailleSignagePDFGenerator)
+            image_renderer: Renderizador de imágenes (BrailleImageRenderer)
+            documents: Documentos incrementales (DocumentStore, default:
+                uno nuevo por contexto)
+            live_sessions: Sesiones de conversión en vivo (DocumentStore de
+                LiveSession, default: uno nuevo por contexto)
+        """
+        if converter is None:
+            from backend.models.braille_converter import braille_converter as converter
+        if db_manager is None:
+            from backend.database.db_manager import DatabaseManager
+            db_manager = DatabaseManager()
+        if pdf_generator is None:
+            from backend.utils.pdf_generator import pdf_generator
+        if image_renderer is None:
+            from backend.utils.image_renderer import image_renderer
+        if documents is None:
+            from backend.models.incremental import DocumentStore
+            documents = DocumentStore()
+        if live_sessions is None:
+            from backend.models.incremental import DocumentStore
+            from backend.models.live_session import LiveSession
+            live_sessions = DocumentStore(factory=LiveSession)
+
+        self.converter = converter
+        self.db_manager = db_manager
+        self.pdf_generator = pdf_generator
+        self.image_renderer = image_renderer
+        self.documents = documents
+        self.live_sessions = live_sessions
+        self.pid = os.getpid()
+        self._post_fork_hooks = []
+
+    def converter_for(self, table: Optional[str] = None):
+        """
+        Conversor de una tabla de traducción.
+
+        Args:
+            table: Nombre de la tabla (default: el conversor del contexto)
+
+        Raises:
+            TableError: Si la tabla no existe o es inválida
+        """
+        if not table or table == self.converter.table.name:
+            return self.converter
+        from backend.models.braille_converter import get_converter
+        return get_converter(table)
+
+    def register_post_fork(self, hook: Callable[[], None]):
+        """
+        Registra una función a ejecutar en cada worker tras el fork.
+
+        Args:
+            hook: Función sin argumentos
+        """
+        self._post_fork_hooks.append(hook)
+
+    @property
+    def post_fork_hooks(self) -> List[Callable[[], None]]:
+        """Funciones registradas para después del fork."""
+        return list(self._post_fork_hooks)
+
+    def post_fork(self):
+        """
+        Inicializa el estado por proceso en un worker recién creado.
+
+        Descarta las conexiones heredadas del maestro y ejecuta los hooks
+        registrados.
+        """
+        self.pid = os.getpid()
+        self.db_manager.after_fork()
+        for hook in self._post_fork_hooks:
+            hook()
+
+    def shutdown(self):
+        """Libera los recursos del proceso (conexiones de base de datos)."""
+        self.db_manager.close()
+
+
+def freeze_shared_state():
+    """
+    Mueve los objetos existentes (tablas del conversor, catálogos,
+    módulos) a la generación permanente del recolector de basura.
+
+    Se llama en el maestro justo antes del fork: así el recolector de los
+    workers no los recorre y sus páginas de memoria siguen compartidas
+    (copy-on-write) en lugar de copiarse en cada worker.
+    """
+    gc.collect()
+    gc.freeze()
+
+
+def init_app_context(app, context: AppContext = None) -> AppContext:
+    """
+    Asocia un contexto a la aplicación (app.extensions['braille']).
+
+    Args:
+        app: Instancia de Flask
+        context: Contexto a usar (default: uno con las instancias globales)
+
+    Returns:
+        El contexto asociado
+    """
+    if context is None:
+        context = AppContext()
+    app.extensions[EXTENSION_NAME] = context
+    return context
+
+
+def get_app_context(app=None) -> AppContext:
+    """
+    Devuelve el contexto de la aplicación actual.
+
+    Args:
+        app: Instancia de Flask (default: current_app)
+    """
+    if app is None:
+        from flask import current_app
+        app = current_app
+    return app.extensions[EXTENSION_NAME]
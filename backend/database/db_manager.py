@@ -7,6 +7,21 @@ y registros de generación de PDFs.
 Tablas:
 - conversions: Historial de conversiones texto↔braille
 - pdf_generations: Registro de PDFs generados
+- conversion_rollups / pdf_rollups: Agregados por minuto y por hora
+  (series temporales), actualizados en la misma transacción que cada
+  registro; las consultas de tendencias no recorren las tablas crudas.
+  Los agregados por minuto caducan (ROLLUP_RETENTION) y se eliminan al
+  escribir agregados, como mucho una vez por ROLLUP_PRUNE_INTERVAL; los
+  por hora se conservan
+
+Las tablas se crean con la primera conexión (no al importar el módulo),
+de modo que crear un DatabaseManager no toca el disco.
+
+Cada hilo reutiliza su propia conexión, que se cierra cuando el hilo
+termina (el servidor de desarrollo crea un hilo por petición). Las
+conexiones pertenecen al proceso que las abrió: tras un fork (workers
+de Gunicorn) se descartan las heredadas y cada worker abre las suyas
+(ver after_fork).
 
 Autor: GR4
 Fecha: Noviembre 2025
@@ -14,8 +29,57 @@ Fecha: Noviembre 2025
 
 import sqlite3
 import os
-from datetime import datetime
-from typing import List, Dict, Optional
+import threading
+import weakref
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from threading import Lock
+from typing import Iterable, Iterator, List, Dict, Optional
+from backend.utils.metrics import timed
+from backend.utils.pdf_storage import StoredPDF
+from backend.utils.profiling import profiled
+
+# Granularidades de las series temporales: formato del inicio del intervalo
+# (UTC, mismo formato que CURRENT_TIMESTAMP) y duración
+ROLLUP_BUCKETS = {
+    'minute': ('%Y-%m-%d %H:%M:00', timedelta(minutes=1)),
+    'hour': ('%Y-%m-%d %H:00:00', timedelta(hours=1)),
+}
+
+# Conservación de los agregados de cada granularidad (None: indefinida).
+# Una semana de minutos es el rango máximo de una consulta por minutos
+ROLLUP_RETENTION = {
+    'minute': timedelta(days=7),
+    'hour': None,
+}
+
+# Frecuencia máxima (por proceso) de la limpieza de agregados caducados
+ROLLUP_PRUNE_INTERVAL = timedelta(hours=1)
+
+# Columnas exportables de cada tabla (en orden) y obligatorias al importar
+EXPORT_COLUMNS = {
+    'conversions': ('id', 'original_text', 'braille_text', 'conversion_type',
+                    'character_count', 'created_at'),
+    'pdf_generations': ('id', 'title', 'file_path', 'format_type', 'file_size',
+                        'storage_backend', 'storage_key', 'created_at'),
+}
+IMPORT_REQUIRED = {
+    'conversions': ('original_text', 'braille_text', 'conversion_type'),
+    'pdf_generations': ('title', 'file_path'),
+}
+
+
+class _ThreadConnection:
+    """
+    Conexión de un hilo. Se guarda en el threading.local del gestor: al
+    terminar el hilo se libera y la conexión se cierra.
+    """
+
+    __slots__ = ('conn', '__weakref__')
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        weakref.finalize(self, conn.close)
 
 
 class DatabaseManager:
@@ -26,33 +90,122 @@ class DatabaseManager:
         Inicializa el gestor de base de datos.
         
         Args:
-            db_path: Ruta a la base de datos SQLite
+            db_path: Ruta a la base de datos SQLite (default: variable de
+                entorno BRAILLE_DB_PATH o backend/database/braille_system.db)
         """
+        if db_path is None:
+            db_path = os.environ.get('BRAILLE_DB_PATH') or None
+        
         if db_path is None:
             # Directorio raíz del proyecto
             project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
             db_dir = os.path.join(project_root, 'backend', 'database')
-            os.makedirs(db_dir, exist_ok=True)
             self.db_path = os.path.join(db_dir, 'braille_system.db')
         else:
             self.db_path = db_path
         
-        self.init_database()
+        # La creación de tablas se difiere a la primera conexión
+        self._initialized = False
+        self._init_lock = Lock()
+        
+        # Conexiones por hilo del proceso actual (referencias débiles: las
+        # de los hilos terminados se cierran y desaparecen solas)
+        self._local = threading.local()
+        self._connections = weakref.WeakSet()
+        self._connections_lock = Lock()
+        self._pid = os.getpid()
+        
+        # Próxima limpieza de agregados caducados (None: en la próxima escritura)
+        self._next_prune: Optional[datetime] = None
+        self._prune_lock = Lock()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Abre una conexión sin comprobar la inicialización."""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row  # Permite acceso por nombre de columna
+        return conn
     
     def get_connection(self) -> sqlite3.Connection:
         """
         Obtiene una conexión a la base de datos.
         
+        La primera llamada crea las tablas si no existen.
+        
         Returns:
             Conexión SQLite
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Permite acceso por nombre de columna
-        return conn
+        if not self._initialized:
+            self.init_database()
+        return self._connect()
+    
+    def _thread_connection(self) -> sqlite3.Connection:
+        """Conexión reutilizable del hilo actual en este proceso."""
+        if self._pid != os.getpid():
+            self.after_fork()
+        
+        holder = getattr(self._local, 'holder', None)
+        if holder is None:
+            if not self._initialized:
+                self.init_database()
+            # check_same_thread=False solo para poder cerrarla desde close()
+            # o al terminar el hilo; cada conexión la usa únicamente su hilo
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            holder = _ThreadConnection(conn)
+            self._local.holder = holder
+            with self._connections_lock:
+                self._connections.add(holder)
+        return holder.conn
+    
+    @contextmanager
+    def connection(self):
+        """
+        Conexión del hilo actual dentro de una transacción.
+        
+        Confirma los cambios al salir del bloque y los revierte si hay
+        una excepción.
+        
+        Ejemplo:
+            with db_manager.connection() as conn:
+                conn.execute('DELETE FROM settings')
+        """
+        conn = self._thread_connection()
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+    
+    def after_fork(self):
+        """
+        Descarta el estado heredado del proceso padre tras un fork.
+        
+        Las conexiones heredadas no se cierran (siguen siendo del padre);
+        el worker abrirá las suyas en el primer uso.
+        """
+        self._local = threading.local()
+        self._connections = weakref.WeakSet()
+        self._connections_lock = Lock()
+        self._init_lock = Lock()
+        self._prune_lock = Lock()
+        self._pid = os.getpid()
     
     def init_database(self):
         """Inicializa las tablas de la base de datos si no existen."""
-        conn = self.get_connection()
+        with self._init_lock:
+            if self._initialized:
+                return
+            self._create_tables()
+            self._initialized = True
+    
+    def _create_tables(self):
+        """Crea el directorio, las tablas y los índices (DDL idempotente)."""
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        
+        conn = self._connect()
         cursor = conn.cursor()
         
         # Tabla de conversiones
@@ -75,10 +228,70 @@ class DatabaseManager:
                 file_path TEXT NOT NULL,
                 format_type TEXT,
                 file_size INTEGER,
+                storage_backend TEXT,
+                storage_key TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         ''')
         
+        # Migración: columnas de almacenamiento en bases de datos anteriores
+        cursor.execute('PRAGMA table_info(pdf_generations)')
+        pdf_columns = {row['name'] for row in cursor.fetchall()}
+        for column in ('storage_backend', 'storage_key'):
+            if column not in pdf_columns:
+                cursor.execute(f'ALTER TABLE pdf_generations ADD COLUMN {column} TEXT')
+        
+        # Tablas de agregados (series temporales)
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'conversion_rollups'"
+        )
+        rollups_exist = cursor.fetchone() is not None
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS conversion_rollups (
+                bucket TEXT NOT NULL,
+                bucket_start TEXT NOT NULL,
+                conversion_type TEXT NOT NULL,
+                conversions INTEGER NOT NULL DEFAULT 0,
+                characters INTEGER NOT NULL DEFAULT 0,
+                latency_count INTEGER NOT NULL DEFAULT 0,
+                latency_ms_sum REAL NOT NULL DEFAULT 0,
+                latency_ms_max REAL NOT NULL DEFAULT 0,
+                PRIMARY KEY (bucket, bucket_start, conversion_type)
+            ) WITHOUT ROWID
+        ''')
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS pdf_rollups (
+                bucket TEXT NOT NULL,
+                bucket_start TEXT NOT NULL,
+                format_type TEXT NOT NULL,
+                pdfs INTEGER NOT NULL DEFAULT 0,
+                bytes INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (bucket, bucket_start, format_type)
+            ) WITHOUT ROWID
+        ''')
+        
+        if not rollups_exist:
+            # Base de datos anterior: agregar una vez los registros existentes
+            # (sin latencia, que no se guardaba)
+            for bucket, (bucket_format, _) in ROLLUP_BUCKETS.items():
+                cursor.execute('''
+                    INSERT INTO conversion_rollups
+                        (bucket, bucket_start, conversion_type, conversions, characters)
+                    SELECT ?, strftime(?, created_at), conversion_type,
+                           COUNT(*), COALESCE(SUM(character_count), 0)
+                    FROM conversions
+                    GROUP BY 2, 3
+                ''', (bucket, bucket_format))
+                cursor.execute('''
+                    INSERT INTO pdf_rollups (bucket, bucket_start, format_type, pdfs, bytes)
+                    SELECT ?, strftime(?, created_at), COALESCE(format_type, ''),
+                           COUNT(*), COALESCE(SUM(file_size), 0)
+                    FROM pdf_generations
+                    GROUP BY 2, 3
+                ''', (bucket, bucket_format))
+        
         # Tabla de configuraciones
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS settings (
@@ -107,35 +320,96 @@ class DatabaseManager:
         conn.commit()
         conn.close()
     
+    @timed('db.save_conversion')
+    @profiled('db.save_conversion')
     def save_conversion(self, original_text: str, braille_text: str, 
-                       conversion_type: str) -> int:
+                       conversion_type: str, latency_ms: float = None) -> int:
         """
-        Guarda un registro de conversión.
+        Guarda un registro de conversión y actualiza sus agregados.
         
         Args:
             original_text: Texto original
             braille_text: Texto en Braille
             conversion_type: Tipo de conversión (text_to_braille, braille_to_text)
+            latency_ms: Duración de la conversión en milisegundos (opcional)
             
         Returns:
             ID del registro creado
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        character_count = len(original_text)
-        
-        cursor.execute('''
-            INSERT INTO conversions (original_text, braille_text, conversion_type, character_count)
-            VALUES (?, ?, ?, ?)
-        ''', (original_text, braille_text, conversion_type, character_count))
+        now = datetime.now(timezone.utc)
         
-        conversion_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            
+            character_count = len(original_text)
+            
+            cursor.execute('''
+                INSERT INTO conversions (original_text, braille_text, conversion_type,
+                                         character_count, created_at)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (original_text, braille_text, conversion_type, character_count,
+                  now.strftime('%Y-%m-%d %H:%M:%S')))
+            
+            conversion_id = cursor.lastrowid
+            
+            has_latency = latency_ms is not None
+            cursor.executemany('''
+                INSERT INTO conversion_rollups
+                    (bucket, bucket_start, conversion_type, conversions, characters,
+                     latency_count, latency_ms_sum, latency_ms_max)
+                VALUES (?, ?, ?, 1, ?, ?, ?, ?)
+                ON CONFLICT (bucket, bucket_start, conversion_type) DO UPDATE SET
+                    conversions = conversions + 1,
+                    characters = characters + excluded.characters,
+                    latency_count = latency_count + excluded.latency_count,
+                    latency_ms_sum = latency_ms_sum + excluded.latency_ms_sum,
+                    latency_ms_max = MAX(latency_ms_max, excluded.latency_ms_max)
+            ''', [
+                (bucket, start, conversion_type, character_count,
+                 int(has_latency), latency_ms or 0.0, latency_ms or 0.0)
+                for bucket, start in self._bucket_starts(now)
+            ])
+            
+            self._maybe_prune_rollups(cursor, now)
         
         return conversion_id
     
+    def _prune_rollups(self, cursor, now: datetime) -> int:
+        """
+        Elimina los agregados más antiguos que su ROLLUP_RETENTION.
+        
+        Returns:
+            Número de agregados eliminados
+        """
+        deleted = 0
+        for bucket, retention in ROLLUP_RETENTION.items():
+            if retention is None:
+                continue
+            cutoff = (now - retention).strftime(ROLLUP_BUCKETS[bucket][0])
+            for table in ('conversion_rollups', 'pdf_rollups'):
+                cursor.execute(f'''
+                    DELETE FROM {table}
+                    WHERE bucket = ? AND bucket_start < ?
+                ''', (bucket, cutoff))
+                deleted += cursor.rowcount
+        return deleted
+    
+    def _maybe_prune_rollups(self, cursor, now: datetime):
+        """Limpia los agregados caducados si toca (cada ROLLUP_PRUNE_INTERVAL)."""
+        with self._prune_lock:
+            if self._next_prune is not None and now < self._next_prune:
+                return
+            self._next_prune = now + ROLLUP_PRUNE_INTERVAL
+        self._prune_rollups(cursor, now)
+    
+    @staticmethod
+    def _bucket_starts(moment: datetime) -> List[tuple]:
+        """Pares (granularidad, inicio del intervalo) de un instante UTC."""
+        return [(bucket, moment.strftime(bucket_format))
+                for bucket, (bucket_format, _) in ROLLUP_BUCKETS.items()]
+    
+    @timed('db.get_conversion_history')
+    @profiled('db.get_conversion_history')
     def get_conversion_history(self, limit: int = 50, 
                               conversion_type: str = None) -> List[Dict]:
         """
@@ -148,29 +422,28 @@ class DatabaseManager:
         Returns:
             Lista de diccionarios con el historial
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        if conversion_type:
-            cursor.execute('''
-                SELECT id, original_text, braille_text, conversion_type, 
-                       character_count, created_at
-                FROM conversions
-                WHERE conversion_type = ?
-                ORDER BY created_at DESC
-                LIMIT ?
-            ''', (conversion_type, limit))
-        else:
-            cursor.execute('''
-                SELECT id, original_text, braille_text, conversion_type,
-                       character_count, created_at
-                FROM conversions
-                ORDER BY created_at DESC
-                LIMIT ?
-            ''', (limit,))
-        
-        rows = cursor.fetchall()
-        conn.close()
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            
+            if conversion_type:
+                cursor.execute('''
+                    SELECT id, original_text, braille_text, conversion_type, 
+                           character_count, created_at
+                    FROM conversions
+                    WHERE conversion_type = ?
+                    ORDER BY created_at DESC
+                    LIMIT ?
+                ''', (conversion_type, limit))
+            else:
+                cursor.execute('''
+                    SELECT id, original_text, braille_text, conversion_type,
+                           character_count, created_at
+                    FROM conversions
+                    ORDER BY created_at DESC
+                    LIMIT ?
+                ''', (limit,))
+            
+            rows = cursor.fetchall()
         
         # Convertir a lista de diccionarios
         history = []
@@ -186,38 +459,64 @@ class DatabaseManager:
         
         return history
     
+    @timed('db.save_pdf_generation')
+    @profiled('db.save_pdf_generation')
     def save_pdf_generation(self, title: str, file_path: str, 
-                          format_type: str) -> int:
+                          format_type: str, stored: StoredPDF = None) -> int:
         """
-        Guarda un registro de generación de PDF.
+        Guarda un registro de generación de PDF y actualiza sus agregados.
         
         Args:
             title: Título del PDF
             file_path: Ruta del archivo generado
             format_type: Tipo de formato (elevator, door, label)
+            stored: PDF devuelto por el almacenamiento (opcional); se
+                registran su backend, clave y tamaño
             
         Returns:
             ID del registro creado
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Obtener tamaño del archivo
-        file_size = 0
-        if os.path.exists(file_path):
-            file_size = os.path.getsize(file_path)
+        if stored is not None:
+            file_size = stored.size
+            storage_backend, storage_key = stored.backend, stored.key
+        else:
+            # Obtener tamaño del archivo
+            file_size = 0
+            if os.path.exists(file_path):
+                file_size = os.path.getsize(file_path)
+            storage_backend = storage_key = None
         
-        cursor.execute('''
-            INSERT INTO pdf_generations (title, file_path, format_type, file_size)
-            VALUES (?, ?, ?, ?)
-        ''', (title, file_path, format_type, file_size))
+        now = datetime.now(timezone.utc)
         
-        pdf_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                INSERT INTO pdf_generations (title, file_path, format_type, file_size,
+                                             storage_backend, storage_key, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (title, file_path, format_type, file_size, storage_backend, storage_key,
+                  now.strftime('%Y-%m-%d %H:%M:%S')))
+            
+            pdf_id = cursor.lastrowid
+            
+            self._maybe_prune_rollups(cursor, now)
+            
+            cursor.executemany('''
+                INSERT INTO pdf_rollups (bucket, bucket_start, format_type, pdfs, bytes)
+                VALUES (?, ?, ?, 1, ?)
+                ON CONFLICT (bucket, bucket_start, format_type) DO UPDATE SET
+                    pdfs = pdfs + 1,
+                    bytes = bytes + excluded.bytes
+            ''', [
+                (bucket, start, format_type or '', file_size)
+                for bucket, start in self._bucket_starts(now)
+            ])
         
         return pdf_id
     
+    @timed('db.get_pdf_history')
+    @profiled('db.get_pdf_history')
     def get_pdf_history(self, limit: int = 50) -> List[Dict]:
         """
         Obtiene el historial de PDFs generados.
@@ -228,18 +527,18 @@ class DatabaseManager:
         Returns:
             Lista de diccionarios con el historial
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT id, title, file_path, format_type, file_size, created_at
-            FROM pdf_generations
-            ORDER BY created_at DESC
-            LIMIT ?
-        ''', (limit,))
-        
-        rows = cursor.fetchall()
-        conn.close()
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT id, title, file_path, format_type, file_size,
+                       storage_backend, storage_key, created_at
+                FROM pdf_generations
+                ORDER BY created_at DESC
+                LIMIT ?
+            ''', (limit,))
+            
+            rows = cursor.fetchall()
         
         history = []
         for row in rows:
@@ -249,11 +548,15 @@ class DatabaseManager:
                 'file_path': row['file_path'],
                 'format_type': row['format_type'],
                 'file_size': row['file_size'],
+                'storage_backend': row['storage_backend'],
+                'storage_key': row['storage_key'],
                 'timestamp': row['created_at']
             })
         
         return history
     
+    @timed('db.get_statistics')
+    @profiled('db.get_statistics')
     def get_statistics(self) -> Dict:
         """
         Obtiene estadísticas del sistema.
@@ -261,87 +564,364 @@ class DatabaseManager:
         Returns:
             Diccionario con estadísticas
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            
+            # Total de conversiones
+            cursor.execute('SELECT COUNT(*) as count FROM conversions')
+            total_conversions = cursor.fetchone()['count']
+            
+            # Conversiones por tipo
+            cursor.execute('''
+                SELECT conversion_type, COUNT(*) as count
+                FROM conversions
+                GROUP BY conversion_type
+            ''')
+            conversions_by_type = {}
+            for row in cursor.fetchall():
+                conversions_by_type[row['conversion_type']] = row['count']
+            
+            # Total de PDFs generados
+            cursor.execute('SELECT COUNT(*) as count FROM pdf_generations')
+            total_pdfs = cursor.fetchone()['count']
+            
+            # PDFs por formato
+            cursor.execute('''
+                SELECT format_type, COUNT(*) as count
+                FROM pdf_generations
+                GROUP BY format_type
+            ''')
+            pdfs_by_format = {}
+            for row in cursor.fetchall():
+                pdfs_by_format[row['format_type']] = row['count']
+            
+            # Total de caracteres convertidos
+            cursor.execute('SELECT SUM(character_count) as total FROM conversions')
+            total_characters = cursor.fetchone()['total'] or 0
         
-        # Total de conversiones
-        cursor.execute('SELECT COUNT(*) as count FROM conversions')
-        total_conversions = cursor.fetchone()['count']
+        return {
+            'total_conversions': total_conversions,
+            'conversions_by_type': conversions_by_type,
+            'total_pdfs': total_pdfs,
+            'pdfs_by_format': pdfs_by_format,
+            'total_characters_converted': total_characters
+        }
+    
+    @timed('db.get_timeseries')
+    @profiled('db.get_timeseries')
+    def get_timeseries(self, start: datetime, end: datetime,
+                       bucket: str = 'hour') -> Dict:
+        """
+        Obtiene la serie temporal de conversiones y PDFs.
         
-        # Conversiones por tipo
-        cursor.execute('''
-            SELECT conversion_type, COUNT(*) as count
-            FROM conversions
-            GROUP BY conversion_type
-        ''')
-        conversions_by_type = {}
-        for row in cursor.fetchall():
-            conversions_by_type[row['conversion_type']] = row['count']
+        Solo lee las tablas de agregados. Los intervalos sin actividad no
+        aparecen en la respuesta.
         
-        # Total de PDFs generados
-        cursor.execute('SELECT COUNT(*) as count FROM pdf_generations')
-        total_pdfs = cursor.fetchone()['count']
+        Args:
+            start: Inicio del rango (incluido; se redondea al intervalo)
+            end: Fin del rango (excluido)
+            bucket: Granularidad ('minute' u 'hour')
+            
+        Returns:
+            Diccionario con las listas 'conversions' y 'pdfs', ordenadas
+            por inicio de intervalo
+            
+        Raises:
+            ValueError: Si la granularidad no es válida
+        """
+        if bucket not in ROLLUP_BUCKETS:
+            raise ValueError(f"Granularidad inválida: {bucket}")
+        bucket_format = ROLLUP_BUCKETS[bucket][0]
         
-        # PDFs por formato
-        cursor.execute('''
-            SELECT format_type, COUNT(*) as count
-            FROM pdf_generations
-            GROUP BY format_type
-        ''')
-        pdfs_by_format = {}
-        for row in cursor.fetchall():
-            pdfs_by_format[row['format_type']] = row['count']
+        def to_utc(moment: datetime) -> datetime:
+            if moment.tzinfo is None:
+                return moment.replace(tzinfo=timezone.utc)
+            return moment.astimezone(timezone.utc)
         
-        # Total de caracteres convertidos
-        cursor.execute('SELECT SUM(character_count) as total FROM conversions')
-        total_characters = cursor.fetchone()['total'] or 0
+        range_start = to_utc(start).strftime(bucket_format)
+        range_end = to_utc(end).strftime('%Y-%m-%d %H:%M:%S')
         
-        conn.close()
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                SELECT bucket_start, conversion_type, conversions, characters,
+                       latency_count, latency_ms_sum, latency_ms_max
+                FROM conversion_rollups
+                WHERE bucket = ? AND bucket_start >= ? AND bucket_start < ?
+                ORDER BY bucket_start, conversion_type
+            ''', (bucket, range_start, range_end))
+            conversion_rows = cursor.fetchall()
+            
+            cursor.execute('''
+                SELECT bucket_start, format_type, pdfs, bytes
+                FROM pdf_rollups
+                WHERE bucket = ? AND bucket_start >= ? AND bucket_start < ?
+                ORDER BY bucket_start, format_type
+            ''', (bucket, range_start, range_end))
+            pdf_rows = cursor.fetchall()
+        
+        def latency_stats(count, total, maximum) -> Dict:
+            return {
+                'latency_avg_ms': round(total / count, 3) if count else None,
+                'latency_max_ms': round(maximum, 3) if count else None
+            }
+        
+        conversions = {}
+        for row in conversion_rows:
+            point = conversions.setdefault(row['bucket_start'], {
+                'bucket_start': row['bucket_start'],
+                'conversions': 0,
+                'characters': 0,
+                'latency_count': 0,
+                'latency_ms_sum': 0.0,
+                'latency_ms_max': 0.0,
+                'by_type': {}
+            })
+            point['conversions'] += row['conversions']
+            point['characters'] += row['characters']
+            point['latency_count'] += row['latency_count']
+            point['latency_ms_sum'] += row['latency_ms_sum']
+            point['latency_ms_max'] = max(point['latency_ms_max'], row['latency_ms_max'])
+            point['by_type'][row['conversion_type']] = {
+                'conversions': row['conversions'],
+                'characters': row['characters'],
+                **latency_stats(row['latency_count'], row['latency_ms_sum'],
+                                row['latency_ms_max'])
+            }
+        for point in conversions.values():
+            point.update(latency_stats(point.pop('latency_count'),
+                                       point.pop('latency_ms_sum'),
+                                       point.pop('latency_ms_max')))
+        
+        pdfs = {}
+        for row in pdf_rows:
+            point = pdfs.setdefault(row['bucket_start'], {
+                'bucket_start': row['bucket_start'],
+                'pdfs': 0,
+                'bytes': 0,
+                'by_format': {}
+            })
+            point['pdfs'] += row['pdfs']
+            point['bytes'] += row['bytes']
+            point['by_format'][row['format_type']] = {
+                'pdfs': row['pdfs'],
+                'bytes': row['bytes']
+            }
         
         return {
-            'total_conversions': total_conversions,
-            'conversions_by_type': conversions_by_type,
-            'total_pdfs': total_pdfs,
-            'pdfs_by_format': pdfs_by_format,
-            'total_characters_converted': total_characters
+            'bucket': bucket,
+            'conversions': list(conversions.values()),
+            'pdfs': list(pdfs.values())
         }
     
-    def delete_old_records(self, days: int = 30):
+    def iter_records(self, table: str, batch_size: int = 1000) -> Iterator[Dict]:
         """
-        Elimina registros antiguos (limpieza de base de datos).
+        Recorre todos los registros de una tabla en orden de id.
+        
+        Usa una conexión propia y lee por lotes (fetchmany), de modo que
+        la memoria no depende del tamaño de la tabla. La conexión se
+        cierra al agotar o cerrar el generador.
         
         Args:
-            days: Número de días de antigüedad para eliminar
+            table: 'conversions' o 'pdf_generations'
+            batch_size: Filas leídas por lote
+            
+        Yields:
+            Un diccionario por registro (columnas de EXPORT_COLUMNS)
+            
+        Raises:
+            ValueError: Si la tabla no es exportable
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        if table not in EXPORT_COLUMNS:
+            raise ValueError(f"Tabla no exportable: {table}")
+        columns = EXPORT_COLUMNS[table]
         
-        cursor.execute('''
-            DELETE FROM conversions
-            WHERE created_at < datetime('now', '-' || ? || ' days')
-        ''', (days,))
+        conn = self.get_connection()
+        try:
+            cursor = conn.execute(
+                f"SELECT {', '.join(columns)} FROM {table} ORDER BY id"
+            )
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(zip(columns, row))
+        finally:
+            conn.close()
+    
+    @timed('db.import_records')
+    def import_records(self, table: str, records: Iterable[Dict],
+                       batch_size: int = 1000) -> int:
+        """
+        Importa registros (p. ej. de una exportación) en lotes.
         
-        conversions_deleted = cursor.rowcount
+        Cada lote se inserta con executemany en su propia transacción,
+        junto con sus agregados. Los ids no se conservan; created_at sí.
+        Si un registro es inválido, los lotes anteriores quedan guardados.
         
-        cursor.execute('''
-            DELETE FROM pdf_generations
-            WHERE created_at < datetime('now', '-' || ? || ' days')
-        ''', (days,))
+        Args:
+            table: 'conversions' o 'pdf_generations'
+            records: Iterable de diccionarios
+            batch_size: Registros por transacción
+            
+        Returns:
+            Número de registros importados
+            
+        Raises:
+            ValueError: Si la tabla no es importable o un registro es inválido
+        """
+        if table not in IMPORT_REQUIRED:
+            raise ValueError(f"Tabla no importable: {table}")
+        
+        imported = 0
+        batch = []
+        for number, record in enumerate(records, start=1):
+            batch.append(self._import_row(table, record, number))
+            if len(batch) >= batch_size:
+                self._insert_batch(table, batch)
+                imported += len(batch)
+                batch = []
+        if batch:
+            self._insert_batch(table, batch)
+            imported += len(batch)
+        
+        return imported
+    
+    @staticmethod
+    def _import_row(table: str, record: Dict, number: int) -> tuple:
+        """Valida un registro importado y lo convierte en fila de la tabla."""
+        missing = [c for c in IMPORT_REQUIRED[table] if not record.get(c)]
+        if missing:
+            raise ValueError(f"Registro {number}: faltan campos {', '.join(missing)}")
+        
+        try:
+            created_at = record.get('created_at')
+            moment = (datetime.fromisoformat(str(created_at)) if created_at
+                      else datetime.now(timezone.utc))
+            if moment.tzinfo is not None:
+                moment = moment.astimezone(timezone.utc)
+            created_at = moment.strftime('%Y-%m-%d %H:%M:%S')
+            
+            if table == 'conversions':
+                count = record.get('character_count')
+                count = int(count) if count not in (None, '') \
+                    else len(record['original_text'])
+                return (record['original_text'], record['braille_text'],
+                        record['conversion_type'], count, created_at)
+            
+            size = record.get('file_size')
+            return (record['title'], record['file_path'], record.get('format_type'),
+                    int(size) if size not in (None, '') else 0,
+                    record.get('storage_backend'), record.get('storage_key'), created_at)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Registro {number}: {e}") from None
+    
+    def _insert_batch(self, table: str, rows: List[tuple]):
+        """Inserta un lote de filas y sus agregados en una transacción."""
+        with self.connection() as conn:
+            self._maybe_prune_rollups(conn.cursor(), datetime.now(timezone.utc))
+            if table == 'conversions':
+                conn.executemany('''
+                    INSERT INTO conversions (original_text, braille_text, conversion_type,
+                                             character_count, created_at)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', rows)
+                conn.executemany('''
+                    INSERT INTO conversion_rollups
+                        (bucket, bucket_start, conversion_type, conversions, characters)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT (bucket, bucket_start, conversion_type) DO UPDATE SET
+                        conversions = conversions + excluded.conversions,
+                        characters = characters + excluded.characters
+                ''', self._batch_rollups(rows, key_index=2, value_index=3))
+            else:
+                conn.executemany('''
+                    INSERT INTO pdf_generations (title, file_path, format_type, file_size,
+                                                 storage_backend, storage_key, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', rows)
+                conn.executemany('''
+                    INSERT INTO pdf_rollups (bucket, bucket_start, format_type, pdfs, bytes)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT (bucket, bucket_start, format_type) DO UPDATE SET
+                        pdfs = pdfs + excluded.pdfs,
+                        bytes = bytes + excluded.bytes
+                ''', self._batch_rollups(rows, key_index=2, value_index=3))
+    
+    def _batch_rollups(self, rows: List[tuple], key_index: int,
+                       value_index: int) -> List[tuple]:
+        """
+        Agrega un lote: (granularidad, inicio, clave, registros, suma) por
+        intervalo, con la fecha en la última columna de cada fila.
+        """
+        totals = {}
+        for row in rows:
+            moment = datetime.strptime(row[-1], '%Y-%m-%d %H:%M:%S')
+            for bucket, start in self._bucket_starts(moment):
+                key = (bucket, start, row[key_index] or '')
+                count, total = totals.get(key, (0, 0))
+                totals[key] = (count + 1, total + row[value_index])
+        return [key + value for key, value in totals.items()]
+    
+    def delete_old_records(self, days: int = 30):
+        """
+        Elimina registros antiguos (limpieza de base de datos).
         
-        pdfs_deleted = cursor.rowcount
+        Los agregados de las series temporales no dependen de los
+        registros: los por hora se conservan y los por minuto caducados
+        (ROLLUP_RETENTION) se eliminan aquí también, sin esperar a la
+        limpieza periódica de las escrituras.
         
-        conn.commit()
-        conn.close()
+        Args:
+            days: Número de días de antigüedad para eliminar
+        """
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            
+            cursor.execute('''
+                DELETE FROM conversions
+                WHERE created_at < datetime('now', '-' || ? || ' days')
+            ''', (days,))
+            
+            conversions_deleted = cursor.rowcount
+            
+            cursor.execute('''
+                DELETE FROM pdf_generations
+                WHERE created_at < datetime('now', '-' || ? || ' days')
+            ''', (days,))
+            
+            pdfs_deleted = cursor.rowcount
+            
+            rollups_deleted = self._prune_rollups(cursor, datetime.now(timezone.utc))
         
         return {
             'conversions_deleted': conversions_deleted,
-            'pdfs_deleted': pdfs_deleted
+            'pdfs_deleted': pdfs_deleted,
+            'rollups_deleted': rollups_deleted
         }
     
+    @property
+    def open_connections(self) -> int:
+        """Conexiones por hilo abiertas en este proceso."""
+        with self._connections_lock:
+            return len(self._connections)
+    
     def close(self):
-        """Cierra la conexión a la base de datos."""
-        # SQLite no mantiene conexiones permanentes, no hay nada que cerrar
-        pass
+        """Cierra las conexiones abiertas por este proceso."""
+        if self._pid != os.getpid():
+            self.after_fork()
+            return
+        
+        with self._connections_lock:
+            holders, self._connections = list(self._connections), weakref.WeakSet()
+        for holder in holders:
+            try:
+                holder.conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
 
 
 # Instancia global
@@ -0,0 +1,151 @@
+"""
+Celdas Braille Compactas
+========================
+Representación compacta de una secuencia de celdas Braille: un byte
+por celda con la máscara de puntos activos (bit 0 = punto 1, ...,
+bit 7 = punto 8). Un byte cubre los 256 patrones de Unicode Braille
+(U+2800-U+28FF), tanto de 6 como de 8 puntos.
+
+Frente a una lista de tuplas (un objeto por celda) ocupa un byte por
+celda y permite acceso sin copias mediante memoryview.
+
+Sistema de numeración de puntos:
+    1 • • 4
+    2 • • 5
+    3 • • 6
+    7 • • 8   (solo en celdas de 8 puntos)
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+from typing import Iterator, List, Tuple, Union
+
+
+def dots_to_mask(dots: Tuple[int, ...]) -> int:
+    """
+    Convierte una tupla de puntos a su máscara de bits (bit 0 = punto 1).
+
+    Ejemplo:
+        >>> dots_to_mask((1, 2, 3))
+        7
+    """
+    mask = 0
+    for dot in dots:
+        mask |= 1 << (dot - 1)
+    return mask
+
+
+# Tupla de puntos (ordenada) de cada máscara posible de 8 bits
+MASK_TO_DOTS = tuple(
+    tuple(dot for dot in range(1, 9) if mask & (1 << (dot - 1)))
+    for mask in range(256)
+)
+
+
+# Carácter Unicode Braille de cada máscara (para str.translate)
+_MASK_TO_UNICODE = {mask: chr(0x2800 + mask) for mask in range(256)}
+
+
+def masks_to_unicode(masks: Union[bytes, bytearray, memoryview]) -> str:
+    """
+    Convierte máscaras (un byte por celda) a Braille Unicode.
+
+    Ejemplo:
+        >>> masks_to_unicode(b'\\x01\\x03')
+        '⠁⠃'
+    """
+    return bytes(masks).decode('latin-1').translate(_MASK_TO_UNICODE)
+
+
+def mask_to_dots(mask: int) -> Tuple[int, ...]:
+    """
+    Convierte una máscara de bits a su tupla de puntos.
+
+    Ejemplo:
+        >>> mask_to_dots(7)
+        (1, 2, 3)
+    """
+    return MASK_TO_DOTS[mask]
+
+
+class BrailleCells:
+    """
+    Secuencia inmutable de celdas Braille respaldada por bytes.
+
+    Se itera como tuplas de puntos (compatible con la salida clásica de
+    text_to_braille_dots); las máscaras están disponibles sin copia en
+    la propiedad masks.
+    """
+
+    __slots__ = ('_data',)
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview] = b''):
+        """
+        Crea la secuencia a partir de las máscaras de cada celda.
+
+        Args:
+            data: Un byte por celda con la máscara de puntos
+        """
+        self._data = bytes(data)
+
+    @classmethod
+    def from_dots(cls, cells) -> 'BrailleCells':
+        """
+        Crea la secuencia a partir de tuplas de puntos.
+
+        Args:
+            cells: Iterable de tuplas de puntos (1-8)
+        """
+        return cls(bytes(dots_to_mask(dots) for dots in cells))
+
+    @property
+    def masks(self) -> memoryview:
+        """Vista de solo lectura de las máscaras (un entero por celda)."""
+        return memoryview(self._data)
+
+    def tobytes(self) -> bytes:
+        """Máscaras como bytes."""
+        return self._data
+
+    def to_unicode(self) -> str:
+        """Celdas como texto Braille Unicode."""
+        return masks_to_unicode(self._data)
+
+    def iter_dots(self) -> Iterator[Tuple[int, ...]]:
+        """Itera las celdas como tuplas de puntos."""
+        table = MASK_TO_DOTS
+        for mask in self._data:
+            yield table[mask]
+
+    def to_list(self) -> List[Tuple[int, ...]]:
+        """Lista de tuplas de puntos (formato clásico)."""
+        table = MASK_TO_DOTS
+        return [table[mask] for mask in self._data]
+
+    def __iter__(self) -> Iterator[Tuple[int, ...]]:
+        return self.iter_dots()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __bool__(self) -> bool:
+        return bool(self._data)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return BrailleCells(self._data[index])
+        return MASK_TO_DOTS[self._data[index]]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, BrailleCells):
+            return self._data == other._data
+        if isinstance(other, (list, tuple)):
+            return self.to_list() == list(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._data)
+
+    def __repr__(self) -> str:
+        return f"BrailleCells({self._data!r})"
@@ -13,7 +13,20 @@ Autor: GR4
 Fecha: Noviembre 2025
 """
 
-from typing import Dict, List, Tuple, Optional
+import hashlib
+import json
+from threading import Lock
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Tuple, Optional, Union
+from backend.models.braille_cells import BrailleCells, MASK_TO_DOTS, dots_to_mask
+from backend.models.translation_tables import (
+    DEFAULT_TABLE, TranslationTable, check_table_name, get_table
+)
+from backend.utils.metrics import timed
+from backend.utils.profiling import profiled
+
+# Versión del formato de client_table (motor de conversión del navegador)
+CLIENT_TABLE_FORMAT = 1
 
 
 class BrailleConverter:
@@ -26,147 +39,58 @@ class BrailleConverter:
     - Serie 3 (u-z): Serie 1 + puntos 3,6
     """
     
-    def __init__(self):
-        """Inicializa los mapeos de conversión Braille."""
+    def __init__(self, table: Union[str, TranslationTable] = DEFAULT_TABLE):
+        """
+        Inicializa los mapeos de conversión Braille.
+        
+        Args:
+            table: Tabla de traducción (nombre o tabla compilada; ver
+                backend.models.translation_tables)
+        """
+        self.table = table if isinstance(table, TranslationTable) else get_table(table)
         self._init_alphabet_maps()
         self._init_number_maps()
         self._init_special_chars()
         self._init_unicode_braille()
+        self._init_validation_table()
+        self._init_info_catalog()
+        self._init_mask_tables()
+        self._init_contractions()
+        self._init_computer_braille()
+        self._init_inverse_maps()
     
     def _init_alphabet_maps(self):
         """
-        Inicializa el mapeo del abecedario español según las tres series.
+        Carga el abecedario de la tabla de traducción (grupos 'letter';
+        en español, las tres series más la w).
         Los puntos se representan como tuplas de números (1-6).
         """
-        # SERIE 1: Letras a-j (matriz primitiva)
-        self.SERIE_1 = {
-            'a': (1,),           # •
-            'b': (1, 2),         # • •
-            'c': (1, 4),         # • 
-            'd': (1, 4, 5),      # • • •
-            'e': (1, 5),         # •   •
-            'f': (1, 2, 4),      # • •
-            'g': (1, 2, 4, 5),   # • • • •
-            'h': (1, 2, 5),      # • •   •
-            'i': (2, 4),         #   • •
-            'j': (2, 4, 5),      #   • • •
-        }
-        
-        # SERIE 2: Letras k-t (Serie 1 + punto 3)
-        self.SERIE_2 = {
-            'k': (1, 3),           # • 
-            'l': (1, 2, 3),        # • •
-            'm': (1, 3, 4),        # • 
-            'n': (1, 3, 4, 5),     # • • •
-            'o': (1, 3, 5),        # •   •
-            'p': (1, 2, 3, 4),     # • •
-            'q': (1, 2, 3, 4, 5),  # • • • •
-            'r': (1, 2, 3, 5),     # • •   •
-            's': (2, 3, 4),        #   • •
-            't': (2, 3, 4, 5),     #   • • •
-        }
-        
-        # SERIE 3: Letras u-z (Serie 1 + puntos 3,6)
-        self.SERIE_3 = {
-            'u': (1, 3, 6),           # • 
-            'v': (1, 2, 3, 6),        # • •
-            'x': (1, 3, 4, 6),        # • 
-            'y': (1, 3, 4, 5, 6),     # • • •
-            'z': (1, 3, 5, 6),        # •   •
-        }
-        
-        # Letra W (añadida posteriormente al braille francés)
-        self.EXTRA = {
-            'w': (2, 4, 5, 6),        #   • • •
-        }
-        
-        # Combinar todas las series
-        self.ALPHABET = {
-            **self.SERIE_1,
-            **self.SERIE_2,
-            **self.SERIE_3,
-            **self.EXTRA
-        }
+        self.ALPHABET = self.table.alphabet
     
     def _init_special_chars(self):
-        """Inicializa caracteres especiales del español."""
-        # Vocales acentuadas
-        self.ACCENTED_VOWELS = {
-            'á': (1, 2, 3, 5, 6),      # á
-            'é': (2, 3, 4, 6),         # é
-            'í': (3, 4),               # í
-            'ó': (3, 4, 6),            # ó
-            'ú': (2, 3, 4, 5, 6),      # ú
-        }
-        
-        # Caracteres adicionales español
-        self.SPANISH_SPECIAL = {
-            'ñ': (1, 2, 4, 5, 6),      # ñ
-            'ü': (1, 2, 5, 6),         # ü
-        }
-        
-        # Signos de puntuación y símbolos
-        self.PUNCTUATION = {
-            '.': (3,),                 # punto (punto 3 - esquina inferior izquierda)
-            ',': (2,),                 # coma
-            ';': (2, 3),               # punto y coma
-            ':': (2, 5),               # dos puntos
-            '?': (2, 6),               # interrogación
-            '¿': (2, 6),               # interrogación apertura (igual que cierre)
-            '!': (2, 3, 5),            # exclamación
-            '¡': (2, 3, 5),            # exclamación apertura
-            '-': (3, 6),               # guion / resta
-            '−': (3, 6),               # signo menos (matemático)
-            '–': (3, 6),               # guion medio (en dash)
-            '—': (3, 6),               # guion largo (em dash)
-            '_': (3, 6),               # guion bajo (underscore)
-            '(': (2, 3, 6),            # paréntesis apertura
-            ')': (3, 5, 6),            # paréntesis cierre
-            '"': (2, 3, 6),            # comillas
-            "'": (3,),                 # apóstrofo
-            '=': (2, 3, 5, 6),         # signo igual (4 puntos de abajo)
-            '/': (2, 5, 6),            # división (barra)
-            '÷': (2, 5, 6),            # división (símbolo)
-            '+': (2, 3, 5),            # suma / más
-            '×': (2, 3, 6),               # multiplicación
-            '*': (2, 3, 6),               # asterisco / multiplicación
-            ' ': tuple(),              # espacio en blanco
-        }
-        
-        # Combinar todos los caracteres especiales
-        self.SPECIAL_CHARS = {
-            **self.ACCENTED_VOWELS,
-            **self.SPANISH_SPECIAL,
-            **self.PUNCTUATION
-        }
+        """
+        Carga los caracteres especiales de la tabla (vocales acentuadas,
+        ñ, ü y signos de puntuación).
+        """
+        self.SPECIAL_CHARS = self.table.special_chars
+        self.PUNCTUATION = self.table.punctuation
     
     def _init_number_maps(self):
         """
-        Inicializa el mapeo de números.
+        Carga los números y los indicadores de la tabla.
         Los números usan el signo de número seguido de las letras de la serie 1.
         """
         # Signo de número (antepuesto a números)
-        self.NUMBER_SIGN = (3, 4, 5, 6)  # ⠼
+        self.NUMBER_SIGN = self.table.number_sign
         
         # Cuadratín (espacio sin puntos - caja vacía)
         self.QUADRATIN = tuple()  # ⠀ (sin puntos)
         
         # Indicador de mayúscula (antepuesto a letras mayúsculas)
-        self.CAPITAL_SIGN = (4, 6)  # ⠨ (puntos 4 y 6)
-        
-        # Números del 0-9 (usan serie 1: a=1, b=2, ..., j=0)
-        self.NUMBERS = {
-            '1': (1,),           # a
-            '2': (1, 2),         # b
-            '3': (1, 4),         # c
-            '4': (1, 4, 5),      # d
-            '5': (1, 5),         # e
-            '6': (1, 2, 4),      # f
-            '7': (1, 2, 4, 5),   # g
-            '8': (1, 2, 5),      # h
-            '9': (2, 4),         # i
-            '0': (2, 4, 5),      # j
-        }
+        self.CAPITAL_SIGN = self.table.capital_sign
+        
+        # Números del 0-9
+        self.NUMBERS = self.table.numbers
     
     def _init_unicode_braille(self):
         """
@@ -182,6 +106,153 @@ class BrailleConverter:
             5: 0x10, 6: 0x20, 7: 0x40, 8: 0x80
         }
     
+    def _init_validation_table(self):
+        """
+        Conjunto de caracteres soportados para la validación (precalculado
+        en la tabla).
+        
+        Incluye las minúsculas de los mapeos, sus mayúsculas (cuando vuelven
+        a la misma minúscula) y los dígitos ASCII. Los caracteres que no
+        están en el conjunto (dígitos Unicode, mayúsculas especiales) se
+        clasifican aparte en _unsupported_parts.
+        """
+        self.SUPPORTED_CHARS = self.table.supported_chars
+    
+    def _init_info_catalog(self):
+        """
+        Catálogo con la información de todos los caracteres soportados.
+        
+        El catálogo (INFO_CATALOG) es de solo lectura, tanto el mapeo como
+        cada entrada, por lo que se comparte entre hilos sin copias.
+        INFO_CATALOG_VERSION es un hash del contenido, usado como ETag.
+        """
+        self.INFO_CATALOG = self.table.info_catalog
+        self.INFO_CATALOG_VERSION = self.table.info_version
+    
+    def _init_mask_tables(self):
+        """
+        Máscaras de bits de cada carácter para la salida compacta de
+        text_to_braille_dots (ver BrailleCells).
+        """
+        self.CHAR_MASKS = self.table.char_masks
+        self.NUMBER_MASKS = self.table.number_masks
+        # Las tablas de braille computerizado no tienen indicadores
+        self.CAPITAL_MASK = dots_to_mask(self.CAPITAL_SIGN) if self.CAPITAL_SIGN else None
+        self.NUMBER_SIGN_MASK = dots_to_mask(self.NUMBER_SIGN) if self.NUMBER_SIGN else None
+    
+    def _init_contractions(self):
+        """
+        Prepara el modo contraído (estenografía): la tabla compilada de
+        contracciones (None si la tabla de traducción no tiene) y las
+        celdas que cuentan como parte de una palabra al retrotraducir
+        (ver backend.models.contractions).
+        """
+        self.CONTRACTIONS = self.table.contractions
+        group_masks = self.CONTRACTIONS.group_masks if self.CONTRACTIONS else frozenset()
+        letter_masks = {mask for char, mask in self.CHAR_MASKS.items() if char.isalpha()}
+        self.WORD_MASKS = frozenset(letter_masks | group_masks | {self.CAPITAL_MASK})
+        self.DIGIT_MASKS = frozenset(self.NUMBER_MASKS.values())
+        self.DECIMAL_MASKS = frozenset(self.CHAR_MASKS[c] for c in (',', '.')
+                                       if c in self.CHAR_MASKS)
+    
+    def _init_computer_braille(self):
+        """
+        Prepara el braille computerizado (tablas con mode 'computer', p. ej.
+        computer8): cada carácter se escribe con una sola celda, de 6 u 8
+        puntos, distinguiendo mayúsculas y sin indicadores.
+        
+        COMPUTER_TO_UNICODE y COMPUTER_FROM_UNICODE son mapeos para
+        str.translate en ambos sentidos.
+        """
+        self.COMPUTER = self.table.mode == 'computer'
+        base = self.BRAILLE_UNICODE_BASE
+        self.COMPUTER_TO_UNICODE = {}
+        self.COMPUTER_FROM_UNICODE = {}
+        if self.COMPUTER:
+            for char, mask in self.CHAR_MASKS.items():
+                self.COMPUTER_TO_UNICODE[ord(char)] = chr(base + mask)
+                self.COMPUTER_FROM_UNICODE.setdefault(base + mask, char)
+    
+    def _init_inverse_maps(self):
+        """
+        Mapeos inversos para braille_to_text: puntos -> carácter (letras,
+        vocales acentuadas, ñ, ü y puntuación) y puntos -> dígito.
+        """
+        # Crear mapeo inverso completo (letras, vocales acentuadas, ñ, ü)
+        inverse_map = {}
+        for char, dots in {**self.ALPHABET, **self.SPECIAL_CHARS}.items():
+            inverse_map[dots] = char
+        
+        # Agregar puntuación
+        for char, dots in self.PUNCTUATION.items():
+            if dots not in inverse_map:  # No sobrescribir si ya existe
+                inverse_map[dots] = char
+        
+        self.INVERSE_MAP = MappingProxyType(inverse_map)
+        self.INVERSE_NUMBERS = MappingProxyType(
+            {dots: num for num, dots in self.NUMBERS.items()}
+        )
+        self._client_table = None
+    
+    def client_table(self) -> Dict:
+        """
+        Tabla compilada para el motor de conversión del navegador
+        (frontend/js/braille_engine.js).
+        
+        Contiene las mismas estructuras que usa este conversor, con las
+        máscaras como enteros, de modo que el navegador produce la misma
+        salida que text_to_braille, get_dots_info y braille_to_text (sin
+        modo contraído). 'version' es un hash del contenido, usado como
+        ETag y en la URL versionada.
+        
+        Returns:
+            Diccionario serializable a JSON (se calcula una sola vez)
+        """
+        if self._client_table is not None:
+            return self._client_table
+        
+        if self.COMPUTER:
+            text_from_mask = {
+                code - self.BRAILLE_UNICODE_BASE: char
+                for code, char in self.COMPUTER_FROM_UNICODE.items()
+            }
+        else:
+            text_from_mask = {dots_to_mask(dots): char for dots, char in self.INVERSE_MAP.items()}
+        
+        exported = {
+            'format': CLIENT_TABLE_FORMAT,
+            'name': self.table.name,
+            'description': self.table.description,
+            'dots': self.table.dots,
+            'mode': self.table.mode,
+            'capital_mask': self.CAPITAL_MASK,
+            'number_sign_mask': self.NUMBER_SIGN_MASK,
+            'char_masks': dict(self.CHAR_MASKS),
+            'number_masks': dict(self.NUMBER_MASKS),
+            'letters': ''.join(self.ALPHABET),
+            'punctuation': ''.join(self.PUNCTUATION),
+            'decimal_masks': sorted(self.DECIMAL_MASKS),
+            'text_from_mask': {str(mask): char for mask, char in sorted(text_from_mask.items())},
+            'digit_from_mask': {str(dots_to_mask(dots)): num
+                                for dots, num in self.INVERSE_NUMBERS.items()},
+            'supported': ''.join(sorted(self.SUPPORTED_CHARS)),
+        }
+        serialized = json.dumps(exported, sort_keys=True, ensure_ascii=True)
+        exported['version'] = hashlib.sha1(serialized.encode('ascii')).hexdigest()[:16]
+        self._client_table = exported
+        return exported
+    
+    def _contraction_table(self):
+        """
+        Tabla de contracciones para el modo contraído.
+        
+        Raises:
+            ValueError: Si la tabla de traducción no tiene modo contraído
+        """
+        if self.CONTRACTIONS is None:
+            raise ValueError(f"La tabla '{self.table.name}' no tiene modo contraído")
+        return self.CONTRACTIONS
+    
     def dots_to_unicode(self, dots: Tuple[int, ...]) -> str:
         """
         Convierte una tupla de puntos a su representación Unicode Braille.
@@ -228,13 +299,17 @@ class BrailleConverter:
         
         return tuple(sorted(dots))
     
-    def text_to_braille(self, text: str, output_format: str = 'unicode') -> str:
+    @timed('converter.text_to_braille')
+    @profiled('converter.text_to_braille')
+    def text_to_braille(self, text: str, output_format: str = 'unicode',
+                        contracted: bool = False) -> str:
         """
         Convierte texto español a Braille.
         
         Args:
             text: Texto en español a convertir
             output_format: Formato de salida ('unicode', 'dots', 'description')
+            contracted: Usar el modo contraído (estenografía)
             
         Returns:
             Texto convertido a Braille según el formato especificado
@@ -248,6 +323,12 @@ class BrailleConverter:
         if not text:
             return ""
         
+        if contracted:
+            return self._format_units(self._contracted_units(text), output_format)
+        
+        if self.COMPUTER:
+            return self._computer_to_braille(text, output_format)
+        
         result = []
         in_number_mode = False
         
@@ -316,26 +397,258 @@ class BrailleConverter:
         
         return ''.join(result) if output_format == 'unicode' else ' '.join(result)
     
-    def text_to_braille_dots(self, text: str) -> list:
+    @timed('converter.text_to_braille_dots')
+    def text_to_braille_dots(self, text: str, compact: bool = False,
+                             contracted: bool = False):
         """
         Convierte texto español a una lista de tuplas de puntos Braille.
         Útil para renderizado visual o generación de PDFs.
         
         Args:
             text: Texto en español a convertir
+            compact: Devolver BrailleCells (un byte por celda con la
+                máscara de puntos) en lugar de una lista de tuplas
+            contracted: Usar el modo contraído (estenografía)
             
         Returns:
-            Lista de tuplas de puntos, cada tupla representa un carácter Braille
+            Lista de tuplas de puntos, cada tupla representa un carácter
+            Braille (o BrailleCells si compact=True)
             
         Ejemplo:
             >>> text_to_braille_dots("Hola")
             [(4,6), (1,2,5), (), (1,3,5), (1,), (1,)]
+            >>> text_to_braille_dots("Hola", compact=True).tobytes()
+            b'(\\x13\\x15\\x07\\x01'
         """
-        if not text:
-            return []
+        if contracted:
+            masks = b''.join(masks for _, masks in self._contracted_units(text))
+        else:
+            masks = self._text_to_masks(text)
+        cells = BrailleCells(masks)
+        return cells if compact else cells.to_list()
+    
+    def _text_to_masks(self, text: str) -> bytearray:
+        """
+        Convierte texto español a las máscaras de bits de sus celdas.
+        
+        Aplica las mismas reglas que text_to_braille (mayúsculas, signo
+        de número, separadores decimales).
+        
+        Args:
+            text: Texto en español
+            
+        Returns:
+            Un byte por celda con la máscara de puntos
+        """
+        if self.COMPUTER:
+            get = self.CHAR_MASKS.get
+            return bytearray([get(char, 0) for char in text])
+        
+        result = bytearray()
+        append = result.append
+        char_masks = self.CHAR_MASKS
+        number_masks = self.NUMBER_MASKS
+        capital_mask = self.CAPITAL_MASK
+        number_sign_mask = self.NUMBER_SIGN_MASK
+        length = len(text)
+        in_number_mode = False
+        
+        for i, char in enumerate(text):
+            # Detectar letra mayúscula - agregar indicador antes de cada una
+            if char.isupper() and char.isalpha():
+                append(capital_mask)
+            
+            # Detectar números
+            if char.isdigit():
+                if not in_number_mode:
+                    # Añadir signo de número al inicio
+                    append(number_sign_mask)
+                    in_number_mode = True
+                append(number_masks.get(char, 0))
+            
+            # Espacio termina modo número
+            elif char == ' ':
+                in_number_mode = False
+                append(0)
+            
+            # TANTO la coma COMO el punto mantienen el modo numérico si hay dígitos después
+            elif char in (',', '.') and in_number_mode:
+                if not (i + 1 < length and text[i + 1].isdigit()):
+                    in_number_mode = False
+                append(char_masks[char])
+            
+            else:
+                # Cualquier otro carácter termina modo numérico; los no
+                # soportados se representan como espacio
+                in_number_mode = False
+                append(char_masks.get(char.lower(), 0))
+        
+        return result
+    
+    def _computer_to_braille(self, text: str, output_format: str) -> str:
+        """
+        Convierte texto con una tabla de braille computerizado (una celda
+        por carácter; los no soportados se representan como espacio).
+        """
+        if output_format == 'unicode':
+            blank = chr(self.BRAILLE_UNICODE_BASE)
+            to_unicode = self.COMPUTER_TO_UNICODE
+            if self.SUPPORTED_CHARS.issuperset(text):
+                return text.translate(to_unicode)
+            return ''.join(to_unicode.get(ord(char), blank) for char in text)
+        
+        masks = self._text_to_masks(text)
+        if output_format == 'dots':
+            return ' '.join(str(MASK_TO_DOTS[mask]) for mask in masks)
+        return ' '.join(f"{char}={MASK_TO_DOTS[mask]}" for char, mask in zip(text, masks))
+    
+    def _contracted_units(self, text: str) -> List[Tuple[str, bytes]]:
+        """
+        Convierte texto en modo contraído a unidades (etiqueta, máscaras).
+        
+        En cada letra se busca la contracción más larga; el resto de
+        caracteres sigue las reglas del braille integral (mayúsculas,
+        signo de número, separadores decimales). La etiqueta es el texto
+        de origen, o [MAY] / [NUM] para los indicadores.
+        
+        Args:
+            text: Texto en español
+            
+        Returns:
+            Lista de unidades en orden
+        """
+        table = self._contraction_table()
+        units = []
+        append = units.append
+        char_masks = self.CHAR_MASKS
+        number_masks = self.NUMBER_MASKS
+        capital = bytes((self.CAPITAL_MASK,))
+        number_sign = bytes((self.NUMBER_SIGN_MASK,))
+        length = len(text)
+        in_number_mode = False
+        
+        i = 0
+        while i < length:
+            char = text[i]
+            
+            if char.isalpha():
+                rule = table.match_text(text, i)
+                if rule is not None:
+                    in_number_mode = False
+                    if char.isupper():
+                        append(('[MAY]', capital))
+                    end = i + len(rule.text)
+                    append((text[i:end], rule.masks))
+                    i = end
+                    continue
+                if char.isupper():
+                    append(('[MAY]', capital))
+            
+            if char.isdigit():
+                if not in_number_mode:
+                    append(('[NUM]', number_sign))
+                    in_number_mode = True
+                append((char, bytes((number_masks.get(char, 0),))))
+            elif char == ' ':
+                in_number_mode = False
+                append((char, b'\x00'))
+            elif char in (',', '.') and in_number_mode:
+                if not (i + 1 < length and text[i + 1].isdigit()):
+                    in_number_mode = False
+                append((char, bytes((char_masks[char],))))
+            else:
+                in_number_mode = False
+                append((char, bytes((char_masks.get(char.lower(), 0),))))
+            i += 1
+        
+        return units
+    
+    def _format_units(self, units: List[Tuple[str, bytes]], output_format: str) -> str:
+        """Da formato de salida de text_to_braille a unidades de celdas."""
+        base = self.BRAILLE_UNICODE_BASE
+        if output_format == 'unicode':
+            return ''.join(chr(base + mask) for _, masks in units for mask in masks)
+        if output_format == 'dots':
+            return ' '.join(str(MASK_TO_DOTS[mask]) for _, masks in units for mask in masks)
+        
+        result = []
+        for label, masks in units:
+            if label in ('[MAY]', '[NUM]'):
+                result.append(label)
+            else:
+                result.append(f"{label}=" + '+'.join(str(MASK_TO_DOTS[m]) for m in masks))
+        return ' '.join(result)
+    
+    def _expand_contractions(self, braille: str) -> str:
+        """
+        Sustituye las contracciones de un texto Braille por las celdas de
+        su texto en braille integral (para retrotraducir).
+        
+        Las contracciones de palabra solo se expanden si la celda está
+        aislada; dentro de un número no se expande nada.
+        """
+        base = self.BRAILLE_UNICODE_BASE
+        table = self._contraction_table()
+        cells = [ord(c) - base if base <= ord(c) < base + 256 else -1 for c in braille]
+        word_masks = self.WORD_MASKS
+        capital = self.CAPITAL_MASK
+        number_sign = self.NUMBER_SIGN_MASK
+        length = len(cells)
+        
+        def isolated(start: int, end: int) -> bool:
+            before = start - 1
+            while before >= 0 and cells[before] == capital:
+                before -= 1
+            if before >= 0 and cells[before] in word_masks:
+                return False
+            return end == length or (cells[end] not in word_masks
+                                     and cells[end] != number_sign)
         
         result = []
         in_number_mode = False
+        i = 0
+        while i < length:
+            mask = cells[i]
+            if mask == number_sign:
+                in_number_mode = True
+            elif in_number_mode and (mask in self.DIGIT_MASKS or mask in self.DECIMAL_MASKS):
+                pass
+            else:
+                in_number_mode = False
+                rule = table.match_cells(cells, i) if mask > 0 else None
+                if rule is not None and (not rule.word or isolated(i, i + len(rule.masks))):
+                    result.extend(chr(base + self.CHAR_MASKS[c]) for c in rule.text)
+                    i += len(rule.masks)
+                    continue
+            result.append(braille[i])
+            i += 1
+        
+        return ''.join(result)
+    
+    @timed('converter.get_dots_info')
+    def get_dots_info(self, text: str) -> List[Dict]:
+        """
+        Obtiene la información de puntos de cada celda para visualización.
+        
+        Args:
+            text: Texto en español
+            
+        Returns:
+            Lista de diccionarios con 'char', 'dots' y 'type' por celda
+            (capital_sign, number_sign, number, space, punctuation,
+            letter, special, unknown)
+            
+        Ejemplo:
+            >>> get_dots_info("a1")
+            [{'char': 'a', 'dots': [1], 'type': 'letter'},
+             {'char': '#', 'dots': [3, 4, 5, 6], 'type': 'number_sign'},
+             {'char': '1', 'dots': [1], 'type': 'number'}]
+        """
+        if self.COMPUTER:
+            return self._computer_dots_info(text)
+        
+        dots_info = []
+        in_number_mode = False
         
         i = 0
         while i < len(text):
@@ -344,53 +657,97 @@ class BrailleConverter:
             
             # Detectar letra mayúscula - agregar indicador antes de cada una
             if char.isupper() and char.isalpha():
-                # Agregar indicador de mayúscula antes de la letra
-                result.append(self.CAPITAL_SIGN)
+                dots_info.append({
+                    'char': '⠨',
+                    'dots': list(self.CAPITAL_SIGN),
+                    'type': 'capital_sign'
+                })
             
-            # Detectar números
             if char.isdigit():
                 if not in_number_mode:
-                    # Añadir signo de número al inicio
-                    result.append(self.NUMBER_SIGN)
+                    # Agregar indicador numérico
+                    dots_info.append({
+                        'char': '#',
+                        'dots': list(self.NUMBER_SIGN),
+                        'type': 'number_sign'
+                    })
                     in_number_mode = True
-                
                 dots = self.NUMBERS.get(char, tuple())
-                
-            # Espacio termina modo número
+                dots_info.append({
+                    'char': char,
+                    'dots': list(dots),
+                    'type': 'number'
+                })
             elif char == ' ':
                 in_number_mode = False
-                dots = tuple()
-                
-            # Letras y caracteres especiales
+                dots_info.append({
+                    'char': ' ',
+                    'dots': [],
+                    'type': 'space'
+                })
             else:
-                # TANTO la coma COMO el punto mantienen el modo numérico si hay dígitos después
-                if char in (',', '.') and in_number_mode:
-                    if i + 1 < len(text) and text[i + 1].isdigit():
-                        dots = self.PUNCTUATION.get(char, tuple())
-                    else:
-                        in_number_mode = False
-                        dots = self.PUNCTUATION.get(char, tuple())
+                # Tanto coma como punto mantienen el modo numérico si hay dígitos después
+                if char in (',', '.') and in_number_mode and i + 1 < len(text) and text[i + 1].isdigit():
+                    dots = self.PUNCTUATION.get(char, tuple())
+                    dots_info.append({
+                        'char': char,
+                        'dots': list(dots),
+                        'type': 'punctuation'
+                    })
                 else:
-                    # Cualquier otro carácter termina modo numérico
                     in_number_mode = False
-                    # Buscar en abecedario y caracteres especiales (usar minúscula)
                     dots = self.ALPHABET.get(char_lower) or self.SPECIAL_CHARS.get(char_lower)
-                    
-                    if dots is None:
-                        # Carácter no soportado, usar espacio
-                        dots = tuple()
-            
-            result.append(dots)
+                    if dots:
+                        char_type = 'letter' if char_lower in self.ALPHABET else 'special'
+                        dots_info.append({
+                            'char': char_lower,
+                            'dots': list(dots),
+                            'type': char_type
+                        })
+                    else:
+                        dots_info.append({
+                            'char': char,
+                            'dots': [],
+                            'type': 'unknown'
+                        })
             i += 1
         
-        return result
+        return dots_info
     
-    def braille_to_text(self, braille: str) -> str:
+    def _computer_dots_info(self, text: str) -> List[Dict]:
+        """get_dots_info para tablas de braille computerizado (sin indicadores)."""
+        dots_info = []
+        char_masks = self.CHAR_MASKS
+        for char in text:
+            mask = char_masks.get(char)
+            if char == ' ':
+                char_type = 'space'
+            elif mask is None:
+                char_type = 'unknown'
+            elif char in self.NUMBER_MASKS:
+                char_type = 'number'
+            elif char in self.PUNCTUATION:
+                char_type = 'punctuation'
+            elif char in self.ALPHABET:
+                char_type = 'letter'
+            else:
+                char_type = 'special'
+            dots_info.append({
+                'char': char,
+                'dots': list(MASK_TO_DOTS[mask or 0]),
+                'type': char_type
+            })
+        return dots_info
+    
+    @timed('converter.braille_to_text')
+    @profiled('converter.braille_to_text')
+    def braille_to_text(self, braille: str, contracted: bool = False) -> str:
         """
         Convierte Braille Unicode a texto español.
         
         Args:
             braille: Texto en Braille Unicode
+            contracted: El Braille está en modo contraído (estenografía)
             
         Returns:
             Texto en español
@@ -402,18 +759,20 @@ class BrailleConverter:
         if not braille:
             return ""
         
-        # Crear mapeo inverso completo (letras, vocales acentuadas, ñ, ü)
-        inverse_map = {}
-        for char, dots in {**self.ALPHABET, **self.SPECIAL_CHARS}.items():
-            inverse_map[dots] = char
+        if contracted:
+            braille = self._expand_contractions(braille)
         
-        # Agregar puntuación
-        for char, dots in self.PUNCTUATION.items():
-            if dots not in inverse_map:  # No sobrescribir si ya existe
-                inverse_map[dots] = char
+        if self.COMPUTER:
+            # Una celda por carácter; las celdas desconocidas se leen como '?'
+            from_unicode = self.COMPUTER_FROM_UNICODE
+            base = self.BRAILLE_UNICODE_BASE
+            return ''.join(
+                from_unicode.get(ord(c), ' ' if ord(c) == base else '?') for c in braille
+            )
         
-        # Mapeo inverso de números
-        inverse_numbers = {dots: num for num, dots in self.NUMBERS.items()}
+        # Mapeos inversos precalculados (ver _init_inverse_maps)
+        inverse_map = self.INVERSE_MAP
+        inverse_numbers = self.INVERSE_NUMBERS
         
         result = []
         in_number_mode = False
@@ -489,7 +848,7 @@ class BrailleConverter:
         
         return ''.join(result)
     
-    def get_braille_info(self, char: str) -> Optional[Dict]:
+    def get_braille_info(self, char: str) -> Optional[Mapping]:
         """
         Obtiene información detallada sobre un carácter en Braille.
         
@@ -497,74 +856,164 @@ class BrailleConverter:
             char: Carácter a consultar
             
         Returns:
-            Diccionario con información del carácter
-        """
-        char = char.lower()
-        
-        # Buscar en todos los mapeos
-        dots = None
-        char_type = None
-        
-        if char in self.ALPHABET:
-            dots = self.ALPHABET[char]
-            if char in self.SERIE_1:
-                char_type = "Serie 1 (a-j)"
-            elif char in self.SERIE_2:
-                char_type = "Serie 2 (k-t)"
-            elif char in self.SERIE_3:
-                char_type = "Serie 3 (u-z)"
-            else:
-                char_type = "Letra extra"
-        elif char in self.SPECIAL_CHARS:
-            dots = self.SPECIAL_CHARS[char]
-            if char in self.ACCENTED_VOWELS:
-                char_type = "Vocal acentuada"
-            elif char in self.SPANISH_SPECIAL:
-                char_type = "Carácter especial español"
-            else:
-                char_type = "Signo de puntuación"
-        elif char.isdigit():
-            dots = self.NUMBERS[char]
-            char_type = "Número"
-        
-        if dots is None:
-            return None
-        
-        return {
-            'character': char,
-            'type': char_type,
-            'dots': dots,
-            'unicode': self.dots_to_unicode(dots),
-            'description': f"Puntos: {', '.join(map(str, dots))}"
-        }
+            Información del carácter (de solo lectura, del catálogo
+            precalculado) o None si no está soportado
+        """
+        return self.INFO_CATALOG.get(char if self.COMPUTER else char.lower())
+    
+    def get_braille_info_bulk(self, chars: Iterable[str]) -> Dict[str, Optional[Mapping]]:
+        """
+        Obtiene la información de varios caracteres en una sola llamada.
+        
+        Args:
+            chars: Caracteres a consultar (p. ej. "abc" o ["a", "ñ"])
+            
+        Returns:
+            Diccionario carácter -> información (None si no está soportado),
+            sin repetidos y en el orden de la entrada
+        """
+        catalog = self.INFO_CATALOG
+        if self.COMPUTER:
+            return {char: catalog.get(char) for char in chars}
+        return {char: catalog.get(char.lower()) for char in chars}
+    
+    def _unsupported_parts(self, char: str) -> Tuple[str, ...]:
+        """
+        Clasifica un carácter que no está en SUPPORTED_CHARS.
+        
+        Args:
+            char: Carácter del texto original
+            
+        Returns:
+            Partes no soportadas de su minúscula (vacío si es soportado,
+            p. ej. un dígito Unicode)
+        """
+        if self.COMPUTER:
+            return (char,)
+        return tuple(c for c in char.lower()
+                     if not c.isdigit() and c not in self.SUPPORTED_CHARS)
+    
+    def find_unsupported(self, text: str, max_failures: Optional[int] = None) -> Dict:
+        """
+        Localiza en una sola pasada los caracteres no soportados.
+        
+        Args:
+            text: Texto a validar
+            max_failures: Detener la búsqueda tras este número de
+                apariciones no soportadas (None: recorrer todo el texto)
+            
+        Returns:
+            Diccionario con 'is_valid', 'failures', 'truncated' y
+            'unsupported': lista (en orden de aparición) con 'char',
+            'code', 'count' y 'positions' (índices en el texto original)
+            
+        Ejemplo:
+            >>> find_unsupported("a@b@")
+            {'is_valid': False, 'failures': 2, 'truncated': False,
+             'unsupported': [{'char': '@', 'code': 'U+0040', 'count': 2,
+                              'positions': [1, 3]}]}
+        """
+        supported = self.SUPPORTED_CHARS
+        result = {'is_valid': True, 'failures': 0, 'truncated': False, 'unsupported': []}
+        
+        # Camino rápido: todos los caracteres están en la tabla
+        if supported.issuperset(text):
+            return result
+        
+        found = {}
+        classified = {}
+        failures = 0
+        
+        for position, char in enumerate(text):
+            if char in supported:
+                continue
+            
+            parts = classified.get(char)
+            if parts is None:
+                parts = self._unsupported_parts(char)
+                classified[char] = parts
+            
+            for part in parts:
+                entry = found.get(part)
+                if entry is None:
+                    entry = {'char': part, 'code': f"U+{ord(part):04X}",
+                             'count': 0, 'positions': []}
+                    found[part] = entry
+                entry['count'] += 1
+                entry['positions'].append(position)
+            
+            if parts:
+                failures += 1
+                if max_failures is not None and failures >= max_failures:
+                    result['truncated'] = position < len(text) - 1
+                    break
+        
+        result['is_valid'] = not found
+        result['failures'] = failures
+        result['unsupported'] = list(found.values())
+        return result
     
-    def validate_text(self, text: str) -> Tuple[bool, List[str]]:
+    @timed('converter.validate_text')
+    def validate_text(self, text: str,
+                      max_failures: Optional[int] = None) -> Tuple[bool, List[str]]:
         """
         Valida si un texto puede ser convertido completamente a Braille.
         
         Args:
             text: Texto a validar
+            max_failures: Detener la búsqueda tras este número de
+                apariciones no soportadas (None: recorrer todo el texto)
             
         Returns:
             Tupla (es_válido, lista_de_caracteres_no_soportados)
         """
-        text = text.lower()
-        unsupported = []
+        if max_failures is not None:
+            details = self.find_unsupported(text, max_failures)
+            return (details['is_valid'], [entry['char'] for entry in details['unsupported']])
         
-        for char in text:
-            if char.isdigit():
-                continue
-            if char in self.ALPHABET or char in self.SPECIAL_CHARS:
-                continue
-            if char not in unsupported:
-                unsupported.append(char)
+        # Sin límite no hacen falta posiciones: basta con los caracteres
+        # distintos en orden de aparición (dict.fromkeys conserva el orden)
+        supported = self.SUPPORTED_CHARS
+        if supported.issuperset(text):
+            return (True, [])
+        
+        unsupported = {}
+        for char in dict.fromkeys(text):
+            if char not in supported:
+                for part in self._unsupported_parts(char):
+                    unsupported[part] = None
         
-        return (len(unsupported) == 0, unsupported)
+        return (len(unsupported) == 0, list(unsupported))
 
 
 # Instancia global para uso en toda la aplicación
 braille_converter = BrailleConverter()
 
+# Conversores por tabla de traducción (compartidos entre hilos)
+_converters = {DEFAULT_TABLE: braille_converter}
+_converters_lock = Lock()
+
+
+def get_converter(table: Optional[str] = None) -> BrailleConverter:
+    """
+    Devuelve el conversor compartido de una tabla de traducción.
+    
+    Args:
+        table: Nombre de la tabla (default: la tabla por defecto)
+        
+    Raises:
+        TableError: Si la tabla no existe o es inválida
+    """
+    name = check_table_name(table or DEFAULT_TABLE)
+    converter = _converters.get(name)
+    if converter is None:
+        with _converters_lock:
+            converter = _converters.get(name)
+            if converter is None:
+                converter = BrailleConverter(name)
+                _converters[name] = converter
+    return converter
+
 
 if __name__ == "__main__":
     # Pruebas rápidas
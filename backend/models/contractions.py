@@ -0,0 +1,156 @@
+"""
+Estenografía (Braille Contraído) - Sistema Braille
+==================================================
+Compilación de las contracciones del modo contraído en árboles de
+prefijos (tries) para buscar siempre la coincidencia más larga. Las
+reglas se definen en la tabla de traducción (sección "contractions" de
+tables/es.json).
+
+Tipos de regla:
+- Palabra ('word'): la palabra completa se escribe con una sola letra
+  (que -> q). Solo se aplica si la palabra está aislada (sin letras ni
+  dígitos alrededor).
+- Grupo ('group'): una secuencia de letras dentro de cualquier palabra
+  se escribe con una celda que el braille integral no usa (ción -> ⠩),
+  o con una celda prefijo seguida de una letra (mente -> ⠐⠍).
+
+Ambigüedad de las reglas de palabra: reutilizan la celda de una letra
+(que -> q, para -> p, como -> c...) y no se escribe signo de letra
+delante de las letras aisladas, así que al retrotraducir una letra
+aislada que coincide con una regla se obtiene la palabra ('p' -> ⠏ ->
+'para', 'J. P.' -> ... 'Para'). El modo contraído no es reversible para
+palabras de una letra ni iniciales: quien necesite el texto exacto debe
+conservar el original (el historial guarda original_text).
+
+La búsqueda recorre el trie desde cada posición, como mucho tantos
+pasos como la regla más larga, por lo que la conversión sigue siendo
+lineal en la longitud del texto.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+from types import MappingProxyType
+from typing import Dict, Optional, Sequence, Tuple
+from backend.models.braille_cells import dots_to_mask
+
+
+class ContractionRule:
+    """Regla compilada: texto, máscaras de sus celdas y tipo."""
+
+    __slots__ = ('text', 'masks', 'word')
+
+    def __init__(self, text: str, masks: bytes, word: bool):
+        self.text = text
+        self.masks = masks
+        self.word = word
+
+    def __repr__(self) -> str:
+        return f"ContractionRule({self.text!r}, {self.masks!r}, word={self.word})"
+
+
+def _build_trie(keys) -> Dict:
+    """
+    Construye un trie de diccionarios anidados; la regla de cada nodo
+    terminal se guarda en la clave None.
+    """
+    root = {}
+    for key, rule in keys:
+        node = root
+        for symbol in key:
+            node = node.setdefault(symbol, {})
+        node[None] = rule
+    return root
+
+
+class ContractionTable:
+    """
+    Tabla de contracciones compilada para ambos sentidos de conversión.
+
+    Es de solo lectura tras crearse, por lo que se comparte entre hilos.
+    """
+
+    def __init__(self, rules: Sequence[Tuple[str, Tuple[Tuple[int, ...], ...], str]]):
+        """
+        Args:
+            rules: Reglas (texto en minúsculas, celdas, 'word' o 'group')
+
+        Raises:
+            ValueError: Si una regla está repetida o su tipo no es válido
+        """
+        compiled = []
+        seen_text, seen_masks = set(), set()
+        for text, cells, kind in rules:
+            if kind not in ('word', 'group'):
+                raise ValueError(f"Tipo de contracción inválido: {kind}")
+            masks = bytes(dots_to_mask(dots) for dots in cells)
+            if text in seen_text or masks in seen_masks:
+                raise ValueError(f"Contracción repetida: {text}")
+            seen_text.add(text)
+            seen_masks.add(masks)
+            compiled.append(ContractionRule(text, masks, kind == 'word'))
+
+        self.rules = tuple(compiled)
+        self.text_trie = _build_trie((rule.text, rule) for rule in compiled)
+        self.cell_trie = _build_trie((rule.masks, rule) for rule in compiled)
+        self.group_masks = frozenset(
+            mask for rule in compiled if not rule.word for mask in rule.masks
+        )
+        self.by_text = MappingProxyType({rule.text: rule for rule in compiled})
+
+    def match_text(self, text: str, start: int) -> Optional[ContractionRule]:
+        """
+        Regla más larga que coincide con el texto en start.
+
+        Las reglas de palabra solo valen si la palabra está aislada. La
+        primera letra puede ser mayúscula; el resto debe ir en minúsculas.
+
+        Args:
+            text: Texto original
+            start: Posición de inicio
+
+        Returns:
+            La regla, o None si no hay coincidencia
+        """
+        node = self.text_trie
+        best = None
+        length = len(text)
+        i = start
+        while i < length:
+            char = text[i]
+            if i > start and not char.islower():
+                break
+            node = node.get(char.lower())
+            if node is None:
+                break
+            i += 1
+            rule = node.get(None)
+            if rule is not None and (not rule.word or self._isolated(text, start, i)):
+                best = rule
+        return best
+
+    @staticmethod
+    def _isolated(text: str, start: int, end: int) -> bool:
+        """Indica si text[start:end] no tiene letras ni dígitos alrededor."""
+        return ((start == 0 or not text[start - 1].isalnum())
+                and (end == len(text) or not text[end].isalnum()))
+
+    def match_cells(self, masks, start: int) -> Optional[ContractionRule]:
+        """
+        Regla más larga cuyas celdas empiezan en start (sin comprobar si
+        la palabra está aislada).
+
+        Args:
+            masks: Máscaras de las celdas
+            start: Posición de inicio
+        """
+        node = self.cell_trie
+        best = None
+        for i in range(start, len(masks)):
+            node = node.get(masks[i])
+            if node is None:
+                break
+            rule = node.get(None)
+            if rule is not None:
+                best = rule
+        return best
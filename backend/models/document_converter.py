@@ -0,0 +1,118 @@
+"""
+Conversión Paralela de Documentos - Sistema Braille
+===================================================
+Convierte documentos grandes a Braille repartiendo el texto entre
+varios procesos.
+
+El estado de text_to_braille entre caracteres es solo el modo numérico,
+y cualquier espacio en blanco lo termina (las mayúsculas se marcan letra
+a letra). Por eso el texto se puede partir justo después de un espacio
+o salto de línea en segmentos independientes: convertidos por separado y
+unidos, dan exactamente el mismo resultado que la conversión secuencial.
+
+Los procesos hijos usan la instancia global del conversor; con fork
+heredan sus tablas ya construidas (solo lectura, copy-on-write).
+
+Ejemplo:
+    braille = convert_document_parallel(texto_largo, workers=8)
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import os
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Optional
+from backend.utils.env import env_int
+from backend.utils.metrics import timed
+
+# Tamaño (caracteres) por debajo del cual se convierte en el proceso actual
+PARALLEL_THRESHOLD = env_int('BRAILLE_PARALLEL_THRESHOLD', 1_000_000)
+
+# Tamaño mínimo de segmento (caracteres)
+MIN_SEGMENT_SIZE = 256 * 1024
+
+# Segmentos por worker (reparte mejor la carga que uno por worker)
+SEGMENTS_PER_WORKER = 4
+
+_WHITESPACE = re.compile(r'\s')
+
+
+def split_segments(text: str, segment_size: int) -> List[str]:
+    """
+    Parte un texto en segmentos que terminan en un espacio en blanco.
+
+    Cada segmento tiene al menos segment_size caracteres (salvo el
+    último) y acaba justo después del primer espacio en blanco a partir
+    de ese tamaño. Un texto sin espacios queda en un único segmento.
+
+    Args:
+        text: Texto a partir
+        segment_size: Tamaño mínimo de cada segmento
+
+    Returns:
+        Lista de segmentos cuya concatenación es el texto original
+    """
+    segments = []
+    start = 0
+    length = len(text)
+    while start < length:
+        match = _WHITESPACE.search(text, start + max(segment_size, 1) - 1)
+        end = match.end() if match else length
+        segments.append(text[start:end])
+        start = end
+    return segments
+
+
+def _convert_segment(task):
+    """Convierte un segmento en un proceso hijo."""
+    from backend.models.braille_converter import braille_converter
+
+    segment, output_format = task
+    return braille_converter.text_to_braille(segment, output_format)
+
+
+@timed('converter.convert_document_parallel')
+def convert_document_parallel(text: str, output_format: str = 'unicode',
+                              workers: Optional[int] = None,
+                              threshold: Optional[int] = None,
+                              executor: Optional[Executor] = None) -> str:
+    """
+    Convierte un documento a Braille usando varios procesos.
+
+    El resultado es idéntico al de braille_converter.text_to_braille.
+
+    Args:
+        text: Texto en español a convertir
+        output_format: Formato de salida ('unicode', 'dots', 'description')
+        workers: Procesos a usar (default: número de CPUs)
+        threshold: Tamaño mínimo para paralelizar (default: PARALLEL_THRESHOLD)
+        executor: Pool de procesos existente (se reutiliza y no se cierra)
+
+    Returns:
+        Texto convertido a Braille
+    """
+    from backend.models.braille_converter import braille_converter
+
+    workers = workers or os.cpu_count() or 1
+    threshold = PARALLEL_THRESHOLD if threshold is None else threshold
+
+    if len(text) < threshold or (workers < 2 and executor is None):
+        return braille_converter.text_to_braille(text, output_format)
+
+    segment_size = max(MIN_SEGMENT_SIZE, len(text) // (workers * SEGMENTS_PER_WORKER))
+    segments = split_segments(text, segment_size)
+    if len(segments) < 2:
+        return braille_converter.text_to_braille(text, output_format)
+
+    tasks = [(segment, output_format) for segment in segments]
+    if executor is not None:
+        outputs = list(executor.map(_convert_segment, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(segments))) as pool:
+            outputs = list(pool.map(_convert_segment, tasks))
+
+    # Los formatos 'dots' y 'description' separan las celdas con espacios
+    separator = '' if output_format == 'unicode' else ' '
+    return separator.join(outputs)
@@ -0,0 +1,314 @@
+"""
+Conversión Incremental - Sistema Braille
+========================================
+Mantiene documentos convertidos a Braille y aplica ediciones (posición,
+caracteres borrados, texto insertado) reconvirtiendo solo la zona
+afectada, para la edición en vivo de documentos largos.
+
+El estado del conversor entre caracteres (modo numérico, palabras
+aisladas del modo contraído) se reinicia en cada espacio en blanco (ver
+document_converter). Por eso el documento se guarda en bloques que
+terminan en un espacio en blanco, con sus celdas:
+
+- Una edición reconvierte solo los bloques que toca: desde el inicio de
+  su bloque (el límite seguro anterior al último espacio antes de la
+  edición) hasta el final del bloque, donde el estado se resincroniza.
+  Si la edición borra el espacio final, se añade el bloque siguiente.
+- El resultado se compara con las celdas anteriores y solo se devuelve
+  el rango de celdas que cambió.
+
+Las posiciones de las ediciones son índices de caracteres (puntos de
+código Unicode) del texto completo.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import time
+import uuid
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, List, NamedTuple, Optional, Tuple
+from backend.models.braille_cells import masks_to_unicode
+from backend.models.document_converter import split_segments
+from backend.utils.env import env_int
+
+# Tamaño objetivo de los bloques (caracteres)
+BLOCK_SIZE = env_int('BRAILLE_INCREMENTAL_BLOCK_SIZE', 256)
+
+# Documentos en memoria por proceso y segundos sin uso antes de descartarlos
+MAX_DOCUMENTS = env_int('BRAILLE_INCREMENTAL_MAX_DOCUMENTS', 1000)
+DOCUMENT_TTL = env_int('BRAILLE_INCREMENTAL_TTL', 3600)
+
+
+class EditError(ValueError):
+    """Edición fuera de los límites del documento."""
+
+
+class VersionConflict(Exception):
+    """La versión base de una edición no es la actual del documento."""
+
+    def __init__(self, expected: int, current: int):
+        super().__init__(f"Versión base {expected} no coincide con la actual {current}")
+        self.expected = expected
+        self.current = current
+
+
+class CellDiff(NamedTuple):
+    """Cambio en las celdas: en start se sustituyen deleted celdas por masks."""
+    start: int
+    deleted: int
+    masks: bytes
+
+    def to_dict(self) -> dict:
+        """Representación JSON (celdas en Braille Unicode)."""
+        return {'start': self.start, 'deleted': self.deleted,
+                'braille': masks_to_unicode(self.masks)}
+
+
+class IncrementalDocument:
+    """
+    Documento convertido a Braille que admite ediciones incrementales.
+
+    No es seguro entre hilos por sí solo: el llamador debe serializar las
+    ediciones (lock).
+    """
+
+    def __init__(self, text: str, converter, contracted: bool = False,
+                 block_size: int = BLOCK_SIZE):
+        """
+        Args:
+            text: Texto inicial
+            converter: Conversor (BrailleConverter) de la tabla elegida
+            contracted: Usar el modo contraído
+            block_size: Tamaño objetivo de los bloques
+        """
+        self.converter = converter
+        self.contracted = contracted
+        self.block_size = block_size
+        self.version = 0
+        self.lock = Lock()
+        self.touched = time.monotonic()
+        self._texts: List[str] = []
+        self._masks: List[bytes] = []
+        self._length = 0
+        self._cells = 0
+        self._replace_blocks(0, 0, text)
+
+    # === CONSULTA ===
+
+    @property
+    def text(self) -> str:
+        """Texto completo."""
+        return ''.join(self._texts)
+
+    @property
+    def masks(self) -> bytes:
+        """Máscaras de todas las celdas."""
+        return b''.join(self._masks)
+
+    @property
+    def braille(self) -> str:
+        """Braille Unicode del documento completo."""
+        return masks_to_unicode(self.masks)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def cell_count(self) -> int:
+        """Número de celdas."""
+        return self._cells
+
+    @property
+    def block_count(self) -> int:
+        """Número de bloques."""
+        return len(self._texts)
+
+    # === EDICIÓN ===
+
+    def _convert(self, text: str) -> bytes:
+        """Máscaras de un bloque."""
+        return self.converter.text_to_braille_dots(
+            text, compact=True, contracted=self.contracted
+        ).tobytes()
+
+    def _replace_blocks(self, first: int, last: int, text: str) -> bytes:
+        """
+        Sustituye los bloques [first, last) por el texto dado, partido en
+        bloques nuevos. Devuelve las máscaras nuevas.
+        """
+        texts = split_segments(text, self.block_size)
+        masks = [self._convert(segment) for segment in texts]
+        old_length = sum(len(t) for t in self._texts[first:last])
+        old_cells = sum(len(m) for m in self._masks[first:last])
+        self._texts[first:last] = texts
+        self._masks[first:last] = masks
+        self._length += len(text) - old_length
+        new_masks = b''.join(masks)
+        self._cells += len(new_masks) - old_cells
+        return new_masks
+
+    def _locate(self, offset: int) -> Tuple[int, int, int]:
+        """
+        Bloque que contiene la posición offset (el último si es el final).
+
+        Returns:
+            Tupla (índice del bloque, carácter inicial, celda inicial)
+        """
+        char_start = cell_start = 0
+        last = len(self._texts) - 1
+        for index, block in enumerate(self._texts):
+            if offset < char_start + len(block) or index == last:
+                return index, char_start, cell_start
+            char_start += len(block)
+            cell_start += len(self._masks[index])
+        return 0, 0, 0
+
+    @staticmethod
+    def check_edit(offset: int, deleted: int, inserted: str, length: int) -> int:
+        """
+        Valida una edición sobre un texto de la longitud dada.
+
+        Returns:
+            Longitud del texto tras la edición
+
+        Raises:
+            EditError: Si los tipos no son válidos o la edición está fuera
+                del texto
+        """
+        if (isinstance(offset, bool) or not isinstance(offset, int)
+                or isinstance(deleted, bool) or not isinstance(deleted, int)
+                or not isinstance(inserted, str)):
+            raise EditError("La edición necesita offset y deleted enteros e inserted texto")
+        if offset < 0 or deleted < 0 or offset + deleted > length:
+            raise EditError(f"Edición fuera del documento (longitud {length})")
+        return length - deleted + len(inserted)
+
+    def apply_edit(self, offset: int, deleted: int, inserted: str,
+                   base_version: Optional[int] = None) -> CellDiff:
+        """
+        Aplica una edición y devuelve el cambio en las celdas.
+
+        Args:
+            offset: Posición (carácter) donde empieza la edición
+            deleted: Caracteres borrados a partir de offset
+            inserted: Texto insertado en offset
+            base_version: Versión sobre la que se hizo la edición (None:
+                no comprobar)
+
+        Returns:
+            Rango mínimo de celdas que cambió
+
+        Raises:
+            VersionConflict: Si base_version no es la versión actual
+            EditError: Si la edición está fuera del documento
+        """
+        if base_version is not None and base_version != self.version:
+            raise VersionConflict(base_version, self.version)
+        self.check_edit(offset, deleted, inserted, self._length)
+
+        self.touched = time.monotonic()
+        if not self._texts:
+            # Documento vacío
+            new_masks = self._replace_blocks(0, 0, inserted)
+            self.version += 1
+            return CellDiff(0, 0, new_masks)
+
+        first, char_start, cell_start = self._locate(offset)
+        last = self._locate(offset + deleted - 1)[0] if deleted else first
+
+        merged = ''.join(self._texts[first:last + 1])
+        local = offset - char_start
+        text = merged[:local] + inserted + merged[local + deleted:]
+        last += 1
+
+        # El bloque debe terminar en un espacio en blanco (o en el final
+        # del documento) para que el estado se resincronice
+        while last < len(self._texts) and (not text or not text[-1].isspace()):
+            text += self._texts[last]
+            last += 1
+
+        old_masks = b''.join(self._masks[first:last])
+        new_masks = self._replace_blocks(first, last, text)
+        self.version += 1
+
+        # Recortar el prefijo y el sufijo comunes
+        limit = min(len(old_masks), len(new_masks))
+        prefix = 0
+        while prefix < limit and old_masks[prefix] == new_masks[prefix]:
+            prefix += 1
+        suffix = 0
+        while (suffix < limit - prefix
+               and old_masks[-1 - suffix] == new_masks[-1 - suffix]):
+            suffix += 1
+
+        return CellDiff(cell_start + prefix, len(old_masks) - prefix - suffix,
+                        new_masks[prefix:len(new_masks) - suffix])
+
+
+class DocumentStore:
+    """
+    Documentos incrementales en memoria, por identificador (LRU con
+    caducidad). Los documentos son de este proceso: con varios workers,
+    el cliente debe volver al mismo o recrear el documento.
+    """
+
+    def __init__(self, max_documents: int = MAX_DOCUMENTS, ttl: float = DOCUMENT_TTL,
+                 factory: Callable[..., IncrementalDocument] = IncrementalDocument):
+        """
+        Args:
+            max_documents: Documentos como máximo (se descartan los menos
+                usados recientemente)
+            ttl: Segundos sin uso tras los que un documento caduca
+            factory: Clase de los documentos (IncrementalDocument o una
+                subclase)
+        """
+        self.max_documents = max_documents
+        self.ttl = ttl
+        self.factory = factory
+        self._documents = OrderedDict()
+        self._lock = Lock()
+
+    def create(self, text: str, converter, contracted: bool = False) -> Tuple[str, IncrementalDocument]:
+        """
+        Crea un documento.
+
+        Returns:
+            Tupla (identificador, documento)
+        """
+        document = self.factory(text, converter, contracted)
+        document_id = uuid.uuid4().hex
+        with self._lock:
+            self._documents[document_id] = document
+            self._expire()
+        return document_id, document
+
+    def get(self, document_id: str) -> Optional[IncrementalDocument]:
+        """Documento por identificador (None si no existe o caducó)."""
+        with self._lock:
+            document = self._documents.get(document_id)
+            if document is None:
+                return None
+            if time.monotonic() - document.touched > self.ttl:
+                del self._documents[document_id]
+                return None
+            self._documents.move_to_end(document_id)
+            return document
+
+    def discard(self, document_id: str) -> Optional[IncrementalDocument]:
+        """Elimina un documento. Devuelve el documento (None si no existía)."""
+        with self._lock:
+            return self._documents.pop(document_id, None)
+
+    def _expire(self):
+        """Descarta los documentos caducados y los que exceden el máximo."""
+        now = time.monotonic()
+        for document_id in [key for key, document in self._documents.items()
+                            if now - document.touched > self.ttl]:
+            del self._documents[document_id]
+        while len(self._documents) > self.max_documents:
+            self._documents.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._documents)
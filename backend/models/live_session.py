@@ -0,0 +1,200 @@
+"""
+Sesiones de Conversión en Vivo - Sistema Braille
+================================================
+Sesión de edición con estado en el servidor: el texto actual y sus
+celdas (un IncrementalDocument), los eventos enviados a los clientes
+conectados por server-sent events y el tiempo de conversión acumulado.
+
+Cada edición aplicada genera un evento 'diff' con el rango de celdas
+cambiado; confirmar la sesión (commit) genera un evento 'commit' y el
+historial recibe una sola fila por sesión en lugar de una por tecla.
+La confirmación va en dos pasos (commit_snapshot y mark_committed): la
+versión solo cuenta como confirmada, y el evento solo se envía, cuando
+la fila ya está guardada.
+
+Los eventos tienen un número de secuencia creciente (el id del evento
+SSE): un cliente que se reconecta con Last-Event-ID recibe los eventos
+que se perdió, o un evento 'snapshot' con el Braille completo si ya no
+están en el registro.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import json
+import time
+from collections import deque
+from threading import Condition, Lock
+from typing import List, NamedTuple, Optional, Tuple
+from backend.models.incremental import (
+    CellDiff, EditError, IncrementalDocument, VersionConflict
+)
+from backend.utils.env import env_int
+
+# Eventos que se guardan para los clientes que se reconectan
+EVENT_LOG_SIZE = env_int('BRAILLE_LIVE_EVENT_LOG', 256)
+
+
+class LiveEvent(NamedTuple):
+    """Evento de una sesión."""
+    seq: int
+    name: str
+    data: dict
+
+    def to_sse(self) -> str:
+        """Evento en formato server-sent events."""
+        payload = json.dumps(self.data, ensure_ascii=False, separators=(',', ':'))
+        return f"id: {self.seq}\nevent: {self.name}\ndata: {payload}\n\n"
+
+
+class LiveSession(IncrementalDocument):
+    """
+    Documento incremental con eventos para los clientes conectados.
+
+    Los métodos toman el lock del documento; las esperas de los streams
+    usan una condición sobre el mismo lock.
+    """
+
+    def __init__(self, text: str, converter, contracted: bool = False, **kwargs):
+        started = time.perf_counter()
+        super().__init__(text, converter, contracted, **kwargs)
+        self.conversion_ms = (time.perf_counter() - started) * 1000
+        self.closed = False
+        self.committed_version: Optional[int] = None
+        # Serializa las confirmaciones (instantánea, guardado y marca)
+        self.commit_lock = Lock()
+        self._condition = Condition(self.lock)
+        self._events = deque(maxlen=EVENT_LOG_SIZE)
+        self._seq = 0
+
+    # === EVENTOS ===
+
+    @property
+    def last_seq(self) -> int:
+        """Secuencia del último evento."""
+        return self._seq
+
+    def _publish(self, name: str, data: dict):
+        """Registra un evento y despierta a los streams (con el lock tomado)."""
+        self._seq += 1
+        self._events.append(LiveEvent(self._seq, name, data))
+        self._condition.notify_all()
+
+    def snapshot(self) -> LiveEvent:
+        """Evento con el estado completo de la sesión."""
+        with self.lock:
+            return LiveEvent(self._seq, 'snapshot', {
+                'version': self.version,
+                'braille': self.braille,
+                'cell_count': self.cell_count
+            })
+
+    def wait_events(self, after: int, timeout: float) -> Tuple[Optional[List[LiveEvent]], bool]:
+        """
+        Espera eventos posteriores a la secuencia after.
+
+        Args:
+            after: Última secuencia recibida por el cliente
+            timeout: Segundos máximos de espera
+
+        Returns:
+            Tupla (eventos, cerrada). Los eventos son None si los
+            posteriores a after ya no están en el registro (el cliente
+            necesita un snapshot); lista vacía si no hubo ninguno.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._seq > after or self.closed, timeout)
+            if self._seq <= after:
+                return [], self.closed
+            if not self._events or self._events[0].seq > after + 1:
+                return None, self.closed
+            return [event for event in self._events if event.seq > after], self.closed
+
+    # === EDICIÓN ===
+
+    def apply_edits(self, edits: list, base_version: int) -> List[CellDiff]:
+        """
+        Aplica una serie de ediciones (coalescidas por el cliente) y
+        publica un evento 'diff' por cada una. La serie es atómica: se
+        validan todas antes de aplicar la primera, así que si alguna es
+        inválida no cambia nada.
+
+        Args:
+            edits: Lista de diccionarios {offset, deleted, inserted},
+                cada uno sobre el resultado del anterior
+            base_version: Versión sobre la que se hizo la primera edición
+
+        Returns:
+            Cambios en las celdas, uno por edición
+
+        Raises:
+            VersionConflict: Si base_version no es la versión actual
+            EditError: Si una edición es inválida o la sesión está cerrada
+        """
+        with self.lock:
+            if self.closed:
+                raise EditError("La sesión está cerrada")
+            if base_version != self.version:
+                raise VersionConflict(base_version, self.version)
+            # Validar la serie completa sobre la longitud resultante de
+            # cada edición antes de tocar el documento
+            batch = []
+            length = self._length
+            for index, edit in enumerate(edits):
+                if not isinstance(edit, dict):
+                    raise EditError(f"edits[{index}]: cada edición debe ser un objeto")
+                args = (edit.get('offset'), edit.get('deleted', 0), edit.get('inserted', ''))
+                try:
+                    length = self.check_edit(*args, length)
+                except EditError as e:
+                    raise EditError(f"edits[{index}]: {e}") from None
+                batch.append(args)
+
+            started = time.perf_counter()
+            diffs = []
+            for args in batch:
+                diff = self.apply_edit(*args)
+                diffs.append(diff)
+                self._publish('diff', {'version': self.version, **diff.to_dict()})
+            self.conversion_ms += (time.perf_counter() - started) * 1000
+            return diffs
+
+    def commit_snapshot(self) -> Optional[Tuple[int, str, str, float]]:
+        """
+        Estado a confirmar. No marca nada: la versión sigue pendiente hasta
+        llamar a mark_committed() tras guardarla.
+
+        Returns:
+            Tupla (versión, texto, Braille, milisegundos de conversión
+            acumulados), o None si esta versión ya estaba confirmada
+        """
+        with self.lock:
+            if self.committed_version == self.version:
+                return None
+            return self.version, self.text, self.braille, self.conversion_ms
+
+    def mark_committed(self, version: int) -> bool:
+        """
+        Marca como confirmada una versión ya guardada y publica el evento
+        'commit'.
+
+        Args:
+            version: Versión devuelta por commit_snapshot()
+
+        Returns:
+            False si la sesión cambió mientras se guardaba (la versión
+            actual sigue pendiente de confirmar)
+        """
+        with self.lock:
+            if version != self.version:
+                return False
+            self.committed_version = version
+            self._publish('commit', {'version': version})
+            return True
+
+    def close(self):
+        """Cierra la sesión y termina los streams conectados."""
+        with self.lock:
+            if not self.closed:
+                self.closed = True
+                self._publish('close', {'version': self.version})
@@ -0,0 +1,451 @@
+"""
+Tablas de Traducción - Sistema Braille
+======================================
+Carga las tablas de traducción Braille desde archivos de datos (JSON en
+backend/models/tables), las valida y las compila en las estructuras de
+búsqueda que usa BrailleConverter.
+
+Formato de un archivo de tabla (ver tables/es.json):
+    {
+        "name": "es",
+        "description": "...",
+        "dots": 6,                         // 6 u 8 puntos por celda
+        "mode": "literary",                // opcional: literary o computer
+        "capital_sign": [4, 6],
+        "number_sign": [3, 4, 5, 6],
+        "groups": [                        // en orden de prioridad
+            {"type": "Serie 1 (a-j)", "kind": "letter",
+             "cells": {"a": [1], ...}},    // kind: letter, special, punctuation
+            ...
+        ],
+        "numbers": {"type": "Número", "cells": {"1": [1], ...}},
+        "contractions": [                  // opcional (modo contraído)
+            {"text": "que", "cells": [[1, 2, 3, 4, 5]], "kind": "word"}, ...
+        ]
+    }
+
+Modos:
+    - literary: braille literario; las claves van en minúscula, las
+      mayúsculas y los números llevan su indicador (capital_sign,
+      number_sign).
+    - computer: braille computerizado (ver tables/computer8.json); cada
+      carácter, en mayúscula o minúscula, se escribe con una sola celda,
+      sin indicadores. capital_sign y number_sign no se usan.
+
+Caché compilada:
+    La tabla compilada se guarda con marshal en tables/__pycache__, con
+    el hash del archivo de datos en el nombre. Si el archivo cambia, el
+    hash no coincide y se vuelve a compilar. Como con los .pyc, no se
+    escribe nada si sys.dont_write_bytecode está activo o el directorio
+    no admite escritura.
+
+Cada tabla se compila una sola vez por proceso y se comparte entre
+hilos (es de solo lectura).
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import glob
+import hashlib
+import json
+import marshal
+import os
+import sys
+import tempfile
+from threading import Lock
+from types import MappingProxyType
+from typing import Dict, List, Optional
+from backend.models.braille_cells import dots_to_mask
+
+TABLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tables')
+
+DEFAULT_TABLE = 'es'
+
+# Versión del formato compilado; cambiarla invalida todas las cachés
+COMPILED_FORMAT = 2
+
+TABLE_MODES = ('literary', 'computer')
+GROUP_KINDS = ('letter', 'special', 'punctuation')
+CONTRACTION_KINDS = ('word', 'group')
+
+BRAILLE_UNICODE_BASE = 0x2800
+
+
+class TableError(ValueError):
+    """Tabla de traducción inexistente o con datos inválidos."""
+
+
+def table_search_path() -> List[str]:
+    """
+    Directorios donde se buscan tablas: los de la variable de entorno
+    BRAILLE_TABLES_PATH (separados por os.pathsep) y el incorporado.
+    """
+    extra = os.environ.get('BRAILLE_TABLES_PATH', '')
+    return [path for path in extra.split(os.pathsep) if path] + [TABLES_DIR]
+
+
+def available_tables() -> List[str]:
+    """Nombres de las tablas disponibles, ordenados."""
+    names = set()
+    for directory in table_search_path():
+        for path in glob.glob(os.path.join(directory, '*.json')):
+            names.add(os.path.splitext(os.path.basename(path))[0])
+    return sorted(names)
+
+
+def check_table_name(name) -> str:
+    """
+    Valida un nombre de tabla (texto con letras, dígitos, '-' y '_').
+
+    Raises:
+        TableError: Si el nombre no es válido (p. ej. no es texto)
+    """
+    if (not isinstance(name, str) or not name
+            or not name.replace('-', '').replace('_', '').isalnum()):
+        raise TableError(f"Nombre de tabla inválido: {name!r}")
+    return name
+
+
+def find_table_file(name: str) -> str:
+    """
+    Ruta del archivo de datos de una tabla.
+
+    Raises:
+        TableError: Si el nombre no es válido o la tabla no existe
+    """
+    check_table_name(name)
+    for directory in table_search_path():
+        path = os.path.join(directory, f'{name}.json')
+        if os.path.isfile(path):
+            return path
+    raise TableError(f"Tabla de traducción no encontrada: {name}")
+
+
+def _check_cell(dots, max_dot: int, where: str) -> tuple:
+    """Valida una celda (lista de puntos) y la devuelve como tupla ordenada."""
+    if not isinstance(dots, list) or not all(isinstance(d, int) for d in dots):
+        raise TableError(f"{where}: la celda debe ser una lista de enteros")
+    if any(d < 1 or d > max_dot for d in dots) or len(set(dots)) != len(dots):
+        raise TableError(f"{where}: puntos inválidos {dots} (1-{max_dot}, sin repetir)")
+    return tuple(sorted(dots))
+
+
+def _check_char(char, where: str, computer: bool = False) -> str:
+    """
+    Valida la clave de una celda (un carácter, en minúscula salvo en las
+    tablas de braille computerizado).
+    """
+    if not isinstance(char, str) or len(char) != 1:
+        raise TableError(f"{where}: {char!r} debe ser un único carácter")
+    if not computer and char.lower() != char:
+        raise TableError(f"{where}: {char!r} debe estar en minúscula")
+    return char
+
+
+def validate_table(data: Dict) -> Dict:
+    """
+    Valida los datos de una tabla y los normaliza (celdas como tuplas).
+
+    Args:
+        data: Contenido del archivo JSON
+
+    Returns:
+        Datos normalizados
+
+    Raises:
+        TableError: Con la descripción del primer error encontrado
+    """
+    if not isinstance(data, dict):
+        raise TableError("La tabla debe ser un objeto JSON")
+    mode = data.get('mode', 'literary')
+    if mode not in TABLE_MODES:
+        raise TableError(f"'mode' debe ser uno de {', '.join(TABLE_MODES)}")
+    computer = mode == 'computer'
+
+    required = ('name', 'dots', 'groups', 'numbers')
+    if not computer:
+        required += ('capital_sign', 'number_sign')
+    for key in required:
+        if key not in data:
+            raise TableError(f"Falta el campo obligatorio '{key}'")
+
+    max_dot = data['dots']
+    if max_dot not in (6, 8):
+        raise TableError("'dots' debe ser 6 u 8")
+
+    if not isinstance(data['groups'], list):
+        raise TableError("'groups' debe ser una lista")
+    groups = []
+    for index, group in enumerate(data['groups']):
+        where = f"groups[{index}]"
+        if not isinstance(group, dict):
+            raise TableError(f"{where}: debe ser un objeto")
+        if group.get('kind') not in GROUP_KINDS:
+            raise TableError(f"{where}: 'kind' debe ser uno de {', '.join(GROUP_KINDS)}")
+        if not isinstance(group.get('cells'), dict) or not group['cells']:
+            raise TableError(f"{where}: 'cells' debe ser un objeto no vacío")
+        cells = tuple(
+            (_check_char(char, where, computer), _check_cell(dots, max_dot, f"{where}.{char}"))
+            for char, dots in group['cells'].items()
+        )
+        groups.append((str(group.get('type', group['kind'])), group['kind'], cells))
+
+    numbers = data['numbers']
+    number_cells = numbers.get('cells', {}) if isinstance(numbers, dict) else {}
+    if set(number_cells) != set('0123456789'):
+        raise TableError("'numbers.cells' debe definir los dígitos 0-9")
+
+    if computer and data.get('contractions'):
+        raise TableError("Las tablas de braille computerizado no admiten contracciones")
+
+    if not isinstance(data.get('contractions', []), list):
+        raise TableError("'contractions' debe ser una lista")
+    contractions = []
+    for index, rule in enumerate(data.get('contractions', [])):
+        where = f"contractions[{index}]"
+        if not isinstance(rule, dict):
+            raise TableError(f"{where}: debe ser un objeto")
+        if rule.get('kind') not in CONTRACTION_KINDS:
+            raise TableError(f"{where}: 'kind' debe ser word o group")
+        text = rule.get('text')
+        if not isinstance(text, str) or not text or text.lower() != text:
+            raise TableError(f"{where}: 'text' debe ser texto en minúscula")
+        if not isinstance(rule.get('cells'), list) or not rule['cells']:
+            raise TableError(f"{where}: 'cells' debe ser una lista no vacía")
+        contractions.append((text, tuple(_check_cell(dots, max_dot, where)
+                                         for dots in rule['cells']), rule['kind']))
+
+    return {
+        'name': str(data['name']),
+        'description': str(data.get('description', '')),
+        'dots': max_dot,
+        'mode': mode,
+        'capital_sign': (() if computer else
+                         _check_cell(data['capital_sign'], max_dot, 'capital_sign')),
+        'number_sign': (() if computer else
+                        _check_cell(data['number_sign'], max_dot, 'number_sign')),
+        'groups': tuple(groups),
+        'numbers_type': str(numbers.get('type', 'Número')),
+        'numbers': tuple((digit, _check_cell(dots, max_dot, f"numbers.{digit}"))
+                         for digit, dots in number_cells.items()),
+        'contractions': tuple(contractions),
+    }
+
+
+def compile_table(data: Dict, content_hash: str = '') -> Dict:
+    """
+    Compila los datos validados en las estructuras de búsqueda.
+
+    El resultado solo contiene tipos que marshal puede serializar.
+
+    Args:
+        data: Datos devueltos por validate_table
+        content_hash: Hash del archivo de datos
+
+    Returns:
+        Diccionario con la tabla compilada
+    """
+    alphabet, special_chars, punctuation = {}, {}, {}
+    for _, kind, cells in data['groups']:
+        target = alphabet if kind == 'letter' else special_chars
+        for char, dots in cells:
+            target.setdefault(char, dots)
+            if kind == 'punctuation':
+                punctuation.setdefault(char, dots)
+    numbers = dict(data['numbers'])
+    computer = data['mode'] == 'computer'
+
+    # Caracteres soportados: minúsculas de los mapeos, sus mayúsculas
+    # (cuando vuelven a la misma minúscula) y los dígitos ASCII. En braille
+    # computerizado, exactamente los caracteres de la tabla.
+    base = set(alphabet) | set(special_chars)
+    if computer:
+        uppercase = set()
+    else:
+        uppercase = {c.upper() for c in base if c.upper().lower() == c}
+
+    # Catálogo de información: la primera aparición de cada carácter
+    catalog = {}
+    catalog_groups = [(group_type, cells) for group_type, _, cells in data['groups']]
+    catalog_groups.append((data['numbers_type'], data['numbers']))
+    for group_type, cells in catalog_groups:
+        for char, dots in cells:
+            if char in catalog:
+                continue
+            catalog[char] = {
+                'character': char,
+                'type': group_type,
+                'dots': dots,
+                'unicode': chr(BRAILLE_UNICODE_BASE + dots_to_mask(dots)),
+                'description': f"Puntos: {', '.join(map(str, dots))}"
+            }
+    serialized = json.dumps(catalog, sort_keys=True, ensure_ascii=True)
+
+    char_masks = {char: dots_to_mask(dots)
+                  for char, dots in {**special_chars, **alphabet}.items()}
+    number_masks = {char: dots_to_mask(dots) for char, dots in numbers.items()}
+    if computer:
+        # Sin signo de número: los dígitos son celdas como las demás
+        char_masks.update(number_masks)
+
+    return {
+        'format': COMPILED_FORMAT,
+        'hash': content_hash,
+        'name': data['name'],
+        'description': data['description'],
+        'dots': data['dots'],
+        'mode': data['mode'],
+        'capital_sign': data['capital_sign'],
+        'number_sign': data['number_sign'],
+        'groups': data['groups'],
+        'alphabet': alphabet,
+        'special_chars': special_chars,
+        'punctuation': punctuation,
+        'numbers': numbers,
+        'char_masks': char_masks,
+        'number_masks': number_masks,
+        'supported_chars': frozenset(base | uppercase | set('0123456789')),
+        'info_catalog': catalog,
+        'info_version': hashlib.sha1(serialized.encode('ascii')).hexdigest()[:16],
+        'contractions': data['contractions'],
+    }
+
+
+class TranslationTable:
+    """
+    Tabla de traducción compilada (solo lectura).
+
+    Los mapeos se exponen como MappingProxyType para poder compartir la
+    tabla entre hilos y entre conversores sin copias.
+    """
+
+    def __init__(self, compiled: Dict, path: Optional[str] = None):
+        """
+        Args:
+            compiled: Resultado de compile_table
+            path: Archivo de datos de origen
+        """
+        self.path = path
+        self.name = compiled['name']
+        self.description = compiled['description']
+        self.dots = compiled['dots']
+        self.mode = compiled['mode']
+        self.hash = compiled['hash']
+        self.capital_sign = compiled['capital_sign']
+        self.number_sign = compiled['number_sign']
+        self.groups = compiled['groups']
+        self.alphabet = MappingProxyType(compiled['alphabet'])
+        self.special_chars = MappingProxyType(compiled['special_chars'])
+        self.punctuation = MappingProxyType(compiled['punctuation'])
+        self.numbers = MappingProxyType(compiled['numbers'])
+        self.char_masks = MappingProxyType(compiled['char_masks'])
+        self.number_masks = MappingProxyType(compiled['number_masks'])
+        self.supported_chars = compiled['supported_chars']
+        self.info_catalog = MappingProxyType({
+            char: MappingProxyType(info) for char, info in compiled['info_catalog'].items()
+        })
+        self.info_version = compiled['info_version']
+        self.contraction_rules = compiled['contractions']
+
+        # El trie de contracciones contiene objetos: se construye al cargar
+        if self.contraction_rules:
+            from backend.models.contractions import ContractionTable
+            self.contractions = ContractionTable(self.contraction_rules)
+        else:
+            self.contractions = None
+
+    def __repr__(self) -> str:
+        return f"TranslationTable({self.name!r}, dots={self.dots}, mode={self.mode!r})"
+
+
+def _cache_path(path: str, content_hash: str) -> str:
+    """Ruta de la caché compilada de un archivo de datos."""
+    name = os.path.splitext(os.path.basename(path))[0]
+    tag = sys.implementation.cache_tag or 'python'
+    return os.path.join(os.path.dirname(path), '__pycache__',
+                        f'{name}.{content_hash}.{tag}.table')
+
+
+def _write_cache(cache_path: str, compiled: Dict):
+    """Guarda la tabla compilada (atómicamente); ignora errores de escritura."""
+    if sys.dont_write_bytecode:
+        return
+    directory = os.path.dirname(cache_path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        # Eliminar cachés de versiones anteriores del mismo archivo
+        prefix = os.path.basename(cache_path).split('.', 1)[0]
+        for stale in glob.glob(os.path.join(directory, f'{prefix}.*.table')):
+            if stale != cache_path:
+                os.remove(stale)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.', suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            marshal.dump(compiled, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def load_table_file(path: str) -> TranslationTable:
+    """
+    Carga una tabla desde su archivo de datos, usando la caché compilada
+    si corresponde al contenido actual.
+
+    Raises:
+        TableError: Si el archivo no es JSON válido o la tabla es inválida
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    content_hash = hashlib.sha256(
+        raw + str(COMPILED_FORMAT).encode('ascii')
+    ).hexdigest()[:16]
+    cache_path = _cache_path(path, content_hash)
+
+    try:
+        with open(cache_path, 'rb') as f:
+            compiled = marshal.load(f)
+        if isinstance(compiled, dict) and compiled.get('hash') == content_hash:
+            return TranslationTable(compiled, path)
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    try:
+        data = json.loads(raw.decode('utf-8'))
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise TableError(f"{os.path.basename(path)}: JSON inválido ({e})") from None
+
+    compiled = compile_table(validate_table(data), content_hash)
+    _write_cache(cache_path, compiled)
+    return TranslationTable(compiled, path)
+
+
+# Tablas cargadas en este proceso (compartidas entre hilos)
+_tables: Dict[str, TranslationTable] = {}
+_tables_lock = Lock()
+
+
+def get_table(name: str = DEFAULT_TABLE) -> TranslationTable:
+    """
+    Devuelve la tabla compilada de un nombre (la carga la primera vez).
+
+    Raises:
+        TableError: Si la tabla no existe o es inválida
+    """
+    table = _tables.get(check_table_name(name))
+    if table is not None:
+        return table
+    with _tables_lock:
+        table = _tables.get(name)
+        if table is None:
+            table = load_table_file(find_table_file(name))
+            _tables[name] = table
+    return table
+
+
+if __name__ == "__main__":
+    # Valida y compila todas las tablas (p. ej. al construir la imagen)
+    for table_name in available_tables():
+        table = get_table(table_name)
+        print(f"✓ {table.name}: {table.description} ({table.dots} puntos, {table.mode}, "
+              f"{len(table.info_catalog)} caracteres, hash {table.hash})")
@@ -0,0 +1,279 @@
+"""
+Rutas API REST Asíncronas - Sistema Braille
+============================================
+Variante asíncrona de los endpoints de conversión y señalética.
+
+Las conversiones se ejecutan en línea (son rápidas y solo usan CPU);
+la generación de PDFs y las escrituras en SQLite se envían a ejecutores
+acotados. Cada clase de endpoint tiene su propio límite de concurrencia,
+de modo que el tráfico de PDFs no deja sin hilos a las conversiones:
+al superarse un límite se responde 503 con cabecera Retry-After.
+
+Bajo WSGI (gunicorn gthread) una vista asíncrona ocupa su hilo del
+worker mientras espera al ejecutor, así que los PDFs se admiten con el
+mismo límite que POST /api/generate-signage (BRAILLE_PDF_LIMIT, por
+debajo de BRAILLE_THREADS) antes de ocupar el ejecutor.
+
+Endpoints:
+- POST /api/async/convert/to-braille: Convierte español a Braille
+- POST /api/async/convert/to-text: Convierte Braille a español
+- POST /api/async/generate-signage: Genera PDF de señalética
+
+Variables de entorno:
+    BRAILLE_CONVERSION_LIMIT   Conversiones simultáneas (default: 64)
+    BRAILLE_PDF_WORKERS        Hilos para generar PDFs (default: 2)
+    BRAILLE_PDF_QUEUE          PDFs en espera (default: 8; las admisiones
+                               las limita antes BRAILLE_PDF_LIMIT)
+    BRAILLE_DB_WORKERS         Hilos para escrituras en SQLite (default: 2)
+    BRAILLE_DB_QUEUE           Escrituras en espera (default: 256)
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+from flask import Blueprint, request, jsonify, send_file
+from backend.app_context import get_app_context
+from backend.utils.metrics import characters_converted
+from backend.utils.concurrency import (
+    ConcurrencyLimiter, BoundedExecutor, ConcurrencyLimitExceeded
+)
+from backend.utils.dots_info import DOTS_INFO_FORMATS, encode_dots_info
+from backend.utils.env import env_int
+from backend.models.translation_tables import TableError
+from backend.routes.braille_routes import (
+    normalize_signage_items, overloaded_response, pdf_limiter, table_error_response
+)
+import time
+from datetime import datetime
+
+# Crear Blueprint para las rutas asíncronas
+braille_async_bp = Blueprint('braille_async', __name__, url_prefix='/api/async')
+
+# Límites por clase de endpoint
+conversion_limiter = ConcurrencyLimiter(
+    'conversion', env_int('BRAILLE_CONVERSION_LIMIT', 64)
+)
+pdf_executor = BoundedExecutor(
+    'pdf', env_int('BRAILLE_PDF_WORKERS', 2), env_int('BRAILLE_PDF_QUEUE', 8)
+)
+db_executor = BoundedExecutor(
+    'db', env_int('BRAILLE_DB_WORKERS', 2), env_int('BRAILLE_DB_QUEUE', 256)
+)
+
+
+def shutdown_executors(wait: bool = True):
+    """
+    Detiene los ejecutores, esperando a que terminen las tareas pendientes.
+    Se llama al apagar un worker para no perder escrituras en la base de datos.
+    """
+    pdf_executor.shutdown(wait=wait)
+    db_executor.shutdown(wait=wait)
+
+
+@braille_async_bp.route('/convert/to-braille', methods=['POST'])
+async def convert_to_braille():
+    """
+    Convierte texto español a Braille (variante asíncrona).
+
+    Request/Response: igual que POST /api/convert/to-braille
+    """
+    try:
+        ctx = get_app_context()
+        
+        with conversion_limiter:
+            data = request.get_json()
+
+            if not data or 'text' not in data:
+                return jsonify({
+                    'success': False,
+                    'error': 'Campo "text" es requerido'
+                }), 400
+
+            try:
+                converter = ctx.converter_for(data.get('table'))
+            except TableError as e:
+                return table_error_response(e)
+
+            started = time.perf_counter()
+            input_text = data['text']
+            output_format = data.get('format', 'unicode')
+
+            if output_format not in ['unicode', 'dots', 'description']:
+                return jsonify({
+                    'success': False,
+                    'error': 'Formato inválido. Opciones: unicode, dots, description'
+                }), 400
+
+            dots_info_format = data.get('dots_info_format', 'list')
+            if dots_info_format not in DOTS_INFO_FORMATS:
+                return jsonify({
+                    'success': False,
+                    'error': f'dots_info_format inválido. Opciones: {", ".join(DOTS_INFO_FORMATS)}'
+                }), 400
+
+            is_valid, unsupported_chars = converter.validate_text(input_text)
+
+            if not is_valid:
+                char_details = [f"'{c}' (U+{ord(c):04X})" for c in unsupported_chars]
+                return jsonify({
+                    'success': False,
+                    'error': 'Texto contiene caracteres no soportados',
+                    'unsupported_characters': unsupported_chars,
+                    'character_codes': char_details
+                }), 400
+
+            # Conversión en línea
+            braille_output = converter.text_to_braille(input_text, output_format)
+            characters_converted.inc(len(input_text), direction='text_to_braille')
+            dots_info = encode_dots_info(converter.get_dots_info(input_text), dots_info_format)
+
+            # Escritura en base de datos fuera del hilo de la petición
+            await db_executor.run(
+                ctx.db_manager.save_conversion,
+                original_text=input_text,
+                braille_text=braille_output,
+                conversion_type='text_to_braille',
+                latency_ms=(time.perf_counter() - started) * 1000
+            )
+
+            return jsonify({
+                'success': True,
+                'input_text': input_text,
+                'braille': braille_output,
+                'dots_info': dots_info,
+                'format': output_format,
+                'character_count': len(input_text),
+                'timestamp': datetime.now().isoformat()
+            }), 200
+
+    except ConcurrencyLimitExceeded as e:
+        return overloaded_response(e)
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error en conversión: {str(e)}'
+        }), 500
+
+
+@braille_async_bp.route('/convert/to-text', methods=['POST'])
+async def convert_to_text():
+    """
+    Convierte Braille Unicode a texto español (variante asíncrona).
+
+    Request/Response: igual que POST /api/convert/to-text
+    """
+    try:
+        ctx = get_app_context()
+        
+        with conversion_limiter:
+            data = request.get_json()
+
+            if not data or 'braille' not in data:
+                return jsonify({
+                    'success': False,
+                    'error': 'Campo "braille" es requerido'
+                }), 400
+
+            try:
+                converter = ctx.converter_for(data.get('table'))
+            except TableError as e:
+                return table_error_response(e)
+
+            started = time.perf_counter()
+            braille_input = data['braille']
+            text_output = converter.braille_to_text(braille_input)
+            characters_converted.inc(len(braille_input), direction='braille_to_text')
+
+            await db_executor.run(
+                ctx.db_manager.save_conversion,
+                original_text=text_output,
+                braille_text=braille_input,
+                conversion_type='braille_to_text',
+                latency_ms=(time.perf_counter() - started) * 1000
+            )
+
+            return jsonify({
+                'success': True,
+                'braille_input': braille_input,
+                'text': text_output,
+                'character_count': len(text_output),
+                'timestamp': datetime.now().isoformat()
+            }), 200
+
+    except ConcurrencyLimitExceeded as e:
+        return overloaded_response(e)
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error en conversión: {str(e)}'
+        }), 500
+
+
+@braille_async_bp.route('/generate-signage', methods=['POST'])
+async def generate_signage():
+    """
+    Genera un PDF de señalética Braille (variante asíncrona).
+
+    El renderizado con ReportLab se ejecuta en el ejecutor de PDFs. Las
+    peticiones se admiten con pdf_limiter (compartido con la variante
+    síncrona) antes de esperar a nada: por encima del límite, 503.
+
+    Request/Response: igual que POST /api/generate-signage
+    """
+    try:
+        ctx = get_app_context()
+        
+        data = request.get_json()
+
+        if not data:
+            return jsonify({
+                'success': False,
+                'error': 'Datos requeridos'
+            }), 400
+
+        title = data.get('title', 'Señalética Braille')
+        items = data.get('items', [])
+        signage_format = data.get('format', 'elevator')
+
+        if not items:
+            return jsonify({
+                'success': False,
+                'error': 'Debe proporcionar al menos un elemento'
+            }), 400
+
+        try:
+            converter = ctx.converter_for(data.get('table'))
+        except TableError as e:
+            return table_error_response(e)
+
+        with pdf_limiter:
+            stored = await pdf_executor.run(
+                ctx.pdf_generator.generate,
+                title=str(title),
+                items=normalize_signage_items(items),
+                format_type=signage_format,
+                table=converter.table.name
+            )
+
+            await db_executor.run(
+                ctx.db_manager.save_pdf_generation,
+                title=title,
+                file_path=stored.path,
+                format_type=signage_format,
+                stored=stored
+            )
+
+        return send_file(
+            stored.path,
+            mimetype='application/pdf',
+            as_attachment=True,
+            download_name=f'senaletica_braille_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pdf'
+        )
+
+    except ConcurrencyLimitExceeded as e:
+        return overloaded_response(e)
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error al generar PDF: {str(e)}'
+        }), 500
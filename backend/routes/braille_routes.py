@@ -6,24 +6,136 @@ Define los endpoints HTTP para la conversión de texto y generación de señalé
 Endpoints:
 - POST /api/convert/to-braille: Convierte español a Braille
 - POST /api/convert/to-text: Convierte Braille a español
-- POST /api/generate-signage: Genera PDF de señalética
+- POST /api/convert/incremental: Conversión incremental para edición en vivo
+- POST /api/generate-signage: Genera PDF de señalética (503 si se
+  alcanzó el límite de PDFs simultáneos)
+- POST /api/render/<format>: Genera imagen SVG/PNG del Braille
 - GET /api/braille/info/<char>: Información sobre un carácter
+- GET /api/braille/info?chars=...: Información de varios caracteres
+- GET /api/tables: Tablas de traducción disponibles (con su versión)
+- GET /api/tables/<name>: Tabla compilada para el motor del navegador
+- POST /api/history: Guarda una conversión hecha en el navegador
+- GET /api/stats/timeseries: Series temporales de conversiones y PDFs
+- GET /api/history/export: Exporta el historial (NDJSON/CSV, gzip opcional)
+- POST /api/history/import: Importa un historial exportado
     - /api/health: Estado del servidor
 
+Variables de entorno:
+    BRAILLE_PDF_LIMIT  PDFs simultáneos por proceso, síncronos y asíncronos
+                       (default: BRAILLE_THREADS / 2; como máximo
+                       BRAILLE_THREADS - 1)
+
 Autor: GR4
 Fecha: Noviembre 2025
 """
 
-from flask import Blueprint, request, jsonify, send_file
-from backend.models.braille_converter import braille_converter
-from backend.utils.pdf_generator import generate_signage_pdf
-from backend.database.db_manager import db_manager
+from flask import Blueprint, Response, request, jsonify, send_file
+from backend.database.db_manager import EXPORT_COLUMNS, ROLLUP_BUCKETS
+from backend.utils.history_export import (
+    EXPORT_FORMATS, encode_records, decode_records, gzip_chunks
+)
+from backend.utils.dots_info import DOTS_INFO_FORMATS, encode_dots_info
+from backend.utils.http_cache import conditional_response
+from backend.utils.concurrency import ConcurrencyLimiter, ConcurrencyLimitExceeded
+from backend.utils.env import env_int
+from backend.utils.image_renderer import MAX_CELLS, SUPPORTED_FORMATS, ImageTooLarge
+from backend.models.translation_tables import DEFAULT_TABLE, TableError, available_tables
+from backend.models.incremental import EditError, VersionConflict
+from backend.app_context import get_app_context
+from backend.utils.metrics import characters_converted
+import hashlib
 import os
-from datetime import datetime
+import re
+import time
+from io import BytesIO
+from datetime import datetime, timedelta, timezone
 
 # Crear Blueprint para las rutas
 braille_bp = Blueprint('braille', __name__, url_prefix='/api')
 
+# Vigencia en caché (segundos) de la información de caracteres; el ETag
+# (versión del catálogo) permite revalidar tras un despliegue
+INFO_CACHE_MAX_AGE = 86400
+
+# Series temporales: duración de cada intervalo, rango por defecto y
+# máximo de intervalos por consulta
+TIMESERIES_BUCKETS = {name: duration for name, (_, duration) in ROLLUP_BUCKETS.items()}
+TIMESERIES_DEFAULT_RANGE = {'minute': timedelta(hours=1), 'hour': timedelta(hours=24)}
+TIMESERIES_MAX_POINTS = 10080
+
+# Tablas para el navegador: la lista se revalida a menudo; la tabla pedida
+# con su versión en la URL (?v=...) no cambia nunca y se cachea un año
+TABLES_LIST_MAX_AGE = 300
+VERSIONED_MAX_AGE = 365 * 86400
+
+
+def _pdf_limit() -> int:
+    """
+    PDFs simultáneos admitidos por proceso. Cada petición de PDF ocupa un
+    hilo del worker mientras se genera (también la variante asíncrona
+    bajo WSGI), así que el límite queda por debajo de BRAILLE_THREADS
+    para que siempre haya hilos libres para las conversiones.
+    """
+    threads = env_int('BRAILLE_THREADS', 4)
+    limit = env_int('BRAILLE_PDF_LIMIT', max(1, threads // 2))
+    return max(1, min(limit, threads - 1))
+
+
+# Límite compartido por /api/generate-signage y /api/async/generate-signage;
+# se reserva antes de generar nada y al alcanzarse se responde 503
+pdf_limiter = ConcurrencyLimiter('pdf', _pdf_limit())
+
+# Tipos de conversión del historial
+CONVERSION_TYPES = ('text_to_braille', 'braille_to_text')
+
+# Texto Braille aceptado en el historial: celdas Unicode y espacios
+_BRAILLE_TEXT = re.compile(r'[\u2800-\u28ff\s]*')
+
+
+def _cached_info_response(payload: dict, status: int = 200, converter=None):
+    """
+    Respuesta JSON cacheable del catálogo de caracteres.
+    
+    Añade ETag (versión del catálogo) y Cache-Control, y responde
+    304 Not Modified si el cliente ya tiene esa versión.
+    """
+    converter = converter or get_app_context().converter
+    response = jsonify(payload)
+    response.status_code = status
+    response.set_etag(converter.INFO_CATALOG_VERSION)
+    response.cache_control.public = True
+    response.cache_control.max_age = INFO_CACHE_MAX_AGE
+    return response.make_conditional(request)
+
+
+def table_error_response(error: TableError):
+    """Respuesta 400 para una tabla de traducción inexistente o inválida."""
+    return jsonify({
+        'success': False,
+        'error': str(error),
+        'available_tables': available_tables()
+    }), 400
+
+
+def normalize_signage_items(items: list) -> list:
+    """
+    Convierte todos los valores de los elementos de señalética a string.
+    
+    Args:
+        items: Lista de diccionarios recibidos en la petición
+        
+    Returns:
+        Lista de diccionarios con valores string ('' para None)
+    """
+    items_normalized = []
+    for item in items:
+        normalized_item = {}
+        for key, value in item.items():
+            # Convertir cualquier valor a string
+            normalized_item[key] = str(value) if value is not None else ''
+        items_normalized.append(normalized_item)
+    return items_normalized
+
 
 @braille_bp.route('/health', methods=['GET'])
 def health_check():
@@ -49,7 +161,10 @@ def convert_to_braille():
     Request Body:
         {
             "text": "Hola mundo",
-            "format": "unicode"  // opcional: unicode, dots, description
+            "format": "unicode",  // opcional: unicode, dots, description
+            "table": "es",        // opcional: tabla de traducción
+            "dots_info_format": "list"  // opcional: list o compact
+                                        // (ver backend/utils/dots_info.py)
         }
     
     Response:
@@ -63,6 +178,8 @@ def convert_to_braille():
         }
     """
     try:
+        ctx = get_app_context()
+        
         data = request.get_json()
         
         if not data or 'text' not in data:
@@ -71,6 +188,12 @@ def convert_to_braille():
                 'error': 'Campo "text" es requerido'
             }), 400
         
+        try:
+            converter = ctx.converter_for(data.get('table'))
+        except TableError as e:
+            return table_error_response(e)
+        
+        started = time.perf_counter()
         input_text = data['text']
         output_format = data.get('format', 'unicode')
         
@@ -81,8 +204,15 @@ def convert_to_braille():
                 'error': 'Formato inválido. Opciones: unicode, dots, description'
             }), 400
         
+        dots_info_format = data.get('dots_info_format', 'list')
+        if dots_info_format not in DOTS_INFO_FORMATS:
+            return jsonify({
+                'success': False,
+                'error': f'dots_info_format inválido. Opciones: {", ".join(DOTS_INFO_FORMATS)}'
+            }), 400
+        
         # Validar texto
-        is_valid, unsupported_chars = braille_converter.validate_text(input_text)
+        is_valid, unsupported_chars = converter.validate_text(input_text)
         
         if not is_valid:
             # Mostrar los códigos Unicode de los caracteres no soportados
@@ -95,79 +225,18 @@ def convert_to_braille():
             }), 400
         
         # Convertir a Braille
-        braille_output = braille_converter.text_to_braille(input_text, output_format)
+        braille_output = converter.text_to_braille(input_text, output_format)
+        characters_converted.inc(len(input_text), direction='text_to_braille')
         
         # Obtener información de puntos para visualización
-        dots_info = []
-        in_number_mode = False
-        
-        i = 0
-        while i < len(input_text):
-            char = input_text[i]
-            char_lower = char.lower()
-            
-            # Detectar letra mayúscula - agregar indicador antes de cada una
-            if char.isupper() and char.isalpha():
-                dots_info.append({
-                    'char': '⠨',
-                    'dots': list(braille_converter.CAPITAL_SIGN),
-                    'type': 'capital_sign'
-                })
-            
-            if char.isdigit():
-                if not in_number_mode:
-                    # Agregar indicador numérico
-                    dots_info.append({
-                        'char': '#',
-                        'dots': list(braille_converter.NUMBER_SIGN),
-                        'type': 'number_sign'
-                    })
-                    in_number_mode = True
-                dots = braille_converter.NUMBERS.get(char, tuple())
-                dots_info.append({
-                    'char': char,
-                    'dots': list(dots),
-                    'type': 'number'
-                })
-            elif char == ' ':
-                in_number_mode = False
-                dots_info.append({
-                    'char': ' ',
-                    'dots': [],
-                    'type': 'space'
-                })
-            else:
-                # Tanto coma como punto mantienen el modo numérico si hay dígitos después
-                if char in (',', '.') and in_number_mode and i + 1 < len(input_text) and input_text[i + 1].isdigit():
-                    dots = braille_converter.PUNCTUATION.get(char, tuple())
-                    dots_info.append({
-                        'char': char,
-                        'dots': list(dots),
-                        'type': 'punctuation'
-                    })
-                else:
-                    in_number_mode = False
-                    dots = braille_converter.ALPHABET.get(char_lower) or braille_converter.SPECIAL_CHARS.get(char_lower)
-                    if dots:
-                        char_type = 'letter' if char_lower in braille_converter.ALPHABET else 'special'
-                        dots_info.append({
-                            'char': char_lower,
-                            'dots': list(dots),
-                            'type': char_type
-                        })
-                    else:
-                        dots_info.append({
-                            'char': char,
-                            'dots': [],
-                            'type': 'unknown'
-                        })
-            i += 1
+        dots_info = encode_dots_info(converter.get_dots_info(input_text), dots_info_format)
         
         # Guardar en base de datos
-        db_manager.save_conversion(
+        ctx.db_manager.save_conversion(
             original_text=input_text,
             braille_text=braille_output,
-            conversion_type='text_to_braille'
+            conversion_type='text_to_braille',
+            latency_ms=(time.perf_counter() - started) * 1000
         )
         
         return jsonify({
@@ -194,7 +263,8 @@ def convert_to_text():
     
     Request Body:
         {
-            "braille": "⠓⠕⠇⠁"
+            "braille": "⠓⠕⠇⠁",
+            "table": "es"  // opcional: tabla de traducción
         }
     
     Response:
@@ -207,6 +277,8 @@ def convert_to_text():
         }
     """
     try:
+        ctx = get_app_context()
+        
         data = request.get_json()
         
         if not data or 'braille' not in data:
@@ -215,16 +287,24 @@ def convert_to_text():
                 'error': 'Campo "braille" es requerido'
             }), 400
         
+        try:
+            converter = ctx.converter_for(data.get('table'))
+        except TableError as e:
+            return table_error_response(e)
+        
+        started = time.perf_counter()
         braille_input = data['braille']
         
         # Convertir a texto
-        text_output = braille_converter.braille_to_text(braille_input)
+        text_output = converter.braille_to_text(braille_input)
+        characters_converted.inc(len(braille_input), direction='braille_to_text')
         
         # Guardar en base de datos
-        db_manager.save_conversion(
+        ctx.db_manager.save_conversion(
             original_text=text_output,
             braille_text=braille_input,
-            conversion_type='braille_to_text'
+            conversion_type='braille_to_text',
+            latency_ms=(time.perf_counter() - started) * 1000
         )
         
         return jsonify({
@@ -242,14 +322,187 @@ def convert_to_text():
         }), 500
 
 
+def overloaded_response(error: ConcurrencyLimitExceeded):
+    """Respuesta 503 cuando una clase de endpoint está saturada."""
+    response = jsonify({
+        'success': False,
+        'error': 'Servidor ocupado, intente de nuevo',
+        'endpoint_class': error.name
+    })
+    response.status_code = 503
+    response.headers['Retry-After'] = '1'
+    return response
+
+
+def unsupported_response(unsupported_chars: list):
+    """Respuesta 400 para texto con caracteres no soportados."""
+    return jsonify({
+        'success': False,
+        'error': 'Texto contiene caracteres no soportados',
+        'unsupported_characters': unsupported_chars,
+        'character_codes': [f"'{c}' (U+{ord(c):04X})" for c in unsupported_chars]
+    }), 400
+
+
+@braille_bp.route('/convert/incremental', methods=['POST'])
+def convert_incremental():
+    """
+    Conversión incremental para la edición en vivo de documentos largos.
+    
+    Sin "document_id" crea un documento y devuelve su Braille completo;
+    con "document_id" aplica una edición sobre la versión "base_version"
+    y devuelve solo el rango de celdas que cambió. Las posiciones son
+    índices de caracteres (puntos de código Unicode) del texto.
+    
+    Request Body (crear):
+        {
+            "text": "Hola mundo",
+            "table": "es",       // opcional: tabla de traducción
+            "contracted": false  // opcional: modo contraído
+        }
+    
+    Request Body (editar):
+        {
+            "document_id": "9f1c...",
+            "base_version": 0,
+            "edit": {"offset": 5, "deleted": 5, "inserted": "amigos"}
+        }
+    
+    Response (editar):
+        {
+            "success": true,
+            "document_id": "9f1c...",
+            "version": 1,
+            "start": 5,           // primera celda cambiada
+            "deleted": 5,         // celdas sustituidas desde start
+            "braille": "⠁⠍⠊⠛⠕⠎",  // celdas nuevas
+            "cell_count": 12
+        }
+    
+    Si base_version no es la versión actual responde 409 con la versión
+    actual; si el documento no existe (o caducó), 404.
+    """
+    try:
+        ctx = get_app_context()
+        
+        data = request.get_json(silent=True)
+        
+        if not isinstance(data, dict):
+            return jsonify({
+                'success': False,
+                'error': 'Se requiere un cuerpo JSON'
+            }), 400
+        
+        document_id = data.get('document_id')
+        
+        if document_id is None:
+            text = data.get('text')
+            if not isinstance(text, str):
+                return jsonify({
+                    'success': False,
+                    'error': 'Campo "text" es requerido'
+                }), 400
+            
+            try:
+                converter = ctx.converter_for(data.get('table'))
+            except TableError as e:
+                return table_error_response(e)
+            
+            contracted = bool(data.get('contracted', False))
+            if contracted and converter.CONTRACTIONS is None:
+                return jsonify({
+                    'success': False,
+                    'error': f'La tabla {converter.table.name} no tiene modo contraído'
+                }), 400
+            
+            is_valid, unsupported_chars = converter.validate_text(text)
+            if not is_valid:
+                return unsupported_response(unsupported_chars)
+            
+            document_id, document = ctx.documents.create(text, converter, contracted)
+            characters_converted.inc(len(text), direction='text_to_braille')
+            
+            return jsonify({
+                'success': True,
+                'document_id': document_id,
+                'version': document.version,
+                'table': converter.table.name,
+                'contracted': contracted,
+                'braille': document.braille,
+                'cell_count': document.cell_count
+            }), 201
+        
+        document = ctx.documents.get(document_id) if isinstance(document_id, str) else None
+        if document is None:
+            return jsonify({
+                'success': False,
+                'error': 'Documento no encontrado o caducado'
+            }), 404
+        
+        edit = data.get('edit')
+        base_version = data.get('base_version')
+        if (not isinstance(edit, dict) or isinstance(base_version, bool)
+                or not isinstance(base_version, int)):
+            return jsonify({
+                'success': False,
+                'error': 'Campos "base_version" y "edit" son requeridos'
+            }), 400
+        
+        inserted = edit.get('inserted', '')
+        if isinstance(inserted, str):
+            is_valid, unsupported_chars = document.converter.validate_text(inserted)
+            if not is_valid:
+                return unsupported_response(unsupported_chars)
+        
+        with document.lock:
+            try:
+                diff = document.apply_edit(edit.get('offset'), edit.get('deleted', 0),
+                                           inserted, base_version)
+            except VersionConflict as e:
+                return jsonify({
+                    'success': False,
+                    'error': str(e),
+                    'version': e.current
+                }), 409
+            except EditError as e:
+                return jsonify({
+                    'success': False,
+                    'error': str(e)
+                }), 400
+            version = document.version
+            cell_count = document.cell_count
+        
+        characters_converted.inc(len(inserted), direction='text_to_braille')
+        
+        return jsonify({
+            'success': True,
+            'document_id': document_id,
+            'version': version,
+            **diff.to_dict(),
+            'cell_count': cell_count
+        }), 200
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error en conversión: {str(e)}'
+        }), 500
+
+
 @braille_bp.route('/braille/info/<char>', methods=['GET'])
 def get_character_info(char):
     """
     Obtiene información detallada sobre un carácter en Braille.
     
+    La respuesta sale del catálogo precalculado del conversor y es
+    cacheable (ETag + Cache-Control).
+    
     Args:
         char: Carácter a consultar (en URL)
     
+    Query Params:
+        table: Tabla de traducción (opcional)
+    
     Response:
         {
             "success": true,
@@ -261,24 +514,81 @@ def get_character_info(char):
         }
     """
     try:
+        ctx = get_app_context()
+        
+        try:
+            converter = ctx.converter_for(request.args.get('table'))
+        except TableError as e:
+            return table_error_response(e)
+        
         if not char or len(char) != 1:
             return jsonify({
                 'success': False,
                 'error': 'Debe proporcionar exactamente un carácter'
             }), 400
         
-        info = braille_converter.get_braille_info(char)
+        info = converter.get_braille_info(char)
         
         if info is None:
-            return jsonify({
+            return _cached_info_response({
                 'success': False,
                 'error': f'Carácter "{char}" no soportado en Braille'
-            }), 404
+            }, 404, converter=converter)
         
-        return jsonify({
+        return _cached_info_response({
             'success': True,
             **info
-        }), 200
+        }, converter=converter)
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error al obtener información: {str(e)}'
+        }), 500
+
+
+@braille_bp.route('/braille/info', methods=['GET'])
+def get_characters_info():
+    """
+    Obtiene la información de varios caracteres en una sola petición.
+    
+    Query Params:
+        chars: Caracteres a consultar (p. ej. "abcáé"); sin este
+            parámetro se devuelve el catálogo completo
+        table: Tabla de traducción (opcional)
+    
+    Response:
+        {
+            "success": true,
+            "version": "2c2b175ef57a6152",
+            "characters": {"a": {...}, "b": {...}},
+            "unsupported": ["@"]
+        }
+    """
+    try:
+        ctx = get_app_context()
+        
+        try:
+            converter = ctx.converter_for(request.args.get('table'))
+        except TableError as e:
+            return table_error_response(e)
+        
+        chars = request.args.get('chars')
+        
+        if chars is None:
+            found = dict(converter.INFO_CATALOG)
+            unsupported = []
+        else:
+            infos = converter.get_braille_info_bulk(chars)
+            found = {char: info for char, info in infos.items() if info is not None}
+            unsupported = [char for char, info in infos.items() if info is None]
+        
+        return _cached_info_response({
+            'success': True,
+            'version': converter.INFO_CATALOG_VERSION,
+            'characters': {char: dict(info) for char, info in found.items()},
+            'unsupported': unsupported
+        }, converter=converter)
         
     except Exception as e:
         return jsonify({
@@ -299,13 +609,16 @@ def generate_signage():
                 {"text": "Piso 1", "number": "1"},
                 {"text": "Piso 2", "number": "2"}
             ],
-            "format": "elevator"  // elevator, door, label
+            "format": "elevator",  // elevator, door, label
+            "table": "computer8"   // opcional: tabla de traducción
         }
     
     Response:
-        Archivo PDF para descarga
+        Archivo PDF para descarga (503 si se alcanzó el límite de PDFs)
     """
     try:
+        ctx = get_app_context()
+        
         data = request.get_json()
         
         if not data:
@@ -324,37 +637,41 @@ def generate_signage():
                 'error': 'Debe proporcionar al menos un elemento'
             }), 400
         
+        try:
+            converter = ctx.converter_for(data.get('table'))
+        except TableError as e:
+            return table_error_response(e)
+        
         # Convertir todos los valores a string para evitar errores de tipo
-        items_normalized = []
-        for item in items:
-            normalized_item = {}
-            for key, value in item.items():
-                # Convertir cualquier valor a string
-                normalized_item[key] = str(value) if value is not None else ''
-            items_normalized.append(normalized_item)
-        
-        # Generar PDF
-        pdf_path = generate_signage_pdf(
-            title=str(title),
-            items=items_normalized,
-            format_type=signage_format
-        )
+        items_normalized = normalize_signage_items(items)
         
-        # Guardar registro en base de datos
-        db_manager.save_pdf_generation(
-            title=title,
-            file_path=pdf_path,
-            format_type=signage_format
-        )
+        with pdf_limiter:
+            # Generar PDF
+            stored = ctx.pdf_generator.generate(
+                title=str(title),
+                items=items_normalized,
+                format_type=signage_format,
+                table=converter.table.name
+            )
+            
+            # Guardar registro en base de datos
+            ctx.db_manager.save_pdf_generation(
+                title=title,
+                file_path=stored.path,
+                format_type=signage_format,
+                stored=stored
+            )
         
         # Enviar archivo
         return send_file(
-            pdf_path,
+            stored.path,
             mimetype='application/pdf',
             as_attachment=True,
             download_name=f'senaletica_braille_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pdf'
         )
         
+    except ConcurrencyLimitExceeded as e:
+        return overloaded_response(e)
     except Exception as e:
         return jsonify({
             'success': False,
@@ -362,6 +679,118 @@ def generate_signage():
         }), 500
 
 
+@braille_bp.route('/render/<image_format>', methods=['POST'])
+def render_image(image_format):
+    """
+    Genera una imagen (SVG o PNG) con el texto en Braille.
+    
+    Args:
+        image_format: Formato de salida (en URL): png, svg
+    
+    Request Body:
+        {
+            "text": "Salida",
+            "dpi": 300,          // opcional: 72-1200
+            "scale": 1.0,        // opcional: 0.25-8
+            "show_empty": false, // opcional: dibujar puntos inactivos (booleano)
+            "table": "es"        // opcional: tabla (8 puntos: celdas de 4 filas)
+        }
+    
+    Response:
+        Imagen PNG o SVG (413 si supera el límite de celdas o de píxeles)
+    """
+    try:
+        ctx = get_app_context()
+        
+        if image_format not in SUPPORTED_FORMATS:
+            return jsonify({
+                'success': False,
+                'error': f'Formato inválido. Opciones: {", ".join(SUPPORTED_FORMATS)}'
+            }), 400
+        
+        data = request.get_json()
+        
+        if not data or 'text' not in data:
+            return jsonify({
+                'success': False,
+                'error': 'Campo "text" es requerido'
+            }), 400
+        
+        text = str(data['text'])
+        
+        # Cada carácter es al menos una celda: rechazar antes de convertir
+        if len(text) - text.count('\n') > MAX_CELLS:
+            return jsonify({
+                'success': False,
+                'error': f'Texto demasiado largo: máximo {MAX_CELLS} celdas por imagen'
+            }), 413
+        
+        show_empty = data.get('show_empty', False)
+        if not isinstance(show_empty, bool):
+            return jsonify({
+                'success': False,
+                'error': 'El campo "show_empty" debe ser booleano'
+            }), 400
+        
+        try:
+            dpi = int(data.get('dpi', 300))
+            scale = float(data.get('scale', 1.0))
+        except (TypeError, ValueError):
+            return jsonify({
+                'success': False,
+                'error': 'Los campos "dpi" y "scale" deben ser numéricos'
+            }), 400
+        
+        if not 72 <= dpi <= 1200 or not 0.25 <= scale <= 8:
+            return jsonify({
+                'success': False,
+                'error': 'Rango inválido: dpi 72-1200, scale 0.25-8'
+            }), 400
+        
+        try:
+            converter = ctx.converter_for(data.get('table'))
+        except TableError as e:
+            return table_error_response(e)
+        
+        # Validar texto (los saltos de línea separan líneas de la imagen)
+        is_valid, unsupported_chars = converter.validate_text(text.replace('\n', ''))
+        
+        if not is_valid:
+            return jsonify({
+                'success': False,
+                'error': 'Texto contiene caracteres no soportados',
+                'unsupported_characters': unsupported_chars
+            }), 400
+        
+        try:
+            content = ctx.image_renderer.render(
+                text,
+                image_format,
+                dpi=dpi,
+                scale=scale,
+                show_empty=show_empty,
+                table=converter.table.name
+            )
+        except ImageTooLarge as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 413
+        
+        mimetype = 'image/png' if image_format == 'png' else 'image/svg+xml'
+        return send_file(
+            BytesIO(content),
+            mimetype=mimetype,
+            download_name=f'braille_{datetime.now().strftime("%Y%m%d_%H%M%S")}.{image_format}'
+        )
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error al generar imagen: {str(e)}'
+        }), 500
+
+
 @braille_bp.route('/history', methods=['GET'])
 def get_conversion_history():
     """
@@ -387,19 +816,23 @@ def get_conversion_history():
         }
     """
     try:
+        ctx = get_app_context()
+        
         limit = request.args.get('limit', 50, type=int)
         conversion_type = request.args.get('type', None)
         
-        history = db_manager.get_conversion_history(
+        history = ctx.db_manager.get_conversion_history(
             limit=limit,
             conversion_type=conversion_type
         )
         
-        return jsonify({
+        # ETag por contenido: el navegador revalida y recibe 304 si no
+        # hubo conversiones nuevas
+        return conditional_response(jsonify({
             'success': True,
             'history': history,
             'count': len(history)
-        }), 200
+        }))
         
     except Exception as e:
         return jsonify({
@@ -408,6 +841,309 @@ def get_conversion_history():
         }), 500
 
 
+@braille_bp.route('/tables', methods=['GET'])
+def list_tables():
+    """
+    Lista las tablas de traducción disponibles.
+    
+    Response (cacheable, con ETag):
+        {
+            "success": true,
+            "default": "es",
+            "tables": [
+                {
+                    "name": "es",
+                    "description": "...",
+                    "dots": 6,
+                    "mode": "literary",
+                    "contracted": true,
+                    "version": "06aa5b95d4971187",
+                    "url": "/api/tables/es?v=06aa5b95d4971187"
+                }
+            ]
+        }
+    """
+    try:
+        ctx = get_app_context()
+        
+        tables = []
+        for name in available_tables():
+            try:
+                converter = ctx.converter_for(name)
+            except TableError:
+                # Archivo de tabla inválido: no se ofrece
+                continue
+            version = converter.client_table()['version']
+            tables.append({
+                'name': name,
+                'description': converter.table.description,
+                'dots': converter.table.dots,
+                'mode': converter.table.mode,
+                'contracted': converter.CONTRACTIONS is not None,
+                'version': version,
+                'url': f'/api/tables/{name}?v={version}'
+            })
+        
+        response = jsonify({
+            'success': True,
+            'default': DEFAULT_TABLE,
+            'tables': tables
+        })
+        etag = ','.join(f"{t['name']}:{t['version']}" for t in tables)
+        response.set_etag(hashlib.sha1(etag.encode('utf-8')).hexdigest()[:16])
+        response.cache_control.public = True
+        response.cache_control.max_age = TABLES_LIST_MAX_AGE
+        return response.make_conditional(request)
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error al listar tablas: {str(e)}'
+        }), 500
+
+
+@braille_bp.route('/tables/<name>', methods=['GET'])
+def get_client_table(name):
+    """
+    Tabla compilada para el motor de conversión del navegador
+    (frontend/js/braille_engine.js).
+    
+    Args:
+        name: Nombre de la tabla (en URL)
+    
+    Query Params:
+        v: Versión esperada (opcional); si coincide con la actual, la
+            respuesta se marca como inmutable
+    
+    Response:
+        Tabla exportada (ver BrailleConverter.client_table), con ETag
+        igual a su versión
+    """
+    try:
+        ctx = get_app_context()
+        
+        try:
+            converter = ctx.converter_for(name)
+        except TableError as e:
+            return table_error_response(e)
+        
+        exported = converter.client_table()
+        response = jsonify(exported)
+        response.set_etag(exported['version'])
+        response.cache_control.public = True
+        if request.args.get('v') == exported['version']:
+            response.cache_control.max_age = VERSIONED_MAX_AGE
+            response.cache_control.immutable = True
+        else:
+            response.cache_control.max_age = INFO_CACHE_MAX_AGE
+        return response.make_conditional(request)
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error al obtener la tabla: {str(e)}'
+        }), 500
+
+
+@braille_bp.route('/history', methods=['POST'])
+def save_client_conversion():
+    """
+    Guarda en el historial una conversión hecha en el navegador.
+    
+    Request Body:
+        {
+            "original_text": "Hola",
+            "braille_text": "⠨⠓⠕⠇⠁",
+            "conversion_type": "text_to_braille",  // o braille_to_text
+            "latency_ms": 0.3                      // opcional
+        }
+    
+    Response:
+        {
+            "success": true,
+            "id": 42
+        }
+    """
+    try:
+        ctx = get_app_context()
+        
+        data = request.get_json(silent=True)
+        
+        if not data:
+            return jsonify({
+                'success': False,
+                'error': 'Datos requeridos'
+            }), 400
+        
+        original_text = data.get('original_text')
+        braille_text = data.get('braille_text')
+        conversion_type = data.get('conversion_type')
+        latency_ms = data.get('latency_ms')
+        
+        if not isinstance(original_text, str) or not isinstance(braille_text, str):
+            return jsonify({
+                'success': False,
+                'error': 'Los campos "original_text" y "braille_text" son requeridos'
+            }), 400
+        
+        if conversion_type not in CONVERSION_TYPES:
+            return jsonify({
+                'success': False,
+                'error': f'Tipo inválido. Opciones: {", ".join(CONVERSION_TYPES)}'
+            }), 400
+        
+        if not _BRAILLE_TEXT.fullmatch(braille_text):
+            return jsonify({
+                'success': False,
+                'error': 'El campo "braille_text" debe estar en Braille Unicode'
+            }), 400
+        
+        if latency_ms is not None and (isinstance(latency_ms, bool)
+                                       or not isinstance(latency_ms, (int, float))):
+            return jsonify({
+                'success': False,
+                'error': 'El campo "latency_ms" debe ser numérico'
+            }), 400
+        
+        record_id = ctx.db_manager.save_conversion(
+            original_text=original_text,
+            braille_text=braille_text,
+            conversion_type=conversion_type,
+            latency_ms=latency_ms
+        )
+        
+        return jsonify({
+            'success': True,
+            'id': record_id
+        }), 201
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error al guardar en el historial: {str(e)}'
+        }), 500
+
+
+@braille_bp.route('/history/export', methods=['GET'])
+def export_history():
+    """
+    Exporta una tabla del historial completa, en streaming.
+    
+    Query Params:
+        table: conversions, pdf_generations (default: conversions)
+        format: ndjson, csv (default: ndjson)
+        compress: gzip (opcional)
+    
+    Response:
+        Archivo NDJSON o CSV (opcionalmente .gz) para descarga; las filas
+        se leen y se envían por lotes
+    """
+    try:
+        ctx = get_app_context()
+        
+        table = request.args.get('table', 'conversions')
+        export_format = request.args.get('format', 'ndjson')
+        compress = request.args.get('compress')
+        
+        if table not in EXPORT_COLUMNS:
+            return jsonify({
+                'success': False,
+                'error': 'Tabla inválida. Opciones: conversions, pdf_generations'
+            }), 400
+        
+        if export_format not in EXPORT_FORMATS:
+            return jsonify({
+                'success': False,
+                'error': 'Formato inválido. Opciones: ndjson, csv'
+            }), 400
+        
+        if compress not in (None, 'gzip'):
+            return jsonify({
+                'success': False,
+                'error': 'Compresión inválida. Opciones: gzip'
+            }), 400
+        
+        chunks = encode_records(ctx.db_manager.iter_records(table), export_format,
+                                EXPORT_COLUMNS[table])
+        filename = f'{table}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.{export_format}'
+        mimetype = EXPORT_FORMATS[export_format]
+        if compress:
+            chunks = gzip_chunks(chunks)
+            filename += '.gz'
+            mimetype = 'application/gzip'
+        
+        return Response(chunks, mimetype=mimetype, headers={
+            'Content-Disposition': f'attachment; filename={filename}'
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error al exportar historial: {str(e)}'
+        }), 500
+
+
+@braille_bp.route('/history/import', methods=['POST'])
+def import_history():
+    """
+    Importa registros exportados con /api/history/export.
+    
+    Query Params:
+        table: conversions, pdf_generations (default: conversions)
+        format: ndjson, csv (default: ndjson)
+    
+    Request Body:
+        Contenido NDJSON o CSV, sin comprimir o en gzip (se detecta)
+    
+    Response:
+        {
+            "success": true,
+            "table": "conversions",
+            "imported": 1200
+        }
+    """
+    try:
+        ctx = get_app_context()
+        
+        table = request.args.get('table', 'conversions')
+        import_format = request.args.get('format', 'ndjson')
+        
+        if table not in EXPORT_COLUMNS:
+            return jsonify({
+                'success': False,
+                'error': 'Tabla inválida. Opciones: conversions, pdf_generations'
+            }), 400
+        
+        if import_format not in EXPORT_FORMATS:
+            return jsonify({
+                'success': False,
+                'error': 'Formato inválido. Opciones: ndjson, csv'
+            }), 400
+        
+        try:
+            imported = ctx.db_manager.import_records(
+                table, decode_records(request.stream, import_format)
+            )
+        except (ValueError, OSError, EOFError) as e:
+            # Registros inválidos, UTF-8 incorrecto o gzip corrupto
+            return jsonify({
+                'success': False,
+                'error': f'Datos inválidos: {str(e)}'
+            }), 400
+        
+        return jsonify({
+            'success': True,
+            'table': table,
+            'imported': imported
+        }), 200
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error al importar historial: {str(e)}'
+        }), 500
+
+
 @braille_bp.route('/validate', methods=['POST'])
 def validate_text():
     """
@@ -415,18 +1151,26 @@ def validate_text():
     
     Request Body:
         {
-            "text": "Texto a validar"
+            "text": "Texto a validar",
+            "max_failures": 100,  (opcional, detiene la búsqueda tras N fallos)
+            "table": "es"         (opcional, tabla de traducción)
         }
     
     Response:
         {
             "success": true,
-            "is_valid": true,
-            "unsupported_characters": [],
-            "message": "Texto válido para conversión"
+            "is_valid": false,
+            "unsupported_characters": ["@"],
+            "details": [
+                {"char": "@", "code": "U+0040", "count": 2, "positions": [4, 9]}
+            ],
+            "truncated": false,
+            "message": "Texto contiene caracteres no soportados"
         }
     """
     try:
+        ctx = get_app_context()
+        
         data = request.get_json()
         
         if not data or 'text' not in data:
@@ -435,13 +1179,29 @@ def validate_text():
                 'error': 'Campo "text" es requerido'
             }), 400
         
+        try:
+            converter = ctx.converter_for(data.get('table'))
+        except TableError as e:
+            return table_error_response(e)
+        
         text = data['text']
-        is_valid, unsupported = braille_converter.validate_text(text)
+        max_failures = data.get('max_failures')
+        
+        if max_failures is not None and (not isinstance(max_failures, int) or max_failures < 1):
+            return jsonify({
+                'success': False,
+                'error': 'max_failures debe ser un entero positivo'
+            }), 400
+        
+        result = converter.find_unsupported(text, max_failures)
+        is_valid = result['is_valid']
         
         return jsonify({
             'success': True,
             'is_valid': is_valid,
-            'unsupported_characters': unsupported,
+            'unsupported_characters': [entry['char'] for entry in result['unsupported']],
+            'details': result['unsupported'],
+            'truncated': result['truncated'],
             'message': 'Texto válido para conversión' if is_valid else 'Texto contiene caracteres no soportados'
         }), 200
         
@@ -452,6 +1212,110 @@ def validate_text():
         }), 500
 
 
+def _parse_timestamp(value: str) -> datetime:
+    """
+    Interpreta una fecha ISO 8601 de la query string (UTC si no indica zona).
+    
+    Raises:
+        ValueError: Si el formato no es válido
+    """
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+@braille_bp.route('/stats/timeseries', methods=['GET'])
+def get_stats_timeseries():
+    """
+    Obtiene la serie temporal de conversiones y PDFs generados.
+    
+    Solo consulta las tablas de agregados (por minuto y por hora); los
+    intervalos sin actividad se omiten.
+    
+    Query Params:
+        from: Inicio ISO 8601, UTC si no indica zona (default: to - 24 h,
+            o to - 1 h con bucket=minute)
+        to: Fin ISO 8601, excluido (default: ahora)
+        bucket: minute, hour (default: hour)
+    
+    Response:
+        {
+            "success": true,
+            "bucket": "hour",
+            "from": "2025-11-22T00:00:00+00:00",
+            "to": "2025-11-23T00:00:00+00:00",
+            "conversions": [
+                {
+                    "bucket_start": "2025-11-22 10:00:00",
+                    "conversions": 12,
+                    "characters": 340,
+                    "latency_avg_ms": 1.8,
+                    "latency_max_ms": 6.2,
+                    "by_type": {"text_to_braille": {...}}
+                }
+            ],
+            "pdfs": [
+                {
+                    "bucket_start": "2025-11-22 10:00:00",
+                    "pdfs": 2,
+                    "bytes": 5120,
+                    "by_format": {"elevator": {"pdfs": 2, "bytes": 5120}}
+                }
+            ]
+        }
+    """
+    try:
+        ctx = get_app_context()
+        
+        bucket = request.args.get('bucket', 'hour')
+        if bucket not in TIMESERIES_BUCKETS:
+            return jsonify({
+                'success': False,
+                'error': 'Granularidad inválida. Opciones: minute, hour'
+            }), 400
+        
+        try:
+            end = _parse_timestamp(request.args['to']) if 'to' in request.args \
+                else datetime.now(timezone.utc)
+            start = _parse_timestamp(request.args['from']) if 'from' in request.args \
+                else end - TIMESERIES_DEFAULT_RANGE[bucket]
+        except ValueError:
+            return jsonify({
+                'success': False,
+                'error': 'Fechas inválidas. Use formato ISO 8601 (2025-11-22T10:00:00)'
+            }), 400
+        
+        if start >= end:
+            return jsonify({
+                'success': False,
+                'error': '"from" debe ser anterior a "to"'
+            }), 400
+        
+        if (end - start) / TIMESERIES_BUCKETS[bucket] > TIMESERIES_MAX_POINTS:
+            return jsonify({
+                'success': False,
+                'error': f'Rango demasiado amplio: máximo {TIMESERIES_MAX_POINTS} intervalos'
+            }), 400
+        
+        series = ctx.db_manager.get_timeseries(start, end, bucket)
+        
+        return jsonify({
+            'success': True,
+            'bucket': bucket,
+            'from': start.isoformat(),
+            'to': end.isoformat(),
+            'conversions': series['conversions'],
+            'pdfs': series['pdfs']
+        }), 200
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error al obtener estadísticas: {str(e)}'
+        }), 500
+
+
 # Manejo de errores globales
 @braille_bp.errorhandler(404)
 def not_found(error):
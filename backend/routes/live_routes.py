@@ -0,0 +1,366 @@
+"""
+Rutas de Conversión en Vivo - Sistema Braille
+=============================================
+Canal de conversión en vivo con estado en el servidor: la sesión guarda
+el texto y sus celdas, aplica las ediciones de forma incremental (ver
+backend/models/incremental.py) y envía los cambios de celdas por
+server-sent events. El historial recibe una sola fila al confirmar la
+sesión, en lugar de una validación, conversión completa y escritura en
+la base de datos por cada pulsación.
+
+Endpoints:
+- POST /api/live/sessions: Crea una sesión
+- GET /api/live/sessions/<id>/events: Stream SSE de la sesión
+- POST /api/live/sessions/<id>/edits: Aplica ediciones
+- POST /api/live/sessions/<id>/commit: Guarda la sesión en el historial
+- DELETE /api/live/sessions/<id>: Cierra la sesión
+
+Eventos del stream: 'snapshot' (Braille completo), 'diff' (rango de
+celdas cambiado: start, deleted, braille), 'commit' y 'close'. El id de
+cada evento permite reanudar con Last-Event-ID.
+
+Las sesiones son del proceso que las crea: con varios workers, el
+balanceador debe enviar las peticiones de una sesión al mismo worker
+(afinidad); si no, el cliente recibe 404 y debe crear otra sesión.
+Cada stream abierto ocupa un hilo del worker, por eso tienen un límite
+por proceso y una duración máxima (el navegador se reconecta solo). El
+límite depende de BRAILLE_THREADS y nunca los ocupa todos; no descuenta
+los PDFs (ver el dimensionado de hilos en backend/server.py).
+
+Variables de entorno:
+    BRAILLE_LIVE_STREAMS         Streams abiertos por proceso (default:
+                                 BRAILLE_THREADS / 2; como máximo
+                                 BRAILLE_THREADS - 1, mínimo 1)
+    BRAILLE_LIVE_KEEPALIVE       Segundos entre comentarios keep-alive (default: 15)
+    BRAILLE_LIVE_STREAM_SECONDS  Duración máxima de un stream (default: 300)
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import time
+from flask import Blueprint, Response, request, jsonify
+from backend.app_context import get_app_context
+from backend.models.incremental import EditError, VersionConflict
+from backend.models.translation_tables import TableError
+from backend.routes.braille_routes import table_error_response, unsupported_response
+from backend.utils.concurrency import ConcurrencyLimiter, ConcurrencyLimitExceeded
+from backend.utils.env import env_int
+from backend.utils.metrics import characters_converted
+
+# Crear Blueprint para las rutas en vivo
+live_bp = Blueprint('braille_live', __name__, url_prefix='/api/live')
+
+
+def _stream_limit() -> int:
+    """
+    Streams abiertos admitidos por proceso: la mitad de los hilos por
+    defecto y nunca todos (mínimo 1).
+    """
+    threads = env_int('BRAILLE_THREADS', 4)
+    limit = env_int('BRAILLE_LIVE_STREAMS', max(1, threads // 2))
+    return max(1, min(limit, threads - 1))
+
+
+stream_limiter = ConcurrencyLimiter('live_stream', _stream_limit())
+KEEPALIVE_SECONDS = env_int('BRAILLE_LIVE_KEEPALIVE', 15)
+STREAM_MAX_SECONDS = env_int('BRAILLE_LIVE_STREAM_SECONDS', 300)
+
+# Milisegundos que espera el navegador antes de reconectarse
+RECONNECT_MS = 3000
+
+
+def _session_or_404(session_id: str):
+    """Sesión por identificador, o la respuesta 404 si no existe."""
+    session = get_app_context().live_sessions.get(session_id)
+    if session is None:
+        return None, (jsonify({
+            'success': False,
+            'error': 'Sesión no encontrada o caducada'
+        }), 404)
+    return session, None
+
+
+@live_bp.route('/sessions', methods=['POST'])
+def create_session():
+    """
+    Crea una sesión de conversión en vivo.
+
+    Request Body:
+        {
+            "text": "Hola",      // opcional: texto inicial
+            "table": "es",       // opcional: tabla de traducción
+            "contracted": false  // opcional: modo contraído
+        }
+
+    Response (201):
+        {
+            "success": true,
+            "session_id": "9f1c...",
+            "version": 0,
+            "braille": "⠨⠓⠕⠇⠁",
+            "cell_count": 5,
+            "events_url": "/api/live/sessions/9f1c.../events"
+        }
+    """
+    try:
+        ctx = get_app_context()
+
+        data = request.get_json(silent=True) or {}
+        text = data.get('text', '')
+        if not isinstance(text, str):
+            return jsonify({
+                'success': False,
+                'error': 'Campo "text" debe ser texto'
+            }), 400
+
+        try:
+            converter = ctx.converter_for(data.get('table'))
+        except TableError as e:
+            return table_error_response(e)
+
+        contracted = bool(data.get('contracted', False))
+        if contracted and converter.CONTRACTIONS is None:
+            return jsonify({
+                'success': False,
+                'error': f'La tabla {converter.table.name} no tiene modo contraído'
+            }), 400
+
+        is_valid, unsupported_chars = converter.validate_text(text)
+        if not is_valid:
+            return unsupported_response(unsupported_chars)
+
+        session_id, session = ctx.live_sessions.create(text, converter, contracted)
+        characters_converted.inc(len(text), direction='text_to_braille')
+
+        return jsonify({
+            'success': True,
+            'session_id': session_id,
+            'version': session.version,
+            'table': converter.table.name,
+            'contracted': contracted,
+            'braille': session.braille,
+            'cell_count': session.cell_count,
+            'events_url': f'/api/live/sessions/{session_id}/events'
+        }), 201
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error en conversión: {str(e)}'
+        }), 500
+
+
+@live_bp.route('/sessions/<session_id>/events', methods=['GET'])
+def session_events(session_id):
+    """
+    Stream server-sent events de una sesión.
+
+    Sin Last-Event-ID (cabecera, o ?last_event_id=) empieza con un
+    evento 'snapshot'; con él, reenvía los eventos posteriores (o un
+    snapshot si ya no están). El stream termina al cerrar la sesión o al
+    cumplirse la duración máxima. Responde 503 si se alcanzó el límite
+    de streams del proceso.
+    """
+    session, error = _session_or_404(session_id)
+    if error:
+        return error
+
+    last_event_id = request.headers.get('Last-Event-ID', request.args.get('last_event_id'))
+    try:
+        after = int(last_event_id) if last_event_id is not None else None
+    except ValueError:
+        after = None
+
+    try:
+        stream_limiter.acquire()
+    except ConcurrencyLimitExceeded as e:
+        response = jsonify({
+            'success': False,
+            'error': 'Demasiados streams abiertos, intente de nuevo',
+            'endpoint_class': e.name
+        })
+        response.status_code = 503
+        response.headers['Retry-After'] = '1'
+        return response
+
+    def generate():
+        last_seq = after
+        deadline = time.monotonic() + STREAM_MAX_SECONDS
+        yield f"retry: {RECONNECT_MS}\n\n"
+        while True:
+            if last_seq is None:
+                snapshot = session.snapshot()
+                last_seq = snapshot.seq
+                yield snapshot.to_sse()
+
+            events, closed = session.wait_events(last_seq, KEEPALIVE_SECONDS)
+            if events is None:
+                last_seq = None
+                continue
+            if events:
+                yield ''.join(event.to_sse() for event in events)
+                last_seq = events[-1].seq
+            else:
+                yield ": keep-alive\n\n"
+            if closed or time.monotonic() >= deadline:
+                return
+
+    response = Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+    response.call_on_close(stream_limiter.release)
+    return response
+
+
+@live_bp.route('/sessions/<session_id>/edits', methods=['POST'])
+def apply_edits(session_id):
+    """
+    Aplica ediciones a una sesión; los cambios de celdas se envían por
+    el stream de eventos.
+
+    Request Body:
+        {
+            "base_version": 3,
+            "edits": [
+                {"offset": 4, "deleted": 0, "inserted": " mundo"}
+            ]
+        }
+
+    Las ediciones se aplican en orden, cada una sobre el resultado de la
+    anterior (el cliente puede agrupar varias pulsaciones en una
+    petición).
+
+    Response:
+        {
+            "success": true,
+            "version": 4,
+            "last_event_id": 7
+        }
+
+    Si base_version no es la versión actual responde 409 con la versión
+    actual. Si alguna edición es inválida se rechaza la serie completa:
+    400 sin aplicar ninguna, con la versión actual (sin cambios).
+    """
+    try:
+        session, error = _session_or_404(session_id)
+        if error:
+            return error
+
+        data = request.get_json(silent=True)
+        edits = data.get('edits') if isinstance(data, dict) else None
+        base_version = data.get('base_version') if isinstance(data, dict) else None
+        if (not isinstance(edits, list) or isinstance(base_version, bool)
+                or not isinstance(base_version, int)):
+            return jsonify({
+                'success': False,
+                'error': 'Campos "base_version" y "edits" son requeridos'
+            }), 400
+
+        inserted = ''.join(edit.get('inserted', '') for edit in edits
+                           if isinstance(edit, dict) and isinstance(edit.get('inserted', ''), str))
+        is_valid, unsupported_chars = session.converter.validate_text(inserted)
+        if not is_valid:
+            return unsupported_response(unsupported_chars)
+
+        try:
+            session.apply_edits(edits, base_version)
+        except VersionConflict as e:
+            return jsonify({
+                'success': False,
+                'error': str(e),
+                'version': e.current
+            }), 409
+        except EditError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e),
+                'version': session.version
+            }), 400
+
+        characters_converted.inc(len(inserted), direction='text_to_braille')
+
+        return jsonify({
+            'success': True,
+            'version': session.version,
+            'last_event_id': session.last_seq
+        }), 200
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error en conversión: {str(e)}'
+        }), 500
+
+
+@live_bp.route('/sessions/<session_id>/commit', methods=['POST'])
+def commit_session(session_id):
+    """
+    Guarda el estado actual de la sesión en el historial (una fila).
+
+    Request Body:
+        {
+            "close": false  // opcional: cerrar la sesión tras guardar
+        }
+
+    Response:
+        {
+            "success": true,
+            "id": 42,        // fila del historial (null si no hubo cambios)
+            "version": 4
+        }
+
+    Confirmar de nuevo sin ediciones nuevas no añade otra fila. Si el
+    guardado falla la versión sigue pendiente y se puede reintentar.
+    """
+    try:
+        ctx = get_app_context()
+
+        session, error = _session_or_404(session_id)
+        if error:
+            return error
+
+        data = request.get_json(silent=True) or {}
+        history_id = None
+        with session.commit_lock:
+            pending = session.commit_snapshot()
+            if pending is not None:
+                version, text, braille, conversion_ms = pending
+                history_id = ctx.db_manager.save_conversion(
+                    original_text=text,
+                    braille_text=braille,
+                    conversion_type='text_to_braille',
+                    latency_ms=conversion_ms
+                )
+                # Solo tras guardar: si falla, la versión sigue pendiente
+                session.mark_committed(version)
+
+        if data.get('close'):
+            session.close()
+            ctx.live_sessions.discard(session_id)
+
+        return jsonify({
+            'success': True,
+            'id': history_id,
+            'version': session.version
+        }), 200
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Error al guardar la sesión: {str(e)}'
+        }), 500
+
+
+@live_bp.route('/sessions/<session_id>', methods=['DELETE'])
+def close_session(session_id):
+    """Cierra una sesión sin guardarla; sus streams reciben 'close'."""
+    session = get_app_context().live_sessions.discard(session_id)
+    if session is None:
+        return jsonify({
+            'success': False,
+            'error': 'Sesión no encontrada o caducada'
+        }), 404
+    session.close()
+    return jsonify({'success': True}), 200
@@ -0,0 +1,161 @@
+"""
+Servidor de Producción - Sistema Braille
+=========================================
+Ejecuta la aplicación Flask bajo Gunicorn (multi-proceso y multi-hilo)
+en lugar del servidor de desarrollo de Flask.
+
+Ejecutar con:
+    python run.py serve
+
+Variables de entorno:
+    FLASK_HOST                 Dirección de escucha (default: 0.0.0.0)
+    FLASK_PORT                 Puerto (default: 5000)
+    BRAILLE_WORKERS            Número de procesos (default: 2 * CPUs + 1)
+    BRAILLE_THREADS            Hilos por proceso (default: 4)
+    BRAILLE_TIMEOUT            Segundos antes de reiniciar un worker bloqueado (default: 30)
+    BRAILLE_GRACEFUL_TIMEOUT   Segundos para terminar peticiones al apagar (default: 30)
+    BRAILLE_KEEPALIVE          Segundos de keep-alive HTTP (default: 5)
+    BRAILLE_MAX_REQUESTS       Reciclar worker tras N peticiones, 0 = nunca (default: 0)
+    BRAILLE_PRELOAD            Cargar la aplicación antes del fork (default: true)
+    BRAILLE_PDF_LIMIT          PDFs simultáneos por proceso (default: BRAILLE_THREADS / 2,
+                               como máximo BRAILLE_THREADS - 1)
+    BRAILLE_LIVE_STREAMS       Streams de /api/live por proceso (default: BRAILLE_THREADS / 2,
+                               como máximo BRAILLE_THREADS - 1)
+
+Dimensionado de hilos: cada petición ocupa un hilo del worker mientras
+dura, incluidas las vistas asíncronas (que esperan al ejecutor de PDFs)
+y los streams de /api/live (hasta BRAILLE_LIVE_STREAM_SECONDS). Cada
+límite por separado deja al menos un hilo libre, pero no se descuentan
+entre sí: con 4 hilos se admiten 2 PDFs y 2 streams, y con ambos llenos
+las conversiones esperan en la cola de Gunicorn hasta que se libera un
+hilo. Es el compromiso elegido para que varios clientes puedan seguir
+una sesión en vivo con el servidor ocioso. Si se esperan muchos streams
+y PDFs a la vez, subir BRAILLE_THREADS (los streams apenas usan CPU)
+en lugar de los límites.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import os
+from typing import Callable, Dict
+from flask import Flask
+from backend.utils.env import env_int, env_bool
+
+
+def get_server_config() -> Dict:
+    """
+    Construye la configuración del servidor a partir del entorno.
+
+    Returns:
+        Diccionario con la configuración de Gunicorn
+    """
+    host = os.environ.get('FLASK_HOST', '0.0.0.0')
+    port = env_int('FLASK_PORT', 5000)
+
+    return {
+        'bind': f'{host}:{port}',
+        'workers': env_int('BRAILLE_WORKERS', 2 * (os.cpu_count() or 1) + 1),
+        'threads': env_int('BRAILLE_THREADS', 4),
+        'timeout': env_int('BRAILLE_TIMEOUT', 30),
+        'graceful_timeout': env_int('BRAILLE_GRACEFUL_TIMEOUT', 30),
+        'keepalive': env_int('BRAILLE_KEEPALIVE', 5),
+        'max_requests': env_int('BRAILLE_MAX_REQUESTS', 0),
+        'max_requests_jitter': env_int('BRAILLE_MAX_REQUESTS_JITTER', 0),
+        'preload_app': env_bool('BRAILLE_PRELOAD', True),
+        'worker_class': 'gthread',
+        'accesslog': '-',
+        'errorlog': '-',
+    }
+
+
+def _worker_context(worker):
+    """Contexto de la aplicación cargada en un worker."""
+    from backend.app_context import get_app_context
+    return get_app_context(worker.app.wsgi())
+
+
+def _when_ready(server):
+    """
+    Hook de Gunicorn en el maestro, antes de crear los workers.
+
+    Con preload, congela los objetos ya creados (tablas del conversor,
+    catálogos, módulos) para que los workers los compartan copy-on-write.
+    """
+    if server.cfg.preload_app:
+        from backend.app_context import freeze_shared_state
+        freeze_shared_state()
+
+
+def _post_fork(server, worker):
+    """
+    Hook de Gunicorn en cada worker recién creado.
+
+    Descarta el estado por proceso heredado del maestro: cada worker
+    abre sus propias conexiones a la base de datos.
+    """
+    _worker_context(worker).post_fork()
+
+
+def _worker_exit(server, worker):
+    """
+    Hook de Gunicorn al terminar un worker.
+
+    Las peticiones en curso ya finalizaron (apagado ordenado); se espera a
+    que los ejecutores terminen las escrituras pendientes y se cierran los
+    recursos de base de datos del proceso.
+    """
+    from backend.routes.async_routes import shutdown_executors
+    shutdown_executors(wait=True)
+    _worker_context(worker).shutdown()
+
+
+def _on_exit(server):
+    """Hook de Gunicorn al detener el proceso maestro."""
+    if server.cfg.preload_app:
+        # Con preload la aplicación (y su contexto) se creó en el maestro
+        _worker_context(server).shutdown()
+
+
+def run_production_server(app_factory: Callable[[], Flask], config: Dict = None):
+    """
+    Ejecuta la aplicación bajo Gunicorn.
+
+    Con preload activado, la aplicación (imports, tablas del conversor,
+    contexto de la aplicación) se crea una sola vez en el proceso maestro
+    y los workers la heredan al hacer fork; cada worker abre después sus
+    propias conexiones a la base de datos (hook post_fork).
+
+    Args:
+        app_factory: Función que crea la aplicación Flask (create_app)
+        config: Configuración de Gunicorn (default: get_server_config())
+    """
+    # Gunicorn no está disponible en Windows: se importa solo al usarlo
+    from gunicorn.app.base import BaseApplication
+
+    class BrailleApplication(BaseApplication):
+        """Aplicación Gunicorn que envuelve create_app()."""
+
+        def __init__(self, options: Dict):
+            self.options = options
+            self.application = None
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                if key in self.cfg.settings and value is not None:
+                    self.cfg.set(key, value)
+            self.cfg.set('when_ready', _when_ready)
+            self.cfg.set('post_fork', _post_fork)
+            self.cfg.set('worker_exit', _worker_exit)
+            self.cfg.set('on_exit', _on_exit)
+
+        def load(self):
+            if self.application is None:
+                self.application = app_factory()
+            return self.application
+
+    if config is None:
+        config = get_server_config()
+
+    BrailleApplication(config).run()
@@ -0,0 +1,111 @@
+"""
+Formato BRF - Sistema Braille
+=============================
+Conversión entre Braille Unicode y BRF (Braille Ready Format), el
+formato de texto que usan las impresoras y líneas Braille: cada celda de
+6 puntos se escribe como un carácter ASCII (tabla ASCII Braille
+norteamericana), con líneas y páginas de tamaño fijo.
+
+BRF solo representa celdas de 6 puntos: las celdas con los puntos 7 u 8
+(tablas de 8 puntos como computer8) no tienen carácter ASCII. Para esas
+tablas hay que usar la salida Unicode, el PDF o las imágenes.
+
+Ejemplo:
+    >>> unicode_to_brf('⠓⠕⠇⠁')
+    'HOLA'
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import re
+from typing import Iterable, Iterator
+
+# Carácter ASCII de cada máscara de 6 puntos (índice = máscara, bit 0 = punto 1)
+BRF_ASCII = " A1B'K2L@CIF/MSP\"E3H9O6R^DJG>NTQ,*5<-U8V.%[$+X!&;:4\\0Z7(_?W]#Y)="
+
+# Tamaño de página habitual de las impresoras Braille
+CELLS_PER_LINE = 40
+LINES_PER_PAGE = 25
+
+BRAILLE_BASE = 0x2800
+
+_TO_BRF = {BRAILLE_BASE + mask: char for mask, char in enumerate(BRF_ASCII)}
+_FROM_BRF = {ord(char): chr(BRAILLE_BASE + mask) for mask, char in enumerate(BRF_ASCII)}
+# Celdas Unicode con el punto 7 o el 8 (sin equivalente en BRF)
+_EIGHT_DOT_CELLS = re.compile('[\u2840-\u28ff]')
+
+# BRF no distingue mayúsculas y minúsculas
+_FROM_BRF.update({ord(char.lower()): chr(BRAILLE_BASE + mask)
+                  for mask, char in enumerate(BRF_ASCII) if char.isalpha()})
+
+
+def unicode_to_brf(braille: str, strict: bool = False) -> str:
+    """
+    Convierte Braille Unicode de 6 puntos a ASCII Braille.
+
+    Los caracteres que no son celdas de 6 puntos se conservan.
+
+    Args:
+        braille: Texto en Braille Unicode
+        strict: Rechazar las celdas de 8 puntos en lugar de conservarlas
+
+    Raises:
+        ValueError: Si strict y el texto tiene celdas con los puntos 7 u 8
+    """
+    if strict:
+        match = _EIGHT_DOT_CELLS.search(braille)
+        if match:
+            raise ValueError(f"BRF solo admite celdas de 6 puntos: {match.group()!r} "
+                             f"en la posición {match.start()}")
+    return braille.translate(_TO_BRF)
+
+
+def brf_to_unicode(brf: str) -> str:
+    """
+    Convierte ASCII Braille a Braille Unicode.
+
+    Los saltos de línea y de página se conservan.
+    """
+    return brf.translate(_FROM_BRF)
+
+
+def wrap_brf_line(line: str, width: int = CELLS_PER_LINE) -> Iterator[str]:
+    """
+    Parte una línea BRF en líneas de como máximo width celdas, cortando
+    en las celdas vacías (espacios) cuando es posible.
+    """
+    while len(line) > width:
+        cut = line.rfind(' ', 0, width + 1)
+        if cut <= 0:
+            cut = width
+        yield line[:cut]
+        line = line[cut:].lstrip(' ')
+    yield line
+
+
+class BRFPaginator:
+    """
+    Compone líneas BRF en páginas: ajusta cada línea al ancho y añade un
+    salto de página (\\f) cada lines_per_page líneas.
+    """
+
+    def __init__(self, cells_per_line: int = CELLS_PER_LINE,
+                 lines_per_page: int = LINES_PER_PAGE):
+        self.cells_per_line = cells_per_line
+        self.lines_per_page = lines_per_page
+        self._line_count = 0
+
+    def feed(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        Procesa líneas BRF (sin salto de línea final).
+
+        Yields:
+            Texto listo para escribir, con sus saltos de línea y de página
+        """
+        for line in lines:
+            for wrapped in wrap_brf_line(line, self.cells_per_line):
+                if self._line_count and self._line_count % self.lines_per_page == 0:
+                    yield '\f'
+                yield wrapped.rstrip(' ') + '\n'
+                self._line_count += 1
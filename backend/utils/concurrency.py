@@ -0,0 +1,143 @@
+"""
+Control de Concurrencia
+=======================
+Límites de concurrencia por tipo de endpoint y ejecutores acotados
+para descargar trabajo bloqueante (PDFs, escrituras en SQLite) desde
+vistas asíncronas.
+
+Cada clase de endpoint tiene su propio límite: cuando se alcanza, la
+petición se rechaza inmediatamente (HTTP 503) en lugar de encolarse,
+de modo que el tráfico de PDFs no puede acaparar los hilos que
+atienden conversiones.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore, Lock
+
+
+class ConcurrencyLimitExceeded(Exception):
+    """Se alcanzó el límite de peticiones simultáneas de un tipo."""
+
+    def __init__(self, name: str, limit: int):
+        self.name = name
+        self.limit = limit
+        super().__init__(f"Límite de concurrencia alcanzado para '{name}' ({limit})")
+
+
+class ConcurrencyLimiter:
+    """Semáforo con nombre que limita las operaciones simultáneas."""
+
+    def __init__(self, name: str, limit: int, wait_timeout: float = 0.0):
+        """
+        Inicializa el limitador.
+
+        Args:
+            name: Nombre de la clase de endpoint (para errores y métricas)
+            limit: Número máximo de operaciones simultáneas
+            wait_timeout: Segundos a esperar por un hueco antes de rechazar
+        """
+        self.name = name
+        self.limit = limit
+        self.wait_timeout = wait_timeout
+        self._semaphore = BoundedSemaphore(limit)
+        self._lock = Lock()
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Número de operaciones en curso."""
+        return self._in_flight
+
+    def acquire(self):
+        """
+        Reserva un hueco.
+
+        Raises:
+            ConcurrencyLimitExceeded: Si no hay huecos disponibles
+        """
+        if self.wait_timeout > 0:
+            acquired = self._semaphore.acquire(timeout=self.wait_timeout)
+        else:
+            acquired = self._semaphore.acquire(blocking=False)
+
+        if not acquired:
+            raise ConcurrencyLimitExceeded(self.name, self.limit)
+
+        with self._lock:
+            self._in_flight += 1
+
+    def release(self):
+        """Libera un hueco reservado con acquire()."""
+        with self._lock:
+            self._in_flight -= 1
+        self._semaphore.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+        return False
+
+
+class BoundedExecutor:
+    """
+    Pool de hilos con cola acotada para ejecutar trabajo bloqueante.
+
+    Admite como máximo max_workers tareas en ejecución más max_queue
+    en espera; por encima de eso run() lanza ConcurrencyLimitExceeded.
+    """
+
+    def __init__(self, name: str, max_workers: int, max_queue: int = 0):
+        """
+        Inicializa el ejecutor.
+
+        Args:
+            name: Nombre del ejecutor (prefijo de los hilos)
+            max_workers: Hilos de trabajo
+            max_queue: Tareas adicionales que pueden esperar en cola
+        """
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._limiter = ConcurrencyLimiter(name, max_workers + max_queue)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix=f'braille-{name}')
+
+    @property
+    def in_flight(self) -> int:
+        """Tareas en ejecución o en cola."""
+        return self._limiter.in_flight
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Envía una tarea al pool.
+
+        Returns:
+            concurrent.futures.Future de la tarea
+
+        Raises:
+            ConcurrencyLimitExceeded: Si el pool y su cola están llenos
+        """
+        self._limiter.acquire()
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except Exception:
+            self._limiter.release()
+            raise
+        future.add_done_callback(lambda _: self._limiter.release())
+        return future
+
+    async def run(self, fn, *args, **kwargs):
+        """Ejecuta una tarea en el pool y espera su resultado sin bloquear el bucle."""
+        # asyncio solo se necesita en vistas asíncronas (ya cargado por asgiref)
+        import asyncio
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True):
+        """Detiene el pool, esperando (por defecto) a las tareas pendientes."""
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,122 @@
+"""
+Formato Compacto de dots_info - Sistema Braille
+===============================================
+Codificación compacta de la información de puntos por celda
+(get_dots_info), que en formato lista ocupa decenas de bytes por celda.
+
+Formato 'compact':
+    {
+        "format": "compact",
+        "count": 3,                          // número de celdas
+        "masks": "AQgB",                     // base64, un byte por celda
+        "type_names": ["capital_sign", ...], // nombres de los códigos
+        "type_runs": "AAEFAg==",             // base64 de pares (código, repeticiones)
+        "labels": "⠨hb"                      // etiqueta de cada celda
+    }
+
+- masks: máscara de puntos de cada celda (bit 0 = punto 1 ... bit 7 =
+  punto 8).
+- type_runs: los tipos de celda codificados por longitud de racha; cada
+  racha son dos bytes, el índice en type_names y su longitud (1-255).
+- labels: un carácter (punto de código) por celda, el 'char' del
+  formato lista.
+
+El frontend lo decodifica con BrailleEngine.decodeDotsInfo.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import base64
+from typing import Dict, List
+from backend.models.braille_cells import dots_to_mask, mask_to_dots
+
+# Formatos de dots_info en las respuestas
+DOTS_INFO_FORMATS = ('list', 'compact')
+
+# Tipos de celda (el índice es el código en type_runs)
+TYPE_NAMES = ('capital_sign', 'number_sign', 'number', 'space',
+              'punctuation', 'letter', 'special', 'unknown')
+_TYPE_CODES = {name: code for code, name in enumerate(TYPE_NAMES)}
+
+# Longitud máxima de una racha (cabe en un byte)
+MAX_RUN = 255
+
+
+def encode_compact(dots_info: List[Dict]) -> Dict:
+    """
+    Codifica la información de puntos en formato compacto.
+
+    Args:
+        dots_info: Lista de get_dots_info
+
+    Returns:
+        Diccionario en formato 'compact'
+    """
+    masks = bytearray()
+    runs = bytearray()
+    labels = []
+    current = None
+    length = 0
+    for item in dots_info:
+        masks.append(dots_to_mask(item['dots']))
+        labels.append(item['char'])
+        code = _TYPE_CODES[item['type']]
+        if code == current and length < MAX_RUN:
+            length += 1
+            continue
+        if current is not None:
+            runs += bytes((current, length))
+        current, length = code, 1
+    if current is not None:
+        runs += bytes((current, length))
+
+    return {
+        'format': 'compact',
+        'count': len(masks),
+        'masks': base64.b64encode(masks).decode('ascii'),
+        'type_names': list(TYPE_NAMES),
+        'type_runs': base64.b64encode(runs).decode('ascii'),
+        'labels': ''.join(labels)
+    }
+
+
+def decode_compact(compact: Dict) -> List[Dict]:
+    """
+    Decodifica el formato compacto a la lista de get_dots_info.
+
+    Raises:
+        ValueError: Si las longitudes no coinciden
+    """
+    masks = base64.b64decode(compact['masks'])
+    runs = base64.b64decode(compact['type_runs'])
+    names = compact['type_names']
+    labels = compact['labels']
+
+    types = []
+    for index in range(0, len(runs) - 1, 2):
+        types.extend([names[runs[index]]] * runs[index + 1])
+
+    if not len(masks) == len(types) == len(labels) == compact['count']:
+        raise ValueError("dots_info compacto con longitudes inconsistentes")
+
+    return [{'char': label, 'dots': list(mask_to_dots(mask)), 'type': type_name}
+            for mask, type_name, label in zip(masks, types, labels)]
+
+
+def encode_dots_info(dots_info: List[Dict], dots_info_format: str = 'list'):
+    """
+    Información de puntos en el formato pedido.
+
+    Args:
+        dots_info: Lista de get_dots_info
+        dots_info_format: 'list' (sin cambios) o 'compact'
+
+    Raises:
+        ValueError: Si el formato no existe
+    """
+    if dots_info_format == 'list':
+        return dots_info
+    if dots_info_format == 'compact':
+        return encode_compact(dots_info)
+    raise ValueError(f"Formato de dots_info inválido: {dots_info_format}")
@@ -0,0 +1,35 @@
+"""
+Variables de Entorno
+====================
+Funciones auxiliares para leer configuración numérica y booleana
+desde variables de entorno con valores por defecto.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import os
+
+
+def env_int(name: str, default: int) -> int:
+    """Lee una variable de entorno entera con valor por defecto."""
+    value = os.environ.get(name)
+    if value is None or value.strip() == '':
+        return default
+    return int(value)
+
+
+def env_float(name: str, default: float) -> float:
+    """Lee una variable de entorno decimal con valor por defecto."""
+    value = os.environ.get(name)
+    if value is None or value.strip() == '':
+        return default
+    return float(value)
+
+
+def env_bool(name: str, default: bool) -> bool:
+    """Lee una variable de entorno booleana con valor por defecto."""
+    value = os.environ.get(name)
+    if value is None or value.strip() == '':
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
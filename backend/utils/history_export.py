@@ -0,0 +1,160 @@
+"""
+Exportación e Importación del Historial
+=======================================
+Serialización en streaming de los registros de la base de datos como
+NDJSON (un objeto JSON por línea) o CSV, con compresión gzip opcional.
+
+Todas las funciones trabajan con iteradores: los registros se leen,
+se convierten y se escriben por lotes, sin cargar el historial completo
+en memoria.
+
+Ejemplo:
+    rows = db_manager.iter_records('conversions')
+    for chunk in gzip_chunks(encode_records(rows, 'ndjson', columns)):
+        archivo.write(chunk)
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import csv
+import io
+import json
+import zlib
+from typing import Dict, Iterable, Iterator, Sequence
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+# Registros por bloque de salida
+CHUNK_RECORDS = 500
+
+# Primeros bytes de un archivo gzip
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+def encode_records(records: Iterable[Dict], export_format: str,
+                   columns: Sequence[str]) -> Iterator[bytes]:
+    """
+    Convierte registros en bloques de bytes NDJSON o CSV.
+
+    Args:
+        records: Iterable de diccionarios
+        export_format: 'ndjson' o 'csv'
+        columns: Columnas a escribir (cabecera y orden en CSV)
+
+    Yields:
+        Bloques UTF-8 de hasta CHUNK_RECORDS registros
+
+    Raises:
+        ValueError: Si el formato no es válido
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Formato de exportación inválido: {export_format}")
+
+    buffer = io.StringIO()
+    if export_format == 'csv':
+        writer = csv.writer(buffer, lineterminator='\n')
+        writer.writerow(columns)
+        write = lambda record: writer.writerow([record.get(c) for c in columns])
+    else:
+        write = lambda record: buffer.write(
+            json.dumps({c: record.get(c) for c in columns}, ensure_ascii=False) + '\n'
+        )
+
+    pending = 0
+    for record in records:
+        write(record)
+        pending += 1
+        if pending >= CHUNK_RECORDS:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    remaining = buffer.getvalue()
+    if remaining:
+        yield remaining.encode('utf-8')
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """
+    Comprime en gzip un flujo de bloques sin acumularlo.
+
+    Args:
+        chunks: Bloques de bytes sin comprimir
+        level: Nivel de compresión (1-9)
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def decode_records(stream, export_format: str) -> Iterator[Dict]:
+    """
+    Lee registros NDJSON o CSV de un flujo binario (gzip detectado).
+
+    Args:
+        stream: Objeto tipo archivo en modo binario
+        export_format: 'ndjson' o 'csv'
+
+    Yields:
+        Un diccionario por registro
+
+    Raises:
+        ValueError: Si el formato no es válido o una línea NDJSON no es
+            un objeto JSON
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Formato de importación inválido: {export_format}")
+
+    stream = _maybe_gunzip(stream)
+    text = io.TextIOWrapper(stream, encoding='utf-8', newline='')
+
+    if export_format == 'csv':
+        for record in csv.DictReader(text):
+            # CSV no distingue vacío de nulo
+            yield {k: (v if v != '' else None) for k, v in record.items()}
+        return
+
+    for line_number, line in enumerate(text, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Línea {line_number}: JSON inválido ({e.msg})") from None
+        if not isinstance(record, dict):
+            raise ValueError(f"Línea {line_number}: se esperaba un objeto JSON")
+        yield record
+
+
+def _maybe_gunzip(stream):
+    """Envuelve el flujo en un lector gzip si empieza por la firma gzip."""
+    import gzip
+
+    buffered = stream if hasattr(stream, 'peek') else io.BufferedReader(_RawAdapter(stream))
+    if buffered.peek(2)[:2] == GZIP_MAGIC:
+        return gzip.GzipFile(fileobj=buffered, mode='rb')
+    return buffered
+
+
+class _RawAdapter(io.RawIOBase):
+    """Adapta un objeto con read() a io.RawIOBase (para BufferedReader)."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._stream.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
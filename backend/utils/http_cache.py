@@ -0,0 +1,218 @@
+"""
+Compresión y Caché HTTP - Sistema Braille
+=========================================
+Compresión transparente de las respuestas grandes y caché de los
+recursos estáticos del frontend.
+
+- Compresión: las respuestas de texto (JSON, HTML, CSS, JS, SVG, NDJSON)
+  de al menos BRAILLE_COMPRESS_MIN_SIZE bytes se comprimen con brotli
+  (si el paquete está instalado) o gzip según Accept-Encoding. El
+  Braille Unicode comprime muy bien. Los streams (SSE, exportaciones)
+  no se tocan. Al comprimir, el ETag pasa a ser débil: If-None-Match
+  usa la comparación débil y el 304 sigue funcionando.
+- Recursos estáticos: asset_url() añade a la URL la huella del
+  contenido (?v=...). Con la huella actual la respuesta se cachea un año
+  como inmutable; sin ella se revalida con su ETag (304). Las versiones
+  comprimidas de los estáticos se guardan en memoria.
+- conditional_response(): ETag por contenido y 304 para respuestas
+  JSON que cambian (historial).
+
+Variables de entorno:
+    BRAILLE_COMPRESS_MIN_SIZE  Bytes mínimos para comprimir (default: 1024)
+    BRAILLE_GZIP_LEVEL         Nivel de gzip (default: 6)
+    BRAILLE_BROTLI_QUALITY     Calidad de brotli (default: 5)
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import gzip
+import hashlib
+import os
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+from flask import request
+from backend.utils.env import env_int
+
+try:
+    import brotli
+except ImportError:  # Opcional: sin brotli se usa solo gzip
+    brotli = None
+
+COMPRESS_MIN_SIZE = env_int('BRAILLE_COMPRESS_MIN_SIZE', 1024)
+GZIP_LEVEL = env_int('BRAILLE_GZIP_LEVEL', 6)
+BROTLI_QUALITY = env_int('BRAILLE_BROTLI_QUALITY', 5)
+
+# Tipos que vale la pena comprimir (las imágenes PNG y los PDF ya lo están)
+COMPRESSIBLE_TYPES = ('text/html', 'text/css', 'text/javascript', 'text/plain',
+                      'text/csv', 'application/json', 'application/javascript',
+                      'application/x-ndjson', 'image/svg+xml')
+
+# Recursos estáticos: vigencia con huella en la URL y endpoints que los sirven
+STATIC_MAX_AGE = 365 * 86400
+STATIC_ENDPOINTS = ('static', 'serve_static')
+
+# Versiones comprimidas de los estáticos en memoria (por ETag y codificación)
+STATIC_CACHE_SIZE = 64
+
+_fingerprints = {}
+_compressed_static = OrderedDict()
+_lock = Lock()
+
+
+# === RECURSOS ESTÁTICOS ===
+
+def asset_fingerprint(static_folder: str, path: str) -> str:
+    """
+    Huella del contenido de un recurso estático (se recalcula si cambia
+    la fecha de modificación o el tamaño).
+
+    Args:
+        static_folder: Carpeta de estáticos de la aplicación
+        path: Ruta relativa del recurso
+    """
+    full_path = os.path.join(static_folder, path)
+    stat = os.stat(full_path)
+    key = (full_path, stat.st_mtime_ns, stat.st_size)
+    fingerprint = _fingerprints.get(key)
+    if fingerprint is None:
+        with open(full_path, 'rb') as file:
+            fingerprint = hashlib.sha1(file.read()).hexdigest()[:12]
+        _fingerprints[key] = fingerprint
+    return fingerprint
+
+
+def make_asset_url(static_folder: str):
+    """Función asset_url(path) para las plantillas: URL con la huella."""
+    def asset_url(path: str) -> str:
+        return f"/{path}?v={asset_fingerprint(static_folder, path)}"
+    return asset_url
+
+
+def _cache_static(response, static_folder: str):
+    """Cache-Control de un recurso estático según la huella de la URL."""
+    path = request.view_args.get('filename') or request.view_args.get('path')
+    version = request.args.get('v')
+    try:
+        current = asset_fingerprint(static_folder, path) if version and path else None
+    except OSError:
+        current = None
+    if current and version == current:
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = STATIC_MAX_AGE
+        response.cache_control.immutable = True
+
+
+# === RESPUESTAS CONDICIONALES ===
+
+def conditional_response(response, max_age: int = 0):
+    """
+    Añade a una respuesta un ETag por contenido y la convierte en 304 si
+    el cliente ya la tiene.
+
+    Args:
+        response: Respuesta (JSON) generada por la vista
+        max_age: Segundos de vigencia; 0 = revalidar siempre (no-cache)
+    """
+    if not response.get_etag()[0]:
+        response.add_etag()
+    if max_age:
+        response.cache_control.max_age = max_age
+    else:
+        response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+# === COMPRESIÓN ===
+
+def negotiate_encoding() -> Optional[str]:
+    """Codificación preferida por el cliente: 'br', 'gzip' o None."""
+    accept = request.accept_encodings
+    best = accept.best_match(['br', 'gzip'] if brotli is not None else ['gzip'])
+    return best if best and accept[best] > 0 else None
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    """Comprime un cuerpo con la codificación dada."""
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _is_compressible(response) -> bool:
+    """Indica si la respuesta admite compresión (sin mirar al cliente)."""
+    if request.method == 'HEAD' or response.status_code != 200:
+        return False
+    if 'Content-Encoding' in response.headers or response.cache_control.no_transform:
+        return False
+    if response.mimetype not in COMPRESSIBLE_TYPES:
+        return False
+    # Streams (SSE, exportaciones): se envían según se generan
+    if response.is_streamed and not response.direct_passthrough:
+        return False
+    size = response.content_length
+    if size is None:
+        size = len(response.get_data())
+    return size >= COMPRESS_MIN_SIZE
+
+
+def compress_response(response):
+    """Comprime la respuesta si el tipo, el tamaño y el cliente lo permiten."""
+    if not _is_compressible(response):
+        return response
+    response.vary.add('Accept-Encoding')
+    encoding = negotiate_encoding()
+    if encoding is None:
+        return response
+
+    etag, weak = response.get_etag()
+    cache_key = None
+    if request.endpoint in STATIC_ENDPOINTS and etag:
+        cache_key = (etag, encoding)
+        with _lock:
+            body = _compressed_static.get(cache_key)
+            if body is not None:
+                _compressed_static.move_to_end(cache_key)
+    else:
+        body = None
+
+    response.direct_passthrough = False
+    if body is None:
+        body = compress_body(response.get_data(), encoding)
+        if cache_key is not None:
+            with _lock:
+                _compressed_static[cache_key] = body
+                while len(_compressed_static) > STATIC_CACHE_SIZE:
+                    _compressed_static.popitem(last=False)
+    else:
+        # El fichero original no se lee pero hay que cerrarlo
+        close = getattr(response.response, 'close', None)
+        if close is not None:
+            response.call_on_close(close)
+
+    response.set_data(body)
+    response.headers['Content-Encoding'] = encoding
+    response.headers.pop('Accept-Ranges', None)
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def init_http_cache(app):
+    """
+    Registra la compresión, la caché de estáticos y asset_url() en las
+    plantillas.
+
+    Args:
+        app: Instancia de Flask
+    """
+    static_folder = app.static_folder
+    app.jinja_env.globals['asset_url'] = make_asset_url(static_folder)
+
+    @app.after_request
+    def _http_cache(response):
+        if request.endpoint in STATIC_ENDPOINTS and response.status_code in (200, 304):
+            _cache_static(response, static_folder)
+        return compress_response(response)
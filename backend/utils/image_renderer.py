@@ -0,0 +1,388 @@
+"""
+Renderizador de Imágenes - Braille en SVG/PNG
+==============================================
+Genera imágenes de celdas Braille (SVG vectorial o PNG rasterizado)
+a partir de la salida de puntos del conversor, sin pasar por el PDF.
+
+Cada patrón de puntos (máscara de 8 bits) se pre-renderiza una única
+vez por geometría y se guarda en una caché de glifos; componer una
+etiqueta consiste solo en copiar (pegar) esos glifos en el lienzo.
+
+Con las tablas de 8 puntos (p. ej. computer8) las celdas tienen una
+cuarta fila con los puntos 7 y 8.
+
+Cada imagen tiene un límite de celdas (MAX_CELLS) y, en PNG, de píxeles
+del lienzo (MAX_PIXELS, un byte por píxel en memoria): por encima se
+lanza ImageTooLarge sin reservar el lienzo.
+
+Variables de entorno:
+    BRAILLE_RENDER_MAX_CELLS   Celdas por imagen (default: 5000)
+    BRAILLE_RENDER_MAX_PIXELS  Píxeles del lienzo PNG (default: 50000000)
+
+Dimensiones estándar de la celda (en milímetros):
+    - Diámetro del punto: 1.5
+    - Distancia entre puntos de una celda: 2.5
+    - Distancia entre celdas: 6.0
+    - Distancia entre líneas: 10.0
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+from collections import OrderedDict
+from io import BytesIO
+from threading import Lock
+from typing import TYPE_CHECKING, Dict, List, Tuple
+from backend.models.braille_converter import BrailleConverter, braille_converter, get_converter
+from backend.models.braille_cells import dots_to_mask
+from backend.utils.env import env_int
+from backend.utils.metrics import timed, cache_hits, cache_misses
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+
+# Formatos de imagen soportados
+SUPPORTED_FORMATS = ('png', 'svg')
+
+# Límites por imagen
+MAX_CELLS = env_int('BRAILLE_RENDER_MAX_CELLS', 5000)
+MAX_PIXELS = env_int('BRAILLE_RENDER_MAX_PIXELS', 50_000_000)
+
+# Posición (columna, fila) de cada punto dentro de la celda
+DOT_POSITIONS = {
+    1: (0, 0), 2: (0, 1), 3: (0, 2),
+    4: (1, 0), 5: (1, 1), 6: (1, 2),
+    7: (0, 3), 8: (1, 3),
+}
+
+MM_PER_INCH = 25.4
+
+# Módulos de Pillow (se cargan en el primer renderizado PNG)
+_pil_modules = None
+
+
+def _pil():
+    """
+    Importa Pillow la primera vez que se necesita.
+
+    Returns:
+        Tupla (Image, ImageDraw)
+    """
+    global _pil_modules
+    if _pil_modules is None:
+        from PIL import Image, ImageDraw
+        _pil_modules = (Image, ImageDraw)
+    return _pil_modules
+
+
+class ImageTooLarge(ValueError):
+    """La imagen pedida supera el límite de celdas o de píxeles."""
+
+
+class CellGeometry:
+    """Geometría de una celda Braille expresada en píxeles."""
+
+    def __init__(self, dpi: int = 300, scale: float = 1.0,
+                 dot_diameter_mm: float = 1.5, dot_spacing_mm: float = 2.5,
+                 cell_spacing_mm: float = 6.0, line_spacing_mm: float = 10.0,
+                 margin_mm: float = 3.0, dots: int = 6):
+        """
+        Calcula las medidas en píxeles para un DPI y escala dados.
+
+        Args:
+            dpi: Resolución de salida (puntos por pulgada)
+            scale: Factor multiplicador sobre las medidas estándar
+            dot_diameter_mm: Diámetro de cada punto
+            dot_spacing_mm: Distancia entre centros de puntos de una celda
+            cell_spacing_mm: Distancia entre celdas consecutivas
+            line_spacing_mm: Distancia entre líneas
+            margin_mm: Margen alrededor de la imagen
+            dots: Puntos por celda (6 u 8; con 8 la celda tiene 4 filas)
+        """
+        px = dpi / MM_PER_INCH * scale
+        rows = 4 if dots == 8 else 3
+
+        self.dpi = dpi
+        self.scale = scale
+        self.dots = tuple(dot for dot, (_, row) in DOT_POSITIONS.items() if row < rows)
+        self.dot_radius = max(1, round(dot_diameter_mm * px / 2))
+        self.dot_spacing = max(2 * self.dot_radius + 1, round(dot_spacing_mm * px))
+        self.cell_width = max(self.dot_spacing + 2 * self.dot_radius + 1,
+                              round(cell_spacing_mm * px))
+        self.cell_height = (rows - 1) * self.dot_spacing + 2 * self.dot_radius + 1
+        self.line_height = max(self.cell_height + 1, round(line_spacing_mm * px))
+        self.margin = round(margin_mm * px)
+
+    @property
+    def key(self) -> Tuple[int, ...]:
+        """Clave hashable de la geometría (usada por la caché de glifos)."""
+        return (self.dot_radius, self.dot_spacing, self.cell_width,
+                self.cell_height, self.line_height, self.margin, len(self.dots))
+
+    def dot_center(self, dot: int) -> Tuple[int, int]:
+        """Centro (x, y) de un punto relativo a la esquina de la celda."""
+        col, row = DOT_POSITIONS[dot]
+        return (self.dot_radius + col * self.dot_spacing,
+                self.dot_radius + row * self.dot_spacing)
+
+
+class BrailleImageRenderer:
+    """Renderizador de Braille a imágenes SVG y PNG con caché de glifos."""
+
+    def __init__(self, max_geometries: int = 16):
+        """
+        Inicializa el renderizador.
+
+        Args:
+            max_geometries: Número máximo de geometrías distintas cuyos
+                glifos se mantienen en caché (política LRU)
+        """
+        self.max_geometries = max_geometries
+        self._png_glyphs = OrderedDict()
+        self._svg_glyphs = OrderedDict()
+        self._lock = Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    # === CACHÉ DE GLIFOS ===
+
+    def _get_glyph_table(self, cache: OrderedDict, geometry_key: tuple) -> Dict:
+        """Obtiene (o crea) la tabla de glifos para una geometría."""
+        with self._lock:
+            table = cache.get(geometry_key)
+            if table is None:
+                table = {}
+                cache[geometry_key] = table
+                if len(cache) > self.max_geometries:
+                    cache.popitem(last=False)
+            else:
+                cache.move_to_end(geometry_key)
+            return table
+
+    def _get_png_glyph(self, mask: int, geometry: CellGeometry,
+                       show_empty: bool) -> 'Image.Image':
+        """Devuelve el glifo rasterizado de una máscara, creándolo si falta."""
+        table = self._get_glyph_table(self._png_glyphs, geometry.key + (show_empty,))
+        glyph = table.get(mask)
+        if glyph is not None:
+            self.cache_hits += 1
+            cache_hits.inc(cache='glyph_png')
+            return glyph
+
+        self.cache_misses += 1
+        cache_misses.inc(cache='glyph_png')
+        Image, ImageDraw = _pil()
+        glyph = Image.new('L', (geometry.cell_width, geometry.cell_height), 255)
+        draw = ImageDraw.Draw(glyph)
+        r = geometry.dot_radius
+        for dot in geometry.dots:
+            cx, cy = geometry.dot_center(dot)
+            box = (cx - r, cy - r, cx + r, cy + r)
+            if mask & (1 << (dot - 1)):
+                draw.ellipse(box, fill=0)
+            elif show_empty:
+                draw.ellipse(box, outline=200)
+        table[mask] = glyph
+        return glyph
+
+    def _get_svg_glyph(self, mask: int, geometry: CellGeometry,
+                       show_empty: bool) -> str:
+        """Devuelve la definición SVG (<g>) de una máscara, creándola si falta."""
+        table = self._get_glyph_table(self._svg_glyphs, geometry.key + (show_empty,))
+        glyph = table.get(mask)
+        if glyph is not None:
+            self.cache_hits += 1
+            cache_hits.inc(cache='glyph_svg')
+            return glyph
+
+        self.cache_misses += 1
+        cache_misses.inc(cache='glyph_svg')
+        r = geometry.dot_radius
+        circles = []
+        for dot in geometry.dots:
+            cx, cy = geometry.dot_center(dot)
+            if mask & (1 << (dot - 1)):
+                circles.append(f'<circle cx="{cx}" cy="{cy}" r="{r}"/>')
+            elif show_empty:
+                circles.append(f'<circle cx="{cx}" cy="{cy}" r="{r}" '
+                               f'fill="none" stroke="#c8c8c8"/>')
+        glyph = f'<g id="c{mask}">{"".join(circles)}</g>'
+        table[mask] = glyph
+        return glyph
+
+    def clear_cache(self):
+        """Vacía la caché de glifos."""
+        with self._lock:
+            self._png_glyphs.clear()
+            self._svg_glyphs.clear()
+
+    # === COMPOSICIÓN ===
+
+    def text_to_mask_lines(self, text: str,
+                           converter: BrailleConverter = None) -> List[bytes]:
+        """
+        Convierte un texto (posiblemente multilínea) a líneas de máscaras.
+
+        Args:
+            text: Texto en español
+            converter: Conversor a usar (default: el de la tabla por defecto)
+
+        Returns:
+            Lista de líneas, cada una con la máscara de cada celda
+            (un byte por celda)
+        """
+        converter = converter or braille_converter
+        return [
+            converter.text_to_braille_dots(line, compact=True).tobytes()
+            for line in text.split('\n')
+        ]
+
+    def _layout(self, text: str, dpi: int, scale: float,
+                table: str = None) -> Tuple[CellGeometry, List[bytes]]:
+        """Geometría (según los puntos de la tabla) y líneas de máscaras."""
+        converter = get_converter(table)
+        geometry = CellGeometry(dpi=dpi, scale=scale, dots=converter.table.dots)
+        lines = self.text_to_mask_lines(text, converter)
+        cells = sum(len(line) for line in lines)
+        if cells > MAX_CELLS:
+            raise ImageTooLarge(f"Demasiadas celdas: {cells} (máximo {MAX_CELLS})")
+        return geometry, lines
+
+    def _canvas_size(self, lines: List[bytes],
+                     geometry: CellGeometry) -> Tuple[int, int]:
+        """Calcula el tamaño del lienzo en píxeles."""
+        max_cells = max((len(line) for line in lines), default=0)
+        width = 2 * geometry.margin + max(1, max_cells) * geometry.cell_width
+        height = (2 * geometry.margin + (len(lines) - 1) * geometry.line_height
+                  + geometry.cell_height)
+        return width, height
+
+    @timed('image.render_png')
+    def render_png(self, text: str, dpi: int = 300, scale: float = 1.0,
+                   show_empty: bool = False, table: str = None) -> bytes:
+        """
+        Renderiza texto en Braille como imagen PNG en escala de grises.
+
+        Args:
+            text: Texto en español
+            dpi: Resolución de salida
+            scale: Factor de tamaño sobre las medidas estándar
+            show_empty: Dibujar el contorno de los puntos inactivos
+            table: Tabla de traducción (default: la tabla por defecto)
+
+        Returns:
+            Contenido del archivo PNG
+
+        Raises:
+            ImageTooLarge: Si supera MAX_CELLS o MAX_PIXELS
+        """
+        geometry, lines = self._layout(text, dpi, scale, table)
+        width, height = self._canvas_size(lines, geometry)
+        if width * height > MAX_PIXELS:
+            raise ImageTooLarge(f"Imagen demasiado grande: {width}x{height} píxeles "
+                                f"(máximo {MAX_PIXELS}); reduzca dpi, scale o el texto")
+
+        Image = _pil()[0]
+        image = Image.new('L', (width, height), 255)
+        y = geometry.margin
+        for line in lines:
+            x = geometry.margin
+            for mask in line:
+                if mask or show_empty:
+                    image.paste(self._get_png_glyph(mask, geometry, show_empty), (x, y))
+                x += geometry.cell_width
+            y += geometry.line_height
+
+        buffer = BytesIO()
+        image.save(buffer, format='PNG', dpi=(dpi, dpi), optimize=False)
+        return buffer.getvalue()
+
+    @timed('image.render_svg')
+    def render_svg(self, text: str, dpi: int = 300, scale: float = 1.0,
+                   show_empty: bool = False, table: str = None) -> bytes:
+        """
+        Renderiza texto en Braille como imagen SVG.
+
+        Cada patrón distinto se define una sola vez en <defs> y las celdas
+        lo referencian con <use>.
+
+        Args:
+            text: Texto en español
+            dpi: Resolución usada para calcular el tamaño físico
+            scale: Factor de tamaño sobre las medidas estándar
+            show_empty: Dibujar el contorno de los puntos inactivos
+            table: Tabla de traducción (default: la tabla por defecto)
+
+        Returns:
+            Contenido del archivo SVG (UTF-8)
+
+        Raises:
+            ImageTooLarge: Si supera MAX_CELLS
+        """
+        geometry, lines = self._layout(text, dpi, scale, table)
+        width, height = self._canvas_size(lines, geometry)
+
+        defs = {}
+        uses = []
+        y = geometry.margin
+        for line in lines:
+            x = geometry.margin
+            for mask in line:
+                if mask or show_empty:
+                    if mask not in defs:
+                        defs[mask] = self._get_svg_glyph(mask, geometry, show_empty)
+                    uses.append(f'<use href="#c{mask}" x="{x}" y="{y}"/>')
+                x += geometry.cell_width
+            y += geometry.line_height
+
+        width_mm = width / dpi * MM_PER_INCH
+        height_mm = height / dpi * MM_PER_INCH
+        svg = (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<svg xmlns="http://www.w3.org/2000/svg" '
+            f'width="{width_mm:.2f}mm" height="{height_mm:.2f}mm" '
+            f'viewBox="0 0 {width} {height}">'
+            f'<rect width="100%" height="100%" fill="#ffffff"/>'
+            f'<defs>{"".join(defs.values())}</defs>'
+            f'<g fill="#000000">{"".join(uses)}</g>'
+            '</svg>'
+        )
+        return svg.encode('utf-8')
+
+    def render(self, text: str, image_format: str = 'png', **options) -> bytes:
+        """
+        Renderiza texto en el formato indicado.
+
+        Args:
+            text: Texto en español
+            image_format: 'png' o 'svg'
+            **options: dpi, scale, show_empty, table
+
+        Returns:
+            Contenido del archivo generado
+        """
+        if image_format == 'png':
+            return self.render_png(text, **options)
+        elif image_format == 'svg':
+            return self.render_svg(text, **options)
+        else:
+            raise ValueError(f"Formato no soportado: {image_format}")
+
+
+# Instancia global
+image_renderer = BrailleImageRenderer()
+
+
+if __name__ == "__main__":
+    # Pruebas
+    print("Generando imágenes de prueba...")
+
+    png = image_renderer.render_png("Salida 1", dpi=150)
+    print(f"✓ PNG generado: {len(png)} bytes")
+
+    svg = image_renderer.render_svg("Salida 1\nPiso 2")
+    print(f"✓ SVG generado: {len(svg)} bytes")
+
+    print(f"✓ Caché: {image_renderer.cache_hits} aciertos, "
+          f"{image_renderer.cache_misses} fallos")
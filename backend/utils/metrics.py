@@ -0,0 +1,303 @@
+"""
+Métricas - Sistema Braille
+==========================
+Subsistema de métricas en memoria con exportación en formato de texto
+de Prometheus (GET /metrics).
+
+Métricas principales:
+- braille_http_requests_total: Peticiones por endpoint, método y estado
+- braille_http_request_duration_seconds: Latencia por endpoint (histograma)
+- braille_span_duration_seconds: Duración de operaciones internas
+  (conversor, base de datos, PDFs) medidas con @timed
+- braille_characters_converted_total: Caracteres convertidos por dirección
+- braille_cache_hits_total / braille_cache_misses_total: Aciertos de cachés
+
+Cada proceso mantiene sus propias métricas; con varios workers de
+Gunicorn cada uno expone las suyas.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import time
+from bisect import bisect_left
+from functools import wraps
+from threading import Lock
+from typing import List, Tuple
+
+# Límites de los histogramas de latencia (segundos)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape_label(value) -> str:
+    """Escapa el valor de una etiqueta según el formato de Prometheus."""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labelnames: Tuple[str, ...], values: Tuple, extra: str = '') -> str:
+    """Construye el bloque {a="x",b="y"} de una muestra."""
+    parts = [f'{name}="{_escape_label(value)}"' for name, value in zip(labelnames, values)]
+    if extra:
+        parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+def _format_value(value: float) -> str:
+    """Formatea un valor numérico (enteros sin decimales)."""
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class Counter:
+    """Contador monotónico con etiquetas."""
+
+    kind = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        """Incrementa el contador para la combinación de etiquetas dada."""
+        key = tuple(labels.get(name, '') for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        """Valor actual para la combinación de etiquetas dada."""
+        key = tuple(labels.get(name, '') for name in self.labelnames)
+        return self._values.get(key, 0)
+
+    def collect(self) -> List[str]:
+        """Líneas de exposición de Prometheus."""
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f'{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}'
+                for key, value in items]
+
+    def reset(self):
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram:
+    """Histograma acumulativo con etiquetas (buckets de Prometheus)."""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}
+        self._lock = Lock()
+
+    def observe(self, value: float, **labels):
+        """Registra una observación."""
+        key = tuple(labels.get(name, '') for name in self.labelnames)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                # [conteos por bucket (+Inf al final), suma, total]
+                series = [[0] * (len(self.buckets) + 1), 0.0, 0]
+                self._series[key] = series
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def get_count(self, **labels) -> int:
+        """Número de observaciones para la combinación de etiquetas dada."""
+        key = tuple(labels.get(name, '') for name in self.labelnames)
+        series = self._series.get(key)
+        return series[2] if series else 0
+
+    def get_sum(self, **labels) -> float:
+        """Suma de observaciones para la combinación de etiquetas dada."""
+        key = tuple(labels.get(name, '') for name in self.labelnames)
+        series = self._series.get(key)
+        return series[1] if series else 0.0
+
+    def collect(self) -> List[str]:
+        """Líneas de exposición de Prometheus."""
+        with self._lock:
+            items = sorted((key, (list(s[0]), s[1], s[2])) for key, s in self._series.items())
+
+        lines = []
+        for key, (counts, total_sum, total_count) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                labels = _format_labels(self.labelnames, key, f'le="{le}"')
+                lines.append(f'{self.name}_bucket{labels} {cumulative}')
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f'{self.name}_sum{labels} {_format_value(total_sum)}')
+            lines.append(f'{self.name}_count{labels} {total_count}')
+        return lines
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+
+class MetricsRegistry:
+    """Registro de métricas del proceso."""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str,
+                labelnames: Tuple[str, ...] = ()) -> Counter:
+        """Crea (o devuelve la existente) una métrica de tipo contador."""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        """Crea (o devuelve la existente) una métrica de tipo histograma."""
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """
+        Genera la exposición completa en formato de texto de Prometheus.
+
+        Returns:
+            Texto con # HELP, # TYPE y las muestras de cada métrica
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+
+        lines = []
+        for metric in metrics:
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            lines.extend(metric.collect())
+        return '\n'.join(lines) + '\n'
+
+    def reset(self):
+        """Pone a cero todas las métricas (útil en pruebas)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+
+# Registro global y métricas del sistema
+registry = MetricsRegistry()
+
+http_requests_total = registry.counter(
+    'braille_http_requests_total',
+    'Peticiones HTTP atendidas',
+    ('method', 'endpoint', 'status')
+)
+http_request_duration = registry.histogram(
+    'braille_http_request_duration_seconds',
+    'Latencia de las peticiones HTTP por endpoint',
+    ('method', 'endpoint')
+)
+span_duration = registry.histogram(
+    'braille_span_duration_seconds',
+    'Duración de operaciones internas (conversor, base de datos, PDF)',
+    ('span',)
+)
+characters_converted = registry.counter(
+    'braille_characters_converted_total',
+    'Caracteres convertidos por dirección',
+    ('direction',)
+)
+cache_hits = registry.counter(
+    'braille_cache_hits_total',
+    'Aciertos de caché',
+    ('cache',)
+)
+cache_misses = registry.counter(
+    'braille_cache_misses_total',
+    'Fallos de caché',
+    ('cache',)
+)
+
+
+class timed:
+    """
+    Mide la duración de una operación en braille_span_duration_seconds.
+
+    Se usa como decorador o como gestor de contexto:
+
+        @timed('db.save_conversion')
+        def save_conversion(...): ...
+
+        with timed('pdf.draw'):
+            ...
+    """
+
+    def __init__(self, span: str):
+        self.span = span
+        self._start = None
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        span_duration.observe(time.perf_counter() - self._start, span=self.span)
+        return False
+
+    def __call__(self, func):
+        span = self.span
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                span_duration.observe(time.perf_counter() - start, span=span)
+
+        return wrapper
+
+
+def init_metrics(app):
+    """
+    Registra la instrumentación HTTP y el endpoint /metrics en la aplicación.
+
+    Args:
+        app: Instancia de Flask
+    """
+    from flask import Response, g, request
+
+    @app.before_request
+    def _start_timer():
+        g.metrics_start = time.perf_counter()
+
+    @app.after_request
+    def _record_request(response):
+        start = g.pop('metrics_start', None)
+        if start is not None:
+            endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+            http_request_duration.observe(time.perf_counter() - start,
+                                          method=request.method, endpoint=endpoint)
+            http_requests_total.inc(method=request.method, endpoint=endpoint,
+                                    status=str(response.status_code))
+        return response
+
+    @app.route('/metrics')
+    def metrics():
+        """Exposición de métricas en formato de texto de Prometheus."""
+        return Response(registry.render(),
+                        mimetype='text/plain; version=0.0.4; charset=utf-8')
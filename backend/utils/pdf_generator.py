@@ -8,33 +8,71 @@ Formatos soportados:
 - Etiquetas de puertas
 - Señalización general
 
+ReportLab se importa al generar el primer PDF y el directorio de salida
+se crea al guardar el primer archivo, de modo que importar este módulo
+no tiene coste ni efectos secundarios (arranque rápido de los workers).
+
+Cada PDF se dibuja en memoria y se guarda a través de un almacenamiento
+(ver pdf_storage): nombre único por petición, escritura atómica y
+subdirectorios por fecha.
+
+Con las tablas de 8 puntos (p. ej. computer8) cada celda se dibuja con
+una cuarta fila para los puntos 7 y 8.
+
 Autor: GR4
 Fecha: Noviembre 2025
 """
 
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.units import cm, inch
-from reportlab.pdfgen import canvas
-from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
 from datetime import datetime
+from io import BytesIO
 import os
-from backend.models.braille_converter import braille_converter
+from typing import TYPE_CHECKING
+from backend.models.braille_converter import BrailleConverter, braille_converter, get_converter
+from backend.models.braille_cells import dots_to_mask
+from backend.utils.metrics import timed
+from backend.utils.pdf_storage import PDFStorage, LocalPDFStorage, StoredPDF
+from backend.utils.profiling import profiled
+
+if TYPE_CHECKING:
+    from reportlab.pdfgen import canvas
+
+# Módulos de ReportLab (se cargan en el primer uso)
+_reportlab_modules = None
+
+
+def _reportlab():
+    """
+    Importa ReportLab la primera vez que se necesita.
+    
+    Returns:
+        Tupla (canvas, colors, A4, cm)
+    """
+    global _reportlab_modules
+    if _reportlab_modules is None:
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import cm
+        from reportlab.pdfgen import canvas
+        _reportlab_modules = (canvas, colors, A4, cm)
+    return _reportlab_modules
 
 
 class BrailleSignagePDFGenerator:
     """Generador de PDFs para señalética Braille."""
     
-    def __init__(self, output_dir: str = None):
+    def __init__(self, output_dir: str = None, storage: PDFStorage = None):
         """
         Inicializa el generador de PDFs.
         
         Args:
-            output_dir: Directorio donde guardar los PDFs
+            output_dir: Directorio donde guardar los PDFs (default: variable
+                de entorno BRAILLE_OUTPUT_DIR o output/)
+            storage: Almacenamiento de los PDFs (default: LocalPDFStorage
+                sobre output_dir)
         """
+        if output_dir is None:
+            output_dir = os.environ.get('BRAILLE_OUTPUT_DIR') or None
+        
         if output_dir is None:
             # Directorio raíz del proyecto
             project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
@@ -42,10 +80,22 @@ class BrailleSignagePDFGenerator:
         else:
             self.output_dir = output_dir
         
-        # Crear directorio si no existe
-        os.makedirs(self.output_dir, exist_ok=True)
+        self.storage = storage or LocalPDFStorage(self.output_dir)
     
-    def _draw_braille_character(self, c: canvas.Canvas, x: float, y: float, 
+    def _store(self, data: bytes, prefix: str, filename: str = None) -> StoredPDF:
+        """
+        Guarda un PDF en el almacenamiento.
+        
+        Args:
+            data: Contenido del PDF
+            prefix: Prefijo del nombre (ascensor, puerta, etiqueta)
+            filename: Nombre fijo en la raíz (opcional); por defecto se
+                genera una clave única en el subdirectorio de la fecha
+        """
+        key = filename or self.storage.new_key(prefix)
+        return self.storage.save(key, data)
+    
+    def _draw_braille_character(self, c: 'canvas.Canvas', x: float, y: float, 
                                dots: tuple, dot_size: float = 3, 
                                spacing: float = 6):
         """
@@ -63,32 +113,50 @@ class BrailleSignagePDFGenerator:
             dot_size: Radio del punto en puntos
             spacing: Espaciado entre puntos
         """
-        # Posiciones de los 6 puntos en el cuadratín
-        positions = {
-            1: (0, 0),
-            2: (0, spacing),
-            3: (0, 2 * spacing),
-            4: (spacing, 0),
-            5: (spacing, spacing),
-            6: (spacing, 2 * spacing)
-        }
+        self._draw_braille_mask(c, x, y, dots_to_mask(dots), dot_size, spacing)
+    
+    def _draw_braille_mask(self, c: 'canvas.Canvas', x: float, y: float,
+                           mask: int, dot_size: float = 3, spacing: float = 6,
+                           cell_dots: int = 6):
+        """
+        Dibuja una celda Braille a partir de su máscara de puntos.
+        
+        Args:
+            c: Canvas de ReportLab
+            x, y: Posición base (esquina superior izquierda)
+            mask: Máscara de bits de los puntos activos (bit 0 = punto 1)
+            dot_size: Radio del punto en puntos
+            spacing: Espaciado entre puntos
+            cell_dots: Puntos de la celda (6 u 8; los puntos 7 y 8 van
+                en una cuarta fila)
+        """
+        # Desplazamiento (dx, dy) de los puntos en el cuadratín
+        positions = (
+            (0, 0), (0, spacing), (0, 2 * spacing),
+            (spacing, 0), (spacing, spacing), (spacing, 2 * spacing)
+        )
+        if cell_dots == 8 or mask > 0x3F:
+            positions += ((0, 3 * spacing), (spacing, 3 * spacing))
+        
+        colors = _reportlab()[1]
         
         # Dibujar puntos activos (llenos)
         c.setFillColor(colors.black)
-        for dot in dots:
-            if dot in positions:
-                dx, dy = positions[dot]
+        for bit, (dx, dy) in enumerate(positions):
+            if mask & (1 << bit):
                 c.circle(x + dx, y - dy, dot_size, fill=1)
         
         # Dibujar puntos inactivos (contorno) - opcional
         c.setStrokeColor(colors.lightgrey)
         c.setLineWidth(0.5)
-        for dot_num, (dx, dy) in positions.items():
-            if dot_num not in dots:
+        for bit, (dx, dy) in enumerate(positions):
+            if not mask & (1 << bit):
                 c.circle(x + dx, y - dy, dot_size, fill=0)
     
-    def _draw_braille_text(self, c: canvas.Canvas, x: float, y: float, 
-                          text: str, char_spacing: float = 15):
+    @profiled('pdf.draw_braille_text')
+    def _draw_braille_text(self, c: 'canvas.Canvas', x: float, y: float, 
+                          text: str, char_spacing: float = 15,
+                          converter: BrailleConverter = None):
         """
         Dibuja una cadena de texto completa en Braille.
         
@@ -97,34 +165,36 @@ class BrailleSignagePDFGenerator:
             x, y: Posición inicial
             text: Texto a dibujar
             char_spacing: Espaciado entre caracteres
+            converter: Conversor a usar (default: el de la tabla por defecto)
         """
         current_x = x
+        converter = converter or braille_converter
+        cell_dots = converter.table.dots
         
         # Convertir texto a braille usando el convertidor completo
         # Esto maneja números, mayúsculas, indicadores, etc.
-        braille_dots_list = braille_converter.text_to_braille_dots(text)
+        # La salida compacta (un byte por celda) se recorre sin crear tuplas
+        cells = converter.text_to_braille_dots(text, compact=True)
         
-        for dots_tuple in braille_dots_list:
-            if dots_tuple == tuple():
-                # Espacio en blanco - solo avanzar sin dibujar celda
-                current_x += char_spacing
-            else:
+        for mask in cells.masks:
+            if mask:
                 # Dibujar carácter con sus puntos
-                self._draw_braille_character(c, current_x, y, dots_tuple)
-                current_x += char_spacing
+                self._draw_braille_mask(c, current_x, y, mask, cell_dots=cell_dots)
+            # Espacio en blanco - solo avanzar sin dibujar celda
+            current_x += char_spacing
     
-    def generate_elevator_signage(self, title: str, items: list, 
-                                 filename: str = None) -> str:
+    def _render_elevator_signage(self, title: str, items: list,
+                                 converter: BrailleConverter = None) -> bytes:
         """
         Genera señalética para ascensores con números de piso.
         
         Args:
             title: Título del documento
             items: Lista de diccionarios con 'text' y 'number'
-            filename: Nombre del archivo (opcional)
+            converter: Conversor a usar (default: el de la tabla por defecto)
             
         Returns:
-            Ruta del PDF generado
+            Contenido del PDF
             
         Ejemplo:
             items = [
@@ -132,14 +202,11 @@ class BrailleSignagePDFGenerator:
                 {'text': 'Piso 1', 'number': '1'}
             ]
         """
-        if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"ascensor_{timestamp}.pdf"
-        
-        filepath = os.path.join(self.output_dir, filename)
+        canvas, colors, A4, cm = _reportlab()
+        buffer = BytesIO()
         
         # Crear canvas
-        c = canvas.Canvas(filepath, pagesize=A4)
+        c = canvas.Canvas(buffer, pagesize=A4)
         width, height = A4
         
         # Título
@@ -188,7 +255,8 @@ class BrailleSignagePDFGenerator:
             
             # Convertir texto a Braille
             full_text = f"{text} {number}"
-            self._draw_braille_text(c, braille_x, braille_y, full_text, char_spacing=20)
+            self._draw_braille_text(c, braille_x, braille_y, full_text, char_spacing=20,
+                                    converter=converter)
             
             # Mover posición para siguiente item
             y_position -= (box_height + 1*cm)
@@ -205,29 +273,26 @@ class BrailleSignagePDFGenerator:
         
         # Guardar PDF
         c.save()
-        return filepath
+        return buffer.getvalue()
     
-    def generate_door_label(self, room_name: str, room_number: str = None,
-                          filename: str = None) -> str:
+    def _render_door_label(self, room_name: str, room_number: str = None,
+                           converter: BrailleConverter = None) -> bytes:
         """
         Genera etiqueta para puertas.
         
         Args:
             room_name: Nombre de la sala/oficina
             room_number: Número de sala (opcional)
-            filename: Nombre del archivo (opcional)
+            converter: Conversor a usar (default: el de la tabla por defecto)
             
         Returns:
-            Ruta del PDF generado
+            Contenido del PDF
         """
-        if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"puerta_{timestamp}.pdf"
-        
-        filepath = os.path.join(self.output_dir, filename)
+        canvas, colors, A4, cm = _reportlab()
+        buffer = BytesIO()
         
         # Crear canvas (tamaño más pequeño para etiquetas)
-        c = canvas.Canvas(filepath, pagesize=(15*cm, 10*cm))
+        c = canvas.Canvas(buffer, pagesize=(15*cm, 10*cm))
         width = 15*cm
         height = 10*cm
         
@@ -257,32 +322,30 @@ class BrailleSignagePDFGenerator:
         total_width = char_count * 20
         braille_x = (width - total_width) / 2
         
-        self._draw_braille_text(c, braille_x, braille_y, braille_text, char_spacing=20)
+        self._draw_braille_text(c, braille_x, braille_y, braille_text, char_spacing=20,
+                                converter=converter)
         
         # Guardar
         c.save()
-        return filepath
+        return buffer.getvalue()
     
-    def generate_custom_label(self, text: str, subtitle: str = None,
-                            filename: str = None) -> str:
+    def _render_custom_label(self, text: str, subtitle: str = None,
+                             converter: BrailleConverter = None) -> bytes:
         """
         Genera etiqueta personalizada.
         
         Args:
             text: Texto principal
             subtitle: Subtítulo (opcional)
-            filename: Nombre del archivo (opcional)
+            converter: Conversor a usar (default: el de la tabla por defecto)
             
         Returns:
-            Ruta del PDF generado
+            Contenido del PDF
         """
-        if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"etiqueta_{timestamp}.pdf"
-        
-        filepath = os.path.join(self.output_dir, filename)
+        canvas, colors, A4, cm = _reportlab()
+        buffer = BytesIO()
         
-        c = canvas.Canvas(filepath, pagesize=A4)
+        c = canvas.Canvas(buffer, pagesize=A4)
         width, height = A4
         
         # Título
@@ -301,7 +364,8 @@ class BrailleSignagePDFGenerator:
         total_width = char_count * 25
         braille_x = (width - total_width) / 2
         
-        self._draw_braille_text(c, braille_x, braille_y, text, char_spacing=25)
+        self._draw_braille_text(c, braille_x, braille_y, text, char_spacing=25,
+                                converter=converter)
         
         # Braille del subtítulo (si existe)
         if subtitle:
@@ -312,7 +376,8 @@ class BrailleSignagePDFGenerator:
             total_width_subtitle = char_count_subtitle * 20
             braille_x_subtitle = (width - total_width_subtitle) / 2
             
-            self._draw_braille_text(c, braille_x_subtitle, braille_y_subtitle, subtitle, char_spacing=20)
+            self._draw_braille_text(c, braille_x_subtitle, braille_y_subtitle, subtitle,
+                                    char_spacing=20, converter=converter)
         
         # Pie de página
         c.setFont("Helvetica-Oblique", 10)
@@ -320,14 +385,108 @@ class BrailleSignagePDFGenerator:
                            f"Sistema Braille - {datetime.now().strftime('%d/%m/%Y')}")
         
         c.save()
-        return filepath
+        return buffer.getvalue()
+    
+    def generate_elevator_signage(self, title: str, items: list, 
+                                 filename: str = None) -> str:
+        """
+        Genera señalética para ascensores con números de piso.
+        
+        Args:
+            title: Título del documento
+            items: Lista de diccionarios con 'text' y 'number'
+            filename: Nombre del archivo (opcional)
+            
+        Returns:
+            Ruta del PDF generado
+        """
+        return self._store(self._render_elevator_signage(title, items),
+                           'ascensor', filename).path
+    
+    def generate_door_label(self, room_name: str, room_number: str = None,
+                          filename: str = None) -> str:
+        """
+        Genera etiqueta para puertas.
+        
+        Args:
+            room_name: Nombre de la sala/oficina
+            room_number: Número de sala (opcional)
+            filename: Nombre del archivo (opcional)
+            
+        Returns:
+            Ruta del PDF generado
+        """
+        return self._store(self._render_door_label(room_name, room_number),
+                           'puerta', filename).path
+    
+    def generate_custom_label(self, text: str, subtitle: str = None,
+                            filename: str = None) -> str:
+        """
+        Genera etiqueta personalizada.
+        
+        Args:
+            text: Texto principal
+            subtitle: Subtítulo (opcional)
+            filename: Nombre del archivo (opcional)
+            
+        Returns:
+            Ruta del PDF generado
+        """
+        return self._store(self._render_custom_label(text, subtitle),
+                           'etiqueta', filename).path
+    
+    @timed('pdf.generate_signage_pdf')
+    def generate(self, title: str, items: list, format_type: str = 'elevator',
+                 table: str = None) -> StoredPDF:
+        """
+        Genera y guarda un PDF de señalética según el formato.
+        
+        Args:
+            title: Título del documento
+            items: Lista de elementos a incluir
+            format_type: Tipo de formato (elevator, door, label)
+            table: Tabla de traducción (default: la tabla por defecto)
+            
+        Returns:
+            PDF guardado (backend, clave, ruta y tamaño)
+            
+        Raises:
+            TableError: Si la tabla no existe
+        """
+        converter = get_converter(table)
+        if format_type == 'elevator':
+            data = self._render_elevator_signage(title, items, converter)
+            prefix = 'ascensor'
+        elif format_type == 'door':
+            # items[0] contiene room_name y room_number
+            item = items[0]
+            data = self._render_door_label(
+                item.get('text', ''),
+                item.get('number', None),
+                converter
+            )
+            prefix = 'puerta'
+        elif format_type == 'label':
+            # items[0] contiene text y subtitle
+            item = items[0]
+            data = self._render_custom_label(
+                item.get('text', ''),
+                item.get('subtitle', None),
+                converter
+            )
+            prefix = 'etiqueta'
+        else:
+            raise ValueError(f"Formato no soportado: {format_type}")
+        
+        return self._store(data, prefix)
 
 
 # Instancia global
 pdf_generator = BrailleSignagePDFGenerator()
 
 
-def generate_signage_pdf(title: str, items: list, format_type: str = 'elevator') -> str:
+def generate_signage_pdf(title: str, items: list, format_type: str = 'elevator',
+                         generator: BrailleSignagePDFGenerator = None) -> str:
     """
     Función helper para generar PDFs de señalética.
     
@@ -335,30 +494,12 @@ def generate_signage_pdf(title: str, items: list, format_type: str = 'elevator')
         title: Título del documento
         items: Lista de elementos a incluir
         format_type: Tipo de formato (elevator, door, label)
+        generator: Generador a usar (default: instancia global pdf_generator)
         
     Returns:
         Ruta del PDF generado
     """
-    generator = BrailleSignagePDFGenerator()
-    
-    if format_type == 'elevator':
-        return generator.generate_elevator_signage(title, items)
-    elif format_type == 'door':
-        # items[0] contiene room_name y room_number
-        item = items[0]
-        return generator.generate_door_label(
-            item.get('text', ''),
-            item.get('number', None)
-        )
-    elif format_type == 'label':
-        # items[0] contiene text y subtitle
-        item = items[0]
-        return generator.generate_custom_label(
-            item.get('text', ''),
-            item.get('subtitle', None)
-        )
-    else:
-        raise ValueError(f"Formato no soportado: {format_type}")
+    return (generator or pdf_generator).generate(title, items, format_type).path
 
 
 if __name__ == "__main__":
@@ -0,0 +1,138 @@
+"""
+Almacenamiento de PDFs - Sistema Braille
+========================================
+Guarda los PDFs generados con nombres únicos y escritura atómica.
+
+Organización en disco (LocalPDFStorage):
+    <raíz>/AAAA/MM/DD/<prefijo>_<AAAAMMDD_HHMMSS>_<id>.pdf
+
+- <id> es un UUID aleatorio: dos peticiones simultáneas nunca comparten
+  archivo, aunque coincidan en el mismo segundo y en distintos workers.
+- El contenido se escribe en un archivo temporal del mismo directorio y
+  se renombra (os.replace), de modo que nadie puede leer un PDF a medio
+  escribir.
+- Los subdirectorios por fecha evitan directorios con miles de archivos.
+
+Cada PDF guardado se identifica por (backend, clave); la base de datos
+registra ambos para poder localizarlo aunque cambie la raíz.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import os
+import tempfile
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+
+class StoredPDF(NamedTuple):
+    """PDF guardado en un almacenamiento."""
+
+    backend: str
+    key: str
+    path: str
+    size: int
+
+
+class PDFStorage(ABC):
+    """Interfaz de almacenamiento de PDFs."""
+
+    backend = 'base'
+
+    def new_key(self, prefix: str, now: Optional[datetime] = None) -> str:
+        """
+        Genera una clave única para un nuevo PDF.
+
+        Args:
+            prefix: Prefijo del nombre (ascensor, puerta, etiqueta)
+            now: Fecha de generación (default: ahora)
+        """
+        now = now or datetime.now()
+        return (f"{now:%Y/%m/%d}/{prefix}_{now:%Y%m%d_%H%M%S}_"
+                f"{uuid.uuid4().hex}.pdf")
+
+    @abstractmethod
+    def save(self, key: str, data: bytes) -> StoredPDF:
+        """Guarda el contenido bajo la clave indicada."""
+
+    @abstractmethod
+    def path(self, key: str) -> str:
+        """Ruta local del PDF de una clave."""
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        """Indica si existe un PDF con la clave dada."""
+
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        """Elimina un PDF; devuelve False si no existía."""
+
+
+class LocalPDFStorage(PDFStorage):
+    """Almacenamiento en el sistema de archivos local."""
+
+    backend = 'local'
+
+    def __init__(self, root: str):
+        """
+        Args:
+            root: Directorio raíz (se crea al guardar el primer PDF)
+        """
+        self.root = root
+
+    def path(self, key: str) -> str:
+        """
+        Ruta local del PDF de una clave.
+
+        Raises:
+            ValueError: Si la clave sale del directorio raíz
+        """
+        root = os.path.abspath(self.root)
+        full_path = os.path.abspath(os.path.join(root, *key.split('/')))
+        if os.path.commonpath([root, full_path]) != root:
+            raise ValueError(f"Clave de almacenamiento inválida: {key}")
+        return full_path
+
+    def save(self, key: str, data: bytes) -> StoredPDF:
+        """
+        Escribe el PDF de forma atómica (archivo temporal + renombrado).
+
+        Args:
+            key: Clave (ruta relativa con '/')
+            data: Contenido del PDF
+
+        Returns:
+            Descripción del PDF guardado
+        """
+        full_path = self.path(key)
+        directory = os.path.dirname(full_path)
+        os.makedirs(directory, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            # mkstemp crea el archivo solo legible por el propietario
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, full_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        return StoredPDF(self.backend, key, full_path, len(data))
+
+    def exists(self, key: str) -> bool:
+        return os.path.isfile(self.path(key))
+
+    def delete(self, key: str) -> bool:
+        try:
+            os.remove(self.path(key))
+            return True
+        except FileNotFoundError:
+            return False
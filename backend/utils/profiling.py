@@ -0,0 +1,289 @@
+"""
+Perfilado - Sistema Braille
+===========================
+Modo de perfilado opcional (cProfile) para reproducir en el propio
+servidor la lentitud observada en producción.
+
+Modos (variable de entorno BRAILLE_PROFILING):
+    off     Desactivado (por defecto). Los hooks no añaden coste apreciable.
+    header  Solo se perfilan las peticiones con la cabecera
+            "X-Braille-Profile: 1".
+    all     Se perfilan todas las peticiones y, fuera de una petición
+            (scripts, CLI), cada llamada a una función marcada con @profiled.
+
+Cada perfil se guarda como archivo .prof (formato pstats) en
+BRAILLE_PROFILE_DIR (por defecto output/profiles) y se acumula en un
+resumen global consultable en GET /api/profiling/summary.
+
+Los perfiles .prof se pueden inspeccionar con:
+    python -m pstats output/profiles/<archivo>.prof
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import cProfile
+import os
+import pstats
+import uuid
+from contextvars import ContextVar
+from datetime import datetime
+from functools import wraps
+from threading import Lock
+from typing import Dict, Optional
+from backend.utils.env import env_int
+
+PROFILING_MODES = ('off', 'header', 'all')
+PROFILE_HEADER = 'X-Braille-Profile'
+
+# Perfil activo en el contexto actual (petición o llamada perfilada)
+_active_profile = ContextVar('braille_active_profile', default=None)
+
+
+class ProfilingManager:
+    """Gestiona la captura, almacenamiento y resumen de perfiles."""
+
+    def __init__(self, mode: str = None, output_dir: str = None,
+                 max_files: int = None):
+        """
+        Inicializa el gestor de perfilado.
+
+        Args:
+            mode: off, header o all (default: BRAILLE_PROFILING)
+            output_dir: Directorio de los .prof (default: BRAILLE_PROFILE_DIR)
+            max_files: Máximo de .prof conservados (default: BRAILLE_PROFILE_MAX_FILES)
+        """
+        if mode is None:
+            mode = os.environ.get('BRAILLE_PROFILING', 'off').strip().lower()
+        if mode not in PROFILING_MODES:
+            raise ValueError(f"Modo de perfilado no soportado: {mode}")
+
+        if output_dir is None:
+            project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+            output_dir = os.environ.get('BRAILLE_PROFILE_DIR',
+                                        os.path.join(project_root, 'output', 'profiles'))
+
+        self.mode = mode
+        self.output_dir = output_dir
+        self.max_files = max_files if max_files is not None else env_int('BRAILLE_PROFILE_MAX_FILES', 200)
+        self._stats = None
+        self._profile_count = 0
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Indica si el perfilado está activo en algún modo."""
+        return self.mode != 'off'
+
+    def should_profile_request(self, headers) -> bool:
+        """
+        Decide si una petición debe perfilarse.
+
+        Args:
+            headers: Cabeceras de la petición
+        """
+        if self.mode == 'all':
+            return True
+        if self.mode == 'header':
+            return headers.get(PROFILE_HEADER, '').strip().lower() in ('1', 'true', 'yes')
+        return False
+
+    def start(self) -> Optional[cProfile.Profile]:
+        """
+        Inicia un perfil en el contexto actual.
+
+        Returns:
+            El perfil iniciado, o None si ya hay uno activo en este contexto
+            o el intérprete no admite otro perfilador
+        """
+        if _active_profile.get() is not None:
+            return None
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Otro perfilador ya está activo en el intérprete
+            return None
+
+        _active_profile.set(profile)
+        return profile
+
+    def stop(self, profile: cProfile.Profile, label: str) -> str:
+        """
+        Detiene un perfil, lo guarda en disco y lo añade al resumen.
+
+        Args:
+            profile: Perfil devuelto por start()
+            label: Etiqueta para el nombre del archivo (endpoint o función)
+
+        Returns:
+            Ruta del archivo .prof generado
+        """
+        profile.disable()
+        _active_profile.set(None)
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        safe_label = ''.join(c if c.isalnum() or c in '-_.' else '_' for c in label).strip('_')
+        filename = (f"{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}_"
+                    f"{safe_label or 'profile'}_{uuid.uuid4().hex[:8]}.prof")
+        path = os.path.join(self.output_dir, filename)
+
+        stats = pstats.Stats(profile)
+        stats.dump_stats(path)
+
+        with self._lock:
+            if self._stats is None:
+                self._stats = stats
+            else:
+                self._stats.add(profile)
+            self._profile_count += 1
+
+        self._prune()
+        return path
+
+    def _prune(self):
+        """Elimina los perfiles más antiguos por encima de max_files."""
+        if self.max_files <= 0:
+            return
+        try:
+            files = sorted(f for f in os.listdir(self.output_dir) if f.endswith('.prof'))
+        except FileNotFoundError:
+            return
+        for filename in files[:-self.max_files]:
+            try:
+                os.remove(os.path.join(self.output_dir, filename))
+            except OSError:
+                pass
+
+    def summary(self, limit: int = 20, sort: str = 'cumulative') -> Dict:
+        """
+        Devuelve las funciones más costosas de todos los perfiles acumulados.
+
+        Args:
+            limit: Número de funciones a devolver
+            sort: Criterio de orden: cumulative, tottime o calls
+
+        Returns:
+            Diccionario con el número de perfiles y la lista de funciones
+        """
+        # Índice de la columna de orden en cada fila
+        sort_keys = {'cumulative': 5, 'tottime': 4, 'calls': 3}
+        if sort not in sort_keys:
+            raise ValueError(f"Criterio de orden no soportado: {sort}")
+
+        with self._lock:
+            raw = dict(self._stats.stats) if self._stats is not None else {}
+            profile_count = self._profile_count
+
+        rows = []
+        for (filename, line, function), (_, ncalls, tottime, cumtime, _) in raw.items():
+            rows.append((filename, line, function, ncalls, tottime, cumtime))
+        rows.sort(key=lambda row: row[sort_keys[sort]], reverse=True)
+
+        return {
+            'mode': self.mode,
+            'profiles': profile_count,
+            'sort': sort,
+            'functions': [
+                {
+                    'function': function,
+                    'file': filename,
+                    'line': line,
+                    'calls': ncalls,
+                    'total_time': round(tottime, 6),
+                    'cumulative_time': round(cumtime, 6)
+                }
+                for filename, line, function, ncalls, tottime, cumtime in rows[:limit]
+            ]
+        }
+
+    def reset(self):
+        """Descarta el resumen acumulado (los .prof en disco se conservan)."""
+        with self._lock:
+            self._stats = None
+            self._profile_count = 0
+
+
+# Instancia global
+profiler = ProfilingManager()
+
+
+def profiled(name: str):
+    """
+    Marca una función como punto caliente perfilable.
+
+    Dentro de una petición perfilada la función ya queda capturada por el
+    perfil de la petición. Fuera de una petición, con el modo 'all', cada
+    llamada genera su propio perfil. Con el perfilado desactivado solo se
+    añade una comprobación.
+
+    Args:
+        name: Nombre del hook (usado en el nombre del archivo .prof)
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if profiler.mode != 'all' or _active_profile.get() is not None:
+                return func(*args, **kwargs)
+
+            profile = profiler.start()
+            if profile is None:
+                return func(*args, **kwargs)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.stop(profile, name)
+
+        return wrapper
+    return decorator
+
+
+def init_profiling(app):
+    """
+    Registra el perfilado por petición y GET /api/profiling/summary.
+
+    Args:
+        app: Instancia de Flask
+    """
+    from flask import g, jsonify, request
+
+    @app.before_request
+    def _start_request_profile():
+        if profiler.enabled and profiler.should_profile_request(request.headers):
+            g.braille_profile = profiler.start()
+
+    @app.after_request
+    def _stop_request_profile(response):
+        profile = g.pop('braille_profile', None)
+        if profile is not None:
+            label = request.endpoint or 'unmatched'
+            path = profiler.stop(profile, label)
+            response.headers['X-Braille-Profile-File'] = os.path.basename(path)
+        return response
+
+    @app.teardown_request
+    def _discard_request_profile(error):
+        # Si la petición falló antes de after_request, cerrar igualmente el perfil
+        profile = g.pop('braille_profile', None)
+        if profile is not None:
+            profiler.stop(profile, f"{request.endpoint or 'unmatched'}_error")
+
+    @app.route('/api/profiling/summary', methods=['GET'])
+    def profiling_summary():
+        """
+        Resumen de las funciones más costosas de los perfiles capturados.
+
+        Query Params:
+            limit: Número de funciones (default: 20)
+            sort: cumulative, tottime o calls (default: cumulative)
+        """
+        limit = request.args.get('limit', 20, type=int)
+        sort = request.args.get('sort', 'cumulative')
+
+        try:
+            summary = profiler.summary(limit=limit, sort=sort)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+
+        return jsonify({'success': True, **summary}), 200
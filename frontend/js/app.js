@@ -3,6 +3,10 @@
  * ========================================================
  * Maneja la interacción del usuario y las llamadas a la API
  * 
+ * Las conversiones se hacen en el navegador con BrailleEngine (ver
+ * braille_engine.js) usando la tabla que exporta el servidor; la API solo
+ * se usa para guardar el historial, generar PDFs y como respaldo.
+ * 
  * Autor: GR4
  * Fecha: Noviembre 2025
  */
@@ -10,13 +14,18 @@
 // === CONFIGURACIÓN ===
 const API_BASE_URL = window.location.origin + '/api';
 
+// Tabla de traducción del motor local
+const ENGINE_TABLE = 'es';
+
 // === ESTADO GLOBAL ===
 let currentMode = 'text-to-braille';
 let currentSignageType = 'elevator';
+let engineReady = Promise.resolve(null);  // Promesa con el BrailleEngine (o null)
 
 // === INICIALIZACIÓN ===
 document.addEventListener('DOMContentLoaded', function() {
     console.log('🚀 Sistema Braille inicializado');
+    initEngine();
     initTabs();
     initConverter();
     initSignage();
@@ -24,6 +33,47 @@ document.addEventListener('DOMContentLoaded', function() {
     initHistory();
 });
 
+// === MOTOR LOCAL ===
+function initEngine() {
+    engineReady = loadBrailleEngine(ENGINE_TABLE).catch(error => {
+        console.warn('Motor local no disponible, se usará la API:', error);
+        return null;
+    });
+}
+
+async function loadBrailleEngine(name) {
+    // La lista indica la versión actual de cada tabla; la tabla se pide con
+    // la versión en la URL, así el navegador la cachea sin revalidar
+    const listResponse = await fetch(`${API_BASE_URL}/tables`);
+    const list = await listResponse.json();
+    const entry = (list.tables || []).find(table => table.name === name);
+    
+    if (!entry) {
+        throw new Error(`Tabla no disponible: ${name}`);
+    }
+    
+    const response = await fetch(window.location.origin + entry.url);
+    const engine = new BrailleEngine(await response.json());
+    console.log(`✓ Motor local: tabla ${engine.name} (versión ${engine.version})`);
+    return engine;
+}
+
+function saveToHistory(originalText, brailleText, conversionType, latencyMs) {
+    // La conversión ya se hizo en el navegador: solo se guarda el resultado
+    fetch(`${API_BASE_URL}/history`, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json'
+        },
+        body: JSON.stringify({
+            original_text: originalText,
+            braille_text: brailleText,
+            conversion_type: conversionType,
+            latency_ms: latencyMs
+        })
+    }).catch(error => console.warn('No se pudo guardar en el historial:', error));
+}
+
 // === GESTIÓN DE TABS ===
 function initTabs() {
     const tabButtons = document.querySelectorAll('.tab-button');
@@ -204,6 +254,21 @@ async function convertToBraille() {
         return;
     }
     
+    // Conversión local; los textos con caracteres fuera de la tabla se
+    // envían a la API, que devuelve el detalle de los no soportados
+    const engine = await engineReady;
+    if (engine && engine.supports(inputText)) {
+        const started = performance.now();
+        const braille = engine.textToBraille(inputText);
+        const dotsInfo = engine.getDotsInfo(inputText);
+        
+        outputBraille.innerHTML = renderBrailleCells(dotsInfo);
+        outputBraille.style.color = '';
+        saveToHistory(inputText, braille, 'text_to_braille', performance.now() - started);
+        showNotification('✓ Conversión exitosa', 'success');
+        return;
+    }
+    
     showLoading(true);
     
     try {
@@ -214,7 +279,8 @@ async function convertToBraille() {
             },
             body: JSON.stringify({
                 text: inputText,
-                format: 'unicode'
+                format: 'unicode',
+                dots_info_format: 'compact'
             })
         });
         
@@ -237,11 +303,47 @@ async function convertToBraille() {
     }
 }
 
+// Decodifica el dots_info compacto sin el motor local (si braille_engine.js
+// no se cargó); mismo formato que BrailleEngine.decodeDotsInfo
+function decodeCompactDotsInfo(dotsInfo) {
+    if (!dotsInfo || Array.isArray(dotsInfo)) {
+        return dotsInfo;
+    }
+    if (dotsInfo.format !== 'compact') {
+        throw new Error(`Formato de dots_info no soportado: ${dotsInfo.format}`);
+    }
+    const toBytes = data => Uint8Array.from(atob(data), char => char.charCodeAt(0));
+    const masks = toBytes(dotsInfo.masks);
+    const runs = toBytes(dotsInfo.type_runs);
+    const labels = Array.from(dotsInfo.labels);
+    const info = [];
+    for (let i = 0; i + 1 < runs.length; i += 2) {
+        for (let n = 0; n < runs[i + 1]; n++) {
+            const cell = info.length;
+            const dots = [1, 2, 3, 4, 5, 6, 7, 8].filter(dot => masks[cell] & (1 << (dot - 1)));
+            info.push({ char: labels[cell], dots: dots, type: dotsInfo.type_names[runs[i]] });
+        }
+    }
+    if (info.length !== dotsInfo.count || masks.length !== info.length || labels.length !== info.length) {
+        throw new Error('dots_info compacto con longitudes inconsistentes');
+    }
+    return info;
+}
+
 function renderBrailleCells(dotsInfo) {
+    // dots_info compacto de la API (dots_info_format: 'compact')
+    dotsInfo = typeof BrailleEngine !== 'undefined'
+        ? BrailleEngine.decodeDotsInfo(dotsInfo)
+        : decodeCompactDotsInfo(dotsInfo);
+
     if (!dotsInfo || dotsInfo.length === 0) {
         return 'El resultado aparecerá aquí...';
     }
     
+    // Con celdas de 8 puntos (tablas como computer8) todas las celdas
+    // llevan la cuarta fila (puntos 7 y 8) para que queden alineadas
+    const eightDots = dotsInfo.some(item => item.dots.some(dot => dot > 6));
+    
     let html = '<div class="braille-cells-container">';
     
     dotsInfo.forEach(item => {
@@ -249,13 +351,14 @@ function renderBrailleCells(dotsInfo) {
             html += '<div class="braille-space"></div>';
         } else {
             html += '<div class="braille-cell">';
-            html += '<div class="braille-dots">';
+            html += `<div class="braille-dots${eightDots ? ' braille-dots-8' : ''}">`;
             
-            // Crear la cuadrícula de 6 puntos en el orden correcto del sistema Braille
+            // Crear la cuadrícula de puntos en el orden correcto del sistema Braille
             // Orden Braille:  1 4    Orden Grid: pos1 pos2
             //                 2 5                pos3 pos4
             //                 3 6                pos5 pos6
-            const brailleOrder = [1, 4, 2, 5, 3, 6];
+            //                 7 8                pos7 pos8 (solo 8 puntos)
+            const brailleOrder = eightDots ? [1, 4, 2, 5, 3, 6, 7, 8] : [1, 4, 2, 5, 3, 6];
             
             brailleOrder.forEach(dotNumber => {
                 const isActive = item.dots.includes(dotNumber);
@@ -283,6 +386,18 @@ async function convertToText() {
     
     const brailleString = builderSequence.map(item => item.unicode).join('');
     
+    const engine = await engineReady;
+    if (engine) {
+        const started = performance.now();
+        const text = engine.brailleToText(brailleString);
+        
+        outputText.textContent = text;
+        outputText.style.color = 'var(--text-primary)';
+        saveToHistory(text, brailleString, 'braille_to_text', performance.now() - started);
+        showNotification('✓ Conversión exitosa', 'success');
+        return;
+    }
+    
     showLoading(true);
     
     try {
@@ -480,27 +595,37 @@ function initReference() {
     generateAccentedTable();
 }
 
+async function fetchCharactersInfo(chars) {
+    // Una sola petición (cacheable) para todos los caracteres de la tabla
+    const response = await fetch(`${API_BASE_URL}/braille/info?chars=${encodeURIComponent(chars)}`);
+    const data = await response.json();
+    return data.success ? data.characters : {};
+}
+
+function fillReferenceTable(table, chars, characters) {
+    for (let char of chars) {
+        const info = characters[char];
+        if (!info) continue;
+        
+        const item = document.createElement('div');
+        item.className = 'braille-item';
+        item.innerHTML = `
+            <span class="braille-char">${info.unicode}</span>
+            <span class="char-label">${char}</span>
+        `;
+        table.appendChild(item);
+    }
+}
+
 async function generateAlphabetTable() {
     const table = document.getElementById('alphabet-table');
     const alphabet = 'abcdefghijklmnopqrstuvwxyz';
     
-    for (let char of alphabet) {
-        try {
-            const response = await fetch(`${API_BASE_URL}/braille/info/${char}`);
-            const data = await response.json();
-            
-            if (data.success) {
-                const item = document.createElement('div');
-                item.className = 'braille-item';
-                item.innerHTML = `
-                    <span class="braille-char">${data.unicode}</span>
-                    <span class="char-label">${char}</span>
-                `;
-                table.appendChild(item);
-            }
-        } catch (error) {
-            console.error(`Error al obtener info de ${char}:`, error);
-        }
+    try {
+        const characters = await fetchCharactersInfo(alphabet);
+        fillReferenceTable(table, alphabet, characters);
+    } catch (error) {
+        console.error('Error al obtener info del abecedario:', error);
     }
 }
 
@@ -508,6 +633,25 @@ async function generateNumbersTable() {
     const table = document.getElementById('numbers-table');
     const numbers = '0123456789';
     
+    const addItem = (braille, num) => {
+        const item = document.createElement('div');
+        item.className = 'braille-item';
+        item.innerHTML = `
+            <span class="braille-char">${braille}</span>
+            <span class="char-label">${num}</span>
+        `;
+        table.appendChild(item);
+    };
+    
+    // Con el motor local no hace falta ninguna petición
+    const engine = await engineReady;
+    if (engine) {
+        for (let num of numbers) {
+            addItem(engine.textToBraille(num), num);
+        }
+        return;
+    }
+    
     // Generar números mediante conversión
     for (let num of numbers) {
         try {
@@ -519,13 +663,7 @@ async function generateNumbersTable() {
             const data = await response.json();
             
             if (data.success) {
-                const item = document.createElement('div');
-                item.className = 'braille-item';
-                item.innerHTML = `
-                    <span class="braille-char">${data.braille}</span>
-                    <span class="char-label">${num}</span>
-                `;
-                table.appendChild(item);
+                addItem(data.braille, num);
             }
         } catch (error) {
             console.error(`Error al obtener ${num}:`, error);
@@ -537,23 +675,11 @@ async function generateAccentedTable() {
     const table = document.getElementById('accented-table');
     const accented = ['á', 'é', 'í', 'ó', 'ú', 'ñ', 'ü'];
     
-    for (let char of accented) {
-        try {
-            const response = await fetch(`${API_BASE_URL}/braille/info/${char}`);
-            const data = await response.json();
-            
-            if (data.success) {
-                const item = document.createElement('div');
-                item.className = 'braille-item';
-                item.innerHTML = `
-                    <span class="braille-char">${data.unicode}</span>
-                    <span class="char-label">${char}</span>
-                `;
-                table.appendChild(item);
-            }
-        } catch (error) {
-            console.error(`Error al obtener ${char}:`, error);
-        }
+    try {
+        const characters = await fetchCharactersInfo(accented.join(''));
+        fillReferenceTable(table, accented, characters);
+    } catch (error) {
+        console.error('Error al obtener vocales acentuadas:', error);
     }
 }
 
@@ -0,0 +1,298 @@
+/**
+ * MOTOR DE CONVERSIÓN BRAILLE - Navegador
+ * =======================================
+ * Convierte texto <-> Braille en el navegador a partir de la tabla
+ * compilada que exporta el servidor (GET /api/tables/<nombre>).
+ *
+ * Reproduce la salida de BrailleConverter (text_to_braille,
+ * get_dots_info y braille_to_text; el modo contraído sigue en el
+ * servidor), de modo que la interfaz solo llama a la API para guardar el
+ * historial o generar PDFs e imágenes. También decodifica el dots_info
+ * compacto de la API (BrailleEngine.decodeDotsInfo).
+ *
+ * Autor: GR4
+ * Fecha: Noviembre 2025
+ */
+
+(function (root) {
+    'use strict';
+
+    const BRAILLE_BASE = 0x2800;
+
+    // Versión del formato de tabla que entiende este motor
+    // (CLIENT_TABLE_FORMAT en braille_converter.py)
+    const TABLE_FORMAT = 1;
+
+    const DIGIT = /^\p{Nd}$/u;
+    const UPPERCASE_LETTER = /^\p{Lu}$/u;
+
+    function maskToDots(mask) {
+        const dots = [];
+        for (let dot = 1; dot <= 8; dot++) {
+            if (mask & (1 << (dot - 1))) {
+                dots.push(dot);
+            }
+        }
+        return dots;
+    }
+
+    function masksToUnicode(masks) {
+        let result = '';
+        for (const mask of masks) {
+            result += String.fromCharCode(BRAILLE_BASE + mask);
+        }
+        return result;
+    }
+
+    function numericMap(object) {
+        const map = new Map();
+        for (const [key, value] of Object.entries(object)) {
+            map.set(Number(key), value);
+        }
+        return map;
+    }
+
+    function base64ToBytes(data) {
+        const binary = atob(data);
+        const bytes = new Uint8Array(binary.length);
+        for (let i = 0; i < binary.length; i++) {
+            bytes[i] = binary.charCodeAt(i);
+        }
+        return bytes;
+    }
+
+    class BrailleEngine {
+        /**
+         * @param {Object} table Tabla exportada por GET /api/tables/<nombre>
+         */
+        constructor(table) {
+            if (table.format !== TABLE_FORMAT) {
+                throw new Error(`Formato de tabla no soportado: ${table.format}`);
+            }
+            this.name = table.name;
+            this.version = table.version;
+            this.dots = table.dots;
+            this.computer = table.mode === 'computer';
+            this.capitalMask = table.capital_mask;
+            this.numberSignMask = table.number_sign_mask;
+            this.charMasks = new Map(Object.entries(table.char_masks));
+            this.numberMasks = new Map(Object.entries(table.number_masks));
+            this.letters = new Set(table.letters);
+            this.punctuation = new Set(table.punctuation);
+            this.decimalMasks = new Set(table.decimal_masks);
+            this.textFromMask = numericMap(table.text_from_mask);
+            this.digitFromMask = numericMap(table.digit_from_mask);
+            this.supported = new Set(table.supported);
+        }
+
+        /**
+         * Decodifica dots_info en formato compacto (dots_info_format:
+         * 'compact', ver backend/utils/dots_info.py) a la lista de
+         * {char, dots, type}. Las listas se devuelven sin cambios.
+         */
+        static decodeDotsInfo(dotsInfo) {
+            if (!dotsInfo || Array.isArray(dotsInfo)) {
+                return dotsInfo;
+            }
+            if (dotsInfo.format !== 'compact') {
+                throw new Error(`Formato de dots_info no soportado: ${dotsInfo.format}`);
+            }
+            const masks = base64ToBytes(dotsInfo.masks);
+            const runs = base64ToBytes(dotsInfo.type_runs);
+            const labels = Array.from(dotsInfo.labels);
+            const info = [];
+            let cell = 0;
+            for (let i = 0; i + 1 < runs.length; i += 2) {
+                const type = dotsInfo.type_names[runs[i]];
+                for (let n = 0; n < runs[i + 1]; n++, cell++) {
+                    info.push({ char: labels[cell], dots: maskToDots(masks[cell]), type: type });
+                }
+            }
+            if (cell !== dotsInfo.count || masks.length !== cell || labels.length !== cell) {
+                throw new Error('dots_info compacto con longitudes inconsistentes');
+            }
+            return info;
+        }
+
+        /** Indica si todos los caracteres del texto están en la tabla. */
+        supports(text) {
+            for (const char of text) {
+                if (!this.supported.has(char)) {
+                    return false;
+                }
+            }
+            return true;
+        }
+
+        /** Máscaras de las celdas del texto (igual que _text_to_masks). */
+        textToMasks(text) {
+            const chars = Array.from(text);
+            const masks = [];
+
+            if (this.computer) {
+                for (const char of chars) {
+                    masks.push(this.charMasks.get(char) || 0);
+                }
+                return masks;
+            }
+
+            let inNumberMode = false;
+            for (let i = 0; i < chars.length; i++) {
+                const char = chars[i];
+
+                // Mayúscula: indicador antes de cada letra
+                if (UPPERCASE_LETTER.test(char)) {
+                    masks.push(this.capitalMask);
+                }
+
+                if (DIGIT.test(char)) {
+                    if (!inNumberMode) {
+                        masks.push(this.numberSignMask);
+                        inNumberMode = true;
+                    }
+                    masks.push(this.numberMasks.get(char) || 0);
+                } else if (char === ' ') {
+                    inNumberMode = false;
+                    masks.push(0);
+                } else if ((char === ',' || char === '.') && inNumberMode) {
+                    // Separador decimal: el modo numérico sigue si hay más dígitos
+                    if (!(i + 1 < chars.length && DIGIT.test(chars[i + 1]))) {
+                        inNumberMode = false;
+                    }
+                    masks.push(this.charMasks.get(char) || 0);
+                } else {
+                    inNumberMode = false;
+                    masks.push(this.charMasks.get(char.toLowerCase()) || 0);
+                }
+            }
+            return masks;
+        }
+
+        /** Texto a Braille Unicode (igual que text_to_braille). */
+        textToBraille(text) {
+            return masksToUnicode(this.textToMasks(text));
+        }
+
+        /** Información de puntos por celda (igual que get_dots_info). */
+        getDotsInfo(text) {
+            const chars = Array.from(text);
+            const info = [];
+
+            if (this.computer) {
+                for (const char of chars) {
+                    const mask = this.charMasks.get(char);
+                    let type;
+                    if (char === ' ') {
+                        type = 'space';
+                    } else if (mask === undefined) {
+                        type = 'unknown';
+                    } else if (this.numberMasks.has(char)) {
+                        type = 'number';
+                    } else if (this.punctuation.has(char)) {
+                        type = 'punctuation';
+                    } else if (this.letters.has(char)) {
+                        type = 'letter';
+                    } else {
+                        type = 'special';
+                    }
+                    info.push({ char: char, dots: maskToDots(mask || 0), type: type });
+                }
+                return info;
+            }
+
+            let inNumberMode = false;
+            for (let i = 0; i < chars.length; i++) {
+                const char = chars[i];
+                const lower = char.toLowerCase();
+
+                if (UPPERCASE_LETTER.test(char)) {
+                    info.push({ char: '⠨', dots: maskToDots(this.capitalMask), type: 'capital_sign' });
+                }
+
+                if (DIGIT.test(char)) {
+                    if (!inNumberMode) {
+                        info.push({ char: '#', dots: maskToDots(this.numberSignMask), type: 'number_sign' });
+                        inNumberMode = true;
+                    }
+                    info.push({ char: char, dots: maskToDots(this.numberMasks.get(char) || 0), type: 'number' });
+                } else if (char === ' ') {
+                    inNumberMode = false;
+                    info.push({ char: ' ', dots: [], type: 'space' });
+                } else if ((char === ',' || char === '.') && inNumberMode
+                           && i + 1 < chars.length && DIGIT.test(chars[i + 1])) {
+                    info.push({ char: char, dots: maskToDots(this.charMasks.get(char) || 0), type: 'punctuation' });
+                } else {
+                    inNumberMode = false;
+                    const mask = this.charMasks.get(lower);
+                    if (mask) {
+                        const type = this.letters.has(lower) ? 'letter' : 'special';
+                        info.push({ char: lower, dots: maskToDots(mask), type: type });
+                    } else {
+                        info.push({ char: char, dots: [], type: 'unknown' });
+                    }
+                }
+            }
+            return info;
+        }
+
+        /** Braille Unicode a texto (igual que braille_to_text). */
+        brailleToText(braille) {
+            const cells = Array.from(braille);
+
+            if (this.computer) {
+                let text = '';
+                for (const cell of cells) {
+                    const offset = cell.codePointAt(0) - BRAILLE_BASE;
+                    const char = offset >= 0 && offset < 256 ? this.textFromMask.get(offset) : undefined;
+                    text += char !== undefined ? char : (offset === 0 ? ' ' : '?');
+                }
+                return text;
+            }
+
+            const maskOf = cell => (cell.codePointAt(0) - BRAILLE_BASE) & 0xFF;
+            const result = [];
+            let inNumberMode = false;
+            let nextIsCapital = false;
+
+            const letter = mask => {
+                let char = this.textFromMask.has(mask) ? this.textFromMask.get(mask) : '?';
+                if (nextIsCapital && char !== '?') {
+                    char = char.toUpperCase();
+                    nextIsCapital = false;
+                }
+                return char;
+            };
+
+            for (let i = 0; i < cells.length; i++) {
+                const mask = maskOf(cells[i]);
+
+                if (mask === this.capitalMask) {
+                    nextIsCapital = true;
+                } else if (mask === this.numberSignMask) {
+                    inNumberMode = true;
+                } else if (mask === 0) {
+                    // Espacio termina modo número
+                    inNumberMode = false;
+                    result.push(' ');
+                } else if (inNumberMode && this.digitFromMask.has(mask)) {
+                    result.push(this.digitFromMask.get(mask));
+                } else if (inNumberMode && this.decimalMasks.has(mask)) {
+                    // Separador decimal: sigue el modo número si hay otro dígito
+                    if (!(i + 1 < cells.length && this.digitFromMask.has(maskOf(cells[i + 1])))) {
+                        inNumberMode = false;
+                    }
+                    result.push(this.textFromMask.has(mask) ? this.textFromMask.get(mask) : '?');
+                } else {
+                    inNumberMode = false;
+                    result.push(letter(mask));
+                }
+            }
+            return result.join('');
+        }
+    }
+
+    root.BrailleEngine = BrailleEngine;
+    if (typeof module !== 'undefined' && module.exports) {
+        module.exports = { BrailleEngine: BrailleEngine };
+    }
+})(typeof window !== 'undefined' ? window : globalThis);
@@ -4,7 +4,8 @@ Servidor Principal Flask - Sistema Braille
 Punto de entrada de la aplicación web.
 
 Ejecutar con:
-    python run.py
+    python run.py          (servidor de desarrollo)
+    python run.py serve    (servidor de producción, ver backend/server.py)
 
 La aplicación estará disponible en:
     http://localhost:5000
@@ -16,14 +17,24 @@ Fecha: Noviembre 2025
 from flask import Flask, render_template, send_from_directory
 from flask_cors import CORS
 import os
+import sys
 from backend.routes.braille_routes import braille_bp
-from backend.database.db_manager import db_manager
+from backend.routes.async_routes import braille_async_bp
+from backend.routes.live_routes import live_bp
+from backend.app_context import AppContext, init_app_context, get_app_context
+from backend.utils.http_cache import conditional_response, init_http_cache
+from backend.utils.metrics import init_metrics
+from backend.utils.profiling import init_profiling
 
 
-def create_app():
+def create_app(context: AppContext = None):
     """
     Factory function para crear la aplicación Flask.
     
+    Args:
+        context: Componentes de la aplicación (conversor, base de datos,
+            generador de PDFs); por defecto las instancias globales
+    
     Returns:
         Instancia de Flask configurada
     """
@@ -49,14 +60,30 @@ def create_app():
         }
     })
     
+    # Contexto de la aplicación (app.extensions['braille'])
+    init_app_context(app, context)
+    
+    # Métricas (latencia por endpoint y GET /metrics)
+    init_metrics(app)
+    
+    # Perfilado opcional (BRAILLE_PROFILING) y GET /api/profiling/summary
+    init_profiling(app)
+    
+    # Compresión gzip/brotli y caché de estáticos con huella (?v=...)
+    init_http_cache(app)
+    
     # Registrar blueprints (rutas)
     app.register_blueprint(braille_bp)
+    app.register_blueprint(braille_async_bp)
+    app.register_blueprint(live_bp)
     
-    # Ruta principal
+    # Ruta principal (index.html es una plantilla: nunca se sirve tal cual
+    # como estático; la regla fija tiene prioridad sobre /<path:filename>)
     @app.route('/')
+    @app.route('/index.html')
     def index():
-        """Página principal."""
-        return send_from_directory('frontend', 'index.html')
+        """Página principal (con las URLs de los estáticos con huella)."""
+        return conditional_response(app.make_response(render_template('index.html')))
     
     # Ruta para servir archivos estáticos adicionales
     @app.route('/<path:path>')
@@ -83,15 +110,35 @@ def create_app():
             'message': str(error)
         }, 500
     
-    # Inicializar base de datos
-    with app.app_context():
-        db_manager.init_database()
+    # La base de datos se inicializa con la primera conexión (ver DatabaseManager)
     
     return app
 
 
+def serve():
+    """Ejecuta la aplicación con el servidor de producción (Gunicorn)."""
+    from backend.server import get_server_config, run_production_server
+    
+    config = get_server_config()
+    
+    print("=" * 70)
+    print("  SISTEMA DE TRANSCRIPCIÓN BRAILLE - PRODUCCIÓN")
+    print("=" * 70)
+    print(f"\n  🚀 Escuchando en http://{config['bind']}")
+    print(f"  ⚙️  Workers: {config['workers']} | Hilos: {config['threads']} | "
+          f"Timeout: {config['timeout']}s | Keep-alive: {config['keepalive']}s")
+    print(f"  📦 Precarga: {config['preload_app']}")
+    print("=" * 70 + "\n")
+    
+    run_production_server(create_app, config)
+
+
 def main():
     """Función principal para ejecutar el servidor."""
+    if len(sys.argv) > 1 and sys.argv[1] == 'serve':
+        serve()
+        return
+    
     # Crear aplicación
     app = create_app()
     
@@ -107,7 +154,7 @@ def main():
     print("=" * 70)
     print(f"\n  🚀 Servidor iniciando en http://{host}:{port}")
     print(f"  🔧 Modo debug: {debug}")
-    print(f"  📁 Base de datos: {db_manager.db_path}")
+    print(f"  📁 Base de datos: {get_app_context(app).db_manager.db_path}")
     print("\n  Presiona Ctrl+C para detener el servidor")
     print("=" * 70 + "\n")
     
@@ -0,0 +1,4 @@
+"""
+Suite de rendimiento
+Benchmarks del conversor, la base de datos y la generación de PDFs
+"""
@@ -0,0 +1,122 @@
+"""
+Configuración de la suite de rendimiento
+=========================================
+Los benchmarks no se ejecutan con "pytest tests/": hay que activarlos
+explícitamente porque incluyen documentos de varios MB.
+
+Ejecutar con:
+    BRAILLE_BENCHMARKS=1 pytest tests/benchmarks
+
+Comprobación de regresiones:
+    Cada benchmark se compara con tests/benchmarks/baselines.json. Para
+    que la comparación sea independiente de la máquina, los tiempos se
+    normalizan con un bucle de calibración ejecutado justo antes y
+    después de cada benchmark (así se compensan también los cambios de
+    frecuencia de la CPU durante la sesión). Un benchmark falla si su
+    tiempo normalizado supera la línea base en más de
+    BRAILLE_BENCHMARK_THRESHOLD (default: 0.5 = 50%).
+
+Actualizar las líneas base (tras una optimización intencionada):
+    BRAILLE_BENCHMARKS=1 BRAILLE_BENCHMARK_UPDATE=1 pytest tests/benchmarks
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import json
+import os
+import time
+import pytest
+
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), 'baselines.json')
+
+
+def _env_enabled(name: str) -> bool:
+    return os.environ.get(name, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+if not _env_enabled('BRAILLE_BENCHMARKS'):
+    collect_ignore_glob = ['test_*.py']
+
+
+def pytest_configure(config):
+    """Desactiva el recolector de basura durante las mediciones (menos ruido)."""
+    if hasattr(config.option, 'benchmark_disable_gc'):
+        config.option.benchmark_disable_gc = True
+
+
+def _calibrate(repeats: int = 15) -> float:
+    """
+    Mide un bucle de Python puro de referencia (mejor de N repeticiones).
+
+    Returns:
+        Segundos del bucle de calibración en esta máquina
+    """
+    text = 'calibracion braille 123 ' * 2000
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        table = {}
+        for char in text:
+            table[char] = table.get(char, 0) + ord(char)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.fixture(scope='session')
+def benchmark_baselines():
+    """Líneas base cargadas de disco más la calibración de esta sesión."""
+    if os.path.exists(BASELINES_PATH):
+        with open(BASELINES_PATH, encoding='utf-8') as f:
+            stored = json.load(f)
+    else:
+        stored = {'benchmarks': {}}
+
+    state = {
+        'stored': stored,
+        'threshold': float(os.environ.get('BRAILLE_BENCHMARK_THRESHOLD', 0.5)),
+        'update': _env_enabled('BRAILLE_BENCHMARK_UPDATE'),
+        'results': {},
+    }
+    yield state
+
+    if state['update'] and state['results']:
+        stored['benchmarks'].update(state['results'])
+        stored['benchmarks'] = dict(sorted(stored['benchmarks'].items()))
+        with open(BASELINES_PATH, 'w', encoding='utf-8') as f:
+            json.dump(stored, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+
+@pytest.fixture(autouse=True)
+def regression_check(request, benchmark_baselines):
+    """Compara cada benchmark con su línea base al terminar la prueba."""
+    calibration = _calibrate()
+    yield
+
+    benchmark = request.node.funcargs.get('benchmark')
+    if benchmark is None or benchmark.stats is None:
+        return
+    calibration = (calibration + _calibrate()) / 2
+
+    name = request.node.name
+    best = benchmark.stats.stats.min
+    state = benchmark_baselines
+    normalized = best / calibration
+    state['results'][name] = normalized
+
+    if state['update']:
+        return
+
+    baseline = state['stored']['benchmarks'].get(name)
+    if baseline is None:
+        return
+
+    limit = baseline * (1 + state['threshold'])
+    if normalized > limit:
+        pytest.fail(
+            f"Regresión de rendimiento en {name}: "
+            f"{normalized:.2f} unidades de calibración "
+            f"(línea base {baseline:.2f}, límite {limit:.2f})",
+            pytrace=False
+        )
@@ -0,0 +1,79 @@
+"""
+Corpus de Benchmarks - Sistema Braille
+======================================
+Textos representativos del tráfico real usados por la suite de
+rendimiento. Todos se generan de forma determinista.
+
+Corpus:
+- labels: Etiquetas cortas de señalética
+- paragraph: Párrafo de texto corrido con acentos y puntuación
+- inventory: Texto de inventario con muchos números y decimales
+- document: Documento de varios MB (párrafos e inventario repetidos)
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+from functools import lru_cache
+from typing import Dict
+
+LABELS = [
+    'Salida',
+    'Piso 1',
+    'Planta Baja',
+    'Ascensor',
+    'Baño',
+    'Oficina 205',
+    'Salida de emergencia',
+    'Recepción',
+    'Sala de reuniones 3',
+    'Escalera',
+]
+
+PARAGRAPH = (
+    'El sistema de lectoescritura braille permite a las personas ciegas '
+    'leer y escribir mediante el tacto. Cada carácter se forma con seis '
+    'puntos en relieve, organizados en dos columnas de tres puntos. '
+    'En español se usan, además, signos para las vocales acentuadas '
+    '(á, é, í, ó, ú), la ñ y la ü; ¿no es así? ¡Claro que sí! '
+    'La señalética accesible incluye ascensores, puertas y pasillos.'
+)
+
+INVENTORY = (
+    'Lote 12345, caja 3.5 kg, ref 2025-11-22, unidades 480; '
+    'estante 17, nivel 4, posición 0.75 m, precio 1299,99 - descuento 15 '
+    'pedido 908172 entregado 3 de 12 cajas, saldo 7.250,50 '
+)
+
+DOCUMENT_SIZE = 2 * 1024 * 1024  # ~2 MB
+
+
+@lru_cache(maxsize=None)
+def get_document(size: int = DOCUMENT_SIZE) -> str:
+    """
+    Genera un documento grande mezclando párrafos e inventario.
+
+    Args:
+        size: Tamaño aproximado en caracteres
+
+    Returns:
+        Texto del documento
+    """
+    block = PARAGRAPH + ' ' + INVENTORY + ' '
+    repeats = size // len(block) + 1
+    return (block * repeats)[:size]
+
+
+def get_corpora() -> Dict[str, str]:
+    """
+    Devuelve los corpus de texto indexados por nombre.
+
+    Returns:
+        Diccionario nombre -> texto (las etiquetas se unen con espacios)
+    """
+    return {
+        'labels': ' '.join(LABELS),
+        'paragraph': PARAGRAPH,
+        'inventory': INVENTORY * 10,
+        'document': get_document(),
+    }
@@ -0,0 +1,148 @@
+"""
+Benchmarks - Sistema Braille
+============================
+Mide el rendimiento de las rutas críticas: conversión, validación,
+escritura en base de datos y generación de PDFs.
+
+Ejecutar con:
+    BRAILLE_BENCHMARKS=1 pytest tests/benchmarks
+    BRAILLE_BENCHMARKS=1 pytest tests/benchmarks -k converter
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import pytest
+import sys
+import os
+
+# Añadir directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+pytest.importorskip('pytest_benchmark')
+
+from backend.models.braille_converter import BrailleConverter
+from backend.database.db_manager import DatabaseManager
+from tests.benchmarks.corpora import get_corpora, LABELS
+
+CORPORA = get_corpora()
+CORPUS_NAMES = list(CORPORA)
+
+
+def _run(benchmark, func, *args, corpus: str = None):
+    """Ejecuta el benchmark; los documentos grandes usan pocas rondas."""
+    if corpus == 'document':
+        return benchmark.pedantic(func, args=args, rounds=5, iterations=1)
+    return benchmark(func, *args)
+
+
+@pytest.fixture(scope='module')
+def converter():
+    """Conversor compartido por todos los benchmarks."""
+    return BrailleConverter()
+
+
+@pytest.fixture(scope='module')
+def braille_corpora(converter):
+    """Versión en Braille Unicode de cada corpus (entrada de braille_to_text)."""
+    return {name: converter.text_to_braille(text) for name, text in CORPORA.items()}
+
+
+@pytest.fixture
+def database(tmp_path):
+    """Base de datos temporal para cada benchmark."""
+    return DatabaseManager(str(tmp_path / 'benchmark.db'))
+
+
+class TestConverterBenchmarks:
+    """Benchmarks del conversor."""
+
+    @pytest.mark.parametrize('corpus', CORPUS_NAMES)
+    def test_converter_text_to_braille(self, benchmark, converter, corpus):
+        """text_to_braille (Unicode)."""
+        benchmark.group = 'text_to_braille'
+        result = _run(benchmark, converter.text_to_braille, CORPORA[corpus], corpus=corpus)
+        assert result
+
+    @pytest.mark.parametrize('corpus', CORPUS_NAMES)
+    def test_converter_text_to_braille_dots(self, benchmark, converter, corpus):
+        """text_to_braille_dots (usado por los PDFs)."""
+        benchmark.group = 'text_to_braille_dots'
+        result = _run(benchmark, converter.text_to_braille_dots, CORPORA[corpus], corpus=corpus)
+        assert result
+
+    @pytest.mark.parametrize('corpus', CORPUS_NAMES)
+    def test_converter_braille_to_text(self, benchmark, converter, braille_corpora, corpus):
+        """braille_to_text."""
+        benchmark.group = 'braille_to_text'
+        result = _run(benchmark, converter.braille_to_text, braille_corpora[corpus], corpus=corpus)
+        assert result
+
+    @pytest.mark.parametrize('corpus', CORPUS_NAMES)
+    def test_converter_validate_text(self, benchmark, converter, corpus):
+        """validate_text."""
+        benchmark.group = 'validate_text'
+        is_valid, _ = _run(benchmark, converter.validate_text, CORPORA[corpus], corpus=corpus)
+        assert is_valid
+
+    def test_converter_get_braille_info(self, benchmark, converter):
+        """get_braille_info sobre todo el abecedario."""
+        benchmark.group = 'get_braille_info'
+        chars = 'abcdefghijklmnopqrstuvwxyzáéíóúñü0123456789.,;:'
+
+        def lookup_all():
+            return [converter.get_braille_info(c) for c in chars]
+
+        assert all(benchmark(lookup_all))
+
+
+class TestDatabaseBenchmarks:
+    """Benchmarks de la base de datos."""
+
+    def test_database_save_conversion(self, benchmark, database, converter):
+        """save_conversion de una etiqueta corta."""
+        benchmark.group = 'database'
+        text = CORPORA['labels']
+        braille = converter.text_to_braille(text)
+        assert benchmark(database.save_conversion, text, braille, 'text_to_braille') > 0
+
+    def test_database_get_conversion_history(self, benchmark, database, converter):
+        """get_conversion_history con 500 filas."""
+        benchmark.group = 'database'
+        for label in LABELS * 50:
+            database.save_conversion(label, converter.text_to_braille(label), 'text_to_braille')
+        assert len(benchmark(database.get_conversion_history, 50)) == 50
+
+
+class TestPDFBenchmarks:
+    """Benchmarks de la generación de PDFs."""
+
+    @pytest.fixture
+    def generator(self, tmp_path):
+        from backend.utils.pdf_generator import BrailleSignagePDFGenerator
+        return BrailleSignagePDFGenerator(str(tmp_path))
+
+    def test_pdf_elevator_signage(self, benchmark, generator):
+        """Señalética de ascensor con 12 pisos."""
+        benchmark.group = 'pdf'
+        items = [{'text': f'Piso {n}', 'number': str(n)} for n in range(12)]
+        path = benchmark.pedantic(generator.generate_elevator_signage,
+                                  args=('ASCENSOR', items, 'bench_elevator.pdf'),
+                                  rounds=10, iterations=1, warmup_rounds=2)
+        assert os.path.exists(path)
+
+    def test_pdf_door_label(self, benchmark, generator):
+        """Etiqueta de puerta."""
+        benchmark.group = 'pdf'
+        path = benchmark.pedantic(generator.generate_door_label,
+                                  args=('Oficina', '205', 'bench_door.pdf'),
+                                  rounds=10, iterations=1, warmup_rounds=2)
+        assert os.path.exists(path)
+
+    def test_pdf_custom_label(self, benchmark, generator):
+        """Etiqueta personalizada con subtítulo."""
+        benchmark.group = 'pdf'
+        path = benchmark.pedantic(generator.generate_custom_label,
+                                  args=('Salida', 'Emergencia', 'bench_label.pdf'),
+                                  rounds=10, iterations=1, warmup_rounds=2)
+        assert os.path.exists(path)
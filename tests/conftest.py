@@ -0,0 +1,40 @@
+"""
+Fixtures Comunes de los Tests
+=============================
+Base de datos temporal y cliente de pruebas de la aplicación,
+compartidos por los tests de las rutas. Un módulo puede redefinir db
+(p. ej. para añadir registros) y client los usa.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import pytest
+import sys
+import os
+
+# Añadir directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.app_context import AppContext
+from backend.database.db_manager import DatabaseManager
+from backend.utils.pdf_generator import BrailleSignagePDFGenerator
+from run import create_app
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Base de datos temporal."""
+    manager = DatabaseManager(str(tmp_path / 'braille.db'))
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def client(tmp_path, db):
+    """Cliente de pruebas con base de datos y salida temporales."""
+    context = AppContext(
+        db_manager=db,
+        pdf_generator=BrailleSignagePDFGenerator(str(tmp_path / 'output'))
+    )
+    return create_app(context).test_client()
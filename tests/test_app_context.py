@@ -0,0 +1,136 @@
+"""
+Tests Unitarios - Contexto de Aplicación
+========================================
+Casos de prueba para el contexto creado por create_app, el estado por
+proceso tras un fork y las conexiones por hilo de la base de datos.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import pytest
+import sys
+import os
+import gc
+import threading
+import sqlite3
+
+# Añadir directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.app_context import AppContext, get_app_context
+from backend.database.db_manager import DatabaseManager, db_manager
+from backend.models.braille_converter import braille_converter
+from backend.utils.pdf_generator import BrailleSignagePDFGenerator
+from run import create_app
+
+
+@pytest.fixture
+def context(tmp_path):
+    """Contexto con base de datos y directorio de salida temporales."""
+    ctx = AppContext(
+        db_manager=DatabaseManager(str(tmp_path / 'braille.db')),
+        pdf_generator=BrailleSignagePDFGenerator(str(tmp_path / 'output'))
+    )
+    yield ctx
+    ctx.shutdown()
+
+
+@pytest.fixture
+def client(context):
+    """Cliente de pruebas de una aplicación con el contexto temporal."""
+    return create_app(context).test_client()
+
+
+class TestAppContext:
+    """Tests del contexto de la aplicación."""
+
+    def test_routes_use_context(self, client, context):
+        """Test que las rutas usan los componentes del contexto."""
+        response = client.post('/api/convert/to-braille', json={'text': 'Piso 1'})
+        assert response.status_code == 200
+        assert context.db_manager.get_conversion_history()[0]['original_text'] == 'Piso 1'
+
+    def test_signage_uses_context_generator(self, client, context):
+        """Test que los PDFs se generan con el generador del contexto."""
+        response = client.post('/api/generate-signage', json={
+            'title': 'Ascensor', 'items': [{'text': 'Piso', 'number': 1}]
+        })
+        assert response.status_code == 200
+        assert os.listdir(context.pdf_generator.output_dir)
+
+    def test_default_components_are_shared(self):
+        """Test que por defecto se usan las instancias globales salvo la base de datos."""
+        app = create_app()
+        assert get_app_context(app).converter is braille_converter
+        assert get_app_context(app).db_manager is not db_manager
+
+    def test_post_fork_hooks(self, context):
+        """Test que post_fork ejecuta los hooks registrados."""
+        calls = []
+        context.register_post_fork(lambda: calls.append('hook'))
+        context.post_fork()
+        assert calls == ['hook']
+
+
+class TestDatabaseConnections:
+    """Tests de las conexiones por hilo y por proceso."""
+
+    def test_connection_reused_per_thread(self, context):
+        """Test que cada hilo reutiliza su conexión."""
+        db = context.db_manager
+        with db.connection() as first:
+            pass
+        with db.connection() as second:
+            pass
+        assert first is second
+
+        other = []
+
+        def worker():
+            with db.connection() as conn:
+                other.append(conn)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        assert other[0] is not first
+
+    def test_finished_threads_close_their_connections(self, context):
+        """Test que las conexiones de los hilos terminados se cierran."""
+        db = context.db_manager
+        connections = []
+
+        def worker():
+            with db.connection() as conn:
+                connections.append(conn)
+
+        for _ in range(200):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+        gc.collect()
+
+        assert db.open_connections == 0
+        with pytest.raises(sqlite3.ProgrammingError):
+            connections[0].execute('SELECT 1')
+
+    def test_after_fork_discards_inherited_connections(self, context):
+        """Test que tras un fork se abren conexiones nuevas."""
+        db = context.db_manager
+        with db.connection() as inherited:
+            pass
+        context.post_fork()
+        with db.connection() as fresh:
+            pass
+        assert fresh is not inherited
+
+    def test_rollback_on_error(self, context):
+        """Test que una excepción revierte la transacción."""
+        db = context.db_manager
+        with pytest.raises(RuntimeError):
+            with db.connection() as conn:
+                conn.execute("INSERT INTO settings (key, value) VALUES ('a', '1')")
+                raise RuntimeError('fallo')
+        with db.connection() as conn:
+            assert conn.execute('SELECT COUNT(*) FROM settings').fetchone()[0] == 0
@@ -0,0 +1,84 @@
+"""
+Tests Unitarios - Celdas Braille Compactas
+==========================================
+Casos de prueba para BrailleCells y la salida compacta de
+text_to_braille_dots.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import pytest
+import sys
+import os
+
+# Añadir directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.models.braille_cells import BrailleCells, dots_to_mask, mask_to_dots
+from backend.models.braille_converter import BrailleConverter
+
+
+@pytest.fixture
+def converter():
+    """Fixture que proporciona una instancia del conversor."""
+    return BrailleConverter()
+
+
+class TestMasks:
+    """Tests de conversión entre puntos y máscaras."""
+
+    def test_round_trip(self):
+        """Test que todas las máscaras de 6 puntos van y vuelven."""
+        for mask in range(64):
+            assert dots_to_mask(mask_to_dots(mask)) == mask
+
+    def test_known_values(self):
+        """Test de valores conocidos."""
+        assert mask_to_dots(0) == ()
+        assert mask_to_dots(7) == (1, 2, 3)
+        assert dots_to_mask((4, 6)) == 40
+
+
+class TestBrailleCells:
+    """Tests de la secuencia compacta."""
+
+    def test_iterates_as_tuples(self):
+        """Test que se itera como tuplas de puntos."""
+        cells = BrailleCells.from_dots([(1,), (), (1, 2, 5)])
+        assert list(cells) == [(1,), (), (1, 2, 5)]
+        assert cells[2] == (1, 2, 5)
+        assert len(cells) == 3
+
+    def test_masks_zero_copy(self):
+        """Test que masks es una vista de solo lectura."""
+        cells = BrailleCells(b'\x01\x00\x13')
+        view = cells.masks
+        assert list(view) == [1, 0, 19]
+        assert view.readonly
+        assert view.obj is cells.tobytes()
+
+    def test_slice_and_equality(self):
+        """Test de cortes y comparación con listas."""
+        cells = BrailleCells(b'\x01\x03\x07')
+        assert cells[1:] == BrailleCells(b'\x03\x07')
+        assert cells == [(1,), (1, 2), (1, 2, 3)]
+        assert not BrailleCells()
+
+
+class TestCompactConversion:
+    """Tests de text_to_braille_dots(compact=True)."""
+
+    @pytest.mark.parametrize('text', [
+        'Hola', 'Piso 3', '3,5 y 2.', 'ÁÑÜ ¿qué?', 'a@b', '', '٣'
+    ])
+    def test_same_cells_as_tuples(self, converter, text):
+        """Test que la salida compacta equivale a la lista de tuplas."""
+        cells = converter.text_to_braille_dots(text, compact=True)
+        assert isinstance(cells, BrailleCells)
+        assert cells.to_list() == converter.text_to_braille_dots(text)
+
+    def test_compact_masks(self, converter):
+        """Test de las máscaras de una palabra con mayúscula."""
+        cells = converter.text_to_braille_dots('Hola', compact=True)
+        assert cells.tobytes() == bytes([40, 19, 21, 7, 1])
@@ -192,6 +192,39 @@ class TestBrailleValidation:
         is_valid, unsupported = converter.validate_text('')
         assert is_valid == True
         assert len(unsupported) == 0
+    
+    def test_validate_uppercase_and_unicode_digits(self, converter):
+        """Test que mayúsculas y dígitos Unicode se consideran soportados."""
+        is_valid, unsupported = converter.validate_text('ÁÑÜ ٣²')
+        assert is_valid == True
+        assert unsupported == []
+    
+    def test_validate_reports_lowercase_in_order(self, converter):
+        """Test que los no soportados se devuelven en minúscula y en orden."""
+        is_valid, unsupported = converter.validate_text('Ж@a#Ж@')
+        assert is_valid == False
+        assert unsupported == ['ж', '@', '#']
+    
+    def test_find_unsupported_positions_and_counts(self, converter):
+        """Test de posiciones y conteos de caracteres no soportados."""
+        result = converter.find_unsupported('a@b@c#')
+        assert result['is_valid'] == False
+        assert result['failures'] == 3
+        assert result['unsupported'] == [
+            {'char': '@', 'code': 'U+0040', 'count': 2, 'positions': [1, 3]},
+            {'char': '#', 'code': 'U+0023', 'count': 1, 'positions': [5]},
+        ]
+    
+    def test_find_unsupported_short_circuit(self, converter):
+        """Test que la búsqueda se detiene tras N fallos."""
+        result = converter.find_unsupported('@@@@#', max_failures=2)
+        assert result['failures'] == 2
+        assert result['truncated'] == True
+        assert result['unsupported'][0]['positions'] == [0, 1]
+        
+        is_valid, unsupported = converter.validate_text('@@@@#', max_failures=2)
+        assert is_valid == False
+        assert unsupported == ['@']
 
 
 class TestBrailleInfo:
@@ -226,6 +259,22 @@ class TestBrailleInfo:
         """Test información de carácter no soportado."""
         info = converter.get_braille_info('@')
         assert info is None
+    
+    def test_info_catalog_is_read_only(self, converter):
+        """Test que el catálogo precalculado no se puede modificar."""
+        info = converter.get_braille_info('A')
+        assert info is converter.INFO_CATALOG['a']
+        with pytest.raises(TypeError):
+            info['type'] = 'otro'
+        with pytest.raises(TypeError):
+            converter.INFO_CATALOG['@'] = {}
+    
+    def test_get_info_bulk(self, converter):
+        """Test de consulta de varios caracteres a la vez."""
+        infos = converter.get_braille_info_bulk('aá@a')
+        assert list(infos) == ['a', 'á', '@']
+        assert infos['á']['type'] == 'Vocal acentuada'
+        assert infos['@'] is None
 
 
 class TestBrailleEdgeCases:
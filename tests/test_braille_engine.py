@@ -0,0 +1,167 @@
+"""
+Tests Unitarios - Motor de Conversión del Navegador
+===================================================
+Casos de prueba para la exportación de las tablas compiladas (GET
+/api/tables), el guardado del historial de conversiones hechas en el
+navegador y la paridad del motor JavaScript (frontend/js/braille_engine.js)
+con BrailleConverter. Los tests de paridad necesitan Node.js.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import pytest
+import sys
+import os
+import json
+import random
+import shutil
+import subprocess
+
+# Añadir directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.models.braille_converter import get_converter
+
+ENGINE_PATH = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', 'frontend', 'js', 'braille_engine.js'
+))
+
+# Ejecuta el motor con una tabla: salidas por texto y retrotraducción
+# de secuencias Braille arbitrarias
+NODE_SCRIPT = """
+const { BrailleEngine } = require(process.argv[1]);
+const input = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+const engine = new BrailleEngine(input.table);
+const texts = input.texts.map(text => ({
+    braille: engine.textToBraille(text),
+    dots_info: engine.getDotsInfo(text),
+    back: engine.brailleToText(engine.textToBraille(text)),
+    supported: engine.supports(text),
+}));
+const brailles = input.brailles.map(braille => engine.brailleToText(braille));
+process.stdout.write(JSON.stringify({ texts, brailles }));
+"""
+
+
+def run_engine(table: dict, texts: list, brailles: list) -> dict:
+    """Ejecuta el motor JavaScript con Node.js."""
+    result = subprocess.run(
+        ['node', '-e', NODE_SCRIPT, ENGINE_PATH],
+        input=json.dumps({'table': table, 'texts': texts, 'brailles': brailles}),
+        capture_output=True, text=True, encoding='utf-8', check=True, timeout=60
+    )
+    return json.loads(result.stdout)
+
+
+def sample_texts(converter, count: int = 300) -> list:
+    """Textos de prueba: casos fijos y textos aleatorios con la tabla."""
+    rng = random.Random(45)
+    alphabet = sorted(converter.SUPPORTED_CHARS) + list('0123456789 ,.') * 3
+    texts = ['Hola Mundo', 'Piso 3,5 y 1.000', 'ÁRBOL ñandú 12.', '1,a 2. 3,',
+             'eth0: 10.0.0.1/24 {MTU=1500}', '', ' ', 'x@y']
+    for _ in range(count):
+        texts.append(''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 40))))
+    return texts
+
+
+def sample_brailles(converter, count: int = 300) -> list:
+    """Secuencias Braille aleatorias, con indicadores y celdas desconocidas."""
+    rng = random.Random(46)
+    masks = [0, 0x01, 0x3F, 0xC0] + list(converter.CHAR_MASKS.values())
+    masks += [m for m in (converter.CAPITAL_MASK, converter.NUMBER_SIGN_MASK) if m] * 8
+    masks += list(converter.NUMBER_MASKS.values()) * 2
+    return [''.join(chr(0x2800 + rng.choice(masks)) for _ in range(rng.randint(1, 30)))
+            for _ in range(count)] + ['abc', '⠼⠁⠂⠃', '⠨⠀⠁']
+
+
+class TestTableExport:
+    """Tests de la exportación de tablas para el navegador."""
+
+    def test_list_tables(self, client):
+        """Test que se listan las tablas con su versión y URL."""
+        response = client.get('/api/tables')
+        data = response.get_json()
+        assert response.status_code == 200
+        names = {table['name']: table for table in data['tables']}
+        assert {'es', 'computer8'} <= set(names)
+        es = names['es']
+        assert es['url'] == f"/api/tables/es?v={es['version']}"
+        assert es['contracted'] is True
+
+    def test_table_is_cacheable(self, client):
+        """Test que la tabla tiene ETag y responde 304 si no cambió."""
+        response = client.get('/api/tables/es')
+        table = response.get_json()
+        assert response.status_code == 200
+        assert response.headers['ETag'] == f'"{table["version"]}"'
+        assert 'immutable' not in response.headers['Cache-Control']
+
+        again = client.get('/api/tables/es', headers={'If-None-Match': response.headers['ETag']})
+        assert again.status_code == 304
+
+    def test_versioned_url_is_immutable(self, client):
+        """Test que la URL con la versión actual se cachea sin revalidar."""
+        version = get_converter('es').client_table()['version']
+        response = client.get(f'/api/tables/es?v={version}')
+        assert 'immutable' in response.headers['Cache-Control']
+        assert 'max-age=31536000' in response.headers['Cache-Control']
+
+    def test_unknown_table(self, client):
+        """Test que una tabla inexistente devuelve 400 con las disponibles."""
+        response = client.get('/api/tables/no-existe')
+        assert response.status_code == 400
+        assert 'es' in response.get_json()['available_tables']
+
+
+class TestClientHistory:
+    """Tests del guardado de conversiones hechas en el navegador."""
+
+    def test_save_client_conversion(self, client):
+        """Test que la conversión se guarda en el historial."""
+        response = client.post('/api/history', json={
+            'original_text': 'hola', 'braille_text': '⠓⠕⠇⠁',
+            'conversion_type': 'text_to_braille', 'latency_ms': 0.4
+        })
+        assert response.status_code == 201
+        history = client.get('/api/history').get_json()['history']
+        assert history[0]['original_text'] == 'hola'
+        assert history[0]['braille_text'] == '⠓⠕⠇⠁'
+
+    def test_rejects_non_braille_output(self, client):
+        """Test que el texto Braille debe estar en Unicode Braille."""
+        response = client.post('/api/history', json={
+            'original_text': 'hola', 'braille_text': 'hola',
+            'conversion_type': 'text_to_braille'
+        })
+        assert response.status_code == 400
+
+    def test_rejects_invalid_type(self, client):
+        """Test que el tipo de conversión debe ser válido."""
+        response = client.post('/api/history', json={
+            'original_text': 'a', 'braille_text': '⠁', 'conversion_type': 'otro'
+        })
+        assert response.status_code == 400
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='Node.js no disponible')
+class TestEngineParity:
+    """Tests de paridad del motor JavaScript con BrailleConverter."""
+
+    @pytest.mark.parametrize('table_name', ['es', 'computer8'])
+    def test_same_output_as_converter(self, table_name):
+        """Test que el motor produce exactamente la salida del servidor."""
+        converter = get_converter(table_name)
+        texts = sample_texts(converter)
+        brailles = sample_brailles(converter)
+        results = run_engine(converter.client_table(), texts, brailles)
+
+        for braille, back in zip(brailles, results['brailles']):
+            assert back == converter.braille_to_text(braille), braille
+
+        for text, result in zip(texts, results['texts']):
+            braille = converter.text_to_braille(text)
+            assert result['braille'] == braille, text
+            assert result['dots_info'] == converter.get_dots_info(text), text
+            assert result['back'] == converter.braille_to_text(braille), text
+            assert result['supported'] == converter.validate_text(text)[0], text
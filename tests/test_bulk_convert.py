@@ -0,0 +1,109 @@
+"""
+Tests Unitarios - Conversión Masiva y Formato BRF
+=================================================
+Casos de prueba para la herramienta tools/bulk_convert.py y la
+conversión entre Braille Unicode y BRF.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import pytest
+import sys
+import os
+
+# Añadir directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.models.braille_converter import braille_converter
+from backend.utils.brf import BRFPaginator, brf_to_unicode, unicode_to_brf
+from tools import bulk_convert
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Árbol de entrada con dos archivos de texto."""
+    source = tmp_path / 'entrada'
+    (source / 'planta1').mkdir(parents=True)
+    (source / 'salida.txt').write_text('Salida\nPiso 1\n', encoding='utf-8')
+    (source / 'planta1' / 'aula.txt').write_text('Aula 3,5\nBaño', encoding='utf-8')
+    (source / 'notas.md').write_text('ignorado', encoding='utf-8')
+    return source
+
+
+class TestBRF:
+    """Tests del formato BRF."""
+
+    def test_round_trip(self):
+        """Test que Unicode -> BRF -> Unicode conserva las celdas."""
+        braille = braille_converter.text_to_braille('Hola 123')
+        assert brf_to_unicode(unicode_to_brf(braille)) == braille
+
+    def test_ascii_braille_letters(self):
+        """Test que las letras básicas coinciden con ASCII Braille."""
+        assert unicode_to_brf('⠓⠕⠇⠁') == 'HOLA'
+        assert brf_to_unicode('hola') == '⠓⠕⠇⠁'
+
+    def test_paginator(self):
+        """Test que se ajusta el ancho y se añaden saltos de página."""
+        paginator = BRFPaginator(cells_per_line=10, lines_per_page=2)
+        output = ''.join(paginator.feed(['AAAA BBBB CCCC', 'DD']))
+        assert output == 'AAAA BBBB\nCCCC\n\fDD\n'
+
+
+class TestBulkConvert:
+    """Tests de la herramienta de conversión masiva."""
+
+    def test_to_braille_mirrors_tree(self, tree, tmp_path):
+        """Test que se convierte cada archivo conservando las líneas."""
+        output = tmp_path / 'salida'
+        summary = bulk_convert.run(str(tree), str(output), workers=1)
+
+        assert summary['files'] == 2 and not summary['failed']
+        converted = (output / 'planta1' / 'aula.braille.txt').read_text(encoding='utf-8')
+        expected = [braille_converter.text_to_braille(line) for line in ('Aula 3,5', 'Baño')]
+        assert converted == '\n'.join(expected)
+
+    def test_to_brf(self, tree, tmp_path):
+        """Test que la salida BRF es ASCII Braille."""
+        output = tmp_path / 'brf'
+        bulk_convert.run(str(tree), str(output), mode='to-brf', workers=1)
+        content = (output / 'salida.brf').read_text(encoding='ascii')
+        assert content.splitlines()[1] == unicode_to_brf(braille_converter.text_to_braille('Piso 1'))
+
+    def test_to_text_round_trip(self, tree, tmp_path):
+        """Test que el Braille generado se puede volver a texto."""
+        braille_dir = tmp_path / 'braille'
+        text_dir = tmp_path / 'texto'
+        bulk_convert.run(str(tree), str(braille_dir), workers=1)
+        bulk_convert.run(str(braille_dir), str(text_dir), mode='to-text', workers=1)
+        assert (text_dir / 'salida.txt').read_text(encoding='utf-8') == 'Salida\nPiso 1\n'
+
+    def test_brf_to_text(self, tree, tmp_path):
+        """Test que los archivos BRF se pueden volver a texto."""
+        brf_dir = tmp_path / 'brf'
+        text_dir = tmp_path / 'texto'
+        bulk_convert.run(str(tree), str(brf_dir), mode='to-brf', workers=1)
+        bulk_convert.run(str(brf_dir), str(text_dir), mode='to-text', workers=1,
+                         pattern='*.brf')
+        assert (text_dir / 'salida.txt').read_text(encoding='utf-8') == 'Salida\nPiso 1\n'
+
+    def test_resume_skips_unchanged(self, tree, tmp_path):
+        """Test que el manifiesto evita repetir archivos sin cambios."""
+        output = tmp_path / 'salida'
+        bulk_convert.run(str(tree), str(output), workers=1)
+
+        (tree / 'salida.txt').write_text('Entrada\n', encoding='utf-8')
+        summary = bulk_convert.run(str(tree), str(output), workers=1)
+        assert summary['files'] == 1
+        assert summary['skipped'] == 1
+
+        summary = bulk_convert.run(str(tree), str(output), workers=1, resume=False)
+        assert summary['files'] == 2
+
+    def test_large_file_uses_mmap(self, tmp_path, monkeypatch):
+        """Test que la lectura con mmap devuelve las mismas líneas."""
+        path = tmp_path / 'grande.txt'
+        path.write_bytes(b'linea uno\nlinea dos\nfinal')
+        monkeypatch.setattr(bulk_convert, 'MMAP_THRESHOLD', 1)
+        assert list(bulk_convert.iter_lines(str(path))) == [b'linea uno\n', b'linea dos\n', b'final']
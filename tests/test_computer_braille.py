@@ -0,0 +1,162 @@
+"""
+Tests Unitarios - Braille Computerizado de 8 Puntos
+===================================================
+Casos de prueba para la tabla computer8 (una celda por carácter) y el
+soporte de celdas de 8 puntos en el conversor, las imágenes, el PDF y
+BRF.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import pytest
+import sys
+import os
+import re
+
+# Añadir directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.models.braille_cells import BrailleCells
+from backend.models.braille_converter import get_converter
+from backend.models.translation_tables import TableError, get_table, validate_table
+from backend.utils.brf import unicode_to_brf
+from backend.utils.image_renderer import BrailleImageRenderer, CellGeometry
+
+
+@pytest.fixture
+def converter():
+    """Conversor de la tabla computer8."""
+    return get_converter('computer8')
+
+
+class TestComputerTable:
+    """Tests de la tabla y del formato 'computer'."""
+
+    def test_table_is_eight_dot_computer(self):
+        """Test que computer8 es una tabla de 8 puntos en modo computer."""
+        table = get_table('computer8')
+        assert table.dots == 8
+        assert table.mode == 'computer'
+        assert table.contractions is None
+
+    def test_every_printable_ascii_has_distinct_cell(self):
+        """Test que los 95 caracteres ASCII imprimibles tienen celdas distintas."""
+        masks = get_table('computer8').char_masks
+        printable = [chr(c) for c in range(0x20, 0x7F)]
+        assert set(printable) <= set(masks)
+        assert len({masks[c] for c in printable}) == len(printable)
+
+    def test_computer_mode_allows_uppercase_keys(self):
+        """Test que el modo computer admite claves en mayúscula y no exige indicadores."""
+        data = validate_table({
+            'name': 'prueba', 'dots': 8, 'mode': 'computer',
+            'groups': [{'kind': 'letter', 'cells': {'a': [1], 'A': [1, 7]}}],
+            'numbers': {'cells': {str(d): [d + 1] for d in range(8)} | {'8': [7, 8], '9': [8]}},
+        })
+        assert data['capital_sign'] == ()
+
+    def test_literary_mode_still_requires_lowercase(self):
+        """Test que el modo literario sigue rechazando claves en mayúscula."""
+        with pytest.raises(TableError):
+            validate_table({
+                'name': 'prueba', 'dots': 6, 'capital_sign': [4, 6],
+                'number_sign': [3, 4, 5, 6],
+                'groups': [{'kind': 'letter', 'cells': {'A': [1]}}],
+                'numbers': {'cells': {str(d): [1] for d in range(10)}},
+            })
+
+    def test_invalid_mode(self):
+        """Test que un modo desconocido se rechaza."""
+        with pytest.raises(TableError):
+            validate_table({'name': 'x', 'mode': 'otro'})
+
+
+class TestComputerConversion:
+    """Tests de la conversión con una celda por carácter."""
+
+    def test_one_cell_per_character(self, converter):
+        """Test que cada carácter produce exactamente una celda."""
+        text = 'eth0: 192.168.1.10/24 {MTU=1500}'
+        assert len(converter.text_to_braille(text)) == len(text)
+
+    def test_uppercase_uses_dot_7(self, converter):
+        """Test que las mayúsculas son la minúscula más el punto 7."""
+        assert converter.text_to_braille('a') == '⠁'
+        assert converter.text_to_braille('A') == '⡁'
+
+    def test_digits_without_number_sign(self, converter):
+        """Test que los dígitos no llevan signo de número."""
+        assert converter.text_to_braille('10') == '⠂⠴'
+
+    def test_round_trip(self, converter):
+        """Test que la retrotraducción recupera el texto exacto."""
+        text = 'Server_01 [rack-B] ~/etc/hosts @ 10.0.0.1'
+        assert converter.braille_to_text(converter.text_to_braille(text)) == text
+
+    def test_compact_masks_use_high_bits(self, converter):
+        """Test que las máscaras compactas usan los bits de los puntos 7 y 8."""
+        cells = converter.text_to_braille_dots('A_', compact=True)
+        assert isinstance(cells, BrailleCells)
+        assert list(cells) == [(1, 7), (4, 5, 6, 7)]
+        assert cells.tobytes() == bytes([0x41, 0x78])
+
+    def test_dots_info_has_no_indicators(self, converter):
+        """Test que la información de puntos no incluye indicadores."""
+        info = converter.get_dots_info('A1 ñ')
+        assert [item['type'] for item in info] == ['letter', 'number', 'space', 'unknown']
+        assert info[0]['dots'] == [1, 7]
+
+    def test_validation_is_case_sensitive_exact(self, converter):
+        """Test que solo se admiten los caracteres de la tabla."""
+        assert converter.validate_text('Hola') == (True, [])
+        assert converter.validate_text('año') == (False, ['ñ'])
+
+    def test_braille_info_keeps_case(self, converter):
+        """Test que la información de mayúsculas y minúsculas es distinta."""
+        assert converter.get_braille_info('A')['dots'] == (1, 7)
+        assert converter.get_braille_info('a')['dots'] == (1,)
+
+    def test_contracted_mode_not_available(self, converter):
+        """Test que el modo contraído no existe en braille computerizado."""
+        with pytest.raises(ValueError):
+            converter.text_to_braille('que', contracted=True)
+
+    def test_default_table_unchanged(self):
+        """Test que la tabla española sigue usando indicadores."""
+        assert get_converter().text_to_braille('A1') == '⠨⠁⠼⠁'
+
+
+class TestEightDotRendering:
+    """Tests de los renderizadores con celdas de 8 puntos."""
+
+    def test_geometry_has_fourth_row(self):
+        """Test que la geometría de 8 puntos añade una fila."""
+        six = CellGeometry(dpi=150)
+        eight = CellGeometry(dpi=150, dots=8)
+        assert eight.dots == (1, 2, 3, 4, 5, 6, 7, 8)
+        assert eight.cell_height - six.cell_height == six.dot_spacing
+        assert six.key != eight.key
+
+    def test_svg_draws_dot_7(self):
+        """Test que el SVG dibuja el punto 7 en la cuarta fila."""
+        renderer = BrailleImageRenderer()
+        svg = renderer.render('A', 'svg', dpi=150, table='computer8').decode('utf-8')
+        geometry = CellGeometry(dpi=150, dots=8)
+        cy = geometry.dot_center(7)[1]
+        assert re.search(rf'<circle cx="\d+" cy="{cy}"', svg)
+
+    def test_pdf_generation_with_eight_dot_table(self, tmp_path):
+        """Test que el PDF se genera con una tabla de 8 puntos."""
+        pytest.importorskip('reportlab')
+        from backend.utils.pdf_generator import BrailleSignagePDFGenerator
+
+        generator = BrailleSignagePDFGenerator(str(tmp_path))
+        stored = generator.generate('Rack', [{'text': 'SRV-01'}], 'label', table='computer8')
+        assert stored.size > 0
+
+    def test_brf_strict_rejects_eight_dot_cells(self, converter):
+        """Test que BRF estricto rechaza celdas con los puntos 7 u 8."""
+        assert unicode_to_brf(converter.text_to_braille('abc'), strict=True) == 'ABC'
+        with pytest.raises(ValueError):
+            unicode_to_brf(converter.text_to_braille('ABC'), strict=True)
@@ -0,0 +1,105 @@
+"""
+Tests Unitarios - Control de Concurrencia
+==========================================
+Casos de prueba para los límites por clase de endpoint, los
+ejecutores acotados usados por las rutas asíncronas y el límite de
+PDFs simultáneos.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import asyncio
+import pytest
+import sys
+import os
+from threading import Event
+
+# Añadir directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.utils.concurrency import (
+    ConcurrencyLimiter, BoundedExecutor, ConcurrencyLimitExceeded
+)
+from backend.routes import async_routes, braille_routes
+
+
+class TestConcurrencyLimiter:
+    """Tests del limitador de concurrencia."""
+
+    def test_rejects_over_limit(self):
+        """Test que se rechaza al superar el límite."""
+        limiter = ConcurrencyLimiter('test', 1)
+
+        with limiter:
+            assert limiter.in_flight == 1
+            with pytest.raises(ConcurrencyLimitExceeded):
+                limiter.acquire()
+
+        assert limiter.in_flight == 0
+
+    def test_slot_released_on_error(self):
+        """Test que el hueco se libera aunque falle la operación."""
+        limiter = ConcurrencyLimiter('test', 1)
+
+        with pytest.raises(RuntimeError):
+            with limiter:
+                raise RuntimeError('fallo')
+
+        with limiter:
+            pass
+
+
+class TestBoundedExecutor:
+    """Tests del ejecutor acotado."""
+
+    def test_run_returns_result(self):
+        """Test que run() devuelve el resultado de la tarea."""
+        executor = BoundedExecutor('test', 1)
+        try:
+            assert asyncio.run(executor.run(sum, [1, 2, 3])) == 6
+        finally:
+            executor.shutdown()
+
+    def test_queue_full_rejects(self):
+        """Test que con el pool y la cola llenos se rechaza la tarea."""
+        executor = BoundedExecutor('test', max_workers=1, max_queue=1)
+        release = Event()
+        try:
+            executor.submit(release.wait)
+            executor.submit(release.wait)
+            with pytest.raises(ConcurrencyLimitExceeded):
+                executor.submit(release.wait)
+        finally:
+            release.set()
+            executor.shutdown()
+
+        assert executor.in_flight == 0
+
+
+class TestPdfLimit:
+    """Tests del límite de PDFs compartido por las rutas síncrona y asíncrona."""
+
+    @pytest.mark.parametrize('url', ['/api/generate-signage', '/api/async/generate-signage'])
+    def test_rejects_when_limit_reached(self, client, monkeypatch, url):
+        """Test que sin huecos de PDF se responde 503 sin generar nada."""
+        limiter = ConcurrencyLimiter('pdf', 1)
+        monkeypatch.setattr(braille_routes, 'pdf_limiter', limiter)
+        monkeypatch.setattr(async_routes, 'pdf_limiter', limiter)
+        with limiter:
+            response = client.post(url, json={'items': [{'text': 'Piso 1'}]})
+        assert response.status_code == 503
+        assert response.headers['Retry-After'] == '1'
+        assert response.get_json()['endpoint_class'] == 'pdf'
+
+    @pytest.mark.parametrize('threads, requested, expected', [
+        ('4', None, 2), ('1', None, 1), ('4', '10', 3), ('8', '3', 3)
+    ])
+    def test_limit_below_thread_count(self, monkeypatch, threads, requested, expected):
+        """Test que el límite de PDFs deja hilos libres para las conversiones."""
+        monkeypatch.setenv('BRAILLE_THREADS', threads)
+        if requested is None:
+            monkeypatch.delenv('BRAILLE_PDF_LIMIT', raising=False)
+        else:
+            monkeypatch.setenv('BRAILLE_PDF_LIMIT', requested)
+        assert braille_routes._pdf_limit() == expected
@@ -0,0 +1,101 @@
+"""
+Tests Unitarios - Modo Contraído (Estenografía)
+===============================================
+Casos de prueba para la tabla de contracciones y su uso en la
+conversión en ambos sentidos.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import pytest
+import sys
+import os
+
+# Añadir directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.models.braille_converter import BrailleConverter
+from backend.models.contractions import ContractionTable
+from backend.models.translation_tables import get_table
+
+
+@pytest.fixture
+def converter():
+    """Fixture que proporciona una instancia del conversor."""
+    return BrailleConverter()
+
+
+class TestContractionTable:
+    """Tests de la tabla compilada."""
+
+    def test_longest_match(self):
+        """Test que se elige la contracción más larga."""
+        table = ContractionTable(get_table('es').contraction_rules)
+        assert table.match_text('mente', 0).text == 'mente'
+        assert table.match_text('entero', 0).text == 'en'
+
+    def test_word_rule_requires_isolated_word(self):
+        """Test que las contracciones de palabra no se aplican dentro de otra."""
+        table = ContractionTable(get_table('es').contraction_rules)
+        assert table.match_text('que tal', 0).text == 'que'
+        assert table.match_text('queso', 0) is None
+        assert table.match_text('2que', 1) is None
+
+    def test_rejects_duplicates(self):
+        """Test que una tabla con celdas repetidas es inválida."""
+        with pytest.raises(ValueError):
+            ContractionTable([('es', ((1, 2, 6),), 'group'),
+                              ('as', ((1, 2, 6),), 'group')])
+
+
+class TestContractedConversion:
+    """Tests de la conversión en modo contraído."""
+
+    @pytest.mark.parametrize('text', [
+        'Que bonito, la nación está para nosotros',
+        'Como siempre, mucho Gobierno hacia Donde también',
+        'Canción rápidamente 3,5 entonces',
+        'El 12 es mayor. ¿Queso?',
+    ])
+    def test_round_trip(self, converter, text):
+        """Test que la retrotraducción coincide con la del braille integral."""
+        contracted = converter.text_to_braille(text, contracted=True)
+        expected = converter.braille_to_text(converter.text_to_braille(text))
+        assert converter.braille_to_text(contracted, contracted=True) == expected
+        assert len(contracted) < len(converter.text_to_braille(text))
+
+    def test_capitalized_contraction(self, converter):
+        """Test que la mayúscula inicial precede a la contracción."""
+        assert converter.text_to_braille('Que', contracted=True) == '⠨⠟'
+
+    def test_without_contractions_matches_grade_one(self, converter):
+        """Test que sin contracciones aplicables el resultado no cambia."""
+        text = 'Piso 1, Aula 3.5'
+        for output_format in ('unicode', 'dots', 'description'):
+            assert (converter.text_to_braille(text, output_format, contracted=True)
+                    == converter.text_to_braille(text, output_format))
+
+    def test_dots_match_unicode(self, converter):
+        """Test que text_to_braille_dots usa las mismas celdas."""
+        text = 'Finalmente que canción'
+        cells = converter.text_to_braille_dots(text, compact=True, contracted=True)
+        unicode_cells = converter.text_to_braille(text, contracted=True)
+        assert ''.join(chr(0x2800 + m) for m in cells.masks) == unicode_cells
+
+    @pytest.mark.parametrize('text, expected', [
+        ('p', 'para'),
+        ('la letra q', 'la letra que'),
+        ('Q', 'Que'),
+        ('x', 'x'),
+    ])
+    def test_isolated_letter_reads_as_word(self, converter, text, expected):
+        """Test que una letra aislada con regla de palabra se lee como la palabra."""
+        contracted = converter.text_to_braille(text, contracted=True)
+        assert contracted == converter.text_to_braille(text)
+        assert converter.braille_to_text(contracted, contracted=True) == expected
+
+    def test_uppercase_word_not_contracted(self, converter):
+        """Test que las palabras en mayúsculas se escriben letra a letra."""
+        assert (converter.text_to_braille('QUE', contracted=True)
+                == converter.text_to_braille('QUE'))
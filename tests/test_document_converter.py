@@ -0,0 +1,99 @@
+"""
+Tests Unitarios - Conversión Paralela de Documentos
+===================================================
+Casos de prueba para la partición en segmentos seguros y la conversión
+en varios procesos.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import pytest
+import sys
+import os
+import random
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+# Añadir directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.models import document_converter
+from backend.models.braille_converter import braille_converter
+from backend.models.document_converter import convert_document_parallel, split_segments
+
+
+def sample_document(size: int) -> str:
+    """Texto con mayúsculas, números, decimales y saltos de línea."""
+    rng = random.Random(42)
+    words = ['Piso', '3,5', '12.000', 'ascensor', 'Baño', '2025', 'ñandú', 'A1',
+             'salida.', '7,', 'Niño\n', '1.', 'Aula\t4']
+    parts = []
+    total = 0
+    while total < size:
+        word = rng.choice(words)
+        parts.append(word)
+        total += len(word) + 1
+    return ' '.join(parts)
+
+
+@pytest.fixture(scope='module')
+def executor():
+    """Pool de dos procesos compartido por los tests."""
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        yield pool
+
+
+@pytest.fixture
+def small_segments(monkeypatch):
+    """Permite segmentos pequeños para probar con textos cortos."""
+    monkeypatch.setattr(document_converter, 'MIN_SEGMENT_SIZE', 64)
+
+
+class TestSplitSegments:
+    """Tests de la partición del texto."""
+
+    def test_segments_rebuild_text(self):
+        """Test que los segmentos concatenados son el texto original."""
+        text = sample_document(5000)
+        segments = split_segments(text, 100)
+        assert ''.join(segments) == text
+        assert len(segments) > 10
+
+    def test_segments_end_in_whitespace(self):
+        """Test que todos los segmentos salvo el último acaban en espacio."""
+        segments = split_segments(sample_document(5000), 100)
+        assert all(segment[-1].isspace() for segment in segments[:-1])
+        assert all(len(segment) >= 100 for segment in segments[:-1])
+
+    def test_text_without_whitespace(self):
+        """Test que un texto sin espacios queda en un segmento."""
+        assert split_segments('a' * 1000, 100) == ['a' * 1000]
+
+
+class TestConvertDocumentParallel:
+    """Tests de la conversión en paralelo."""
+
+    @pytest.mark.parametrize('output_format', ['unicode', 'dots', 'description'])
+    def test_identical_to_sequential(self, executor, small_segments, output_format):
+        """Test que el resultado coincide con la conversión secuencial."""
+        text = sample_document(20000)
+        expected = braille_converter.text_to_braille(text, output_format)
+        result = convert_document_parallel(text, output_format, threshold=0,
+                                           executor=executor)
+        assert result == expected
+
+    def test_own_pool(self, small_segments):
+        """Test que sin executor se crea y cierra un pool propio."""
+        text = sample_document(3000)
+        result = convert_document_parallel(text, workers=2, threshold=0)
+        assert result == braille_converter.text_to_braille(text)
+
+    def test_small_text_stays_sequential(self):
+        """Test que por debajo del umbral no se usa el pool."""
+        class FailingExecutor(Executor):
+            def map(self, *args, **kwargs):
+                raise AssertionError('no debe usarse el pool')
+
+        text = 'Piso 1'
+        result = convert_document_parallel(text, executor=FailingExecutor())
+        assert result == braille_converter.text_to_braille(text)
@@ -0,0 +1,155 @@
+"""
+Tests Unitarios - dots_info Compacto
+====================================
+Casos de prueba para la codificación compacta de la información de
+puntos (backend/utils/dots_info.py), la opción dots_info_format de
+/api/convert/to-braille y su decodificación en el navegador
+(BrailleEngine.decodeDotsInfo, o app.js sin el motor; necesita Node.js).
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import pytest
+import sys
+import os
+import json
+import shutil
+import subprocess
+
+# Añadir directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.models.braille_converter import get_converter
+from backend.utils.dots_info import decode_compact, encode_compact, encode_dots_info
+
+ENGINE_PATH = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', 'frontend', 'js', 'braille_engine.js'
+))
+
+NODE_SCRIPT = """
+const { BrailleEngine } = require(process.argv[1]);
+const input = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+process.stdout.write(JSON.stringify(input.map(BrailleEngine.decodeDotsInfo)));
+"""
+
+APP_PATH = os.path.join(os.path.dirname(ENGINE_PATH), 'app.js')
+
+# app.js sin braille_engine.js (y sin DOM): solo se usan sus funciones
+NODE_APP_SCRIPT = """
+const fs = require('fs');
+const vm = require('vm');
+global.window = { location: { origin: '' } };
+console.log = () => {};
+global.document = {
+    addEventListener() {},
+    getElementById: () => ({ addEventListener() {} }),
+    createElement: () => ({ set textContent(value) { this.innerHTML = value; } })
+};
+vm.runInThisContext(fs.readFileSync(process.argv[1], 'utf8'));
+const input = JSON.parse(fs.readFileSync(0, 'utf8'));
+process.stdout.write(JSON.stringify({
+    decoded: input.map(decodeCompactDotsInfo),
+    html: renderBrailleCells(input[0]).includes('braille-cell')
+}));
+"""
+
+SAMPLES = ['Hola Mundo', 'Piso 3,5 y 1.000', 'ÁRBOL ñandú 12.', 'a☃b', '', 'x' * 600]
+
+
+class TestCompactEncoding:
+    """Tests de la codificación compacta."""
+
+    @pytest.mark.parametrize('table_name', ['es', 'computer8'])
+    @pytest.mark.parametrize('text', SAMPLES)
+    def test_round_trip(self, table_name, text):
+        """Test que decodificar devuelve exactamente la lista original."""
+        dots_info = get_converter(table_name).get_dots_info(text)
+        assert decode_compact(encode_compact(dots_info)) == dots_info
+
+    def test_long_runs_are_split(self):
+        """Test que las rachas de más de 255 celdas se parten."""
+        compact = encode_compact(get_converter().get_dots_info('x' * 600))
+        assert compact['count'] == 600
+        assert len(compact['type_runs']) == 8  # 3 rachas = 6 bytes en base64
+
+    def test_much_smaller_than_list(self):
+        """Test que el formato compacto ocupa mucho menos que la lista."""
+        dots_info = get_converter().get_dots_info('Hola Mundo, piso 3. ' * 500)
+        list_size = len(json.dumps(dots_info))
+        compact_size = len(json.dumps(encode_compact(dots_info)))
+        assert compact_size * 10 < list_size
+
+    def test_inconsistent_lengths(self):
+        """Test que un dots_info compacto corrupto se rechaza."""
+        compact = encode_compact(get_converter().get_dots_info('hola'))
+        compact['labels'] = 'hol'
+        with pytest.raises(ValueError):
+            decode_compact(compact)
+
+    def test_unknown_format(self):
+        """Test que un formato desconocido se rechaza."""
+        with pytest.raises(ValueError):
+            encode_dots_info([], 'otro')
+
+
+class TestDotsInfoFormatOption:
+    """Tests de la opción dots_info_format de la API."""
+
+    @pytest.mark.parametrize('url', ['/api/convert/to-braille', '/api/async/convert/to-braille'])
+    def test_compact_response(self, client, url):
+        """Test que la API devuelve el formato compacto pedido."""
+        response = client.post(url, json={'text': 'Hola 12', 'dots_info_format': 'compact'})
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data['dots_info']['format'] == 'compact'
+        assert decode_compact(data['dots_info']) == get_converter().get_dots_info('Hola 12')
+
+    def test_default_is_list(self, client):
+        """Test que sin la opción se mantiene la lista."""
+        data = client.post('/api/convert/to-braille', json={'text': 'a'}).get_json()
+        assert data['dots_info'] == [{'char': 'a', 'dots': [1], 'type': 'letter'}]
+
+    @pytest.mark.parametrize('url', ['/api/convert/to-braille', '/api/async/convert/to-braille'])
+    def test_invalid_format(self, client, url):
+        """Test que un formato inválido devuelve 400."""
+        response = client.post(url, json={'text': 'a', 'dots_info_format': 'binario'})
+        assert response.status_code == 400
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='Node.js no disponible')
+class TestBrowserDecoding:
+    """Tests de la decodificación en el navegador."""
+
+    def test_engine_decodes_compact(self):
+        """Test que BrailleEngine.decodeDotsInfo reproduce la lista original."""
+        payload = []
+        expected = []
+        for table_name in ('es', 'computer8'):
+            for text in SAMPLES:
+                dots_info = get_converter(table_name).get_dots_info(text)
+                payload += [encode_compact(dots_info), dots_info]
+                expected += [dots_info, dots_info]
+
+        result = subprocess.run(
+            ['node', '-e', NODE_SCRIPT, ENGINE_PATH], input=json.dumps(payload),
+            capture_output=True, text=True, encoding='utf-8', check=True, timeout=60
+        )
+        assert json.loads(result.stdout) == expected
+
+    def test_app_decodes_without_engine(self):
+        """Test que app.js decodifica el formato compacto sin BrailleEngine."""
+        payload = []
+        expected = []
+        for text in SAMPLES:
+            dots_info = get_converter().get_dots_info(text)
+            payload += [encode_compact(dots_info), dots_info]
+            expected += [dots_info, dots_info]
+
+        result = subprocess.run(
+            ['node', '-e', NODE_APP_SCRIPT, APP_PATH], input=json.dumps(payload),
+            capture_output=True, text=True, encoding='utf-8', check=True, timeout=60
+        )
+        output = json.loads(result.stdout)
+        assert output['decoded'] == expected
+        assert output['html'] is True
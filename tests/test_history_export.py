@@ -0,0 +1,124 @@
+"""
+Tests Unitarios - Exportación e Importación del Historial
+=========================================================
+Casos de prueba para la exportación en streaming (NDJSON/CSV, gzip) y
+la importación por lotes.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import pytest
+import sys
+import os
+import gzip
+import io
+import json
+
+# Añadir directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.database.db_manager import DatabaseManager, EXPORT_COLUMNS
+from backend.utils.history_export import encode_records, decode_records, gzip_chunks
+
+
+@pytest.fixture
+def db(db):
+    """Base de datos temporal con algunas conversiones."""
+    for n in range(25):
+        db.save_conversion(f'piso {n}', '⠏⠊⠎⠕', 'text_to_braille')
+    return db
+
+
+class TestEncoding:
+    """Tests de la serialización."""
+
+    @pytest.mark.parametrize('export_format', ['ndjson', 'csv'])
+    def test_round_trip(self, db, export_format):
+        """Test que exportar y leer devuelve los mismos registros."""
+        columns = EXPORT_COLUMNS['conversions']
+        data = b''.join(encode_records(db.iter_records('conversions', batch_size=7),
+                                       export_format, columns))
+        records = list(decode_records(io.BytesIO(data), export_format))
+        assert len(records) == 25
+        assert records[3]['original_text'] == 'piso 3'
+
+    def test_gzip_detected(self, db):
+        """Test que la lectura detecta el contenido gzip."""
+        chunks = encode_records(db.iter_records('conversions'), 'ndjson',
+                                EXPORT_COLUMNS['conversions'])
+        data = b''.join(gzip_chunks(chunks))
+        assert gzip.decompress(data).count(b'\n') == 25
+        assert len(list(decode_records(io.BytesIO(data), 'ndjson'))) == 25
+
+    def test_invalid_ndjson_line(self):
+        """Test que una línea inválida indica su número."""
+        with pytest.raises(ValueError, match='Línea 2'):
+            list(decode_records(io.BytesIO(b'{}\n[1]\n'), 'ndjson'))
+
+
+class TestImport:
+    """Tests de la importación por lotes."""
+
+    def test_import_keeps_timestamps_and_rollups(self, tmp_path):
+        """Test que se conserva created_at y se actualizan los agregados."""
+        db = DatabaseManager(str(tmp_path / 'destino.db'))
+        records = [{'original_text': 'hola', 'braille_text': '⠓⠕⠇⠁',
+                    'conversion_type': 'text_to_braille',
+                    'created_at': '2025-11-03 10:31:12'}] * 5
+        assert db.import_records('conversions', records, batch_size=2) == 5
+
+        history = db.get_conversion_history()
+        assert history[0]['timestamp'] == '2025-11-03 10:31:12'
+        assert history[0]['character_count'] == 4
+
+        from datetime import datetime
+        series = db.get_timeseries(datetime(2025, 11, 3), datetime(2025, 11, 4))
+        assert series['conversions'][0]['conversions'] == 5
+        db.close()
+
+    def test_invalid_record(self, db):
+        """Test que un registro incompleto se rechaza con su número."""
+        with pytest.raises(ValueError, match='Registro 2'):
+            db.import_records('conversions', [
+                {'original_text': 'a', 'braille_text': '⠁', 'conversion_type': 'x'},
+                {'original_text': 'b'}
+            ])
+
+
+class TestHistoryEndpoints:
+    """Tests de los endpoints de exportación e importación."""
+
+    def test_export_ndjson(self, client):
+        """Test que se exporta un objeto por línea."""
+        response = client.get('/api/history/export')
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-ndjson'
+        lines = response.data.decode('utf-8').splitlines()
+        assert len(lines) == 25
+        assert json.loads(lines[0])['original_text'] == 'piso 0'
+
+    def test_export_csv_gzip(self, client):
+        """Test que la exportación CSV puede comprimirse."""
+        response = client.get('/api/history/export?format=csv&compress=gzip')
+        assert response.mimetype == 'application/gzip'
+        assert 'conversions_' in response.headers['Content-Disposition']
+        text = gzip.decompress(response.data).decode('utf-8')
+        assert text.startswith('id,original_text,')
+
+    def test_export_import_round_trip(self, client, db):
+        """Test que un archivo exportado se puede volver a importar."""
+        exported = client.get('/api/history/export?compress=gzip').data
+        response = client.post('/api/history/import', data=exported)
+        assert response.get_json()['imported'] == 25
+        assert db.get_statistics()['total_conversions'] == 50
+
+    @pytest.mark.parametrize('query', ['table=settings', 'format=xml', 'compress=zip'])
+    def test_export_invalid_parameters(self, client, query):
+        """Test que los parámetros inválidos devuelven 400."""
+        assert client.get(f'/api/history/export?{query}').status_code == 400
+
+    def test_import_invalid_data(self, client):
+        """Test que los datos inválidos devuelven 400."""
+        response = client.post('/api/history/import', data=b'no es json\n')
+        assert response.status_code == 400
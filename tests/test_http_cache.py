@@ -0,0 +1,159 @@
+"""
+Tests Unitarios - Compresión y Caché HTTP
+=========================================
+Casos de prueba para la compresión de respuestas (gzip/brotli con
+umbral de tamaño), los ETag y respuestas 304 del historial y la página
+principal, y las URLs de estáticos con huella cacheadas como inmutables.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import pytest
+import sys
+import os
+import re
+import gzip
+
+# Añadir directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.utils import http_cache
+
+FRONTEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'frontend'))
+
+GZIP = {'Accept-Encoding': 'gzip'}
+
+
+def asset_urls(client) -> list:
+    """URLs de los estáticos enlazados desde la página principal."""
+    html = client.get('/').get_data(as_text=True)
+    return re.findall(r'(?:href|src)="(/[^"]+\?v=[0-9a-f]+)"', html)
+
+
+class TestCompression:
+    """Tests de la compresión de respuestas."""
+
+    def test_large_json_is_gzipped(self, client):
+        """Test que una respuesta grande se comprime con gzip."""
+        response = client.post('/api/convert/to-braille', json={'text': 'hola mundo ' * 200},
+                               headers=GZIP)
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in response.headers['Vary']
+        body = gzip.decompress(response.data)
+        assert len(response.data) * 10 < len(body)
+        assert b'"success"' in body
+
+    def test_small_response_is_not_compressed(self, client):
+        """Test que las respuestas por debajo del umbral no se comprimen."""
+        response = client.post('/api/convert/to-braille', json={'text': 'hola'}, headers=GZIP)
+        assert 'Content-Encoding' not in response.headers
+
+    def test_client_without_gzip(self, client):
+        """Test que sin Accept-Encoding la respuesta va sin comprimir."""
+        response = client.post('/api/convert/to-braille', json={'text': 'hola mundo ' * 200})
+        assert 'Content-Encoding' not in response.headers
+        assert response.get_json()['success'] is True
+
+    def test_gzip_refused(self, client):
+        """Test que gzip;q=0 no se usa."""
+        response = client.post('/api/convert/to-braille', json={'text': 'hola mundo ' * 200},
+                               headers={'Accept-Encoding': 'gzip;q=0'})
+        assert 'Content-Encoding' not in response.headers
+
+    def test_brotli_when_available(self, client):
+        """Test que se prefiere brotli si el cliente y el servidor lo admiten."""
+        brotli = pytest.importorskip('brotli')
+        response = client.post('/api/convert/to-braille', json={'text': 'hola mundo ' * 200},
+                               headers={'Accept-Encoding': 'gzip, br'})
+        assert response.headers['Content-Encoding'] == 'br'
+        assert b'"success"' in brotli.decompress(response.data)
+
+    def test_png_is_not_compressed(self, client):
+        """Test que las imágenes PNG no se comprimen de nuevo."""
+        pytest.importorskip('PIL')
+        response = client.post('/api/render/png', json={'text': 'hola mundo ' * 20}, headers=GZIP)
+        assert response.status_code == 200
+        assert 'Content-Encoding' not in response.headers
+
+
+class TestConditionalGet:
+    """Tests de ETag y 304."""
+
+    def test_history_etag_and_304(self, client):
+        """Test que el historial se revalida con su ETag."""
+        response = client.get('/api/history')
+        assert response.headers['Cache-Control'] == 'no-cache'
+        etag = response.headers['ETag']
+        assert client.get('/api/history', headers={'If-None-Match': etag}).status_code == 304
+
+        client.post('/api/convert/to-braille', json={'text': 'hola'})
+        assert client.get('/api/history', headers={'If-None-Match': etag}).status_code == 200
+
+    def test_compressed_response_keeps_304(self, client):
+        """Test que el ETag débil de la respuesta comprimida sigue dando 304."""
+        for text in ('hola mundo ' * 50, 'adiós ' * 50):
+            client.post('/api/convert/to-braille', json={'text': text})
+        response = client.get('/api/history', headers=GZIP)
+        assert response.headers['Content-Encoding'] == 'gzip'
+        etag = response.headers['ETag']
+        assert etag.startswith('W/')
+        again = client.get('/api/history', headers={**GZIP, 'If-None-Match': etag})
+        assert again.status_code == 304
+
+    def test_index_html_is_rendered(self, client):
+        """Test que /index.html se renderiza y no devuelve la plantilla Jinja."""
+        html = client.get('/index.html').get_data(as_text=True)
+        assert html == client.get('/').get_data(as_text=True)
+        assert '{{' not in html and 'asset_url' not in html
+
+    def test_index_is_revalidated(self, client):
+        """Test que la página principal tiene ETag y responde 304."""
+        response = client.get('/')
+        assert response.headers['Cache-Control'] == 'no-cache'
+        assert client.get('/', headers={'If-None-Match': response.headers['ETag']}).status_code == 304
+
+
+class TestStaticAssets:
+    """Tests de los estáticos con huella."""
+
+    def test_index_links_fingerprinted_assets(self, client):
+        """Test que la página enlaza los estáticos con su huella."""
+        urls = asset_urls(client)
+        assert {url.split('?')[0] for url in urls} == {
+            '/css/styles.css', '/js/braille_engine.js', '/js/app.js'
+        }
+
+    def test_fingerprinted_asset_is_immutable(self, client):
+        """Test que la URL con la huella actual se cachea un año."""
+        url = next(url for url in asset_urls(client) if 'app.js' in url)
+        response = client.get(url, headers=GZIP)
+        cache_control = response.headers['Cache-Control']
+        assert 'immutable' in cache_control
+        assert f'max-age={http_cache.STATIC_MAX_AGE}' in cache_control
+        assert response.headers['Content-Encoding'] == 'gzip'
+        with open(os.path.join(FRONTEND_DIR, 'js', 'app.js'), 'rb') as file:
+            assert gzip.decompress(response.data) == file.read()
+        response.close()
+
+    def test_stale_fingerprint_is_revalidated(self, client):
+        """Test que una huella antigua no se cachea como inmutable."""
+        response = client.get('/js/app.js?v=000000000000')
+        assert 'immutable' not in response.headers['Cache-Control']
+        response.close()
+
+    def test_static_304(self, client):
+        """Test que un estático sin cambios responde 304."""
+        response = client.get('/css/styles.css', headers=GZIP)
+        etag = response.headers['ETag']
+        response.close()
+        again = client.get('/css/styles.css', headers={**GZIP, 'If-None-Match': etag})
+        assert again.status_code == 304
+
+    def test_fingerprint_changes_with_content(self, tmp_path):
+        """Test que la huella cambia al cambiar el contenido."""
+        asset = tmp_path / 'a.js'
+        asset.write_text('uno')
+        first = http_cache.asset_fingerprint(str(tmp_path), 'a.js')
+        asset.write_text('dos!')
+        assert http_cache.asset_fingerprint(str(tmp_path), 'a.js') != first
@@ -0,0 +1,120 @@
+"""
+Tests Unitarios - Renderizador de Imágenes Braille
+===================================================
+Casos de prueba para la exportación SVG/PNG con caché de glifos y los
+límites de tamaño de /api/render.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import pytest
+import sys
+import os
+from io import BytesIO
+
+# Añadir directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PIL import Image
+from backend.utils import image_renderer
+from backend.utils.image_renderer import (
+    BrailleImageRenderer, CellGeometry, ImageTooLarge, dots_to_mask
+)
+
+
+@pytest.fixture
+def renderer():
+    """Fixture que proporciona un renderizador con caché vacía."""
+    return BrailleImageRenderer()
+
+
+class TestImageRendererPNG:
+    """Tests de salida PNG."""
+
+    def test_png_is_valid_image(self, renderer):
+        """Test que el PNG generado se puede abrir."""
+        content = renderer.render_png('hola', dpi=150)
+        image = Image.open(BytesIO(content))
+
+        assert image.format == 'PNG'
+        geometry = CellGeometry(dpi=150)
+        assert image.size[0] == 2 * geometry.margin + 4 * geometry.cell_width
+
+    def test_png_multiline_height(self, renderer):
+        """Test que cada línea añade una altura de línea."""
+        one = Image.open(BytesIO(renderer.render_png('a', dpi=150)))
+        two = Image.open(BytesIO(renderer.render_png('a\nb', dpi=150)))
+
+        assert two.size[1] - one.size[1] == CellGeometry(dpi=150).line_height
+
+    def test_glyph_cache_reused(self, renderer):
+        """Test que los patrones repetidos se sirven desde la caché."""
+        renderer.render_png('aaaa')
+
+        assert renderer.cache_misses == 1
+        assert renderer.cache_hits == 3
+
+
+class TestImageRendererSVG:
+    """Tests de salida SVG."""
+
+    def test_svg_defines_each_pattern_once(self, renderer):
+        """Test que cada patrón se define una sola vez en <defs>."""
+        svg = renderer.render_svg('aab').decode('utf-8')
+
+        assert svg.count('<g id="c1">') == 1
+        assert svg.count('href="#c1"') == 2
+        assert svg.count('href="#c3"') == 1
+
+    def test_svg_skips_blank_cells(self, renderer):
+        """Test que los espacios no generan celdas."""
+        svg = renderer.render_svg('a b').decode('utf-8')
+        assert '<use' in svg
+        assert svg.count('<use') == 2
+
+    def test_invalid_format(self, renderer):
+        """Test formato no soportado."""
+        with pytest.raises(ValueError):
+            renderer.render('hola', 'gif')
+
+
+class TestRenderLimits:
+    """Tests de los límites de tamaño de las imágenes."""
+
+    def test_pixel_budget(self, renderer, monkeypatch):
+        """Test que un lienzo por encima del límite no se reserva."""
+        monkeypatch.setattr(image_renderer, 'MAX_PIXELS', 10_000)
+        with pytest.raises(ImageTooLarge):
+            renderer.render_png('hola', dpi=1200, scale=8)
+
+    def test_cell_limit(self, renderer, monkeypatch):
+        """Test que se limita el número de celdas (también en SVG)."""
+        monkeypatch.setattr(image_renderer, 'MAX_CELLS', 3)
+        with pytest.raises(ImageTooLarge):
+            renderer.render_svg('Hola')
+
+    def test_huge_canvas_returns_413(self, client):
+        """Test que dpi y scale máximos con un texto largo responden 413."""
+        response = client.post('/api/render/png', json={
+            'text': 'hola mundo ' * 300, 'dpi': 1200, 'scale': 8
+        })
+        assert response.status_code == 413
+
+    def test_long_text_returns_413(self, client):
+        """Test que un texto con más celdas que el límite se rechaza antes de convertir."""
+        response = client.post('/api/render/svg', json={'text': 'a' * (image_renderer.MAX_CELLS + 1)})
+        assert response.status_code == 413
+
+    @pytest.mark.parametrize('show_empty', ['false', 1, None])
+    def test_show_empty_must_be_boolean(self, client, show_empty):
+        """Test que show_empty solo admite true/false."""
+        response = client.post('/api/render/svg', json={'text': 'a', 'show_empty': show_empty})
+        assert response.status_code == 400
+
+
+def test_dots_to_mask():
+    """Test conversión de puntos a máscara de bits."""
+    assert dots_to_mask(()) == 0
+    assert dots_to_mask((1,)) == 1
+    assert dots_to_mask((1, 2, 3, 4, 5, 6)) == 63
@@ -0,0 +1,190 @@
+"""
+Tests Unitarios - Conversión Incremental
+========================================
+Casos de prueba para IncrementalDocument (las ediciones producen el
+mismo Braille que reconvertir el documento completo y devuelven solo
+las celdas cambiadas), DocumentStore y POST /api/convert/incremental.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import pytest
+import sys
+import os
+import random
+
+# Añadir directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.models.braille_cells import masks_to_unicode
+from backend.models.braille_converter import get_converter
+from backend.models.incremental import (
+    DocumentStore, EditError, IncrementalDocument, VersionConflict
+)
+
+
+def full_braille(converter, text: str, contracted: bool = False) -> str:
+    """Braille del texto completo convertido de una vez."""
+    return masks_to_unicode(
+        converter.text_to_braille_dots(text, compact=True, contracted=contracted).tobytes()
+    )
+
+
+def random_edits(document: IncrementalDocument, converter, contracted: bool, seed: int):
+    """Aplica ediciones aleatorias y comprueba cada resultado."""
+    rng = random.Random(seed)
+    words = ['que', 'para', 'Hola', 'mundo', '3,5', '1.000', 'A1', 'x', ',', '.', '12']
+    braille = list(document.braille)
+    for _ in range(300):
+        offset = rng.randint(0, len(document))
+        deleted = rng.randint(0, min(8, len(document) - offset))
+        inserted = rng.choice(['', ' ', rng.choice(words), rng.choice(words) + ' ',
+                               ' ' + rng.choice(words), '\n'])
+        diff = document.apply_edit(offset, deleted, inserted, document.version)
+
+        braille[diff.start:diff.start + diff.deleted] = masks_to_unicode(diff.masks)
+        expected = full_braille(converter, document.text, contracted)
+        assert document.braille == expected
+        assert ''.join(braille) == expected
+        assert document.cell_count == len(expected)
+
+
+class TestIncrementalDocument:
+    """Tests de las ediciones sobre un documento."""
+
+    @pytest.mark.parametrize('table_name,contracted', [
+        ('es', False), ('es', True), ('computer8', False)
+    ])
+    def test_random_edits_match_full_conversion(self, table_name, contracted):
+        """Test que las ediciones equivalen a reconvertir el documento completo."""
+        converter = get_converter(table_name)
+        text = 'Piso 3,5 de 1.000 que para Hola mundo. ' * 40
+        document = IncrementalDocument(text, converter, contracted, block_size=32)
+        random_edits(document, converter, contracted, seed=47)
+
+    def test_diff_is_minimal(self):
+        """Test que solo se devuelven las celdas que cambian."""
+        document = IncrementalDocument('hola mundo', get_converter('es'))
+        diff = document.apply_edit(5, 5, 'mando')
+        assert (diff.start, diff.deleted, masks_to_unicode(diff.masks)) == (6, 1, '⠁')
+
+    def test_number_mode_resyncs_after_edit(self):
+        """Test que borrar un espacio entre números une el modo numérico."""
+        converter = get_converter('es')
+        document = IncrementalDocument('12 34 ' * 50, converter, block_size=8)
+        document.apply_edit(2, 1, '')
+        assert document.braille == full_braille(converter, document.text)
+        assert document.braille.startswith('⠼⠁⠃⠉⠙⠀')
+
+    def test_only_touched_blocks_are_converted(self):
+        """Test que la edición no reconvierte el resto del documento."""
+        converter = get_converter('es')
+        document = IncrementalDocument('hola mundo ' * 1000, converter, block_size=64)
+        calls = []
+        original = document._convert
+        document._convert = lambda text: calls.append(text) or original(text)
+        document.apply_edit(5000, 0, 'x')
+        assert sum(len(text) for text in calls) < 200
+
+    def test_empty_document(self):
+        """Test que se puede editar un documento vacío."""
+        converter = get_converter('es')
+        document = IncrementalDocument('', converter)
+        diff = document.apply_edit(0, 0, 'Hola')
+        assert masks_to_unicode(diff.masks) == '⠨⠓⠕⠇⠁'
+        document.apply_edit(0, 4, '')
+        assert document.braille == '' and document.text == ''
+
+    def test_version_conflict(self):
+        """Test que una versión base antigua se rechaza."""
+        document = IncrementalDocument('hola', get_converter('es'))
+        document.apply_edit(0, 0, 'a', base_version=0)
+        with pytest.raises(VersionConflict) as info:
+            document.apply_edit(0, 0, 'b', base_version=0)
+        assert info.value.current == 1
+
+    @pytest.mark.parametrize('offset,deleted', [(-1, 0), (3, 5), (5, 0), (0, -1), ('0', 0)])
+    def test_edit_out_of_range(self, offset, deleted):
+        """Test que una edición fuera del documento se rechaza."""
+        document = IncrementalDocument('hola', get_converter('es'))
+        with pytest.raises(EditError):
+            document.apply_edit(offset, deleted, '')
+        assert document.version == 0
+
+
+class TestDocumentStore:
+    """Tests del almacén de documentos."""
+
+    def test_least_recently_used_is_evicted(self):
+        """Test que se descarta el documento usado hace más tiempo."""
+        store = DocumentStore(max_documents=2)
+        converter = get_converter('es')
+        first, _ = store.create('a', converter)
+        second, _ = store.create('b', converter)
+        store.get(first)
+        store.create('c', converter)
+        assert store.get(first) is not None
+        assert store.get(second) is None
+
+    def test_expired_document(self):
+        """Test que un documento sin uso caduca."""
+        store = DocumentStore(ttl=0)
+        document_id, document = store.create('a', get_converter('es'))
+        document.touched -= 1
+        assert store.get(document_id) is None
+
+
+class TestIncrementalEndpoint:
+    """Tests de POST /api/convert/incremental."""
+
+    def test_create_and_edit(self, client):
+        """Test que se crea un documento y se edita por rangos de celdas."""
+        created = client.post('/api/convert/incremental', json={'text': 'hola mundo'})
+        assert created.status_code == 201
+        data = created.get_json()
+        assert data['braille'] == '⠓⠕⠇⠁⠀⠍⠥⠝⠙⠕'
+
+        response = client.post('/api/convert/incremental', json={
+            'document_id': data['document_id'], 'base_version': 0,
+            'edit': {'offset': 0, 'deleted': 1, 'inserted': 'H'}
+        })
+        edit = response.get_json()
+        assert response.status_code == 200
+        assert (edit['version'], edit['start'], edit['deleted'], edit['braille']) == (1, 0, 0, '⠨')
+        assert edit['cell_count'] == 11
+
+    def test_stale_version_returns_409(self, client):
+        """Test que una edición sobre una versión antigua devuelve 409."""
+        document_id = client.post('/api/convert/incremental', json={'text': 'hola'}).get_json()['document_id']
+        edit = {'document_id': document_id, 'base_version': 0,
+                'edit': {'offset': 0, 'deleted': 0, 'inserted': 'a'}}
+        assert client.post('/api/convert/incremental', json=edit).status_code == 200
+        response = client.post('/api/convert/incremental', json=edit)
+        assert response.status_code == 409
+        assert response.get_json()['version'] == 1
+
+    def test_unknown_document(self, client):
+        """Test que un documento inexistente devuelve 404."""
+        response = client.post('/api/convert/incremental', json={
+            'document_id': 'no-existe', 'base_version': 0,
+            'edit': {'offset': 0, 'deleted': 0, 'inserted': 'a'}
+        })
+        assert response.status_code == 404
+
+    def test_unsupported_insert(self, client):
+        """Test que el texto insertado con caracteres no soportados se rechaza."""
+        document_id = client.post('/api/convert/incremental', json={'text': 'hola'}).get_json()['document_id']
+        response = client.post('/api/convert/incremental', json={
+            'document_id': document_id, 'base_version': 0,
+            'edit': {'offset': 0, 'deleted': 0, 'inserted': '☃'}
+        })
+        assert response.status_code == 400
+        assert response.get_json()['unsupported_characters'] == ['☃']
+
+    def test_contracted_requires_contractions(self, client):
+        """Test que el modo contraído se rechaza en tablas sin contracciones."""
+        response = client.post('/api/convert/incremental', json={
+            'text': 'abc', 'table': 'computer8', 'contracted': True
+        })
+        assert response.status_code == 400
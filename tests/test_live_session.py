@@ -0,0 +1,274 @@
+"""
+Tests Unitarios - Conversión en Vivo
+====================================
+Casos de prueba para LiveSession (eventos de cambios de celdas y
+reanudación con Last-Event-ID) y las rutas /api/live: creación de
+sesiones, ediciones, stream server-sent events y una sola fila de
+historial al confirmar.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import pytest
+import sys
+import os
+import json
+import sqlite3
+
+# Añadir directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.models.braille_converter import get_converter
+from backend.models.incremental import EditError, VersionConflict
+from backend.models.live_session import LiveSession
+from backend.routes import live_routes
+
+
+@pytest.fixture
+def client(client, monkeypatch):
+    """Cliente de pruebas con keep-alive corto en los streams."""
+    monkeypatch.setattr(live_routes, 'KEEPALIVE_SECONDS', 0.05)
+    return client
+
+
+def parse_sse(chunk: str) -> list:
+    """Eventos (id, nombre, datos) de un fragmento SSE."""
+    events = []
+    for block in chunk.split('\n\n'):
+        fields = dict(line.split(': ', 1) for line in block.splitlines()
+                      if ': ' in line and not line.startswith(':'))
+        if 'event' in fields:
+            events.append((int(fields['id']), fields['event'], json.loads(fields['data'])))
+    return events
+
+
+def read_events(response, count: int) -> list:
+    """Lee del stream hasta recibir count eventos."""
+    events = []
+    for chunk in response.response:
+        events += parse_sse(chunk.decode('utf-8') if isinstance(chunk, bytes) else chunk)
+        if len(events) >= count:
+            break
+    return events
+
+
+def create_session(client, text: str = 'hola') -> dict:
+    """Crea una sesión y devuelve la respuesta."""
+    response = client.post('/api/live/sessions', json={'text': text})
+    assert response.status_code == 201
+    return response.get_json()
+
+
+class TestLiveSession:
+    """Tests de los eventos de una sesión."""
+
+    def test_edits_publish_diffs(self):
+        """Test que cada edición publica su cambio de celdas."""
+        session = LiveSession('hola', get_converter('es'))
+        session.apply_edits([{'offset': 4, 'deleted': 0, 'inserted': ' mundo'},
+                             {'offset': 0, 'deleted': 1, 'inserted': 'H'}], 0)
+        events, closed = session.wait_events(0, timeout=0)
+        assert [event.name for event in events] == ['diff', 'diff']
+        assert events[-1].data == {'version': 2, 'start': 0, 'deleted': 0, 'braille': '⠨'}
+        assert not closed
+
+    def test_wait_times_out_without_events(self):
+        """Test que la espera sin eventos devuelve una lista vacía."""
+        session = LiveSession('hola', get_converter('es'))
+        assert session.wait_events(0, timeout=0.01) == ([], False)
+
+    def test_lost_events_require_snapshot(self):
+        """Test que si los eventos ya no están en el registro se pide un snapshot."""
+        session = LiveSession('a', get_converter('es'))
+        for _ in range(300):
+            session.apply_edits([{'offset': 0, 'deleted': 0, 'inserted': 'a'}], session.version)
+        events, _ = session.wait_events(1, timeout=0)
+        assert events is None
+
+    def test_stale_base_version(self):
+        """Test que una versión base antigua se rechaza sin aplicar nada."""
+        session = LiveSession('hola', get_converter('es'))
+        with pytest.raises(VersionConflict):
+            session.apply_edits([{'offset': 0, 'deleted': 0, 'inserted': 'a'}], 5)
+        assert session.text == 'hola'
+
+    def test_invalid_edit_rejects_whole_batch(self):
+        """Test que si una edición de la serie es inválida no se aplica ninguna."""
+        session = LiveSession('hola', get_converter('es'))
+        with pytest.raises(EditError, match=r'edits\[1\]'):
+            session.apply_edits([{'offset': 4, 'deleted': 0, 'inserted': 's'},
+                                 {'offset': 9, 'deleted': 0, 'inserted': 'x'}], 0)
+        assert session.text == 'hola'
+        assert session.version == 0
+        assert session.wait_events(0, timeout=0) == ([], False)
+
+    def test_batch_validated_on_running_length(self):
+        """Test que cada edición se valida sobre el resultado de las anteriores."""
+        session = LiveSession('hola', get_converter('es'))
+        session.apply_edits([{'offset': 4, 'deleted': 0, 'inserted': ' mundo'},
+                             {'offset': 9, 'deleted': 1, 'inserted': 'o!'}], 0)
+        assert session.text == 'hola mundo!'
+
+    def test_commit_once_per_version(self):
+        """Test que confirmar sin cambios nuevos no devuelve nada."""
+        session = LiveSession('hola', get_converter('es'))
+        version, text, braille, _ = session.commit_snapshot()
+        assert (version, text, braille) == (0, 'hola', '⠓⠕⠇⠁')
+        assert session.commit_snapshot() is not None
+        assert session.mark_committed(version)
+        assert session.commit_snapshot() is None
+        events, _ = session.wait_events(0, timeout=0)
+        assert [event.name for event in events] == ['commit']
+
+    def test_commit_of_outdated_version_stays_pending(self):
+        """Test que si la sesión cambió durante el guardado no se marca confirmada."""
+        session = LiveSession('hola', get_converter('es'))
+        version = session.commit_snapshot()[0]
+        session.apply_edits([{'offset': 4, 'deleted': 0, 'inserted': 's'}], 0)
+        assert not session.mark_committed(version)
+        assert session.commit_snapshot()[1] == 'holas'
+
+    def test_closed_session_rejects_edits(self):
+        """Test que una sesión cerrada no admite ediciones."""
+        session = LiveSession('hola', get_converter('es'))
+        session.close()
+        with pytest.raises(EditError):
+            session.apply_edits([], 0)
+
+
+class TestLiveRoutes:
+    """Tests de las rutas /api/live."""
+
+    def test_stream_starts_with_snapshot_and_pushes_diffs(self, client):
+        """Test que el stream envía el estado y después los cambios."""
+        session_id = create_session(client)['session_id']
+        stream = client.get(f'/api/live/sessions/{session_id}/events', buffered=False)
+        assert stream.mimetype == 'text/event-stream'
+
+        snapshot = read_events(stream, 1)
+        assert snapshot[0][1:] == ('snapshot', {'version': 0, 'braille': '⠓⠕⠇⠁', 'cell_count': 4})
+
+        response = client.post(f'/api/live/sessions/{session_id}/edits', json={
+            'base_version': 0, 'edits': [{'offset': 4, 'deleted': 0, 'inserted': 's'}]
+        })
+        assert response.get_json()['version'] == 1
+        event = read_events(stream, 1)[0]
+        assert event[1:] == ('diff', {'version': 1, 'start': 4, 'deleted': 0, 'braille': '⠎'})
+        stream.close()
+
+    def test_resume_with_last_event_id(self, client):
+        """Test que al reconectar se reciben los eventos perdidos."""
+        session_id = create_session(client)['session_id']
+        for version in range(2):
+            client.post(f'/api/live/sessions/{session_id}/edits', json={
+                'base_version': version, 'edits': [{'offset': 0, 'deleted': 0, 'inserted': 'a'}]
+            })
+        stream = client.get(f'/api/live/sessions/{session_id}/events',
+                            headers={'Last-Event-ID': '1'}, buffered=False)
+        events = read_events(stream, 1)
+        assert [(seq, name) for seq, name, _ in events] == [(2, 'diff')]
+        stream.close()
+
+    def test_commit_writes_single_history_row(self, client, db):
+        """Test que la sesión produce una sola fila de historial."""
+        session_id = create_session(client, 'hola')['session_id']
+        for version, char in enumerate('abc'):
+            client.post(f'/api/live/sessions/{session_id}/edits', json={
+                'base_version': version, 'edits': [{'offset': 4 + version, 'deleted': 0, 'inserted': char}]
+            })
+        assert db.get_conversion_history() == []
+
+        first = client.post(f'/api/live/sessions/{session_id}/commit').get_json()
+        again = client.post(f'/api/live/sessions/{session_id}/commit').get_json()
+        assert first['id'] is not None and again['id'] is None
+
+        history = db.get_conversion_history()
+        assert len(history) == 1
+        assert history[0]['original_text'] == 'holaabc'
+
+    def test_failed_save_can_be_retried(self, client, db, monkeypatch):
+        """Test que si falla el guardado la sesión no queda confirmada."""
+        session_id = create_session(client, 'hola')['session_id']
+        stream = client.get(f'/api/live/sessions/{session_id}/events', buffered=False)
+        read_events(stream, 1)
+
+        save_conversion = db.save_conversion
+
+        def failing_save(**kwargs):
+            raise sqlite3.OperationalError('database is locked')
+
+        monkeypatch.setattr(db, 'save_conversion', failing_save)
+        assert client.post(f'/api/live/sessions/{session_id}/commit').status_code == 500
+
+        monkeypatch.setattr(db, 'save_conversion', save_conversion)
+        response = client.post(f'/api/live/sessions/{session_id}/commit').get_json()
+        assert response['id'] is not None
+        assert [row['original_text'] for row in db.get_conversion_history()] == ['hola']
+
+        # Los clientes solo reciben el 'commit' del guardado correcto
+        client.delete(f'/api/live/sessions/{session_id}')
+        names = [name for _, name, _ in read_events(stream, 2)]
+        assert names == ['commit', 'close']
+        stream.close()
+
+    def test_commit_and_close(self, client):
+        """Test que confirmar con close elimina la sesión."""
+        session_id = create_session(client)['session_id']
+        client.post(f'/api/live/sessions/{session_id}/commit', json={'close': True})
+        response = client.post(f'/api/live/sessions/{session_id}/edits', json={
+            'base_version': 0, 'edits': []
+        })
+        assert response.status_code == 404
+
+    def test_stale_edit_returns_409(self, client):
+        """Test que una edición sobre una versión antigua devuelve 409."""
+        session_id = create_session(client)['session_id']
+        response = client.post(f'/api/live/sessions/{session_id}/edits', json={
+            'base_version': 3, 'edits': [{'offset': 0, 'deleted': 0, 'inserted': 'a'}]
+        })
+        assert response.status_code == 409
+        assert response.get_json()['version'] == 0
+
+    def test_invalid_batch_returns_400_unchanged(self, client):
+        """Test que una serie con una edición inválida no cambia la sesión."""
+        session_id = create_session(client)['session_id']
+        response = client.post(f'/api/live/sessions/{session_id}/edits', json={
+            'base_version': 0, 'edits': [{'offset': 0, 'deleted': 0, 'inserted': 'a'}, 'x']
+        })
+        assert response.status_code == 400
+        assert response.get_json()['version'] == 0
+
+    @pytest.mark.parametrize('threads, requested, expected', [
+        ('4', None, 2), ('16', None, 8), ('1', None, 1), ('4', '8', 3), ('16', '3', 3)
+    ])
+    def test_stream_limit_leaves_threads(self, monkeypatch, threads, requested, expected):
+        """Test que los streams nunca ocupan todos los hilos del worker."""
+        monkeypatch.setenv('BRAILLE_THREADS', threads)
+        if requested is None:
+            monkeypatch.delenv('BRAILLE_LIVE_STREAMS', raising=False)
+        else:
+            monkeypatch.setenv('BRAILLE_LIVE_STREAMS', requested)
+        assert live_routes._stream_limit() == expected
+
+    def test_stream_limit(self, client, monkeypatch):
+        """Test que se rechazan los streams por encima del límite."""
+        monkeypatch.setattr(live_routes, 'stream_limiter',
+                            live_routes.ConcurrencyLimiter('live_stream', 1))
+        session_id = create_session(client)['session_id']
+        first = client.get(f'/api/live/sessions/{session_id}/events', buffered=False)
+        second = client.get(f'/api/live/sessions/{session_id}/events', buffered=False)
+        assert second.status_code == 503
+        first.close()
+        third = client.get(f'/api/live/sessions/{session_id}/events', buffered=False)
+        assert third.status_code == 200
+        third.close()
+
+    def test_delete_closes_stream(self, client):
+        """Test que cerrar la sesión termina el stream."""
+        session_id = create_session(client)['session_id']
+        stream = client.get(f'/api/live/sessions/{session_id}/events', buffered=False)
+        read_events(stream, 1)
+        assert client.delete(f'/api/live/sessions/{session_id}').status_code == 200
+        events = read_events(stream, 10)
+        assert events[-1][1] == 'close'
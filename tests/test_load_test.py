@@ -0,0 +1,65 @@
+"""
+Tests Unitarios - Prueba de Carga
+=================================
+Casos de prueba para el cálculo de la mezcla, percentiles y el
+resumen del harness de carga (tools/load_test.py).
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import pytest
+import sys
+import os
+
+# Añadir directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from tools.load_test import parse_mix, percentile, summarize
+
+
+class TestParseMix:
+    """Tests de la interpretación de la mezcla de endpoints."""
+
+    def test_weights(self):
+        """Test de pesos explícitos e implícitos."""
+        assert parse_mix('to-braille=3, history') == {'to-braille': 3.0, 'history': 1.0}
+
+    def test_unknown_endpoint(self):
+        """Test que un endpoint desconocido es rechazado."""
+        with pytest.raises(ValueError):
+            parse_mix('to-braille=1,inexistente=1')
+
+    def test_empty_mix(self):
+        """Test que una mezcla sin pesos positivos es rechazada."""
+        with pytest.raises(ValueError):
+            parse_mix('history=0')
+
+
+class TestSummary:
+    """Tests de percentiles y resumen."""
+
+    def test_percentile_nearest_rank(self):
+        """Test del percentil por rango más cercano."""
+        values = [float(i) for i in range(1, 101)]
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 95) == 95.0
+        assert percentile(values, 100) == 100.0
+        assert percentile([], 50) == 0.0
+
+    def test_summarize_errors(self):
+        """Test que el resumen cuenta errores y rechazos 503."""
+        results = [
+            ('to-braille', 0.010, 200, 100),
+            ('to-braille', 0.020, 503, 50),
+            ('history', 0.005, 0, 0),
+            ('history', 0.015, 200, 300),
+        ]
+        summary = summarize(results, elapsed=2.0)
+
+        assert summary['total']['requests'] == 4
+        assert summary['total']['throughput_rps'] == 2.0
+        assert summary['total']['error_rate'] == 0.5
+        assert summary['to-braille']['rejected_503'] == 1
+        assert summary['history']['bytes'] == 300
+        assert summary['to-braille']['max_ms'] == 20.0
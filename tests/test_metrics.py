@@ -0,0 +1,90 @@
+"""
+Tests Unitarios - Métricas
+===========================
+Casos de prueba para contadores, histogramas y la exposición en
+formato de texto de Prometheus.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import pytest
+import sys
+import os
+
+# Añadir directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.utils.metrics import MetricsRegistry, timed, span_duration
+
+
+@pytest.fixture
+def registry():
+    """Fixture que proporciona un registro de métricas vacío."""
+    return MetricsRegistry()
+
+
+class TestMetrics:
+    """Tests del registro de métricas."""
+
+    def test_counter_with_labels(self, registry):
+        """Test contador con etiquetas."""
+        counter = registry.counter('test_total', 'Ayuda', ('kind',))
+        counter.inc(kind='a')
+        counter.inc(3, kind='a')
+        counter.inc(kind='b')
+
+        assert counter.get(kind='a') == 4
+        assert 'test_total{kind="a"} 4' in registry.render()
+
+    def test_histogram_buckets_are_cumulative(self, registry):
+        """Test que los buckets del histograma son acumulativos."""
+        histogram = registry.histogram('test_seconds', 'Ayuda', buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        histogram.observe(5)
+
+        output = registry.render()
+        assert 'test_seconds_bucket{le="0.1"} 1' in output
+        assert 'test_seconds_bucket{le="1.0"} 2' in output
+        assert 'test_seconds_bucket{le="+Inf"} 3' in output
+        assert 'test_seconds_count 3' in output
+
+    def test_render_has_help_and_type(self, registry):
+        """Test que la exposición incluye # HELP y # TYPE."""
+        registry.counter('test_total', 'Ayuda del contador')
+        output = registry.render()
+
+        assert '# HELP test_total Ayuda del contador' in output
+        assert '# TYPE test_total counter' in output
+
+    def test_label_escaping(self, registry):
+        """Test escape de comillas en etiquetas."""
+        counter = registry.counter('test_total', 'Ayuda', ('path',))
+        counter.inc(path='a"b')
+        assert 'path="a\\"b"' in registry.render()
+
+
+class TestTimedSpan:
+    """Tests del decorador/gestor de contexto timed."""
+
+    def test_decorator_records_span(self):
+        """Test que el decorador registra una observación."""
+        before = span_duration.get_count(span='test.decorated')
+
+        @timed('test.decorated')
+        def work():
+            return 42
+
+        assert work() == 42
+        assert span_duration.get_count(span='test.decorated') == before + 1
+
+    def test_context_manager_records_on_error(self):
+        """Test que se registra la duración aunque haya excepción."""
+        before = span_duration.get_count(span='test.context')
+
+        with pytest.raises(ValueError):
+            with timed('test.context'):
+                raise ValueError()
+
+        assert span_duration.get_count(span='test.context') == before + 1
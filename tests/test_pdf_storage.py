@@ -0,0 +1,124 @@
+"""
+Tests Unitarios - Almacenamiento de PDFs
+========================================
+Casos de prueba para los nombres únicos, la escritura atómica y el
+registro del almacenamiento en la base de datos.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import pytest
+import sys
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+# Añadir directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.database.db_manager import DatabaseManager
+from backend.utils.pdf_generator import BrailleSignagePDFGenerator
+from backend.utils.pdf_storage import LocalPDFStorage, PDFStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Almacenamiento local en un directorio temporal."""
+    return LocalPDFStorage(str(tmp_path))
+
+
+class TestLocalPDFStorage:
+    """Tests del almacenamiento local."""
+
+    def test_keys_unique_within_same_second(self, storage):
+        """Test que dos claves del mismo segundo son distintas."""
+        now = datetime(2025, 11, 3, 10, 30, 0)
+        first = storage.new_key('ascensor', now)
+        second = storage.new_key('ascensor', now)
+        assert first != second
+        assert first.startswith('2025/11/03/ascensor_20251103_103000_')
+
+    def test_save_is_atomic(self, storage, tmp_path):
+        """Test que se guarda el contenido sin dejar temporales."""
+        stored = storage.save('2025/11/03/a.pdf', b'%PDF-1.4 prueba')
+        assert stored.size == 15
+        assert storage.exists('2025/11/03/a.pdf')
+        with open(stored.path, 'rb') as f:
+            assert f.read() == b'%PDF-1.4 prueba'
+        assert os.listdir(tmp_path / '2025' / '11' / '03') == ['a.pdf']
+
+    def test_rejects_keys_outside_root(self, storage):
+        """Test que una clave no puede salir del directorio raíz."""
+        with pytest.raises(ValueError):
+            storage.path('../fuera.pdf')
+
+    def test_interface_is_abstract(self):
+        """Test que la interfaz no se instancia sin implementar sus métodos."""
+        with pytest.raises(TypeError):
+            PDFStorage()
+
+        class Incomplete(PDFStorage):
+            def save(self, key, data):
+                return None
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+
+class TestConcurrentGeneration:
+    """Tests de generación simultánea."""
+
+    def test_concurrent_pdfs_do_not_collide(self, tmp_path):
+        """Test que PDFs simultáneos acaban en archivos distintos."""
+        generator = BrailleSignagePDFGenerator(str(tmp_path))
+
+        def generate(n):
+            return generator.generate(f'Piso {n}', [{'text': 'Piso', 'number': str(n)}])
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(generate, range(16)))
+
+        assert len({stored.key for stored in results}) == 16
+        for stored in results:
+            assert os.path.getsize(stored.path) == stored.size
+
+
+class TestStorageRecords:
+    """Tests del registro en base de datos."""
+
+    def test_save_records_storage(self, tmp_path):
+        """Test que se guarda el backend y la clave del PDF."""
+        db = DatabaseManager(str(tmp_path / 'braille.db'))
+        generator = BrailleSignagePDFGenerator(str(tmp_path / 'output'))
+        stored = generator.generate('Ascensor', [{'text': 'Piso', 'number': '1'}])
+
+        db.save_pdf_generation('Ascensor', stored.path, 'elevator', stored=stored)
+        record = db.get_pdf_history()[0]
+        assert record['storage_backend'] == 'local'
+        assert record['storage_key'] == stored.key
+        assert record['file_size'] == stored.size
+        db.close()
+
+    def test_migrates_existing_database(self, tmp_path):
+        """Test que una base de datos anterior recibe las columnas nuevas."""
+        path = str(tmp_path / 'antigua.db')
+        conn = sqlite3.connect(path)
+        conn.execute('''
+            CREATE TABLE pdf_generations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                file_path TEXT NOT NULL,
+                format_type TEXT,
+                file_size INTEGER,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        conn.commit()
+        conn.close()
+
+        db = DatabaseManager(path)
+        db.save_pdf_generation('Antiguo', '/no/existe.pdf', 'door')
+        assert db.get_pdf_history()[0]['storage_key'] is None
+        db.close()
@@ -0,0 +1,85 @@
+"""
+Tests Unitarios - Perfilado
+============================
+Casos de prueba para el modo de perfilado opcional con cProfile.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import pytest
+import sys
+import os
+
+# Añadir directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.utils import profiling
+from backend.utils.profiling import ProfilingManager, profiled
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """Fixture que sustituye el gestor global por uno en modo 'all'."""
+    manager = ProfilingManager(mode='all', output_dir=str(tmp_path), max_files=2)
+    monkeypatch.setattr(profiling, 'profiler', manager)
+    return manager
+
+
+class TestProfiling:
+    """Tests del gestor de perfilado."""
+
+    def test_invalid_mode(self):
+        """Test modo de perfilado no soportado."""
+        with pytest.raises(ValueError):
+            ProfilingManager(mode='siempre')
+
+    def test_header_mode(self):
+        """Test que en modo 'header' solo se perfila con la cabecera."""
+        manager = ProfilingManager(mode='header')
+        assert manager.should_profile_request({'X-Braille-Profile': '1'})
+        assert not manager.should_profile_request({})
+        assert not ProfilingManager(mode='off').should_profile_request({'X-Braille-Profile': '1'})
+
+    def test_profiled_function_writes_profile(self, manager, tmp_path):
+        """Test que una función marcada genera un .prof y entra en el resumen."""
+        @profiled('test.work')
+        def work():
+            return sum(range(1000))
+
+        assert work() == sum(range(1000))
+
+        files = os.listdir(tmp_path)
+        assert len(files) == 1 and files[0].endswith('.prof')
+        summary = manager.summary(limit=50)
+        assert summary['profiles'] == 1
+        assert any(f['function'] == 'work' for f in summary['functions'])
+
+    def test_nested_calls_profiled_once(self, manager, tmp_path):
+        """Test que las llamadas anidadas no abren un segundo perfil."""
+        @profiled('test.inner')
+        def inner():
+            return 1
+
+        @profiled('test.outer')
+        def outer():
+            return inner() + inner()
+
+        assert outer() == 2
+        assert manager.summary()['profiles'] == 1
+
+    def test_old_profiles_pruned(self, manager, tmp_path):
+        """Test que solo se conservan max_files perfiles."""
+        @profiled('test.work')
+        def work():
+            return 1
+
+        for _ in range(4):
+            work()
+
+        assert len(os.listdir(tmp_path)) == 2
+
+    def test_invalid_sort(self, manager):
+        """Test criterio de orden no soportado."""
+        with pytest.raises(ValueError):
+            manager.summary(sort='nombre')
@@ -0,0 +1,75 @@
+"""
+Tests de Arranque - Sistema Braille
+===================================
+Comprueba que importar la aplicación es barato: sin ReportLab ni
+Pillow, sin tocar el disco y dentro de un presupuesto de tiempo.
+
+Cada comprobación se ejecuta en un proceso nuevo para que los módulos
+ya cargados por otras pruebas no alteren el resultado.
+
+Variables de entorno:
+    BRAILLE_IMPORT_BUDGET   Segundos máximos para importar el backend
+                            una vez cargado Flask (default: 1.0)
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+IMPORT_BUDGET = float(os.environ.get('BRAILLE_IMPORT_BUDGET', '1.0'))
+
+# Importa Flask primero para medir solo el coste propio del backend
+STARTUP_SCRIPT = '''
+import json, sys, time
+import flask, flask_cors
+start = time.perf_counter()
+import run
+elapsed = time.perf_counter() - start
+app = run.create_app()
+print(json.dumps({
+    'elapsed': elapsed,
+    'loaded': sorted(m for m in ('reportlab', 'PIL') if m in sys.modules)
+}))
+'''
+
+
+@pytest.fixture(scope='module')
+def startup(tmp_path_factory):
+    """Importa run y crea la aplicación en un proceso nuevo."""
+    tmp = tmp_path_factory.mktemp('startup')
+    env = dict(os.environ)
+    env['BRAILLE_DB_PATH'] = str(tmp / 'db' / 'braille.db')
+    env['BRAILLE_OUTPUT_DIR'] = str(tmp / 'output')
+
+    completed = subprocess.run(
+        [sys.executable, '-c', STARTUP_SCRIPT],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result['tmp'] = tmp
+    return result
+
+
+class TestColdStart:
+    """Tests del coste de importación."""
+
+    def test_heavy_libraries_not_loaded(self, startup):
+        """Test que ReportLab y Pillow se cargan en el primer uso."""
+        assert startup['loaded'] == []
+
+    def test_no_disk_side_effects(self, startup):
+        """Test que ni la base de datos ni el directorio de salida se crean."""
+        assert not (startup['tmp'] / 'db').exists()
+        assert not (startup['tmp'] / 'output').exists()
+
+    def test_import_budget(self, startup):
+        """Test que importar el backend cabe en el presupuesto."""
+        assert startup['elapsed'] < IMPORT_BUDGET
@@ -0,0 +1,194 @@
+"""
+Tests Unitarios - Series Temporales
+===================================
+Casos de prueba para los agregados por minuto y por hora y el endpoint
+/api/stats/timeseries.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import pytest
+import sys
+import os
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+# Añadir directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.database.db_manager import DatabaseManager
+
+
+def last_day():
+    """Rango (inicio, fin) que cubre las últimas 24 horas."""
+    end = datetime.now(timezone.utc) + timedelta(minutes=1)
+    return end - timedelta(days=1), end
+
+
+class TestRollups:
+    """Tests de los agregados en la escritura."""
+
+    def test_conversions_are_aggregated(self, db):
+        """Test que las conversiones se agregan por tipo."""
+        db.save_conversion('hola', '⠓⠕⠇⠁', 'text_to_braille', latency_ms=2.0)
+        db.save_conversion('piso', '⠏⠊⠎⠕', 'text_to_braille', latency_ms=4.0)
+        db.save_conversion('uno', '⠥⠝⠕', 'braille_to_text')
+
+        series = db.get_timeseries(*last_day(), bucket='minute')
+        totals = {}
+        for point in series['conversions']:
+            for conversion_type, values in point['by_type'].items():
+                totals.setdefault(conversion_type, []).append(values)
+
+        text_to_braille = totals['text_to_braille']
+        assert sum(v['conversions'] for v in text_to_braille) == 2
+        assert sum(v['characters'] for v in text_to_braille) == 8
+        assert max(v['latency_max_ms'] for v in text_to_braille) == 4.0
+        assert totals['braille_to_text'][0]['latency_avg_ms'] is None
+
+    def test_pdfs_are_aggregated(self, db):
+        """Test que los PDFs se agregan por formato y tamaño."""
+        db.save_pdf_generation('Ascensor', '/no/existe.pdf', 'elevator')
+        db.save_pdf_generation('Puerta', '/no/existe.pdf', 'door')
+
+        series = db.get_timeseries(*last_day(), bucket='hour')
+        assert sum(point['pdfs'] for point in series['pdfs']) == 2
+        formats = set()
+        for point in series['pdfs']:
+            formats.update(point['by_format'])
+        assert formats == {'elevator', 'door'}
+
+    def test_reads_only_rollups(self, db):
+        """Test que la serie no depende de las tablas crudas."""
+        db.save_conversion('hola', '⠓⠕⠇⠁', 'text_to_braille')
+        with db.connection() as conn:
+            conn.execute('DELETE FROM conversions')
+
+        series = db.get_timeseries(*last_day())
+        assert series['conversions'][0]['conversions'] == 1
+
+    def test_range_excludes_other_buckets(self, db):
+        """Test que el rango filtra por inicio de intervalo."""
+        db.save_conversion('hola', '⠓⠕⠇⠁', 'text_to_braille')
+        past = datetime.now(timezone.utc) - timedelta(days=2)
+        series = db.get_timeseries(past, past + timedelta(hours=1))
+        assert series['conversions'] == []
+
+    def test_minute_rollups_expire(self, db):
+        """Test que la limpieza elimina los agregados por minuto caducados."""
+        db.save_conversion('hola', '⠓⠕⠇⠁', 'text_to_braille')
+        with db.connection() as conn:
+            conn.execute("UPDATE conversion_rollups SET bucket_start = '2020-01-01 10:31:00' "
+                         "WHERE bucket = 'minute'")
+            conn.execute("UPDATE conversion_rollups SET bucket_start = '2020-01-01 10:00:00' "
+                         "WHERE bucket = 'hour'")
+
+        assert db.delete_old_records()['rollups_deleted'] == 1
+        old = (datetime(2020, 1, 1, 10), datetime(2020, 1, 1, 11))
+        assert db.get_timeseries(*old, bucket='minute')['conversions'] == []
+        assert db.get_timeseries(*old, bucket='hour')['conversions'][0]['conversions'] == 1
+
+    def test_writes_prune_expired_rollups(self, db):
+        """Test que las escrituras eliminan solas los agregados por minuto caducados."""
+        with db.connection() as conn:
+            conn.executemany('''
+                INSERT INTO conversion_rollups (bucket, bucket_start, conversion_type, conversions)
+                VALUES (?, ?, 'text_to_braille', 1)
+            ''', [('minute', '2020-01-01 10:31:00'), ('hour', '2020-01-01 10:00:00')])
+
+        db.save_conversion('hola', '⠓⠕⠇⠁', 'text_to_braille')
+
+        old = (datetime(2020, 1, 1, 10), datetime(2020, 1, 1, 11))
+        assert db.get_timeseries(*old, bucket='minute')['conversions'] == []
+        assert db.get_timeseries(*old, bucket='hour')['conversions'][0]['conversions'] == 1
+
+    def test_pruning_is_throttled(self, db, monkeypatch):
+        """Test que la limpieza se hace como mucho una vez por intervalo."""
+        db.save_conversion('hola', '⠓⠕⠇⠁', 'text_to_braille')
+        with db.connection() as conn:
+            conn.execute('''
+                INSERT INTO pdf_rollups (bucket, bucket_start, format_type, pdfs, bytes)
+                VALUES ('minute', '2020-01-01 10:31:00', 'door', 1, 10)
+            ''')
+        old = (datetime(2020, 1, 1, 10), datetime(2020, 1, 1, 11))
+
+        db.save_conversion('adiós', '⠁⠙⠊⠬⠎', 'text_to_braille')
+        assert db.get_timeseries(*old, bucket='minute')['pdfs']
+
+        monkeypatch.setattr(db, '_next_prune', datetime.now(timezone.utc) - timedelta(seconds=1))
+        db.save_conversion('adiós', '⠁⠙⠊⠬⠎', 'text_to_braille')
+        assert db.get_timeseries(*old, bucket='minute')['pdfs'] == []
+
+    def test_recent_minute_rollups_kept(self, db):
+        """Test que los agregados por minuto recientes se conservan."""
+        db.save_conversion('hola', '⠓⠕⠇⠁', 'text_to_braille')
+        assert db.delete_old_records()['rollups_deleted'] == 0
+        assert db.get_timeseries(*last_day(), bucket='minute')['conversions']
+
+    def test_invalid_bucket(self, db):
+        """Test que una granularidad desconocida es un error."""
+        with pytest.raises(ValueError):
+            db.get_timeseries(*last_day(), bucket='day')
+
+    def test_backfills_existing_database(self, tmp_path):
+        """Test que una base de datos anterior agrega sus registros."""
+        path = str(tmp_path / 'antigua.db')
+        conn = sqlite3.connect(path)
+        conn.execute('''
+            CREATE TABLE conversions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                original_text TEXT NOT NULL,
+                braille_text TEXT NOT NULL,
+                conversion_type TEXT NOT NULL,
+                character_count INTEGER,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        conn.execute('''
+            INSERT INTO conversions (original_text, braille_text, conversion_type,
+                                     character_count, created_at)
+            VALUES ('hola', '⠓⠕⠇⠁', 'text_to_braille', 4, '2025-11-03 10:31:12')
+        ''')
+        conn.commit()
+        conn.close()
+
+        db = DatabaseManager(path)
+        series = db.get_timeseries(datetime(2025, 11, 3, 10), datetime(2025, 11, 3, 11),
+                                   bucket='minute')
+        assert series['conversions'][0]['bucket_start'] == '2025-11-03 10:31:00'
+        assert series['conversions'][0]['characters'] == 4
+        db.close()
+
+
+class TestTimeseriesEndpoint:
+    """Tests del endpoint /api/stats/timeseries."""
+
+    def test_conversion_latency_recorded(self, client):
+        """Test que las conversiones por API registran su latencia."""
+        client.post('/api/convert/to-braille', json={'text': 'Piso 1'})
+        response = client.get('/api/stats/timeseries?bucket=minute')
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data['conversions'][0]['conversions'] == 1
+        assert data['conversions'][0]['latency_avg_ms'] is not None
+
+    def test_explicit_range(self, client):
+        """Test que se aceptan from y to en ISO 8601."""
+        response = client.get('/api/stats/timeseries'
+                              '?from=2025-11-01T00:00:00&to=2025-11-02T00:00:00Z')
+        data = response.get_json()
+        assert response.status_code == 200
+        assert data['from'] == '2025-11-01T00:00:00+00:00'
+        assert data['conversions'] == []
+
+    @pytest.mark.parametrize('query', [
+        'bucket=day',
+        'from=ayer',
+        'from=2025-11-02T00:00:00&to=2025-11-01T00:00:00',
+        'bucket=minute&from=2025-01-01T00:00:00&to=2025-11-01T00:00:00',
+    ])
+    def test_invalid_parameters(self, client, query):
+        """Test que los parámetros inválidos devuelven 400."""
+        response = client.get(f'/api/stats/timeseries?{query}')
+        assert response.status_code == 400
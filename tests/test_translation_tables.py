@@ -0,0 +1,177 @@
+"""
+Tests Unitarios - Tablas de Traducción
+======================================
+Casos de prueba para la carga, validación, compilación y caché de las
+tablas de traducción, y su selección por petición.
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import pytest
+import sys
+import os
+import json
+import threading
+
+# Añadir directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.models import braille_converter as converter_module
+from backend.models import translation_tables
+from backend.models.braille_converter import braille_converter, get_converter
+from backend.models.translation_tables import (
+    TableError, get_table, load_table_file, validate_table
+)
+from run import create_app
+
+
+def minimal_table(**overrides) -> dict:
+    """Tabla de prueba con dos letras y los dígitos."""
+    data = {
+        'name': 'prueba',
+        'dots': 6,
+        'capital_sign': [4, 6],
+        'number_sign': [3, 4, 5, 6],
+        'groups': [
+            {'type': 'Letra', 'kind': 'letter', 'cells': {'a': [1], 'b': [1, 2]}},
+            {'type': 'Puntuación', 'kind': 'punctuation', 'cells': {' ': [], '.': [3]}},
+        ],
+        'numbers': {'cells': {str(d): [1] for d in range(10)}},
+    }
+    data.update(overrides)
+    return data
+
+
+@pytest.fixture
+def tables_dir(tmp_path, monkeypatch):
+    """Directorio de tablas adicional con la tabla 'prueba'."""
+    (tmp_path / 'prueba.json').write_text(json.dumps(minimal_table()), encoding='utf-8')
+    monkeypatch.setenv('BRAILLE_TABLES_PATH', str(tmp_path))
+    monkeypatch.setattr(translation_tables, '_tables', {})
+    monkeypatch.setattr(converter_module, '_converters',
+                        {translation_tables.DEFAULT_TABLE: braille_converter})
+    return tmp_path
+
+
+class TestValidation:
+    """Tests de la validación de tablas."""
+
+    def test_valid_table(self):
+        """Test que una tabla correcta se normaliza."""
+        data = validate_table(minimal_table())
+        assert data['groups'][0][2] == (('a', (1,)), ('b', (1, 2)))
+
+    @pytest.mark.parametrize('overrides, message', [
+        ({'dots': 7}, "'dots'"),
+        ({'capital_sign': [7]}, 'capital_sign'),
+        ({'numbers': {'cells': {'1': [1]}}}, 'dígitos'),
+        ({'groups': [{'kind': 'letter', 'cells': {'A': [1]}}]}, 'minúscula'),
+        ({'groups': [{'kind': 'otro', 'cells': {'a': [1]}}]}, 'kind'),
+        ({'groups': {'kind': 'letter'}}, "'groups' debe ser una lista"),
+        ({'groups': [{'kind': 'letter', 'cells': {'a': [1]}}, 'a']}, r'groups\[1\]'),
+        ({'contractions': {'text': 'de'}}, "'contractions' debe ser una lista"),
+        ({'contractions': [5]}, r'contractions\[0\]'),
+        ({'contractions': [{'kind': 'word', 'text': 'de', 'cells': 5}]}, r'contractions\[0\]'),
+    ])
+    def test_invalid_table(self, overrides, message):
+        """Test que los errores indican el campo inválido."""
+        with pytest.raises(TableError, match=message):
+            validate_table(minimal_table(**overrides))
+
+    def test_missing_field(self):
+        """Test que faltan campos obligatorios."""
+        data = minimal_table()
+        del data['groups']
+        with pytest.raises(TableError, match='groups'):
+            validate_table(data)
+
+
+class TestCompiledCache:
+    """Tests de la caché compilada."""
+
+    def test_cache_written_and_invalidated(self, tables_dir, monkeypatch):
+        """Test que la caché se reutiliza y se invalida al cambiar el archivo."""
+        monkeypatch.setattr(sys, 'dont_write_bytecode', False)
+        path = str(tables_dir / 'prueba.json')
+        cache_dir = tables_dir / '__pycache__'
+
+        first = load_table_file(path)
+        cached = os.listdir(cache_dir)
+        assert len(cached) == 1 and first.hash in cached[0]
+        assert load_table_file(path).alphabet == first.alphabet
+
+        (tables_dir / 'prueba.json').write_text(
+            json.dumps(minimal_table(description='cambiada')), encoding='utf-8')
+        second = load_table_file(path)
+        assert second.hash != first.hash
+        assert second.description == 'cambiada'
+        assert os.listdir(cache_dir) == [f for f in os.listdir(cache_dir) if second.hash in f]
+
+    def test_no_cache_when_bytecode_disabled(self, tables_dir, monkeypatch):
+        """Test que no se escribe la caché con dont_write_bytecode."""
+        monkeypatch.setattr(sys, 'dont_write_bytecode', True)
+        load_table_file(str(tables_dir / 'prueba.json'))
+        assert not (tables_dir / '__pycache__').exists()
+
+
+class TestTableSelection:
+    """Tests de la selección de tablas."""
+
+    def test_default_table_is_spanish(self):
+        """Test que el conversor global usa la tabla española."""
+        assert braille_converter.table is get_table('es')
+        assert braille_converter.text_to_braille('Hola') == '⠨⠓⠕⠇⠁'
+
+    def test_converters_shared_between_threads(self, tables_dir):
+        """Test que cada tabla se compila una vez y se comparte."""
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(get_converter('prueba')))
+                   for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len({id(c) for c in results}) == 1
+        assert results[0].text_to_braille('ab') == '⠁⠃'
+
+    def test_unknown_table(self):
+        """Test que una tabla inexistente es un error."""
+        with pytest.raises(TableError):
+            get_table('no-existe')
+        with pytest.raises(TableError):
+            get_table('../es')
+
+    @pytest.mark.parametrize('name', [5, ['es'], {'es': 1}])
+    def test_non_string_table_name(self, name):
+        """Test que un nombre de tabla que no es texto es un TableError."""
+        with pytest.raises(TableError):
+            get_table(name)
+        with pytest.raises(TableError):
+            get_converter(name)
+
+    def test_contracted_requires_contractions(self, tables_dir):
+        """Test que el modo contraído requiere reglas en la tabla."""
+        with pytest.raises(ValueError):
+            get_converter('prueba').text_to_braille('ab', contracted=True)
+
+    def test_table_per_request(self, tables_dir, tmp_path):
+        """Test que la tabla se elige en cada petición."""
+        from backend.app_context import AppContext
+        from backend.database.db_manager import DatabaseManager
+        context = AppContext(db_manager=DatabaseManager(str(tmp_path / 'braille.db')))
+        client = create_app(context).test_client()
+
+        response = client.post('/api/convert/to-braille', json={'text': 'ab', 'table': 'prueba'})
+        assert response.get_json()['braille'] == '⠁⠃'
+
+        response = client.post('/api/validate', json={'text': 'c', 'table': 'prueba'})
+        assert response.get_json()['is_valid'] is False
+
+        response = client.post('/api/convert/to-braille', json={'text': 'ab', 'table': 'xx'})
+        assert response.status_code == 400
+        assert 'prueba' in response.get_json()['available_tables']
+
+        response = client.post('/api/convert/to-braille', json={'text': 'hola', 'table': 5})
+        assert response.status_code == 400
+        context.shutdown()
@@ -0,0 +1,4 @@
+"""
+Herramientas de desarrollo
+Scripts de soporte (pruebas de carga, mediciones) que no forman parte del servidor
+"""
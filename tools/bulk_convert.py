@@ -0,0 +1,319 @@
+"""
+Conversión Masiva sin Conexión - Sistema Braille
+================================================
+Convierte árboles de directorios de archivos de texto sin pasar por la
+API HTTP:
+
+    to-braille   Texto español -> Braille Unicode   (.braille.txt)
+    to-brf       Texto español -> BRF (ASCII Braille, páginas de 40x25)
+    to-text      Braille Unicode o BRF -> texto español (.txt)
+
+- Los archivos se reparten entre un pool de procesos.
+- Cada archivo se lee línea a línea (con mmap si es grande) y la salida
+  se escribe en streaming en un temporal que se renombra al terminar.
+- Un manifiesto (JSON por línea) registra cada archivo completado con su
+  tamaño y fecha; al relanzar se saltan los que no han cambiado.
+- Al final se muestra un resumen de rendimiento.
+- --table elige la tabla de traducción (p. ej. computer8). BRF solo
+  admite celdas de 6 puntos: los archivos con celdas de 8 puntos fallan
+  en el modo to-brf.
+
+Ejecutar con:
+    python -m tools.bulk_convert entrada/ salida/
+    python -m tools.bulk_convert entrada/ salida/ --mode to-brf --workers 8
+    python -m tools.bulk_convert salida/ texto/ --mode to-text --pattern "*.brf"
+    python -m tools.bulk_convert etiquetas/ salida/ --table computer8
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import argparse
+import fnmatch
+import json
+import mmap
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional
+
+# Añadir directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+MODES = ('to-braille', 'to-brf', 'to-text')
+
+# Extensión de salida de cada modo
+OUTPUT_SUFFIX = {
+    'to-braille': '.braille.txt',
+    'to-brf': '.brf',
+    'to-text': '.txt',
+}
+
+# Patrón de entrada por defecto de cada modo
+DEFAULT_PATTERN = {
+    'to-braille': '*.txt',
+    'to-brf': '*.txt',
+    'to-text': '*.braille.txt',
+}
+
+MANIFEST_NAME = '.bulk_manifest.jsonl'
+
+# Archivos a partir de este tamaño se leen con mmap
+MMAP_THRESHOLD = 1024 * 1024
+
+
+def iter_lines(path: str) -> Iterator[bytes]:
+    """
+    Lee las líneas de un archivo (con su salto de línea).
+
+    Los archivos grandes se recorren con mmap, sin cargarlos en memoria.
+    """
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        if size < MMAP_THRESHOLD:
+            yield from f
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from iter(mm.readline, b'')
+
+
+def _split_newline(line: str):
+    """Separa el salto de línea final: (contenido, salto)."""
+    if line.endswith('\r\n'):
+        return line[:-2], '\r\n'
+    if line.endswith('\n'):
+        return line[:-1], '\n'
+    return line, ''
+
+
+def convert_file(source: str, target: str, mode: str, table: Optional[str] = None) -> Dict:
+    """
+    Convierte un archivo (se ejecuta en un proceso del pool).
+
+    Args:
+        source: Archivo de entrada (UTF-8, o ASCII Braille si es .brf)
+        target: Archivo de salida (se escribe de forma atómica)
+        mode: Modo de conversión (ver MODES)
+        table: Tabla de traducción (default: la tabla por defecto)
+
+    Returns:
+        Diccionario con bytes leídos, caracteres convertidos y segundos
+
+    Raises:
+        ValueError: En modo to-brf, si el texto produce celdas de 8 puntos
+    """
+    from backend.models.braille_converter import get_converter
+    from backend.utils.brf import BRFPaginator, brf_to_unicode, unicode_to_brf
+
+    braille_converter = get_converter(table)
+
+    started = time.perf_counter()
+    characters = 0
+    paginator = BRFPaginator() if mode == 'to-brf' else None
+    brf_input = mode == 'to-text' and source.lower().endswith('.brf')
+
+    directory = os.path.dirname(target)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as out:
+            for number, raw in enumerate(iter_lines(source)):
+                line = raw.decode('utf-8-sig' if number == 0 else 'utf-8')
+                content, newline = _split_newline(line)
+                characters += len(content)
+
+                if mode == 'to-text':
+                    if brf_input:
+                        # Los saltos de página de BRF se tratan como líneas
+                        content = brf_to_unicode(content.replace('\f', ''))
+                    out.write(braille_converter.braille_to_text(content) + newline)
+                    continue
+
+                braille = braille_converter.text_to_braille(content)
+                if paginator is None:
+                    out.write(braille + newline)
+                else:
+                    out.writelines(paginator.feed([unicode_to_brf(braille, strict=True)]))
+        os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    return {
+        'bytes': os.path.getsize(source),
+        'characters': characters,
+        'seconds': time.perf_counter() - started,
+    }
+
+
+def find_files(input_dir: str, pattern: str) -> List[str]:
+    """Rutas relativas (ordenadas) de los archivos que cumplen el patrón."""
+    found = []
+    for root, dirs, files in os.walk(input_dir):
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+        for name in files:
+            if fnmatch.fnmatch(name, pattern) and not name.startswith('.'):
+                found.append(os.path.relpath(os.path.join(root, name), input_dir))
+    return sorted(found)
+
+
+def output_path(output_dir: str, relative: str, mode: str) -> str:
+    """Ruta de salida de un archivo (mismo árbol, extensión del modo)."""
+    base = relative
+    for suffix in ('.braille.txt', '.brf', '.txt'):
+        if base.lower().endswith(suffix):
+            base = base[:-len(suffix)]
+            break
+    return os.path.join(output_dir, base + OUTPUT_SUFFIX[mode])
+
+
+def load_manifest(path: str) -> Dict[str, Dict]:
+    """Entradas completadas del manifiesto (la última por archivo)."""
+    entries = {}
+    if not os.path.exists(path):
+        return entries
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+                entries[entry['file']] = entry
+            except (ValueError, KeyError):
+                # Línea incompleta de una ejecución interrumpida
+                continue
+    return entries
+
+
+def _signature(path: str) -> Dict:
+    """Tamaño y fecha de modificación de un archivo."""
+    stat = os.stat(path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def run(input_dir: str, output_dir: str, mode: str = 'to-braille',
+        workers: Optional[int] = None, pattern: Optional[str] = None,
+        resume: bool = True, manifest_path: Optional[str] = None,
+        table: Optional[str] = None) -> Dict:
+    """
+    Convierte todos los archivos de un directorio.
+
+    Args:
+        input_dir: Directorio de entrada (se recorre recursivamente)
+        output_dir: Directorio de salida (mismo árbol)
+        mode: Modo de conversión (ver MODES)
+        workers: Procesos del pool (default: número de CPUs)
+        pattern: Patrón de nombres de entrada (default: según el modo)
+        resume: Saltar archivos ya convertidos según el manifiesto
+        manifest_path: Manifiesto (default: <salida>/.bulk_manifest.jsonl)
+        table: Tabla de traducción (default: la tabla por defecto)
+
+    Returns:
+        Resumen de la ejecución
+    """
+    if mode not in MODES:
+        raise ValueError(f"Modo inválido: {mode}")
+    pattern = pattern or DEFAULT_PATTERN[mode]
+    manifest_path = manifest_path or os.path.join(output_dir, MANIFEST_NAME)
+    os.makedirs(output_dir, exist_ok=True)
+
+    done = load_manifest(manifest_path) if resume else {}
+    pending, skipped = [], 0
+    for relative in find_files(input_dir, pattern):
+        source = os.path.join(input_dir, relative)
+        target = output_path(output_dir, relative, mode)
+        if os.path.abspath(source) == os.path.abspath(target):
+            raise ValueError(f"La salida sobrescribiría la entrada: {source}")
+        signature = _signature(source)
+        entry = done.get(relative)
+        if (entry and entry.get('mode') == mode and entry.get('table') == table
+                and entry.get('size') == signature['size']
+                and entry.get('mtime_ns') == signature['mtime_ns'] and os.path.exists(target)):
+            skipped += 1
+            continue
+        pending.append((relative, source, target, signature))
+
+    summary = {'mode': mode, 'files': 0, 'skipped': skipped, 'failed': [],
+               'bytes': 0, 'characters': 0, 'seconds': 0.0}
+    started = time.perf_counter()
+
+    with open(manifest_path, 'a', encoding='utf-8') as manifest, \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(convert_file, source, target, mode, table): (relative, signature)
+                   for relative, source, target, signature in pending}
+        for future in as_completed(futures):
+            relative, signature = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                summary['failed'].append({'file': relative, 'error': str(e)})
+                continue
+            summary['files'] += 1
+            summary['bytes'] += result['bytes']
+            summary['characters'] += result['characters']
+            manifest.write(json.dumps({'file': relative, 'mode': mode, 'table': table, **signature,
+                                       'characters': result['characters']},
+                                      ensure_ascii=False) + '\n')
+            manifest.flush()
+
+    elapsed = time.perf_counter() - started
+    summary['seconds'] = round(elapsed, 3)
+    summary['mb_per_second'] = round(summary['bytes'] / 1e6 / elapsed, 2) if elapsed else 0.0
+    summary['chars_per_second'] = round(summary['characters'] / elapsed) if elapsed else 0
+    return summary
+
+
+def format_report(summary: Dict) -> str:
+    """Formatea el resumen como texto."""
+    lines = [
+        '=' * 60,
+        f"  CONVERSIÓN MASIVA - modo {summary['mode']}",
+        '=' * 60,
+        f"  archivos convertidos   {summary['files']}",
+        f"  archivos sin cambios   {summary['skipped']}",
+        f"  archivos con error     {len(summary['failed'])}",
+        f"  bytes leídos           {summary['bytes']}",
+        f"  caracteres             {summary['characters']}",
+        f"  tiempo                 {summary['seconds']} s",
+        f"  rendimiento            {summary['mb_per_second']} MB/s, "
+        f"{summary['chars_per_second']} caracteres/s",
+    ]
+    for failure in summary['failed']:
+        lines.append(f"  ERROR {failure['file']}: {failure['error']}")
+    lines.append('=' * 60)
+    return '\n'.join(lines)
+
+
+def main(argv: List[str] = None) -> int:
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(description='Convierte directorios de archivos a/desde Braille')
+    parser.add_argument('input_dir', help='Directorio de entrada')
+    parser.add_argument('output_dir', help='Directorio de salida')
+    parser.add_argument('--mode', choices=MODES, default='to-braille', help='Tipo de conversión')
+    parser.add_argument('--workers', type=int, default=None, help='Procesos (default: CPUs)')
+    parser.add_argument('--pattern', default=None, help='Patrón de archivos de entrada')
+    parser.add_argument('--no-resume', action='store_true',
+                        help='Convertir todo aunque el manifiesto indique que ya está hecho')
+    parser.add_argument('--manifest', default=None, help='Ruta del manifiesto')
+    parser.add_argument('--table', default=None,
+                        help='Tabla de traducción (default: es; p. ej. computer8)')
+    parser.add_argument('--json', dest='json_path', default=None,
+                        help='Guardar el resumen en un archivo JSON')
+    args = parser.parse_args(argv)
+
+    summary = run(args.input_dir, args.output_dir, args.mode, args.workers,
+                  args.pattern, not args.no_resume, args.manifest, args.table)
+    print(format_report(summary))
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+
+    return 1 if summary['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
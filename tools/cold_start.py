@@ -0,0 +1,147 @@
+"""
+Medición de Arranque en Frío - Sistema Braille
+==============================================
+Lanza varios procesos nuevos de Python y mide, en cada uno, cuánto
+tarda cada fase del arranque de un worker:
+
+    interpreter   Arranque del intérprete (hasta ejecutar la primera línea)
+    import        import run (Flask, blueprints, conversor)
+    create_app    run.create_app()
+    first_request Primera petición (GET /api/health)
+    first_convert Primera conversión (incluye crear la base de datos)
+    first_pdf     Primer PDF (incluye importar ReportLab), con --pdf
+
+Cada proceso usa una base de datos y un directorio de salida temporales.
+
+Ejecutar con:
+    python -m tools.cold_start
+    python -m tools.cold_start --runs 10 --pdf --json arranque.json
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+PHASES = ('interpreter', 'import', 'create_app', 'first_request',
+          'first_convert', 'first_pdf')
+
+# Script ejecutado en cada proceso hijo; escribe las marcas de tiempo en JSON
+CHILD_SCRIPT = '''
+import json, sys, time
+marks = {'start': time.perf_counter()}
+import run
+marks['import'] = time.perf_counter()
+app = run.create_app()
+marks['create_app'] = time.perf_counter()
+client = app.test_client()
+client.get('/api/health')
+marks['first_request'] = time.perf_counter()
+client.post('/api/convert/to-braille', json={'text': 'Piso 1'})
+marks['first_convert'] = time.perf_counter()
+if sys.argv[1] == '1':
+    client.post('/api/generate-signage', json={'title': 'Ascensor',
+                'items': [{'text': 'Piso', 'number': '1'}]})
+    marks['first_pdf'] = time.perf_counter()
+print(json.dumps(marks))
+'''
+
+
+def measure_once(include_pdf: bool = False) -> Dict[str, float]:
+    """
+    Mide un arranque en un proceso nuevo.
+
+    Args:
+        include_pdf: Medir también la generación del primer PDF
+
+    Returns:
+        Diccionario fase -> segundos
+    """
+    with tempfile.TemporaryDirectory(prefix='braille_cold_') as tmp:
+        env = dict(os.environ)
+        env['BRAILLE_DB_PATH'] = os.path.join(tmp, 'braille.db')
+        env['BRAILLE_OUTPUT_DIR'] = os.path.join(tmp, 'output')
+        env['PYTHONPATH'] = PROJECT_ROOT + os.pathsep + env.get('PYTHONPATH', '')
+
+        launched = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, '-c', CHILD_SCRIPT, '1' if include_pdf else '0'],
+            cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, check=True
+        )
+        total = time.perf_counter() - launched
+
+    marks = json.loads(completed.stdout.strip().splitlines()[-1])
+    phases = {'interpreter': None}
+    previous = marks['start']
+    for phase in PHASES[1:]:
+        if phase in marks:
+            phases[phase] = marks[phase] - previous
+            previous = marks[phase]
+    # El intérprete es el tiempo total menos lo medido dentro del proceso
+    phases['interpreter'] = max(0.0, total - (previous - marks['start']))
+    phases['total'] = total
+    return phases
+
+
+def summarize(runs: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """Mediana, mínimo y máximo (en ms) de cada fase."""
+    summary = {}
+    for phase in PHASES + ('total',):
+        values = [run[phase] for run in runs if phase in run]
+        if values:
+            summary[phase] = {
+                'median_ms': round(statistics.median(values) * 1000, 1),
+                'min_ms': round(min(values) * 1000, 1),
+                'max_ms': round(max(values) * 1000, 1),
+            }
+    return summary
+
+
+def format_report(summary: Dict[str, Dict[str, float]], runs: int) -> str:
+    """Formatea el resumen como tabla de texto."""
+    lines = [
+        '=' * 60,
+        f'  ARRANQUE EN FRÍO - {runs} procesos',
+        '=' * 60,
+        f"  {'fase':<16}{'mediana ms':>14}{'mín ms':>14}{'máx ms':>14}",
+        '-' * 60,
+    ]
+    for phase, values in summary.items():
+        lines.append(f"  {phase:<16}{values['median_ms']:>14}"
+                     f"{values['min_ms']:>14}{values['max_ms']:>14}")
+    lines.append('=' * 60)
+    return '\n'.join(lines)
+
+
+def main(argv: List[str] = None) -> int:
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(description='Mide el arranque en frío de un worker')
+    parser.add_argument('--runs', type=int, default=5, help='Procesos a lanzar')
+    parser.add_argument('--pdf', action='store_true', help='Medir también el primer PDF')
+    parser.add_argument('--json', dest='json_path', default=None,
+                        help='Guardar el resumen en un archivo JSON')
+    args = parser.parse_args(argv)
+
+    runs = [measure_once(args.pdf) for _ in range(args.runs)]
+    summary = summarize(runs)
+    print(format_report(summary, args.runs))
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump({'runs': args.runs, 'phases': summary}, f, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,363 @@
+"""
+Prueba de Carga - Sistema Braille
+=================================
+Generador de carga autocontenido que reproduce una mezcla configurable
+de llamadas a la API y reporta latencias (p50/p95/p99), rendimiento y
+tasa de errores por endpoint.
+
+Destinos:
+    inprocess                 Cliente de pruebas de Flask dentro del proceso
+                              (sin red; usa una base de datos y un directorio
+                              de salida temporales)
+    http://127.0.0.1:5000     Servidor local ya iniciado (python run.py serve)
+
+Ejecutar con:
+    python -m tools.load_test --requests 2000 --concurrency 8
+    python -m tools.load_test --target http://127.0.0.1:5000 --duration 30 \\
+        --mix to-braille=70,to-text=20,signage=2,history=8
+    python -m tools.load_test --json resultados.json
+
+Autor: GR4
+Fecha: Noviembre 2025
+"""
+
+import argparse
+import http.client
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+# Añadir directorio raíz al path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Mezcla por defecto (pesos relativos)
+DEFAULT_MIX = 'to-braille=60,to-text=25,signage=5,history=10'
+
+LABELS = ['Salida', 'Piso 1', 'Planta Baja', 'Ascensor', 'Baño', 'Oficina 205',
+          'Salida de emergencia', 'Recepción', 'Sala de reuniones 3', 'Escalera']
+
+PARAGRAPH = ('El sistema de lectoescritura braille permite a las personas ciegas '
+             'leer y escribir mediante el tacto. Lote 12345, caja 3.5 kg, '
+             'unidades 480; ¿disponible? ¡Sí! ')
+
+
+def _text_payload(rng: random.Random) -> Dict:
+    """Texto de entrada: 80% etiquetas cortas, 20% párrafos."""
+    if rng.random() < 0.8:
+        return {'text': rng.choice(LABELS), 'format': 'unicode'}
+    return {'text': PARAGRAPH * rng.randint(1, 5), 'format': 'unicode'}
+
+
+def _braille_payload(rng: random.Random) -> Dict:
+    """Braille de entrada (patrones Unicode de letras y espacios)."""
+    cells = [chr(0x2800 + rng.choice((1, 3, 9, 25, 17, 11, 27, 19, 10, 26, 5, 7, 0)))
+             for _ in range(rng.randint(4, 60))]
+    return {'braille': ''.join(cells)}
+
+
+def _signage_payload(rng: random.Random) -> Dict:
+    """Petición de PDF de ascensor con 2 a 6 pisos."""
+    floors = rng.randint(2, 6)
+    return {
+        'title': 'ASCENSOR',
+        'format': 'elevator',
+        'items': [{'text': f'Piso {n}', 'number': str(n)} for n in range(floors)]
+    }
+
+
+# Nombre -> (método, ruta, generador del cuerpo JSON)
+ENDPOINTS = {
+    'to-braille': ('POST', '/api/convert/to-braille', _text_payload),
+    'to-text': ('POST', '/api/convert/to-text', _braille_payload),
+    'signage': ('POST', '/api/generate-signage', _signage_payload),
+    'history': ('GET', '/api/history?limit=50', None),
+    'async-to-braille': ('POST', '/api/async/convert/to-braille', _text_payload),
+    'async-to-text': ('POST', '/api/async/convert/to-text', _braille_payload),
+    'async-signage': ('POST', '/api/async/generate-signage', _signage_payload),
+}
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """
+    Interpreta una mezcla "nombre=peso,nombre=peso".
+
+    Args:
+        mix: Mezcla de endpoints
+
+    Returns:
+        Diccionario nombre -> peso
+
+    Raises:
+        ValueError: Si un endpoint no existe o un peso no es válido
+    """
+    weights = {}
+    for part in mix.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in ENDPOINTS:
+            raise ValueError(f"Endpoint desconocido: {name}. Opciones: {', '.join(ENDPOINTS)}")
+        weights[name] = float(weight) if weight else 1.0
+        if weights[name] < 0:
+            raise ValueError(f"Peso negativo para {name}")
+    if not weights or sum(weights.values()) <= 0:
+        raise ValueError("La mezcla debe tener al menos un endpoint con peso positivo")
+    return weights
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """
+    Percentil por rango más cercano sobre una lista ya ordenada.
+
+    Args:
+        sorted_values: Valores ordenados de menor a mayor
+        pct: Percentil (0-100)
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class InProcessTarget:
+    """Destino que usa el cliente de pruebas de Flask (sin red)."""
+
+    def __init__(self):
+        self._workdir = tempfile.TemporaryDirectory(prefix='braille_load_')
+        os.environ.setdefault('BRAILLE_DB_PATH', os.path.join(self._workdir.name, 'load.db'))
+        os.environ.setdefault('BRAILLE_OUTPUT_DIR', os.path.join(self._workdir.name, 'output'))
+
+        from run import create_app
+        self.app = create_app()
+        self._local = threading.local()
+        self.name = 'inprocess'
+
+    def request(self, method: str, path: str, body: Optional[Dict]) -> Tuple[int, int]:
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = self._local.client = self.app.test_client()
+        response = client.open(path, method=method, json=body)
+        size = len(response.get_data())
+        response.close()
+        return response.status_code, size
+
+    def close(self):
+        self._workdir.cleanup()
+
+
+class HTTPTarget:
+    """Destino HTTP con una conexión keep-alive por hilo."""
+
+    def __init__(self, base_url: str):
+        parsed = urlparse(base_url)
+        if parsed.scheme != 'http' or not parsed.hostname:
+            raise ValueError(f"URL no soportada: {base_url}")
+        self.host = parsed.hostname
+        self.port = parsed.port or 80
+        self.prefix = parsed.path.rstrip('/')
+        self._local = threading.local()
+        self.name = base_url
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = http.client.HTTPConnection(self.host, self.port, timeout=60)
+        return conn
+
+    def request(self, method: str, path: str, body: Optional[Dict]) -> Tuple[int, int]:
+        headers = {}
+        data = None
+        if body is not None:
+            data = json.dumps(body).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+
+        conn = self._connection()
+        try:
+            conn.request(method, self.prefix + path, body=data, headers=headers)
+            response = conn.getresponse()
+            size = len(response.read())
+            return response.status, size
+        except (http.client.HTTPException, OSError):
+            # Reabrir la conexión en la siguiente petición
+            conn.close()
+            self._local.conn = None
+            raise
+
+    def close(self):
+        pass
+
+
+def run_load(target, mix: Dict[str, float], concurrency: int = 4,
+             total_requests: Optional[int] = None, duration: Optional[float] = None,
+             seed: int = 0) -> Tuple[List[Tuple[str, float, int, int]], float]:
+    """
+    Ejecuta la carga contra el destino.
+
+    Args:
+        target: InProcessTarget o HTTPTarget
+        mix: Pesos por endpoint
+        concurrency: Número de hilos cliente
+        total_requests: Total de peticiones (si no se indica, usar duration)
+        duration: Duración en segundos
+        seed: Semilla para reproducir la misma secuencia de peticiones
+
+    Returns:
+        (lista de (endpoint, latencia_s, estado, bytes), segundos transcurridos)
+        Un estado 0 indica un error de conexión/excepción.
+    """
+    if total_requests is None and duration is None:
+        total_requests = 1000
+
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    results = []
+    results_lock = threading.Lock()
+    counter = [0]
+    counter_lock = threading.Lock()
+    deadline = time.perf_counter() + duration if duration else None
+
+    def next_ticket() -> bool:
+        with counter_lock:
+            if total_requests is not None and counter[0] >= total_requests:
+                return False
+            counter[0] += 1
+        return deadline is None or time.perf_counter() < deadline
+
+    def worker(worker_id: int):
+        rng = random.Random(seed * 1000 + worker_id)
+        local_results = []
+        while next_ticket():
+            name = rng.choices(names, weights)[0]
+            method, path, payload_fn = ENDPOINTS[name]
+            body = payload_fn(rng) if payload_fn else None
+            start = time.perf_counter()
+            try:
+                status, size = target.request(method, path, body)
+            except Exception:
+                status, size = 0, 0
+            local_results.append((name, time.perf_counter() - start, status, size))
+        with results_lock:
+            results.extend(local_results)
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True)
+               for i in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, time.perf_counter() - start
+
+
+def summarize(results: List[Tuple[str, float, int, int]], elapsed: float) -> Dict:
+    """
+    Calcula latencias, rendimiento y errores por endpoint y en total.
+
+    Args:
+        results: Resultados de run_load
+        elapsed: Segundos transcurridos
+
+    Returns:
+        Diccionario con una entrada por endpoint y 'total'
+    """
+    groups = {}
+    for name, latency, status, size in results:
+        groups.setdefault(name, []).append((latency, status, size))
+    groups['total'] = [(latency, status, size) for _, latency, status, size in results]
+
+    summary = {}
+    for name, rows in groups.items():
+        latencies = sorted(row[0] for row in rows)
+        errors = sum(1 for row in rows if row[1] == 0 or row[1] >= 500)
+        rejected = sum(1 for row in rows if row[1] == 503)
+        summary[name] = {
+            'requests': len(rows),
+            'throughput_rps': round(len(rows) / elapsed, 2) if elapsed else 0.0,
+            'error_rate': round(errors / len(rows), 4) if rows else 0.0,
+            'rejected_503': rejected,
+            'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+            'p95_ms': round(percentile(latencies, 95) * 1000, 3),
+            'p99_ms': round(percentile(latencies, 99) * 1000, 3),
+            'max_ms': round(latencies[-1] * 1000, 3) if latencies else 0.0,
+            'bytes': sum(row[2] for row in rows),
+        }
+    return summary
+
+
+def format_report(summary: Dict, elapsed: float, target_name: str, concurrency: int) -> str:
+    """Formatea el resumen como tabla de texto."""
+    lines = [
+        '=' * 92,
+        f'  PRUEBA DE CARGA - destino: {target_name} | concurrencia: {concurrency} '
+        f'| duración: {elapsed:.2f}s',
+        '=' * 92,
+        f"  {'endpoint':<18}{'peticiones':>11}{'req/s':>10}{'p50 ms':>10}"
+        f"{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}{'errores':>10}",
+        '-' * 92,
+    ]
+    names = sorted(name for name in summary if name != 'total') + ['total']
+    for name in names:
+        row = summary[name]
+        lines.append(
+            f"  {name:<18}{row['requests']:>11}{row['throughput_rps']:>10.1f}"
+            f"{row['p50_ms']:>10.2f}{row['p95_ms']:>10.2f}{row['p99_ms']:>10.2f}"
+            f"{row['max_ms']:>10.2f}{row['error_rate'] * 100:>9.2f}%"
+        )
+    lines.append('=' * 92)
+    return '\n'.join(lines)
+
+
+def main(argv: List[str] = None) -> int:
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(description='Prueba de carga de la API Braille')
+    parser.add_argument('--target', default='inprocess',
+                        help='inprocess o URL base (http://127.0.0.1:5000)')
+    parser.add_argument('--mix', default=DEFAULT_MIX,
+                        help=f'Mezcla de endpoints con pesos (default: {DEFAULT_MIX})')
+    parser.add_argument('--concurrency', type=int, default=4, help='Hilos cliente')
+    parser.add_argument('--requests', type=int, default=None, help='Total de peticiones')
+    parser.add_argument('--duration', type=float, default=None, help='Duración en segundos')
+    parser.add_argument('--seed', type=int, default=0, help='Semilla de la secuencia')
+    parser.add_argument('--json', dest='json_path', default=None,
+                        help='Guardar el resumen en un archivo JSON')
+    args = parser.parse_args(argv)
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    target = InProcessTarget() if args.target == 'inprocess' else HTTPTarget(args.target)
+    try:
+        results, elapsed = run_load(target, mix, args.concurrency,
+                                    args.requests, args.duration, args.seed)
+    finally:
+        target.close()
+
+    summary = summarize(results, elapsed)
+    print(format_report(summary, elapsed, target.name, args.concurrency))
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'target': target.name,
+                'concurrency': args.concurrency,
+                'mix': mix,
+                'elapsed_seconds': round(elapsed, 3),
+                'endpoints': summary
+            }, f, indent=2)
+
+    return 1 if summary.get('total', {}).get('error_rate', 0) > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())